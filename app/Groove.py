@@ -2,48 +2,57 @@
 import os
 import sys
 from inspect import getsourcefile
+from multiprocessing import freeze_support
 from pathlib import Path
 
 os.chdir(Path(getsourcefile(lambda: 0)).resolve().parent)
 
 
-from PyQt5.QtCore import QLocale, Qt, QTranslator
-from PyQt5.QtWidgets import QApplication
+def main():
+    """ launch Groove Music """
+    from PyQt5.QtCore import QLocale, Qt, QTranslator
+    from PyQt5.QtWidgets import QApplication
 
-from common.application import SingletonApplication
-from common.config import config, Language
-from common.setting import APP_NAME
-from common.dpi_manager import DPI_SCALE
-from View.main_window import MainWindow
+    from common.application import SingletonApplication
+    from common.config import config, Language
+    from common.setting import APP_NAME
+    from common.dpi_manager import DPI_SCALE
+    from View.main_window import MainWindow
 
+    # fix bug: qt.qpa.plugin: Could not load the Qt platform plugin "xcb"
+    if "QT_QPA_PLATFORM_PLUGIN_PATH" in os.environ:
+        os.environ.pop("QT_QPA_PLATFORM_PLUGIN_PATH")
 
-# fix bug: qt.qpa.plugin: Could not load the Qt platform plugin "xcb"
-if "QT_QPA_PLATFORM_PLUGIN_PATH" in os.environ:
-    os.environ.pop("QT_QPA_PLATFORM_PLUGIN_PATH")
+    # enable high dpi scale
+    os.environ["QT_ENABLE_HIGHDPI_SCALING"] = "0"
+    os.environ["QT_SCALE_FACTOR"] = str(DPI_SCALE)
 
-# enable high dpi scale
-os.environ["QT_ENABLE_HIGHDPI_SCALING"] = "0"
-os.environ["QT_SCALE_FACTOR"] = str(DPI_SCALE)
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
 
-QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
+    app = SingletonApplication(sys.argv, APP_NAME)
+    app.setAttribute(Qt.AA_DontCreateNativeWidgetSiblings)
+    app.setApplicationName(APP_NAME)
 
-app = SingletonApplication(sys.argv, APP_NAME)
-app.setAttribute(Qt.AA_DontCreateNativeWidgetSiblings)
-app.setApplicationName(APP_NAME)
+    # Internationalization
+    translator = QTranslator()
+    language = config.get(config.language)  # type: Language
 
-# Internationalization
-translator = QTranslator()
-language = config.get(config.language)  # type: Language
+    if language == Language.AUTO:
+        translator.load(QLocale.system(), ":/i18n/Groove_")
+    elif language != Language.ENGLISH:
+        translator.load(f":/i18n/Groove_{language.value}.qm")
 
-if language == Language.AUTO:
-    translator.load(QLocale.system(), ":/i18n/Groove_")
-elif language != Language.ENGLISH:
-    translator.load(f":/i18n/Groove_{language.value}.qm")
+    app.installTranslator(translator)
 
-app.installTranslator(translator)
+    # create main window
+    groove = MainWindow()
+    groove.show()
 
-# create main window
-groove = MainWindow()
-groove.show()
+    app.exec_()
 
-app.exec_()
\ No newline at end of file
+
+if __name__ == '__main__':
+    # worker processes of the song information reader re-import this module,
+    # so the application must only be launched in the main process
+    freeze_support()
+    main()
@@ -77,7 +77,7 @@ class AlbumInterface(SongSelectionModeInterface):
         newSongInfo: SongInfo
             new song information
         """
-        albumInfo = self.library.albumInfoController.getAlbumInfo(
+        albumInfo = self.library.getAlbumInfo(
             self.singer, self.album)
         if not albumInfo:
             return
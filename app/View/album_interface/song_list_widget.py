@@ -93,7 +93,7 @@ class SongListWidget(NoScrollSongListWidget):
         menu.addToMenu.playingAct.triggered.connect(
             lambda: signalBus.addSongsToPlayingPlaylistSig.emit([self.currentSongInfo]))
         menu.selectAct.triggered.connect(
-            lambda: self.currentSongCard.setChecked(True))
+            lambda: self.setSongCardChecked(self.currentRow(), True))
         menu.addToMenu.addSongsToPlaylistSig.connect(
             lambda name: signalBus.addSongsToCustomPlaylistSig.emit(name, self.songInfos))
         menu.addToMenu.newPlaylistAct.triggered.connect(
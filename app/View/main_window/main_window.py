@@ -195,19 +195,20 @@ class MainWindow(AcrylicWindow):
         """ initialize song library """
         DBInitializer.init()
 
+        # show the cached library first, then scan audio directories in the background
         self.library = Library(
             config.get(config.musicFolders),
             QSqlDatabase.database(DBInitializer.CONNECTION_NAME)
         )
+        self.library.loadFromCache()
+
         self.libraryThread = LibraryThread(
             config.get(config.musicFolders), self)
 
-        eventLoop = QEventLoop(self)
-        self.libraryThread.finished.connect(eventLoop.quit)
-        self.libraryThread.start()
-        eventLoop.exec()
-
-        self.libraryThread.library.copyTo(self.library)
+        # merge the loaded chunks into interfaces at most once per second
+        self.mergeLibraryTimer = QTimer(self)
+        self.mergeLibraryTimer.setSingleShot(True)
+        self.mergeLibraryTimer.setInterval(1000)
 
     def initWindow(self):
         """ initialize window """
@@ -265,6 +266,26 @@ class MainWindow(AcrylicWindow):
         self.navigationInterface.navigationMenu.installEventFilter(self)
         self.updateLyricPosTimer.start()
         self.onInitFinished()
+        self.loadLibrary()
+
+    def loadLibrary(self):
+        """ scan audio directories in the background """
+        self.showScanInfoTooltip()
+        self.libraryThread.addTask(self.libraryThread.library.load, stream=True)
+
+    def onLibraryLoadProgressed(self, songInfos: List[SongInfo], albumInfos: List[AlbumInfo], singerInfos: list):
+        """ library load progressed slot """
+        self.library.merge(songInfos, albumInfos, singerInfos)
+        if not self.mergeLibraryTimer.isActive():
+            self.mergeLibraryTimer.start()
+
+    def onLibraryLoadFinished(self, directories: List[str], songInfos: List[SongInfo], removedFiles: List[str], tree: dict):
+        """ library load finished slot """
+        self.mergeLibraryTimer.stop()
+        self.library.applyLoadResult(directories, songInfos, removedFiles, tree)
+        self.myMusicInterface.updateWindow(False)
+        self.setPlayButtonEnabled(self.songTabSongListWidget.songCardNum > 0)
+        self.hideScanInfoTooltip()
 
     def onInitFinished(self):
         """ initialize finished slot """
@@ -398,9 +419,8 @@ class MainWindow(AcrylicWindow):
         if len(files) > 10:
             self.showScanInfoTooltip()
 
-        self.libraryThread.setTask(
+        self.libraryThread.addTask(
             self.libraryThread.library.loadFromFiles, files=files)
-        self.libraryThread.start()
 
     def initPlayer(self):
         """ initialize player """
@@ -955,6 +975,9 @@ class MainWindow(AcrylicWindow):
         """ switch to search result interface """
         self.searchResultInterface.search(keyWord)
         self.switchToSubInterface(self.searchResultInterface)
+
+    def onLocalSearchFinished(self):
+        """ local search finished slot """
         self.searchResultInterface.localSongListWidget.setPlayBySongInfo(
             self.mediaPlaylist.getCurrentSong())
 
@@ -985,7 +1008,7 @@ class MainWindow(AcrylicWindow):
         if self.isInSelectionMode:
             return
 
-        albumInfo = self.library.albumInfoController.getAlbumInfo(
+        albumInfo = self.library.getAlbumInfo(
             singer, album)
         if not albumInfo:
             return
@@ -1066,15 +1089,19 @@ class MainWindow(AcrylicWindow):
         if len(files) > 10:
             self.showScanInfoTooltip()
 
-        eventLoop = QEventLoop(self)
-        self.libraryThread.setTask(
-            lambda: self.library.loadFromFiles(files, False))
-        self.libraryThread.finished.connect(eventLoop.quit)
-        self.libraryThread.start()
-        eventLoop.exec()
+        def task():
+            return self.libraryThread.library.loadFromFiles(files, False)
 
-        self.hideScanInfoTooltip()
-        self.addSongsToCustomPlaylist(name, self.libraryThread.taskResult)
+        def onTaskFinished(finishedTask, songInfos: List[SongInfo]):
+            if finishedTask is not task:
+                return
+
+            self.libraryThread.taskFinished.disconnect(onTaskFinished)
+            self.hideScanInfoTooltip()
+            self.addSongsToCustomPlaylist(name, songInfos)
+
+        self.libraryThread.taskFinished.connect(onTaskFinished)
+        self.libraryThread.addTask(task)
 
     def addSongsToCustomPlaylist(self, name: str, songInfos: List[SongInfo]):
         """ add songs to custom playlist """
@@ -1125,7 +1152,7 @@ class MainWindow(AcrylicWindow):
 
     def playAlbum(self, singer: str, album: str, index=0):
         """ play songs in an album """
-        albumInfo = self.library.albumInfoController.getAlbumInfo(
+        albumInfo = self.library.getAlbumInfo(
             singer, album)
         if not albumInfo:
             return
@@ -1244,6 +1271,8 @@ class MainWindow(AcrylicWindow):
         self.mediaPlaylist.save()
         self.systemTrayIcon.hide()
         self.hotkeyManager.clear(self.winId())
+        self.library.pictureController.saveIndex()
+        self.library.sortKeyController.saveIndex()
 
         # close database
         QSqlDatabase.database(DBInitializer.CONNECTION_NAME).close()
@@ -1273,19 +1302,14 @@ class MainWindow(AcrylicWindow):
     def onSelectedFolderChanged(self, directories: List[str]):
         """ selected music folders changed slot """
         self.showScanInfoTooltip()
-        self.libraryThread.setTask(
+        self.libraryThread.addTask(
             self.libraryThread.library.setDirectories, directories=directories)
-        self.libraryThread.start()
 
     def onReloadFinished(self):
         """ reload library finished slot """
-        self.libraryThread.library.copyTo(self.library)
+        # the reloaded library has been applied by `onLibraryLoadFinished()`
         self.myMusicInterface.updateWindow()
-
-        if self.scanInfoTooltip:
-            self.scanInfoTooltip.setState(True)
-
-        self.scanInfoTooltip = None
+        self.hideScanInfoTooltip()
 
     def onLoadFromFilesFinished(self, songInfos: List[SongInfo]):
         """ load song information form files finished slot """
@@ -1590,6 +1614,10 @@ class MainWindow(AcrylicWindow):
         self.playlistInterface.switchToAlbumCardInterfaceSig.connect(
             self.switchToAlbumCardInterface)
 
+        # search result interface signal
+        self.searchResultInterface.localSearchFinished.connect(
+            self.onLocalSearchFinished)
+
         # playlist card interface signal
         self.playlistCardInterface.createPlaylistSig.connect(
             self.showCreatePlaylistDialog)
@@ -1610,7 +1638,11 @@ class MainWindow(AcrylicWindow):
         self.videoInterface.fullScreenChanged.connect(self.setVideoFullScreen)
 
         # library thread signal
+        self.libraryThread.loadFinished.connect(self.onLibraryLoadFinished)
         self.libraryThread.reloadFinished.connect(self.onReloadFinished)
+        self.libraryThread.loadProgressed.connect(self.onLibraryLoadProgressed)
+        self.mergeLibraryTimer.timeout.connect(
+            lambda: self.myMusicInterface.updateWindow(False))
         self.libraryThread.loadFromFilesFinished.connect(
             self.onLoadFromFilesFinished)
 
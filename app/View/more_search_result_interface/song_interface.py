@@ -71,7 +71,7 @@ class OnlineSongListWidget(NoScrollSongListWidget):
         menu.viewOnlineAct.triggered.connect(
             lambda: signalBus.getSongDetailsUrlSig.emit(self.currentSongInfo, QueryServerType.KUWO))
         menu.selectAct.triggered.connect(
-            lambda: self.currentSongCard.setChecked(True))
+            lambda: self.setSongCardChecked(self.currentRow(), True))
 
         menu.addToMenu.playingAct.triggered.connect(
             lambda: signalBus.addSongsToPlayingPlaylistSig.emit([self.currentSongInfo]))
@@ -1,31 +1,41 @@
 # coding:utf-8
 from typing import Dict, List
 
-import pinyin
 from common.database.entity import AlbumInfo
 from common.library import Library
 from common.signal_bus import signalBus
+from common.sort_key import sortKeyIndex
 from common.style_sheet import setStyleSheet
-from components.album_card import (AlbumBlurBackground, AlbumCard,
-                                   AlbumCardType, GridAlbumCardView)
-from PyQt5.QtCore import QFile, QParallelAnimationGroup, QPoint, Qt, pyqtSignal
-from PyQt5.QtWidgets import QApplication, QLabel, QVBoxLayout, QWidget
+from common.thread.save_album_info_thread import SaveAlbumInfoThread
+from components.album_card import AlbumBlurBackground, AlbumCard
+from components.dialog_box.album_info_edit_dialog import AlbumInfoEditDialog
+from components.dialog_box.message_dialog import MessageDialog
+from components.widgets.virtual_grid_view import VirtualGridView
+from PyQt5.QtCore import (QMargins, QParallelAnimationGroup, QPoint, QSize,
+                          pyqtSignal)
+from PyQt5.QtWidgets import QApplication, QLabel
 
 
-class AlbumCardView(QWidget):
+class AlbumCardView(VirtualGridView):
     """ Album card view """
 
     albumNumChanged = pyqtSignal(int)           # 专辑数改变
     checkedNumChanged = pyqtSignal(int, bool)   # 选中专辑卡数量改变
 
     def __init__(self, library: Library, parent=None):
-        super().__init__(parent)
+        super().__init__(
+            QSize(210, 290),
+            spacings=(10, 20),
+            margins=QMargins(15, 245, 0, 120),
+            parent=parent
+        )
         self.library = library
         self.albumInfos = library.albumInfos
 
-        self.checkedAlbumCards = []  # type:List[AlbumCard]
-        self.albumCardViews = []  # type:List[GridAlbumCardView]
-        self.firstViewMap = {}
+        # checked albums, the key is (singer, album)
+        self.checkedAlbumMap = {}   # type:Dict[tuple, AlbumInfo]
+        self.firstGroupMap = {}
+        self.labels = []
 
         self.isInSelectionMode = False
         self.isAllAlbumCardsChecked = False
@@ -38,107 +48,90 @@ class AlbumCardView(QWidget):
             "Artist": self.sortBySinger
         }
 
-        self.vBoxLayout = QVBoxLayout(self)
         self.guideLabel = QLabel(
             self.tr("There is nothing to display here. Try a different filter."), self)
 
         self.albumBlurBackground = AlbumBlurBackground(self)
         self.hideCheckBoxAniGroup = QParallelAnimationGroup(self)
-        self.albumCards = [AlbumCard(i, self) for i in self.albumInfos]
 
         self.__initWidget()
 
     def __initWidget(self):
         """ initialize widgets """
         self.resize(1270, 760)
-        self.vBoxLayout.setSpacing(30)
-        self.vBoxLayout.setContentsMargins(15, 245, 0, 120)
         self.guideLabel.move(35, 286)
 
         self.albumBlurBackground.hide()
         self.guideLabel.raise_()
         self.guideLabel.setHidden(bool(self.albumInfos))
 
+        self.hideCheckBoxAniGroup.finished.connect(self.__hideAllCheckBox)
+        self.titleClicked.connect(
+            lambda: signalBus.switchToLabelNavigationInterfaceSig.emit(self.labels, self.labelLayout))
+
         self.__setQss()
         self.sortByAddTime()
 
-    def __createAlbumCardView(self, albumCards: List[AlbumCard], title=None):
-        """ create an album card view """
-        albumInfos = [i.albumInfo for i in albumCards]
-        view = GridAlbumCardView(
-            self.library,
-            albumInfos,
-            AlbumCardType.ALBUM_CARD,
-            title=title,
-            create=False,
-            isGrouped=True,
-            parent=self
-        )
-        m = self.vBoxLayout.contentsMargins()
-        view.setFixedWidth(self.width() - m.left() - m.right())
-        view.setAlbumCards(albumCards)
-        view.adjustHeight()
-
-        self.hideCheckBoxAniGroup.addAnimation(view.hideCheckBoxAniGroup)
-
-        # connect signal to slot
-        view.checkedStateChanged.connect(self.__onAlbumCardCheckedStateChanged)
-        view.showBlurAlbumBackgroundSig.connect(self.__showBlurAlbumBackground)
-        view.hideBlurAlbumBackgroundSig.connect(self.albumBlurBackground.hide)
+    @property
+    def checkedAlbumInfos(self) -> List[AlbumInfo]:
+        return list(self.checkedAlbumMap.values())
 
-        self.albumCardViews.append(view)
-        return view
+    @property
+    def labelLayout(self) -> str:
+        """ layout of label navigation interface """
+        return "list" if self.sortMode == "Release year" else "grid"
 
-    def resizeEvent(self, e):
-        """ 根据宽度调整网格的列数 """
-        m = self.vBoxLayout.contentsMargins()
-        w = self.width() - m.left() - m.right()
+    def _createCard(self, index: int) -> AlbumCard:
+        card = AlbumCard(self.items[index], self)
+        card.restoreState(self.__isChecked(index), self.isInSelectionMode)
+        card.setStyle(QApplication.style())
+        self.hideCheckBoxAniGroup.addAnimation(card.hideCheckBoxAni)
 
-        for view in self.albumCardViews:
-            view.setFixedWidth(w)
-            view.adjustHeight()
-
-        # self.adjustHeight()
-
-    def adjustHeight(self):
-        """ adjust the height of view """
-        if not self.albumCardViews:
+        # connect signal to slot
+        card.deleteCardSig.connect(self.__showDeleteCardDialog)
+        card.showAlbumInfoEditDialogSig.connect(self.showAlbumInfoEditDialog)
+        card.nextPlaySignal.connect(
+            lambda s, a: signalBus.nextToPlaySig.emit(self.getAlbumSongInfos(s, a)))
+        card.addToPlayingSignal.connect(
+            lambda s, a: signalBus.addSongsToPlayingPlaylistSig.emit(self.getAlbumSongInfos(s, a)))
+        card.addAlbumToCustomPlaylistSig.connect(
+            lambda n, s, a: signalBus.addSongsToCustomPlaylistSig.emit(n, self.getAlbumSongInfos(s, a)))
+        card.addAlbumToNewCustomPlaylistSig.connect(
+            lambda s, a: signalBus.addSongsToNewCustomPlaylistSig.emit(self.getAlbumSongInfos(s, a)))
+        card.checkedStateChanged.connect(self.__onAlbumCardCheckedStateChanged)
+        card.showBlurAlbumBackgroundSig.connect(self.__showBlurAlbumBackground)
+        card.hideBlurAlbumBackgroundSig.connect(self.albumBlurBackground.hide)
+        return card
+
+    def _bindCard(self, card: AlbumCard, index: int):
+        card.updateWindow(self.items[index])
+        card.restoreState(self.__isChecked(index), self.isInSelectionMode)
+
+    def __isChecked(self, index: int) -> bool:
+        albumInfo = self.items[index]
+        return (albumInfo.singer, albumInfo.album) in self.checkedAlbumMap
+
+    def getAlbumSongInfos(self, singer: str, album: str):
+        """ get song information of an album """
+        albumInfo = self.library.getAlbumInfo(
+            singer, album)
+        if not albumInfo:
+            return []
+
+        return albumInfo.songInfos
+
+    def __showDeleteCardDialog(self, singer: str, album: str):
+        """ show delete album card dialog box """
+        title = self.tr("Are you sure you want to delete this?")
+        content = self.tr("If you delete") + f' "{album}" ' + \
+            self.tr("it won't be on be this device anymore.")
+
+        w = MessageDialog(title, content, self.window())
+        if not w.exec_():
             return
 
-        views = self.albumCardViews
-
-        vh = sum(i.height() for i in views)
-        n = len(views) - 1
-        m = self.vBoxLayout.contentsMargins()
-        h = vh + 30*n + m.top() + m.bottom()
-        self.resize(self.width(), h)
-
-    def __removeViewFromLayout(self):
-        """ remove all views from layout """
-        for view in self.albumCardViews:
-            view.layout().removeAllWidgets()
-            self.hideCheckBoxAniGroup.removeAnimation(
-                view.hideCheckBoxAniGroup)
-            view.deleteLater()
-
-        self.albumCardViews.clear()
-        self.firstViewMap.clear()
-
-    def __addViewToLayout(self):
-        """ add views to layout """
-        for view in self.albumCardViews:
-            self.vBoxLayout.addWidget(view, 0, Qt.AlignTop)
-
-            title = view.title
-            if self.sortMode == 'Artist':
-                title = pinyin.get_initial(title)[0].upper()
-                title = "..." if not 65 <= ord(title) <= 90 else title
-
-            # add the first view corresponding to the letter to dict
-            if title not in self.firstViewMap:
-                self.firstViewMap[title] = view
-
-        self.adjustHeight()
+        files = [i.file for i in self.getAlbumSongInfos(singer, album)]
+        signalBus.removeSongSig.emit(files)
 
     def setSortMode(self, sortMode: str):
         """ sort album cards
@@ -154,101 +147,91 @@ class AlbumCardView(QWidget):
         self.albumBlurBackground.hide()
         self.__sortFunctions[sortMode]()
 
+    def __setGroups(self, groups: list):
+        """ set album groups and map the navigation labels to the first group """
+        self.setGroups(groups)
+        self.adjustHeight()
+
+        self.firstGroupMap.clear()
+        for title, _ in groups:
+            label = title
+            if self.sortMode == 'Artist':
+                label = sortKeyIndex.letter(title)
+
+            self.firstGroupMap.setdefault(label, title)
+
     def sortByAddTime(self):
         """ sort album cards by added time """
         self.sortMode = "Date added"
-        self.__removeViewFromLayout()
-        self.__createAlbumCardView(self.albumCards)
-        self.__addViewToLayout()
+        self.labels = []
+        self.__setGroups([('', self.albumInfos)])
 
     def sortByFirstLetter(self):
         """ sort album cards by first letter """
         self.sortMode = "A to Z"
 
-        self.__removeViewFromLayout()
-
-        firstLetters = {}  # type:Dict[str, List[AlbumCard]]
+        firstLetters = {}  # type:Dict[str, List[AlbumInfo]]
 
-        for card in self.albumCards:
-            letter = pinyin.get_initial(card.album[0])[0].upper()
-            letter = letter if 65 <= ord(letter) <= 90 else "..."
+        for albumInfo in self.albumInfos:
+            letter = sortKeyIndex.letter(albumInfo.album)
 
             if letter not in firstLetters:
                 firstLetters[letter] = []
 
-            firstLetters[letter].append(card)
+            firstLetters[letter].append(albumInfo)
 
         # sort group
-        groupCards = sorted(firstLetters.items(), key=lambda i: i[0])
+        groups = sorted(firstLetters.items(), key=lambda i: i[0])
 
         # remove ... group to the last position
         if "..." in firstLetters:
-            groupCards.append(groupCards.pop(0))
+            groups.append(groups.pop(0))
 
-        # create views
-        for letter, cards in groupCards:
-            view = self.__createAlbumCardView(cards, letter)
-            view.titleClicked.connect(
-                lambda: signalBus.switchToLabelNavigationInterfaceSig.emit(list(firstLetters.keys()), "grid"))
-
-        self.__addViewToLayout()
+        self.labels = list(firstLetters.keys())
+        self.__setGroups(groups)
 
     def sortByYear(self):
         """ sort album cards by release year """
         self.sortMode = "Release year"
-        self.__removeViewFromLayout()
 
-        years = {}  # type:Dict[str, List[AlbumCard]]
+        years = {}  # type:Dict[str, List[AlbumInfo]]
 
-        for card in self.albumCards:
-            year = card.year if card.year else self.tr('Unknown')
+        for albumInfo in self.albumInfos:
+            year = str(albumInfo.year) if albumInfo.year else self.tr('Unknown')
 
             if year not in years:
                 years[year] = []
 
-            years[year].append(card)
+            years[year].append(albumInfo)
 
         # sort groups by year
-        groupCards = sorted(years.items(), key=lambda i: i[0], reverse=True)
-        years = sorted(years.keys(), reverse=True)
+        groups = sorted(years.items(), key=lambda i: i[0], reverse=True)
 
         if self.tr("Unknown") in years:
-            groupCards.append(groupCards.pop(0))
-
-        # create views
-        for year, cards in groupCards:
-            view = self.__createAlbumCardView(cards, year)
-            view.titleClicked.connect(
-                lambda: signalBus.switchToLabelNavigationInterfaceSig.emit(years, "list"))
+            groups.append(groups.pop(0))
 
-        self.__addViewToLayout()
+        self.labels = sorted(years.keys(), reverse=True)
+        self.__setGroups(groups)
 
     def sortBySinger(self):
         """ sort album cards by singer """
         self.sortMode = "Artist"
-        self.__removeViewFromLayout()
 
-        singers = {}  # type:Dict[str, List[AlbumCard]]
+        singers = {}  # type:Dict[str, List[AlbumInfo]]
 
-        for card in self.albumCards:
-            singer = card.singer
+        for albumInfo in self.albumInfos:
+            singer = albumInfo.singer
 
             if singer not in singers:
                 singers[singer] = []
 
-            singers[singer].append(card)
+            singers[singer].append(albumInfo)
 
         # sort groups
-        groupCards = sorted(
-            singers.items(), key=lambda i: pinyin.get_initial(i[0])[0].lower())
-
-        # create views
-        for singer, cards in groupCards:
-            view = self.__createAlbumCardView(cards, singer)
-            view.titleClicked.connect(
-                lambda: signalBus.switchToLabelNavigationInterfaceSig.emit(list(singers.keys()), "grid"))
+        groups = sorted(singers.items(), key=lambda i: sortKeyIndex.key(i[0]))
 
-        self.__addViewToLayout()
+        self.labels = list(singers.keys())
+        self.__setGroups(groups)
 
     def __setQss(self):
         """ set style sheet """
@@ -258,24 +241,23 @@ class AlbumCardView(QWidget):
 
     def __onAlbumCardCheckedStateChanged(self, albumCard: AlbumCard, isChecked: bool):
         """ album card checked state changed slot """
-        N0 = len(self.checkedAlbumCards)
-
-        if albumCard not in self.checkedAlbumCards and isChecked:
-            self.checkedAlbumCards.append(albumCard)
-        elif albumCard in self.checkedAlbumCards and not isChecked:
-            self.checkedAlbumCards.remove(albumCard)
-        else:
+        key = (albumCard.singer, albumCard.album)
+        if isChecked == (key in self.checkedAlbumMap):
             return
 
-        N1 = len(self.checkedAlbumCards)
+        if isChecked:
+            self.checkedAlbumMap[key] = albumCard.albumInfo
+        else:
+            self.checkedAlbumMap.pop(key)
 
-        if N0 == 0 and N1 > 0:
-            self.setSelectionModeOpen(True)
-        elif N1 == 0:
-            self.setSelectionModeOpen(False)
+        self.__onCheckedNumChanged()
 
-        self.isAllAlbumCardsChecked = N1 == len(self.albumCards)
-        self.checkedNumChanged.emit(N1, self.isAllAlbumCardsChecked)
+    def __onCheckedNumChanged(self):
+        """ checked album number changed slot """
+        N = len(self.checkedAlbumMap)
+        self.setSelectionModeOpen(N > 0)
+        self.isAllAlbumCardsChecked = N == len(self.albumInfos)
+        self.checkedNumChanged.emit(N, self.isAllAlbumCardsChecked)
 
     def setSelectionModeOpen(self, isOpen: bool):
         """ set whether to open selection mode """
@@ -283,25 +265,37 @@ class AlbumCardView(QWidget):
             return
 
         self.isInSelectionMode = isOpen
-        for view in self.albumCardViews:
-            view.setSelectionModeOpen(isOpen)
+        for card in self.visibleCards.values():
+            card.setSelectionModeOpen(isOpen)
 
         if not isOpen:
             self.hideCheckBoxAniGroup.start()
 
+    def __hideAllCheckBox(self):
+        """ hide check box of album cards """
+        if self.isInSelectionMode:
+            return
+
+        for card in self.cards():
+            card.checkBox.hide()
+
     def uncheckAll(self):
         """ uncheck all album cards """
-        for albumCard in self.checkedAlbumCards.copy():
-            albumCard.setChecked(False)
+        self.setAllChecked(False)
 
     def setAllChecked(self, isChecked: bool):
         """ set the checked state of all album cards """
-        if self.isAllAlbumCardsChecked == isChecked:
+        if self.isAllAlbumCardsChecked == isChecked and bool(self.checkedAlbumMap) == isChecked:
             return
 
-        self.isAllAlbumCardsChecked = isChecked
-        for albumCard in self.albumCards:
-            albumCard.setChecked(isChecked)
+        self.checkedAlbumMap.clear()
+        if isChecked:
+            self.checkedAlbumMap = {(i.singer, i.album): i for i in self.albumInfos}
+
+        for index, card in self.visibleCards.items():
+            card.restoreState(self.__isChecked(index), card.isInSelectionMode)
+
+        self.__onCheckedNumChanged()
 
     def __showBlurAlbumBackground(self, pos: QPoint, picPath: str):
         """ show blur background """
@@ -315,38 +309,56 @@ class AlbumCardView(QWidget):
         if albumInfos == self.albumInfos:
             return
 
+        N_ = len(self.albumInfos)
         N = len(albumInfos)
-        N_ = len(self.albumCards)
-        if N < N_:
-            for i in range(N_ - 1, N - 1, -1):
-                albumCard = self.albumCards.pop()
-                albumCard.deleteLater()
-                QApplication.processEvents()
-        elif N > N_:
-            for albumInfo in albumInfos[N_:]:
-                self.albumCards.append(AlbumCard(albumInfo, self))
-                QApplication.processEvents()
-
         self.albumInfos = albumInfos
-        n = min(N_, N)
-        for i in range(n):
-            albumInfo = albumInfos[i]
-            self.albumCards[i].updateWindow(albumInfo)
-            QApplication.processEvents()
+
+        # remove the checked albums which no longer exist
+        keys = {(i.singer, i.album) for i in albumInfos}
+        checkedNum = len(self.checkedAlbumMap)
+        self.checkedAlbumMap = {
+            k: v for k, v in self.checkedAlbumMap.items() if k in keys}
 
         # resort album cards
         self.__sortFunctions[self.sortMode]()
 
         self.guideLabel.setHidden(bool(albumInfos))
 
+        if checkedNum != len(self.checkedAlbumMap):
+            self.__onCheckedNumChanged()
+
         if N_ != N:
             self.albumNumChanged.emit(N)
 
     def getLabelY(self, label: str):
         """ get the vertical position value of speciftied label """
-        view = self.firstViewMap[label]
-        return view.y() - self.vBoxLayout.contentsMargins().top()
+        y = self.groupY(self.firstGroupMap[label])
+        return y - self.margins.top()
 
     def showAlbumInfoEditDialog(self, singer: str, album: str):
         """ show album information edit dialog box """
-        self.albumCardViews[0].showAlbumInfoEditDialog(singer, album)
+        albumInfo = self.library.getAlbumInfo(
+            singer, album)
+        if not albumInfo:
+            return
+
+        # create thread and dialog box
+        thread = SaveAlbumInfoThread(self)
+        w = AlbumInfoEditDialog(albumInfo, self.window())
+
+        # connect signal to slot
+        w.saveInfoSig.connect(thread.setAlbumInfo)
+        w.saveInfoSig.connect(thread.start)
+        thread.saveFinishedSignal.connect(w.onSaveComplete)
+        thread.saveFinishedSignal.connect(self.__onSaveAlbumInfoFinished)
+
+        # show dialog box
+        w.setStyle(QApplication.style())
+        w.exec_()
+
+    def __onSaveAlbumInfoFinished(self, oldAlbumInfo: AlbumInfo, newAlbumInfo: AlbumInfo, coverPath: str):
+        """ save album information """
+        self.sender().quit()
+        self.sender().wait()
+        self.sender().deleteLater()
+        signalBus.editAlbumInfoSig.emit(oldAlbumInfo, newAlbumInfo, coverPath)
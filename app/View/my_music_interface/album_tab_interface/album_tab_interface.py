@@ -30,11 +30,12 @@ class AlbumTabInterface(AlbumSelectionModeInterface):
         )
         self.vBox.setContentsMargins(0, 0, 0, 0)
 
-    def updateWindow(self, albumInfos: List[AlbumInfo]):
+    def updateWindow(self, albumInfos: List[AlbumInfo], scrollToTop=True):
         """ update window """
         self.albumCardView.updateAllAlbumCards(albumInfos)
         self.adjustScrollHeight()
-        self.verticalScrollBar().setValue(0)
+        if scrollToTop:
+            self.verticalScrollBar().setValue(0)
 
     def setSortMode(self, sortMode: str):
         """ sort album cards
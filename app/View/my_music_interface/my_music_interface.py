@@ -73,9 +73,9 @@ class MyMusicInterface(QWidget):
         if index == 0:
             randomPlayButton.setNumber(self.songListWidget.songCardNum)
         elif index == 1:
-            randomPlayButton.setNumber(len(self.singerCardView.singerCards))
+            randomPlayButton.setNumber(len(self.singerCardView.singerInfos))
         elif index == 2:
-            randomPlayButton.setNumber(len(self.albumCardView.albumCards))
+            randomPlayButton.setNumber(len(self.albumCardView.albumInfos))
 
     def deleteSongs(self, songPaths: List[str]):
         """ delete songs """
@@ -161,11 +161,20 @@ class MyMusicInterface(QWidget):
         """ scroll to the position specified by label """
         self.stackedWidget.currentWidget().scrollToLabel(label)
 
-    def updateWindow(self):
-        """ update window """
+    def updateWindow(self, scrollToTop=True):
+        """ update window
+
+        Parameters
+        ----------
+        scrollToTop: bool
+            whether to scroll the album and singer tab interface to the top,
+            set it to `False` to merge the new loaded library chunks smoothly
+        """
         self.songTabInterface.updateWindow(self.library.songInfos)
-        self.singerTabInterface.updateWindow(self.library.singerInfos)
-        self.albumTabInterface.updateWindow(self.library.albumInfos)
+        self.singerTabInterface.updateWindow(
+            self.library.singerInfos, scrollToTop)
+        self.albumTabInterface.updateWindow(
+            self.library.albumInfos, scrollToTop)
 
     def __connectSignalToSlot(self):
         """ connect signal to slot """
@@ -21,11 +21,12 @@ class SingerTabInterface(SingerSelectionModeInterface):
         )
         self.vBox.setContentsMargins(0, 0, 0, 0)
 
-    def updateWindow(self, singerInfos: List[SingerInfo]):
+    def updateWindow(self, singerInfos: List[SingerInfo], scrollToTop=True):
         """ update window """
         self.singerCardView.updateAllSingerCards(singerInfos)
         self.adjustScrollHeight()
-        self.verticalScrollBar().setValue(0)
+        if scrollToTop:
+            self.verticalScrollBar().setValue(0)
 
     def scrollToLabel(self, label: str):
         """ scroll to the position specified by label """
@@ -3,10 +3,11 @@ import re
 
 from common.picture import Cover
 from common.database.entity import SongInfo
+from common.thumbnail import thumbnailCache
 from components.widgets.label import FadeInLabel
 from components.widgets.perspective_widget import PerspectiveWidget
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal
-from PyQt5.QtGui import QFont, QFontMetrics, QPainter, QPixmap
+from PyQt5.QtGui import QFont, QFontMetrics, QPainter
 from PyQt5.QtWidgets import QWidget
 
 
@@ -40,6 +41,8 @@ class SongInfoCard(PerspectiveWidget):
         if not self.songInfo:
             self.hide()
 
+        thumbnailCache.thumbnailReady.connect(self.__onThumbnailReady)
+
     def __setSongInfo(self, songInfo: SongInfo):
         """ set song information """
         self.songInfo = songInfo
@@ -85,9 +88,23 @@ class SongInfoCard(PerspectiveWidget):
 
         self.albumChanged.emit(coverPath)
         self.coverPath = coverPath
-        self.albumCoverLabel.setPixmap(QPixmap(coverPath).scaled(
+        self.__setCoverPixmap()
+
+    def __setCoverPixmap(self):
+        """ set the thumbnail of album cover, it's updated once the thumbnail is loaded """
+        pixmap = thumbnailCache.thumbnail(self.coverPath, 115)
+        self.albumCoverLabel.setPixmap(pixmap.scaled(
             115, 115, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation))
 
+    def __onThumbnailReady(self, path: str, size: int):
+        if path != self.coverPath:
+            return
+
+        # keep the opacity of fade in animation
+        opacity = self.albumCoverLabel.opacity
+        self.__setCoverPixmap()
+        self.albumCoverLabel.setOpacity(opacity)
+
 
 class ScrollTextWindow(QWidget):
     """ Scroll text window """
@@ -174,15 +174,15 @@ class SongListWidget(ListWidget):
 
     def updateOneSongCard(self, newSongInfo: SongInfo):
         """ update a song card """
-        for i, songInfo in enumerate(self.songInfos):
-            if songInfo.file == newSongInfo.file:
-                self.songInfos[i] = newSongInfo
-                self.songCards[i].updateSongCard(newSongInfo)
+        self.updateMultiSongCards([newSongInfo])
 
     def updateMultiSongCards(self, songInfos: List[SongInfo]):
         """ update multi song cards """
-        for songInfo in songInfos:
-            self.updateOneSongCard(songInfo)
+        songInfoMap = {i.file: i for i in songInfos}
+        for i, songInfo in enumerate(self.songInfos):
+            if songInfo.file in songInfoMap:
+                self.songInfos[i] = songInfoMap[songInfo.file]
+                self.songCards[i].updateSongCard(self.songInfos[i])
 
     def appendOneSongCard(self, songInfo: SongInfo):
         """ append a song card """
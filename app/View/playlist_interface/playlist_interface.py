@@ -129,11 +129,7 @@ class PlaylistInterface(SongSelectionModeInterface):
         self.playlistName = self.playlist.name
 
     def _onDelete(self):
-        songInfos = []
-        for songCard in self.songListWidget.checkedSongCards.copy():
-            songCard.setChecked(False)
-            songInfos.append(songCard.songInfo)
-            self.songListWidget.removeSongCard(songCard.itemIndex)
+        songInfos = self.songListWidget.removeCheckedSongCards()
 
         self.playlistInfoBar.updateWindow(self.playlist)
         self.adjustScrollHeight()
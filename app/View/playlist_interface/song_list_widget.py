@@ -83,9 +83,9 @@ class SongListWidget(NoScrollSongListWidget):
 
         self.playSignal.emit(index)
 
-    def __onRemoveButtonClicked(self, index, songCard=None):
+    def __onRemoveButtonClicked(self, index, songInfo=None):
         """ remove button clicked slot """
-        songInfo = songCard.songInfo if songCard else self.sender().songInfo
+        songInfo = songInfo or self.sender().songInfo
         self.removeSongCard(index)
         self.removeSongSignal.emit(songInfo)
 
@@ -109,13 +109,13 @@ class SongListWidget(NoScrollSongListWidget):
         menu.nextSongAct.triggered.connect(
             lambda: signalBus.nextToPlaySig.emit([self.currentSongInfo]))
         menu.deleteAct.triggered.connect(
-            lambda: self.__onRemoveButtonClicked(self.currentRow(), self.currentSongCard))
+            lambda: self.__onRemoveButtonClicked(self.currentRow(), self.currentSongInfo))
         menu.selectAct.triggered.connect(
-            lambda: self.currentSongCard.setChecked(True))
+            lambda: self.setSongCardChecked(self.currentRow(), True))
         menu.showAlbumAct.triggered.connect(
             lambda: signalBus.switchToAlbumInterfaceSig.emit(
-                self.currentSongCard.album,
-                self.currentSongCard.singer
+                self.currentSongInfo.album,
+                self.currentSongInfo.singer
             )
         )
 
@@ -74,12 +74,13 @@ class RecentPlayInterface(SongSelectionModeInterface):
         signalBus.playCheckedSig.emit(songInfos)
 
     def _onDelete(self):
-        if len(self.songListWidget.checkedSongCards) > 1:
+        songInfos = self.songListWidget.checkedSongInfos
+        if len(songInfos) > 1:
             title = self.tr("Are you sure you want to delete these?")
             content = self.tr(
                 "If you delete these songs, they will no longer in the list, but won't be deleted.")
         else:
-            name = self.songListWidget.checkedSongCards[0].songName
+            name = songInfos[0].title
             title = self.tr("Are you sure you want to delete this?")
             content = self.tr("If you delete") + f' "{name}" ' + \
                 self.tr("it will no longer in the list, but won't be deleted.")
@@ -88,12 +89,8 @@ class RecentPlayInterface(SongSelectionModeInterface):
         if not w.exec():
             return
 
-        files = [i.songPath for i in self.songListWidget.checkedSongCards]
-
-        for songCard in self.songListWidget.checkedSongCards.copy():
-            songCard.setChecked(False)
-            self.songListWidget.removeSongCard(songCard.itemIndex)
-
+        songInfos = self.songListWidget.removeCheckedSongCards()
+        files = [i.file for i in songInfos]
         self.library.recentPlayController.deleteBatch(files)
 
     def __addRecentPlay(self, songInfo: SongInfo):
@@ -39,7 +39,7 @@ class RecentSongListWidget(SongListWidget):
 
     def prependOneSongCard(self, songInfo: SongInfo):
         super().prependOneSongCard(songInfo)
-        self.songCardNumChanged.emit(len(self.songCards))
+        self.songCardNumChanged.emit(self.songCardNum)
 
     def setPlayBySongInfo(self, songInfo: SongInfo):
         self.cancelState()
@@ -2,13 +2,14 @@
 from typing import List
 
 from common.config import config
-from common.crawler import KuWoMusicCrawler, SongQuality
+from common.crawler import SongQuality
 from common.database.entity import SongInfo
 from common.icon import getIconColor
 from common.library import Library
 from common.signal_bus import signalBus
 from common.style_sheet import setStyleSheet
 from common.thread.download_song_thread import DownloadSongThread
+from common.thread.searcher import searcher
 from components.widgets.scroll_area import ScrollArea
 from components.widgets.tool_tip import DownloadStateToolTip
 from PyQt5.QtCore import pyqtSignal
@@ -24,6 +25,8 @@ from .song_group_box import SongGroupBox
 class SearchResultInterface(ScrollArea):
     """ Search result interface """
 
+    localSearchFinished = pyqtSignal()
+
     def __init__(self, library: Library, parent=None):
         """
         Parameters
@@ -60,7 +63,6 @@ class SearchResultInterface(ScrollArea):
         self.localSongListWidget = self.localSongGroupBox.songListWidget
         self.onlineSongListWidget = self.onlineSongGroupBox.songListWidget
 
-        self.crawler = KuWoMusicCrawler()
         self.totalOnlineSongs = 0
 
         self.downloadSongThread = DownloadSongThread(self)
@@ -147,47 +149,30 @@ class SearchResultInterface(ScrollArea):
         self.downloadStateTooltip = None
 
     def search(self, keyWord: str):
-        """ search local songs, albums, playlist and online songs """
+        """ search local songs, albums, playlist and online songs in background,
+        the results are shown once they are ready """
         self.keyWord = keyWord
-
-        # match singer information
-        self.singerInfos = self.library.singerInfoController.getSingerInfosLike(
-            singer=keyWord
-        )
-
-        # match album information
-        self.albumInfos = self.library.albumInfoController.getAlbumInfosLike(
-            singer=keyWord,
-            album=keyWord
-        )
-
-        # match local song information
-        self.localSongInfos = self.library.songInfoController.getSongInfosLike(
-            file=keyWord,
-            title=keyWord,
-            singer=keyWord,
-            album=keyWord
-        )
-
-        # match local playlist
-        self.playlists = self.library.playlistController.getPlaylistsLike(
-            name=keyWord,
-            singer=keyWord,
-            album=keyWord
-        )
-
-        # search online songs
         self.currentPage = 1
-        pageSize = config.get(config.onlinePageSize)
-        if pageSize > 0:
-            self.onlineSongInfos, self.totalOnlineSongs = self.crawler.getSongInfos(
-                keyWord, 1, pageSize)
-        else:
-            self.onlineSongInfos = []
+        self.playlists = {}
+        self.albumInfos = []
+        self.singerInfos = []
+        self.localSongInfos = []
+        self.onlineSongInfos = []
+        self.totalOnlineSongs = 0
 
-        # update window
         self.titleLabel.setText(f'"{keyWord}"'+self.tr('Search Result'))
         self.titleLabel.adjustSize()
+        searcher.search(keyWord, config.get(config.onlinePageSize))
+
+    def __onLocalResultReady(self, keyWord: str, singerInfos: list, albumInfos: list,
+                             songInfos: list, playlists: list):
+        """ local search finished slot """
+        self.singerInfos = singerInfos
+        self.albumInfos = albumInfos
+        self.localSongInfos = songInfos
+        self.playlists = playlists
+
+        # update window
         self.singerGroupBox.updateWindow(self.singerInfos)
         self.albumGroupBox.updateWindow(self.albumInfos)
         self.playlistGroupBox.updateWindow(self.playlists)
@@ -197,6 +182,15 @@ class SearchResultInterface(ScrollArea):
         self.__adjustHeight()
         self.__updateWidgetsVisible()
         self.verticalScrollBar().setValue(0)
+        self.localSearchFinished.emit()
+
+    def __onOnlineResultReady(self, keyWord: str, songInfos: list, total: int):
+        """ online search finished slot """
+        self.onlineSongInfos = songInfos
+        self.totalOnlineSongs = total
+        self.onlineSongGroupBox.updateWindow(self.onlineSongInfos[:5])
+        self.__adjustHeight()
+        self.__updateWidgetsVisible()
 
     def __adjustHeight(self):
         """ adjust window height """
@@ -272,3 +266,7 @@ class SearchResultInterface(ScrollArea):
 
         # down thread signal
         self.downloadSongThread.finished.connect(self.__onDownloadAllComplete)
+
+        # searcher signal
+        searcher.localResultReady.connect(self.__onLocalResultReady)
+        searcher.onlineResultReady.connect(self.__onOnlineResultReady)
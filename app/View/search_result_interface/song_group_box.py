@@ -118,8 +118,8 @@ class LocalSongListWidget(NoScrollSongListWidget):
         menu.showPropertyAct.triggered.connect(self.showSongPropertyDialog)
         menu.showAlbumAct.triggered.connect(
             lambda: signalBus.switchToAlbumInterfaceSig.emit(
-                self.currentSongCard.singer,
-                self.currentSongCard.album
+                self.currentSongInfo.singer,
+                self.currentSongInfo.album
             )
         )
 
@@ -5,7 +5,7 @@ from common.translator import Translator
 from components.app_bar import AppBarButtonFactory as BF
 from components.app_bar import CollapsingAppBarBase
 from PyQt5.QtCore import QObject, Qt
-from PyQt5.QtGui import QColor, QPalette, QPixmap
+from PyQt5.QtGui import QColor, QPalette
 from PyQt5.QtWidgets import QLabel
 
 
@@ -49,7 +49,7 @@ class SingerInfoBar(CollapsingAppBarBase):
 
     def updateCover(self, coverPath: str):
         """ update cover """
-        self.coverLabel.setPixmap(QPixmap(coverPath))
+        self.coverLabel.setImagePath(coverPath)
         self.blurLabel.updateWindow(coverPath, 8)
         self.__adjustBlurLabel()
         self.blurLabel.show()
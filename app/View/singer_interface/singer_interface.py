@@ -85,7 +85,7 @@ class SingerInterface(AlbumSelectionModeInterface):
         """ get all song information of singer """
         albums = [i.album for i in self.albumInfos]
         singers = [self.singer]*len(albums)
-        songInfos = self.library.songInfoController.getSongInfosBySingerAlbum(
+        songInfos = self.library.getSongInfosBySingerAlbum(
             singers, albums)
         return songInfos
 
@@ -7,6 +7,10 @@ cacheFolder = Path(config.get(config.cacheFolder))
 dbPath = cacheFolder / "cache.db"
 lyricFolder = cacheFolder / "Lyric"
 albumCoverFolder = cacheFolder / "AlbumCover"
+albumCoverStoreFolder = cacheFolder / "AlbumCoverStore"
 lastPlaylistFolder = cacheFolder / "LastPlaylist"
 singerAvatarFolder = cacheFolder / "SingerAvatar"
-crawlAlbumCoverFolder = cacheFolder / "CrawlAlbumCover"
\ No newline at end of file
+crawlAlbumCoverFolder = cacheFolder / "CrawlAlbumCover"
+thumbnailFolder = cacheFolder / "Thumbnail"
+coverEffectFolder = cacheFolder / "CoverEffect"
+responseCachePath = cacheFolder / "response_cache.db"
@@ -272,6 +272,10 @@ class Config(Singleton, QObject):
     cacheFolder = ConfigItem(
         "Folders", "CacheFolder", Path(QStandardPaths.writableLocation(QStandardPaths.AppLocalDataLocation))/APP_NAME, FolderValidator(), restart=True)
 
+    # library
+    scanWorkers = RangeConfigItem(
+        "Library", "ScanWorkers", 0, RangeValidator(0, 64))    # 0 means using all cpu cores
+
     # online
     onlineSongQuality = OptionsConfigItem(
         "Online", "SongQuality", SongQuality.STANDARD, OptionsValidator(SongQuality), EnumSerializer(SongQuality))
@@ -279,6 +283,10 @@ class Config(Singleton, QObject):
         "Online", "PageSize", 30, RangeValidator(0, 50))
     onlineMvQuality = OptionsConfigItem(
         "Online", "MvQuality", MvQuality.FULL_HD, OptionsValidator(MvQuality), EnumSerializer(MvQuality))
+    connectTimeout = RangeConfigItem(
+        "Online", "ConnectTimeout", 5, RangeValidator(1, 60))      # seconds
+    readTimeout = RangeConfigItem(
+        "Online", "ReadTimeout", 15, RangeValidator(1, 300))       # seconds
 
     # main window
     enableAcrylicBackground = ConfigItem(
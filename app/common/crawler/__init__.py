@@ -1,9 +1,11 @@
 from enum import Enum
 
 from .crawler_base import CrawlerBase, MvQuality, SongQuality
+from .http_client import HttpClient, httpClient
 from .kugou_music_crawler import KuGouMusicCrawler
 from .kuwo_music_crawler import KuWoFakeSongUrl, KuWoMusicCrawler
 from .qq_music_crawler import QQMusicCrawler
+from .response_cache import ResponseCache, responseCache
 from .wanyi_music_crawler import WanYiMusicCrawler
 
 
@@ -4,7 +4,6 @@ from enum import Enum
 from pathlib import Path
 from typing import List, Tuple
 
-import requests
 from common.quality import MvQuality, SongQuality
 from common.picture import Cover
 from common.database.entity import AlbumInfo, SingerInfo, SongInfo
@@ -12,6 +11,7 @@ from common.meta_data.writer import MetaDataWriter
 from fuzzywuzzy import fuzz
 
 from .exception_handler import exceptionHandler
+from .http_client import httpClient
 
 
 
@@ -485,11 +485,9 @@ class CrawlerBase:
         return best_infos[matches.index(max(matches))]
 
     def send_request(self, url: str, *, method='get', data=None, params=None, headers=None, cookies=None, **kwargs):
-        """ send request """
-        response = requests.request(
-            method, url, data=data, params=params, headers=headers, cookies=cookies, **kwargs)
-        response.raise_for_status()
-        return response
+        """ send request with the shared http client, the concurrent requests of each crawler are limited """
+        return httpClient.request(
+            method, url, self.name, data=data, params=params, headers=headers, cookies=cookies, **kwargs)
 
 
 class AudioQualityError(Exception):
@@ -1,9 +1,17 @@
 # coding:utf-8
 from copy import deepcopy
+from threading import local
 from ..logger import Logger
 
 
 logger = Logger('crawler')
+_state = local()
+
+
+def errorCount() -> int:
+    """ the number of exceptions handled in current thread, it's used to tell
+    the default value returned on error apart from the real result """
+    return getattr(_state, "count", 0)
 
 
 def exceptionHandler(*default):
@@ -22,6 +30,7 @@ def exceptionHandler(*default):
                 return func(*args, **kwargs)
             except BaseException as e:
                 logger.error(f"{e.__class__.__name__}: {e}")
+                _state.count = errorCount() + 1
                 value = deepcopy(default)
                 if len(value) == 0:
                     return None
@@ -0,0 +1,136 @@
+# coding:utf-8
+from threading import BoundedSemaphore, Lock
+from typing import Dict, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ..config import config
+
+
+class HttpClient:
+    """ HTTP client shared by all crawlers
+
+    The connections are kept alive in the per-host pools of a shared session,
+    idempotent requests are retried with backoff on connection errors and
+    server errors, and the concurrent requests of each provider are limited.
+    """
+
+    def __init__(self, poolSize=10, retries=3, backoff=0.5, concurrency=4):
+        """
+        Parameters
+        ----------
+        poolSize: int
+            maximum number of connections kept alive for each host
+
+        retries: int
+            maximum number of retries of idempotent requests
+
+        backoff: float
+            backoff factor of retries, the n-th retry sleeps `backoff * 2^(n-1)` seconds
+
+        concurrency: int
+            maximum number of concurrent requests of each provider
+        """
+        self.concurrency = concurrency
+        self.semaphores = {}    # type:Dict[str, BoundedSemaphore]
+        self.lock = Lock()
+
+        # POST isn't in the default allowed methods of `Retry`, so it's never retried
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=poolSize, pool_maxsize=poolSize, max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        """ connect timeout and read timeout in seconds """
+        return config.get(config.connectTimeout), config.get(config.readTimeout)
+
+    def request(self, method: str, url: str, provider: str = None, **kwargs) -> requests.Response:
+        """ send request
+
+        Parameters
+        ----------
+        method: str
+            request method, e.g. `get` and `post`
+
+        url: str
+            request url
+
+        provider: str
+            the provider whose concurrent requests are limited, use the host of url if it's `None`
+
+        **kwargs:
+            other parameters of `requests.request()`
+
+        Returns
+        -------
+        response: Response
+            the response of request
+
+        Raises
+        ------
+        RequestException:
+            thrown when the request fails or the status code isn't 2xx
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        with self.__semaphore(provider or urlparse(url).hostname):
+            response = self.session.request(method, url, **kwargs)
+
+        response.raise_for_status()
+        return response
+
+    def download(self, url: str, savePath: str, provider: str = None, chunkSize=1 << 16, **kwargs):
+        """ download file, the response is streamed to file instead of being held in memory
+
+        Parameters
+        ----------
+        url: str
+            file url
+
+        savePath: str
+            save path of file
+
+        provider: str
+            the provider whose concurrent requests are limited, use the host of url if it's `None`
+
+        chunkSize: int
+            size of chunk written to file
+
+        **kwargs:
+            other parameters of `requests.request()`
+
+        Raises
+        ------
+        RequestException:
+            thrown when the request fails or the status code isn't 2xx
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        with self.__semaphore(provider or urlparse(url).hostname):
+            with self.session.get(url, stream=True, **kwargs) as response:
+                response.raise_for_status()
+                with open(savePath, "wb") as f:
+                    for chunk in response.iter_content(chunkSize):
+                        f.write(chunk)
+
+    def __semaphore(self, provider: str) -> BoundedSemaphore:
+        """ get the semaphore limiting concurrent requests of provider """
+        with self.lock:
+            if provider not in self.semaphores:
+                self.semaphores[provider] = BoundedSemaphore(self.concurrency)
+
+            return self.semaphores[provider]
+
+
+httpClient = HttpClient()
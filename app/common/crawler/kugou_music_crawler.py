@@ -5,12 +5,12 @@ from hashlib import md5
 from time import time
 from typing import List, Tuple
 
-import requests
 from common.database.entity import SongInfo
 
 from .crawler_base import (AudioQualityError, CrawlerBase, MvQuality,
                            SongQuality, VideoQualityError)
 from .exception_handler import exceptionHandler
+from .response_cache import cached
 
 
 class KuGouMusicCrawler(CrawlerBase):
@@ -98,6 +98,7 @@ class KuGouMusicCrawler(CrawlerBase):
         return song_infos, total
 
     @exceptionHandler([], 0)
+    @cached('search')
     def getSongInfos(self, key_word: str, page_num=1, page_size=10) -> Tuple[List[SongInfo], int]:
         # send request for song information
         url = 'https://complexsearch.kugou.com/v2/search/song'
@@ -172,6 +173,7 @@ class KuGouMusicCrawler(CrawlerBase):
         return self.saveSong(song_info, save_dir, '.mp3', response.content)
 
     @exceptionHandler('')
+    @cached('lyric')
     def getLyric(self, key_word: str) -> str:
         song_info = self.getSongInfo(key_word)
         if not song_info:
@@ -180,6 +182,7 @@ class KuGouMusicCrawler(CrawlerBase):
         return self.getSongDetails(song_info['fileHash'], song_info['albumID']).get('lyrics')
 
     @exceptionHandler([], 0)
+    @cached('mv')
     def getMvInfos(self, key_word: str, page_num=1, page_size=10) -> Tuple[List[dict], int]:
         # send request for MV information
         url = 'https://complexsearch.kugou.com/v1/search/mv'
@@ -1,5 +1,6 @@
 # coding:utf-8
 import json
+import os
 from enum import Enum
 from typing import List, Tuple
 from urllib import parse
@@ -11,6 +12,7 @@ from common.url import FakeUrl
 from .crawler_base import (AudioQualityError, CrawlerBase, MvQuality,
                            SongQuality)
 from .exception_handler import exceptionHandler
+from .response_cache import cached
 from .kuwo_url_decoder import decode_song_url, decode_mv_url
 
 
@@ -36,6 +38,7 @@ class KuWoMusicCrawler(CrawlerBase):
         }
 
     @exceptionHandler([], 0)
+    @cached('search')
     def getSongInfos(self, key_word: str, page_num=1, page_size=10) -> Tuple[List[SongInfo], int]:
         key_word = parse.quote(key_word)
 
@@ -91,6 +94,7 @@ class KuWoMusicCrawler(CrawlerBase):
         return url
 
     @exceptionHandler('')
+    @cached('details')
     def getSongDetailsUrl(self, key_word: str):
         song_info = self.getSongInfo(key_word)
         if not song_info:
@@ -122,6 +126,7 @@ class KuWoMusicCrawler(CrawlerBase):
         return song_infos, total
 
     @exceptionHandler('')
+    @cached('avatar', os.path.exists)
     def getSingerAvatar(self, singer):
         singer_ = parse.quote(singer)
 
@@ -136,6 +141,7 @@ class KuWoMusicCrawler(CrawlerBase):
         return Avatar(singer).save(response.content)
 
     @exceptionHandler()
+    @cached('lyric')
     def getLyric(self, key_word: str) -> list:
         song_info = self.getSongInfo(key_word)
         if not song_info:
@@ -149,6 +155,7 @@ class KuWoMusicCrawler(CrawlerBase):
         return json.loads(response.text)['data']['lrclist']
 
     @exceptionHandler([], 0)
+    @cached('mv')
     def getMvInfos(self, key_word: str, page_num=1, page_size=10) -> Tuple[List[dict], int]:
         key_word = parse.quote(key_word)
 
@@ -4,12 +4,12 @@ import json
 from pathlib import Path
 from typing import Union
 
-import requests
 from common.database.entity import SongInfo
 from common.url import FakeUrl
 
 from .crawler_base import CrawlerBase, MvQuality, VideoQualityError
 from .exception_handler import exceptionHandler
+from .response_cache import cached
 
 
 class QQMusicCrawler(CrawlerBase):
@@ -37,6 +37,7 @@ class QQMusicCrawler(CrawlerBase):
         }
 
     @exceptionHandler([], 0)
+    @cached('search')
     def getSongInfos(self, key_word: str, page_num=1, page_size=10):
         infos = self.__search(key_word, "song", page_num, page_size)
         song_infos = []
@@ -99,11 +100,12 @@ class QQMusicCrawler(CrawlerBase):
         url = json.loads(response.text[18:-1])["data"]["headpiclist"][0]["picurl"]
 
         with open(save_path, 'wb') as f:
-            f.write(requests.get(url, headers=self.headers).content)
+            f.write(self.send_request(url, headers=self.headers).content)
 
         return url
 
     @exceptionHandler('')
+    @cached('lyric')
     def getLyric(self, key_word: str):
         song_info = self.getSongInfo(key_word)
         if not song_info:
@@ -116,6 +118,7 @@ class QQMusicCrawler(CrawlerBase):
         return base64.b64decode(lyric).decode('utf-8')
 
     @exceptionHandler([], 0)
+    @cached('mv')
     def getMvInfos(self, key_word: str, page_num=1, page_size=10):
         infos = self.__search(key_word, "mv", page_num, page_size)
 
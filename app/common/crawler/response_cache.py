@@ -0,0 +1,193 @@
+# coding:utf-8
+import os
+import pickle
+import sqlite3
+from functools import wraps
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import Callable, Tuple, Union
+
+from ..cache import responseCachePath
+from .exception_handler import errorCount
+
+
+class ResponseCache:
+    """ On-disk cache of crawler results
+
+    The results are keyed by crawler, method and arguments, and stored in a
+    size-bounded SQLite database with a time to live per kind. Empty results
+    such as "not found" are cached with a shorter time to live, while the
+    default values returned on network errors are never cached.
+    """
+
+    # kind: time to live of result in seconds
+    ttls = {
+        "search": 6 * 3600,
+        "details": 7 * 86400,
+        "lyric": 7 * 86400,
+        "avatar": 30 * 86400,
+        "mv": 86400,
+    }
+
+    def __init__(self, path: Union[str, Path] = responseCachePath, maxSize=32 << 20, negativeTtl=3600):
+        """
+        Parameters
+        ----------
+        path: str | Path
+            database path, `:memory:` means the cache isn't persisted
+
+        maxSize: int
+            the maximum total size of cached results in bytes, the results
+            expiring earliest are removed when it's exceeded
+
+        negativeTtl: float
+            time to live of empty results in seconds
+        """
+        self.path = str(path)
+        self.maxSize = maxSize
+        self.negativeTtl = negativeTtl
+        self.size = None
+        self.lock = Lock()
+        self._connection = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """ the database connection shared by threads, it's created on first use """
+        if self._connection is None:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS tbl_response(
+                    key TEXT PRIMARY KEY,
+                    value BLOB,
+                    expire REAL,
+                    size INTEGER
+                )
+            """)
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_response_expire ON tbl_response(expire)")
+            self._connection = connection
+
+        return self._connection
+
+    def get(self, key: str) -> Tuple[bool, object]:
+        """ get the cached result
+
+        Returns
+        -------
+        hit: bool
+            whether the result is cached and not expired
+
+        value:
+            the cached result, `None` if it's not hit
+        """
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT value FROM tbl_response WHERE key = ? AND expire > ?", (key, time())).fetchone()
+
+        if row is None:
+            return False, None
+
+        try:
+            return True, pickle.loads(row[0])
+        except Exception:
+            return False, None
+
+    def put(self, key: str, value, ttl: float):
+        """ cache the result for `ttl` seconds """
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self.lock, self.connection:
+            connection = self.connection
+            if self.size is None:
+                self.size = connection.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM tbl_response").fetchone()[0]
+
+            # the replaced row no longer takes up space
+            row = connection.execute(
+                "SELECT size FROM tbl_response WHERE key = ?", (key,)).fetchone()
+            if row:
+                self.size -= row[0]
+
+            connection.execute(
+                "INSERT OR REPLACE INTO tbl_response VALUES (?, ?, ?, ?)", (key, data, time() + ttl, len(data)))
+            self.size += len(data)
+
+            if self.size > self.maxSize:
+                self.__trim()
+
+    def clear(self):
+        """ remove all cached results """
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM tbl_response")
+            self.size = 0
+
+    def cached(self, kind: str, isValid: Callable[[object], bool] = None):
+        """ decorator which caches the result of crawler method
+
+        Parameters
+        ----------
+        kind: str
+            kind of result, which decides the time to live, e.g. `search` and `avatar`
+
+        isValid: Callable
+            check whether the cached non-empty result can be used, e.g. the downloaded
+            file still exists
+        """
+        ttl = self.ttls[kind]
+
+        def outer(func):
+
+            @wraps(func)
+            def inner(crawler, *args, **kwargs):
+                key = f"{crawler.name}.{func.__name__}:{args!r}:{sorted(kwargs.items())!r}"
+                hit, value = self.get(key)
+                if hit and (self.isEmpty(value) or not isValid or isValid(value)):
+                    return value
+
+                # the default value returned on error isn't the real result
+                count = errorCount()
+                value = func(crawler, *args, **kwargs)
+                if errorCount() == count:
+                    self.put(key, value, self.negativeTtl if self.isEmpty(value) else ttl)
+
+                return value
+
+            return inner
+
+        return outer
+
+    @staticmethod
+    def isEmpty(value) -> bool:
+        """ whether the result means "not found", e.g. `None`, `''` and `([], 0)` """
+        if isinstance(value, tuple) and value:
+            return not value[0]
+
+        return not value
+
+    def __trim(self):
+        """ remove the expired results and the results expiring earliest until
+        the total size drops to 3/4 of the maximum size """
+        connection = self.connection
+        connection.execute("DELETE FROM tbl_response WHERE expire <= ?", (time(),))
+
+        size = 0
+        limit = self.maxSize * 3 // 4
+        rows = connection.execute(
+            "SELECT key, size FROM tbl_response ORDER BY expire DESC").fetchall()
+        for i, (_, n) in enumerate(rows):
+            if size + n > limit:
+                connection.executemany(
+                    "DELETE FROM tbl_response WHERE key = ?", [(k,) for k, _ in rows[i:]])
+                break
+
+            size += n
+
+        self.size = size
+
+
+responseCache = ResponseCache()
+cached = responseCache.cached
@@ -1,11 +1,11 @@
 # coding:utf-8
 import base64
 import json
+import os
 import random
 from datetime import datetime
 from typing import List, Tuple
 
-import requests
 from common.picture import Avatar
 from common.database.entity import AlbumInfo, SingerInfo, SongInfo
 from common.url import FakeUrl
@@ -16,6 +16,7 @@ from fuzzywuzzy import fuzz
 from .crawler_base import (AudioQualityError, CrawlerBase, MvQuality,
                            SongQuality, VideoQualityError)
 from .exception_handler import exceptionHandler
+from .response_cache import cached
 
 
 class WanYiMusicCrawler(CrawlerBase):
@@ -53,6 +54,7 @@ class WanYiMusicCrawler(CrawlerBase):
 
     # TODO: can only get the first 20 search results
     @exceptionHandler([], 0)
+    @cached('search')
     def getSongInfos(self, key_word: str, page_num=1, page_size=10) -> Tuple[List[SongInfo], int]:
         # send request for song information
         text = self.__cloudSearch(key_word, 'song', page_num, page_size)
@@ -124,6 +126,7 @@ class WanYiMusicCrawler(CrawlerBase):
         return play_urls
 
     @exceptionHandler('')
+    @cached('details')
     def getSongDetailsUrl(self, key_word: str):
         # search song information
         song_infos, _ = self.getSongInfos(key_word, page_size=20)
@@ -141,6 +144,7 @@ class WanYiMusicCrawler(CrawlerBase):
         return f'https://music.163.com/#/song?id={WanYiFakeSongUrl.getId(url)}'
 
     @exceptionHandler([], 0)
+    @cached('search')
     def getAlbumInfos(self, key_word: str, page_num=1, page_size=10) -> Tuple[List[AlbumInfo], int]:
         # send request for album information
         text = self.__cloudSearch(key_word, 'album', page_num, page_size)
@@ -161,6 +165,7 @@ class WanYiMusicCrawler(CrawlerBase):
         return album_infos, data['albumCount']
 
     @exceptionHandler('')
+    @cached('details')
     def getAlbumDetailsUrl(self, key_word: str):
         album_infos, _ = self.getAlbumInfos(key_word, 1, 20)
         if not album_infos:
@@ -177,6 +182,7 @@ class WanYiMusicCrawler(CrawlerBase):
         return f'https://music.163.com/#/album?id={id}'
 
     @exceptionHandler([], 0)
+    @cached('search')
     def getSingerInfos(self, key_word: str, page_num=1, page_size=10) -> Tuple[List[SingerInfo], int]:
         # send request for singer information
         text = self.__cloudSearch(key_word, 'singer', page_num, page_size)
@@ -194,6 +200,7 @@ class WanYiMusicCrawler(CrawlerBase):
         return singer_infos, data['artistCount']
 
     @exceptionHandler('')
+    @cached('details')
     def getSingerDetailsUrl(self, key_word: str):
         singer_infos, _ = self.getSingerInfos(key_word, 1, 20)
         if not singer_infos:
@@ -210,6 +217,7 @@ class WanYiMusicCrawler(CrawlerBase):
         return f'https://music.163.com/#/artist?id={id}'
 
     @exceptionHandler()
+    @cached('lyric')
     def getLyric(self, key_word: str):
         song_info = self.getSongInfo(key_word)
         if not song_info:
@@ -233,6 +241,7 @@ class WanYiMusicCrawler(CrawlerBase):
         return lyrics
 
     @exceptionHandler('')
+    @cached('avatar', os.path.exists)
     def getSingerAvatar(self, singer: str):
         # send request for singer information
         url = "https://music.163.com/weapi/cloudsearch/get/web"
@@ -248,14 +257,14 @@ class WanYiMusicCrawler(CrawlerBase):
             return ''
 
         # send request for avatar
-        response = requests.get(
+        response = self.send_request(
             data[0]['img1v1Url']+'?param=300y300', headers=self.headers)
-        response.raise_for_status()
 
         # save avatar
         return Avatar(singer).save(response.content)
 
     @exceptionHandler([], 0)
+    @cached('mv')
     def getMvInfos(self, key_word: str, page_num=1, page_size=10) -> Tuple[List[dict], int]:
         text = self.__cloudSearch(key_word, 'video', page_num, page_size)
 
@@ -389,8 +398,8 @@ class WanYiMusicCrawler(CrawlerBase):
         """
         headers = headers or self.headers
         form_data = self.encryptor.encrypt(str(form_data))
-        response = requests.post(url, form_data, headers=headers)
-        response.raise_for_status()
+        response = self.send_request(
+            url, method='post', data=form_data, headers=headers)
         return response.text
 
 
@@ -1 +1,2 @@
-from .db_initializer import DBInitializer
\ No newline at end of file
+from .db_initializer import DBInitializer
+from .db_migrator import DBMigrator
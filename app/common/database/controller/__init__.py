@@ -1,6 +1,10 @@
+from .aggregation_controller import AggregationController
 from .album_cover_controller import AlbumCoverController
 from .album_info_controller import AlbumInfoController
+from .picture_controller import PictureController
 from .playlist_controller import PlaylistController
 from .recent_play_controller import RecentPlayController
 from .singer_info_controller import SingerInfoController
+from .snapshot_controller import SnapshotController
 from .song_info_controller import SongInfoController
+from .sort_key_controller import SortKeyController
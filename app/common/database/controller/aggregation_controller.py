@@ -0,0 +1,257 @@
+# coding:utf-8
+from typing import Dict, List, Set, Tuple
+
+from common.meta_data.reader import SongInfoReader
+from PyQt5.QtSql import QSqlDatabase
+
+from ..entity import AlbumInfo, SingerInfo, SongInfo
+from ..service import AlbumInfoService, SingerInfoService
+from ..utils import UUIDUtils
+
+
+class AggregationController:
+    """ Incremental album and singer information aggregation controller
+
+    The songs of each album are indexed in memory by `(singer, album)`, so a
+    song change only re-aggregates the affected albums and singers, and only
+    the changed rows are written to database.
+    """
+
+    def __init__(self, db: QSqlDatabase = None):
+        self.albumInfoService = AlbumInfoService(db)
+        self.singerInfoService = SingerInfoService(db)
+        self.albumSongInfos = {}    # type:Dict[Tuple[str, str], Dict[str, SongInfo]]
+        self.albumInfos = {}        # type:Dict[Tuple[str, str], AlbumInfo]
+        self.singerAlbums = {}      # type:Dict[str, Set[Tuple[str, str]]]
+        self.singerInfos = {}       # type:Dict[str, SingerInfo]
+        self.isBuilt = False
+
+    def build(self, songInfos: List[SongInfo], albumInfos: List[AlbumInfo], singerInfos: List[SingerInfo]):
+        """ build the indexes from the information in library
+
+        Parameters
+        ----------
+        songInfos: List[SongInfo]
+            song information list
+
+        albumInfos: List[AlbumInfo]
+            album information list
+
+        singerInfos: List[SingerInfo]
+            singer information list
+        """
+        self.albumSongInfos.clear()
+        for songInfo in songInfos:
+            key = (songInfo.singer, songInfo.album)
+            self.albumSongInfos.setdefault(key, {})[songInfo.file] = songInfo
+
+        self.albumInfos = {(i.singer, i.album): i for i in albumInfos}
+        self.singerInfos = {i.singer: i for i in singerInfos}
+
+        self.singerAlbums.clear()
+        for singer, album in self.albumInfos:
+            self.singerAlbums.setdefault(singer, set()).add((singer, album))
+
+        self.isBuilt = True
+
+    def invalidate(self):
+        """ mark the indexes as out of date, they should be built again before used """
+        self.isBuilt = False
+
+    def update(self, added: List[SongInfo] = None, removed: List[SongInfo] = None, override=False):
+        """ apply the song information changes to the album and singer information
+
+        Parameters
+        ----------
+        added: List[SongInfo]
+            song information added to library
+
+        removed: List[SongInfo]
+            song information removed from library, the old song information
+            should be passed here when a song is edited
+
+        override: bool
+            whether the year and genre of `added` songs take precedence over
+            the current values of their albums, used when songs are edited
+
+        Returns
+        -------
+        albumInfos: List[AlbumInfo]
+            album information list sorted by modified time, not contain song information
+
+        singerInfos: List[SingerInfo]
+            singer information list
+        """
+        added = added or []
+        removed = removed or []
+        albumKeys = {}  # type:Dict[Tuple[str, str], None]
+
+        for songInfo in removed:
+            key = (songInfo.singer, songInfo.album)
+            self.albumSongInfos.get(key, {}).pop(songInfo.file, None)
+            albumKeys[key] = None
+
+        for songInfo in added:
+            key = (songInfo.singer, songInfo.album)
+            self.albumSongInfos.setdefault(key, {})[songInfo.file] = songInfo
+            albumKeys[key] = None
+
+        preferredFiles = {i.file for i in added} if override else set()
+        singers = self.__updateAlbumInfos(list(albumKeys), preferredFiles)
+        self.__updateSingerInfos(singers)
+
+        albumInfos = sorted(
+            self.albumInfos.values(),
+            key=lambda i: i.modifiedTime,
+            reverse=True
+        )
+        singerInfos = [self.singerInfos[i] for i in dict.fromkeys(
+            i.singer for i in albumInfos) if i in self.singerInfos]
+
+        return albumInfos, singerInfos
+
+    def __updateAlbumInfos(self, keys: List[Tuple[str, str]], preferredFiles: Set[str]) -> List[str]:
+        """ aggregate the affected albums and update database
+
+        Returns
+        -------
+        singers: List[str]
+            singers whose album information changed
+        """
+        defaultGenre = SongInfoReader().genre
+        addedAlbumInfos = []    # type:List[AlbumInfo]
+        expiredAlbumInfos = []  # type:List[AlbumInfo]
+        removedIds = []
+        singers = {}
+
+        for key in keys:
+            singer, album = key
+            songInfos = list(self.albumSongInfos.get(key, {}).values())
+            oldAlbumInfo = self.albumInfos.get(key)
+
+            if not songInfos:
+                self.albumSongInfos.pop(key, None)
+                if oldAlbumInfo:
+                    self.albumInfos.pop(key)
+                    self.singerAlbums[singer].discard(key)
+                    if oldAlbumInfo.id:
+                        removedIds.append(oldAlbumInfo.id)
+                    singers[singer] = None
+
+                continue
+
+            # the edited songs decide the year and genre of album
+            songInfos.sort(key=lambda i: (
+                i.file not in preferredFiles, -i.createTime))
+            isOverride = songInfos[0].file in preferredFiles
+
+            albumInfo = AlbumInfo(
+                id=oldAlbumInfo.id if oldAlbumInfo else None,
+                singer=singer,
+                album=album,
+                modifiedTime=max(i.createTime for i in songInfos)
+            )
+            if oldAlbumInfo and not isOverride:
+                albumInfo.year = oldAlbumInfo.year
+                albumInfo.genre = oldAlbumInfo.genre
+
+            for songInfo in songInfos:
+                year = songInfo.year
+                genre = songInfo.genre
+
+                if not albumInfo.year and year:
+                    albumInfo.year = year
+
+                if (not albumInfo.genre and genre) or (
+                        albumInfo.genre == defaultGenre and genre != defaultGenre):
+                    albumInfo.genre = genre
+
+            if oldAlbumInfo and albumInfo.id and self.__isSameAlbum(oldAlbumInfo, albumInfo):
+                continue
+
+            self.albumInfos[key] = albumInfo
+            self.singerAlbums.setdefault(singer, set()).add(key)
+            singers[singer] = None
+
+            if albumInfo.id:
+                expiredAlbumInfos.append(albumInfo)
+                continue
+
+            # the temporary album information created during loading has no id
+            cacheAlbumInfo = self.albumInfoService.findBy(
+                singer=singer, album=album)
+            if cacheAlbumInfo:
+                albumInfo.id = cacheAlbumInfo.id
+                expiredAlbumInfos.append(albumInfo)
+            else:
+                albumInfo.id = UUIDUtils.getUUID()
+                addedAlbumInfos.append(albumInfo)
+
+        # update database
+        self.albumInfoService.removeByIds(removedIds)
+        self.albumInfoService.modifyByIds(expiredAlbumInfos)
+        self.albumInfoService.addBatch(addedAlbumInfos)
+
+        return list(singers)
+
+    def __updateSingerInfos(self, singers: List[str]):
+        """ aggregate the affected singers and update database """
+        defaultGenre = SongInfoReader().genre
+        addedSingerInfos = []    # type:List[SingerInfo]
+        expiredSingerInfos = []  # type:List[SingerInfo]
+        removedIds = []
+
+        for singer in singers:
+            albumInfos = sorted(
+                (self.albumInfos[i] for i in self.singerAlbums.get(singer, [])),
+                key=lambda i: i.modifiedTime,
+                reverse=True
+            )
+            oldSingerInfo = self.singerInfos.get(singer)
+
+            if not albumInfos:
+                self.singerAlbums.pop(singer, None)
+                if oldSingerInfo:
+                    self.singerInfos.pop(singer)
+                    if oldSingerInfo.id:
+                        removedIds.append(oldSingerInfo.id)
+
+                continue
+
+            singerInfo = SingerInfo(
+                id=oldSingerInfo.id if oldSingerInfo else None,
+                singer=singer,
+                genre=oldSingerInfo.genre if oldSingerInfo else None
+            )
+            for albumInfo in albumInfos:
+                genre = albumInfo.genre
+                if (not singerInfo.genre and genre) or (
+                        singerInfo.genre == defaultGenre and genre != defaultGenre):
+                    singerInfo.genre = genre
+
+            if oldSingerInfo and singerInfo.id and oldSingerInfo.genre == singerInfo.genre:
+                continue
+
+            self.singerInfos[singer] = singerInfo
+
+            if singerInfo.id:
+                expiredSingerInfos.append(singerInfo)
+                continue
+
+            cacheSingerInfo = self.singerInfoService.findBy(singer=singer)
+            if cacheSingerInfo:
+                singerInfo.id = cacheSingerInfo.id
+                expiredSingerInfos.append(singerInfo)
+            else:
+                singerInfo.id = UUIDUtils.getUUID()
+                addedSingerInfos.append(singerInfo)
+
+        # update database
+        self.singerInfoService.removeByIds(removedIds)
+        self.singerInfoService.modifyByIds(expiredSingerInfos)
+        self.singerInfoService.addBatch(addedSingerInfos)
+
+    @staticmethod
+    def __isSameAlbum(old: AlbumInfo, new: AlbumInfo):
+        return (old.year, old.genre, old.modifiedTime) == (
+            new.year, new.genre, new.modifiedTime)
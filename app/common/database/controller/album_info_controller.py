@@ -94,7 +94,13 @@ class AlbumInfoController:
 
         return albumInfos
 
-    def getAlbumInfo(self, singer: str, album: str):
+    def getCachedAlbumInfos(self) -> List[AlbumInfo]:
+        """ get all album information in cache without updating database """
+        albumInfos = self.albumInfoService.listAll()
+        albumInfos.sort(key=lambda i: i.modifiedTime, reverse=True)
+        return albumInfos
+
+    def getAlbumInfo(self, singer: str, album: str, songInfos: List[SongInfo] = None):
         """ get an album information from the database
 
         Paramters
@@ -105,6 +111,9 @@ class AlbumInfoController:
         album: str
             album name
 
+        songInfos: List[SongInfo]
+            song information of album, they are queried from database if it's `None`
+
         Returns
         -------
         albumInfo: AlbumInfo
@@ -114,8 +123,10 @@ class AlbumInfoController:
         if not albumInfo:
             return None
 
-        albumInfo.songInfos = self.songInfoService.listBySingerAlbum(
-            singer, album)
+        if songInfos is None:
+            songInfos = self.songInfoService.listBySingerAlbum(singer, album)
+
+        albumInfo.songInfos = songInfos
 
         albumInfo.songInfos.sort(key=lambda i: i.track or 0)
         return albumInfo
@@ -141,6 +152,10 @@ class AlbumInfoController:
         """ fuzzy search album information """
         return self.albumInfoService.listLike(**condition)
 
+    def searchAlbumInfos(self, keyWord: str, limit: int = None):
+        """ full-text search album information, the results are sorted by relevance """
+        return self.albumInfoService.search(keyWord, limit)
+
     def updateBySongInfo(self, old: SongInfo, new: SongInfo):
         """ update album information by song information, you should call
         this function after updating song info table
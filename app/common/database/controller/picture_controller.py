@@ -0,0 +1,47 @@
+# coding:utf-8
+from common.picture import Avatar, Cover, Picture
+from PyQt5.QtSql import QSqlDatabase
+
+from ..service import PictureInfoService
+
+
+class PictureController:
+    """ Album cover and singer avatar index controller """
+
+    def __init__(self, db: QSqlDatabase = None):
+        self.pictureInfoService = PictureInfoService(db)
+
+    def loadIndex(self, rebuild=True):
+        """ load the picture index from database, the picture folders are
+        scanned if the index hasn't been persisted or is out of date
+
+        Parameters
+        ----------
+        rebuild: bool
+            whether to scan the picture folders if the index needs rebuilding, the
+            index is left unloaded if it's `False`, and pictures are looked up in folders
+        """
+        if Picture.index.isLoaded:
+            return
+
+        pictureInfos = self.pictureInfoService.listAll()
+
+        # the cache folder may be moved to another place
+        folders = (str(Cover.parentFolder), str(Cover.storeFolder), str(Avatar.parentFolder))
+        if not pictureInfos or not all(i.path.startswith(folders) for i in pictureInfos):
+            if not rebuild:
+                return
+
+            pictureInfos = Cover.scan() + Avatar.scan()
+            Cover.removeUnreferenced(pictureInfos)
+            self.pictureInfoService.clearTable()
+            self.pictureInfoService.addBatch(pictureInfos)
+
+        Picture.index.load(pictureInfos)
+
+    def saveIndex(self) -> bool:
+        """ persist the changes of picture index """
+        added, removed = Picture.index.takeChanges()
+        s1 = self.pictureInfoService.removeByIds(removed) if removed else True
+        s2 = self.pictureInfoService.addBatch(added) if added else True
+        return s1 and s2
@@ -43,6 +43,10 @@ class PlaylistController:
         """ fuzzy search playlist """
         return self.playlistService.listLike(**condition)
 
+    def searchPlaylists(self, keyWord: str, limit: int = None):
+        """ full-text search playlists, the results are sorted by relevance """
+        return self.playlistService.search(keyWord, limit)
+
     def create(self, playlist: Playlist):
         """ create a playlist """
         return self.playlistService.add(playlist)
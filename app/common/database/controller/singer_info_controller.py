@@ -69,6 +69,10 @@ class SingerInfoController:
 
         return list(currentSingerInfos.values())
 
+    def getCachedSingerInfos(self) -> List[SingerInfo]:
+        """ get all singer information in cache without updating database """
+        return self.singerInfoService.listAll()
+
     def getSingerInfos(self, albumInfos: List[AlbumInfo]) -> List[SingerInfo]:
         """ get singer information from album information and update database
 
@@ -114,3 +118,7 @@ class SingerInfoController:
     def getSingerInfosLike(self, **condition):
         """ fuzzy search album information """
         return self.singerInfoService.listLike(**condition)
+
+    def searchSingerInfos(self, keyWord: str, limit: int = None):
+        """ full-text search singer information, the results are sorted by relevance """
+        return self.singerInfoService.search(keyWord, limit)
@@ -0,0 +1,158 @@
+# coding:utf-8
+import os
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List
+
+from common.meta_data.reader import SongInfoReader
+from PyQt5.QtSql import QSqlDatabase
+
+from ..entity import DirectorySnapshot, FileSnapshot
+from ..service import SnapshotService
+
+
+class SnapshotController:
+    """ Directory snapshot controller """
+
+    def __init__(self, db: QSqlDatabase = None):
+        self.snapshotService = SnapshotService(db)
+
+    def scan(self, directories: List[str]) -> List[FileSnapshot]:
+        """ scan audio directories recursively and update the snapshots in database,
+        the directory whose modified time is unchanged will not be listed again, but
+        the files in it are still stated because editing file doesn't change it
+
+        Parameters
+        ----------
+        directories: List[str]
+            root audio directories
+
+        Returns
+        -------
+        snapshots: List[FileSnapshot]
+            snapshots of all audio files in the directories
+        """
+        # get all snapshots from database
+        cacheDirs = {i.path: i for i in self.snapshotService.listAllDirectories()}
+        cacheSubDirs = defaultdict(list)    # type:Dict[str, List[str]]
+        for snapshot in cacheDirs.values():
+            cacheSubDirs[snapshot.parent or ''].append(snapshot.path)
+
+        cacheFiles = defaultdict(list)      # type:Dict[str, List[FileSnapshot]]
+        for snapshot in self.snapshotService.listAllFiles():
+            cacheFiles[snapshot.directory].append(snapshot)
+
+        visited = set()
+        fileSnapshots = {}          # type:Dict[str, FileSnapshot]
+        expiredDirs = []            # type:List[DirectorySnapshot]
+        expiredFiles = []           # type:List[FileSnapshot]
+        modifiedFiles = []          # type:List[FileSnapshot]
+        stack = [(self.__adjustPath(i), '') for i in directories or []]
+
+        while stack:
+            path, parent = stack.pop()
+            if path in visited:
+                continue
+
+            try:
+                mtime = os.stat(path).st_mtime
+            except OSError:
+                continue
+
+            visited.add(path)
+            snapshot = cacheDirs.get(path)
+
+            if snapshot and snapshot.mtime == mtime and (snapshot.parent or '') == parent:
+                files = self.__statFiles(cacheFiles[path], modifiedFiles)
+                subDirs = cacheSubDirs[path]
+            else:
+                files, subDirs = self.__scanDir(path)
+                expiredDirs.append(DirectorySnapshot(path, parent, mtime))
+                expiredFiles.extend(files)
+
+            for file in files:
+                fileSnapshots[file.file] = file
+
+            stack.extend((i, path) for i in subDirs)
+
+        # update database
+        removedDirs = [i for i in cacheDirs if i not in visited]
+        self.snapshotService.removeDirectories(removedDirs)
+        self.snapshotService.replaceDirectories(expiredDirs, expiredFiles)
+        if modifiedFiles:
+            self.snapshotService.updateFiles(modifiedFiles)
+
+        return list(fileSnapshots.values())
+
+    def getDirectoryTree(self, snapshots: List[FileSnapshot]) -> Dict[Path, List[Path]]:
+        """ get the audio files of each scanned directory
+
+        Parameters
+        ----------
+        snapshots: List[FileSnapshot]
+            file snapshots returned by `scan()`
+
+        Returns
+        -------
+        tree: Dict[Path, List[Path]]
+            directory path: audio file paths, the directories without audio files are included
+        """
+        tree = {Path(i.path): [] for i in self.snapshotService.listAllDirectories()}
+        for snapshot in snapshots:
+            tree.setdefault(Path(snapshot.directory), []).append(Path(snapshot.file))
+
+        return tree
+
+    @staticmethod
+    def __statFiles(snapshots: List[FileSnapshot], modifiedFiles: List[FileSnapshot]) -> List[FileSnapshot]:
+        """ update the snapshots of files in an unchanged directory, the modified
+        snapshots are appended to `modifiedFiles` """
+        files = []
+        for snapshot in snapshots:
+            try:
+                stat = os.stat(snapshot.file)
+            except OSError:
+                continue
+
+            if stat.st_mtime != snapshot.mtime or stat.st_size != snapshot.size:
+                snapshot.mtime = stat.st_mtime
+                snapshot.size = stat.st_size
+                snapshot.inode = stat.st_ino
+                modifiedFiles.append(snapshot)
+
+            files.append(snapshot)
+
+        return files
+
+    def __scanDir(self, path: str):
+        """ list the audio files and sub directories of a directory """
+        files = []
+        subDirs = []
+        formats = tuple(SongInfoReader.formats)
+
+        try:
+            entries = list(os.scandir(path))
+        except OSError:
+            return files, subDirs
+
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subDirs.append(self.__adjustPath(entry.path))
+                elif entry.is_file() and entry.name.lower().endswith(formats):
+                    stat = entry.stat()
+                    files.append(FileSnapshot(
+                        file=self.__adjustPath(entry.path),
+                        directory=path,
+                        size=stat.st_size,
+                        mtime=stat.st_mtime,
+                        inode=stat.st_ino
+                    ))
+            except OSError:
+                continue
+
+        return files, subDirs
+
+    @staticmethod
+    def __adjustPath(path) -> str:
+        return os.path.abspath(path).replace('\\', '/')
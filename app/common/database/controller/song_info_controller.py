@@ -1,8 +1,9 @@
 # coding:utf-8
 from pathlib import Path
-from typing import List, Union
+from typing import Dict, Iterator, List, Union
 
-from common.meta_data.reader import SongInfoReader
+from common.config import config
+from common.meta_data.reader import ParallelSongInfoReader
 from PyQt5.QtSql import QSqlDatabase
 
 from ..entity import SongInfo
@@ -14,8 +15,9 @@ class SongInfoController:
 
     def __init__(self, db: QSqlDatabase = None):
         self.songInfoService = SongInfoService(db)
+        self.reader = ParallelSongInfoReader(config.get(config.scanWorkers))
 
-    def getSongInfosFromCache(self, files: List[Path]):
+    def getSongInfosFromCache(self, files: List[Path], mtimes: Dict[Path, int] = None, removed: List[str] = None):
         """ get song information from cache and update database
 
         Parameters
@@ -23,11 +25,45 @@ class SongInfoController:
         files: List[Path]
             path of audio files
 
+        mtimes: Dict[Path, int]
+            modified time of audio files, `stat()` will be called if it's `None`
+
+        removed: List[str]
+            list which collects the files removed from cache
+
         Returns
         -------
         songInfos: List[SongInfo]
             song information list
         """
+        songInfos = []  # type:List[SongInfo]
+        for chunk in self.iterSongInfosFromCache(files, mtimes, removed):
+            songInfos.extend(chunk)
+
+        songInfos.sort(key=lambda i: i.createTime, reverse=True)
+        return songInfos
+
+    def iterSongInfosFromCache(self, files: List[Path], mtimes: Dict[Path, int] = None,
+                               removed: List[str] = None) -> Iterator[List[SongInfo]]:
+        """ get song information from cache chunk by chunk and update database
+
+        Parameters
+        ----------
+        files: List[Path]
+            path of audio files
+
+        mtimes: Dict[Path, int]
+            modified time of audio files, `stat()` will be called if it's `None`
+
+        removed: List[str]
+            list which collects the files removed from cache
+
+        Yields
+        ------
+        songInfos: List[SongInfo]
+            the first chunk contains the cached song information which is still valid,
+            the rest chunks contain song information read from expired or new files
+        """
         # get all song information from database
         cacheSongInfos = self.songInfoService.listAll()
         cacheSongInfoMap = {Path(i.file): i for i in cacheSongInfos}
@@ -38,28 +74,36 @@ class SongInfoController:
         commonFiles = currentFiles & cacheFiles
         removedFiles = cacheFiles - currentFiles
 
-        reader = SongInfoReader()
-        songInfos = []          # type:List[SongInfo]
-        expiredSongInfos = []   # type:List[SongInfo]
+        songInfos = []      # type:List[SongInfo]
+        expiredFiles = []   # type:List[Path]
         for file in commonFiles:
             songInfo = cacheSongInfoMap[file]
-            if songInfo.modifiedTime == int(file.stat().st_mtime):
+            mtime = mtimes[file] if mtimes is not None else int(file.stat().st_mtime)
+            if songInfo.modifiedTime == mtime:
                 songInfos.append(songInfo)
             else:
-                songInfo = reader.read(file)
-                songInfos.append(songInfo)
-                expiredSongInfos.append(songInfo)
+                expiredFiles.append(file)
 
-        newSongInfos = [reader.read(i) for i in addedFiles]
-        songInfos.extend(newSongInfos)
-        songInfos.sort(key=lambda i: i.createTime, reverse=True)
+        removedFiles = [str(i).replace('\\', '/') for i in removedFiles]
+        self.songInfoService.removeByIds(removedFiles)
+        if removed is not None:
+            removed.extend(removedFiles)
+
+        yield songInfos
+
+        # update database once a chunk is read
+        for chunk in self.reader.iterBatches(expiredFiles):
+            self.songInfoService.modifyByIds(chunk)
+            yield chunk
 
-        # update database
-        self.songInfoService.modifyByIds(expiredSongInfos)
-        self.songInfoService.addBatch(newSongInfos)
-        self.songInfoService.removeByIds(
-            [str(i).replace('\\', '/') for i in removedFiles])
+        for chunk in self.reader.iterBatches(addedFiles):
+            self.songInfoService.addBatch(chunk)
+            yield chunk
 
+    def getCachedSongInfos(self) -> List[SongInfo]:
+        """ get all song information in cache without scanning audio files """
+        songInfos = self.songInfoService.listAll()
+        songInfos.sort(key=lambda i: i.createTime, reverse=True)
         return songInfos
 
     def getSongInfosBySingers(self, singers: List[str]):
@@ -107,10 +151,13 @@ class SongInfoController:
         """ fuzzy search song information """
         return self.songInfoService.listLike(**condition)
 
+    def searchSongInfos(self, keyWord: str, limit: int = None):
+        """ full-text search song information, the results are sorted by relevance """
+        return self.songInfoService.search(keyWord, limit)
+
     def addSongInfos(self, files: List[Path]):
         """ add song information to database """
-        reader = SongInfoReader()
-        songInfos = [reader.read(i) for i in files]
+        songInfos = self.reader.read(files)
         songInfos.sort(key=lambda i: i.createTime, reverse=True)
 
         # 更新数据库
@@ -133,5 +180,4 @@ class SongInfoController:
 
     def getSongInfosFromFile(self, files: List[Union[str, Path]]):
         """ get song information from files and do not operate the database """
-        reader = SongInfoReader()
-        return [reader.read(i) for i in files]
+        return self.reader.read(files)
@@ -0,0 +1,33 @@
+# coding:utf-8
+from typing import List
+
+from common.sort_key import sortKeyIndex
+from PyQt5.QtSql import QSqlDatabase
+
+from ..entity import AlbumInfo, Playlist, SingerInfo, SongInfo
+from ..service import SortKeyService
+
+
+class SortKeyController:
+    """ Sort key controller """
+
+    def __init__(self, db: QSqlDatabase = None):
+        self.sortKeyService = SortKeyService(db)
+
+    def loadIndex(self):
+        """ load the sort keys persisted in database """
+        if not sortKeyIndex.isLoaded:
+            sortKeyIndex.load(self.sortKeyService.listAll())
+
+    def update(self, songInfos: List[SongInfo] = None, albumInfos: List[AlbumInfo] = None,
+               singerInfos: List[SingerInfo] = None, playlists: List[Playlist] = None):
+        """ compute the sort keys of song titles, albums, singers and playlist names """
+        sortKeyIndex.add(i.title for i in songInfos or [])
+        sortKeyIndex.add(i.album for i in albumInfos or [])
+        sortKeyIndex.add(i.singer for i in singerInfos or [])
+        sortKeyIndex.add(i.name for i in playlists or [])
+
+    def saveIndex(self) -> bool:
+        """ persist the new sort keys """
+        sortKeys = sortKeyIndex.takeChanges()
+        return self.sortKeyService.addBatch(sortKeys) if sortKeys else True
@@ -1,5 +1,9 @@
 from .album_info_dao import AlbumInfoDao
+from .picture_info_dao import PictureInfoDao
 from .playlist_dao import PlaylistDao, SongPlaylistDao
 from .recent_play_dao import RecentPlayDao
+from .search_index_dao import SearchIndexDao
 from .singer_info_dao import SingerInfoDao
+from .snapshot_dao import DirectorySnapshotDao, FileSnapshotDao
 from .song_info_dao import SongInfoDao, PlaylistSongInfoDao
+from .sort_key_dao import SortKeyDao
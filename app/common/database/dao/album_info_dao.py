@@ -10,6 +10,7 @@ class AlbumInfoDao(DaoBase):
 
     table = 'tbl_album_info'
     fields = ['id', 'singer', 'album', 'year', 'genre', 'modifiedTime']
+    searchKind = 'album'
 
     def createTable(self):
         success = self.query.exec(f"""
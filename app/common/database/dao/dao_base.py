@@ -1,9 +1,13 @@
 # coding:utf-8
-from typing import List
+import sqlite3
+from contextlib import closing
+from dataclasses import fields, is_dataclass
+from typing import Callable, List, Sequence
 
 from PyQt5.QtSql import QSqlDatabase, QSqlRecord
 
 from ..entity import Entity, EntityFactory
+from ..utils import SearchUtils
 from .sql_query import SqlQuery
 
 
@@ -23,6 +27,7 @@ class DaoBase:
 
     table = ''
     fields = ['id']
+    searchKind = ''     # kind of records in the full-text search index
 
     def __init__(self, db: QSqlDatabase = None):
         self.setDatabase(db)
@@ -92,6 +97,45 @@ class DaoBase:
 
         return self.iterRecords()
 
+    def search(self, keyWord: str, limit: int = None) -> List[Entity]:
+        """ full-text search records, the search index should be refreshed before searching
+
+        Parameters
+        ----------
+        keyWord: str
+            key word to search, the last word of key word is used as prefix
+
+        limit: int
+            the maximum number of records, `None` means no limit
+
+        Returns
+        -------
+        entities: List[Entity]
+            entity instances sorted by relevance, empty if no records are found
+        """
+        match = SearchUtils.toMatchQuery(keyWord)
+        if not self.searchKind or not match:
+            return []
+
+        # the title is more relevant than singer and album, file name is the least relevant
+        sql = f"""
+            SELECT s.* FROM tbl_search_index f
+            JOIN tbl_search_document d ON d.id = f.rowid
+            JOIN {self.table} s ON s.{self.fields[0]} = d.key
+            WHERE tbl_search_index MATCH ? AND d.kind = ?
+            ORDER BY bm25(tbl_search_index, 10, 5, 5, 1)
+        """
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+
+        self.query.prepare(sql)
+        self.query.addBindValue(match)
+        self.query.addBindValue(self.searchKind)
+        if not self.query.exec():
+            return []
+
+        return self.iterRecords()
+
     def _prepareSelectBy(self, condition: dict):
         """ prepare sql select statement
 
@@ -181,14 +225,85 @@ class DaoBase:
     @finishQuery
     def iterRecords(self) -> List[Entity]:
         """ iterate over all queried records """
+        query = self.query
+        record = query.record()
+        columns = range(record.count())
+        createEntity = self.entityCreator(
+            [record.fieldName(i) for i in columns])
+
+        # the column-to-field mapping is resolved once, values are read by position
+        value = query.value
         entities = []
+        while query.next():
+            entities.append(createEntity([value(i) for i in columns]))
 
-        while self.query.next():
-            entity = self.loadFromRecord(self.query.record())
-            entities.append(entity)
+        return entities
+
+    @classmethod
+    def listAllFromFile(cls, path: str, batchSize=1024) -> List[Entity]:
+        """ query all records with stdlib `sqlite3`, which doesn't need a
+        `QSqlDatabase` connection and can be used in worker threads
+
+        Parameters
+        ----------
+        path: str
+            path of database file
+
+        batchSize: int
+            number of rows fetched at a time
+
+        Returns
+        -------
+        entities: List[Entity]
+            entity instances, empty if no records are found
+        """
+        entities = []
+        with closing(sqlite3.connect(path)) as connection:
+            cursor = connection.execute(f"SELECT * FROM {cls.table}")
+            createEntity = cls.entityCreator([i[0] for i in cursor.description])
+
+            while True:
+                rows = cursor.fetchmany(batchSize)
+                if not rows:
+                    break
+
+                entities.extend(map(createEntity, rows))
 
         return entities
 
+    @classmethod
+    def entityCreator(cls, columns: List[str]) -> Callable[[Sequence], Entity]:
+        """ get a function which creates an entity from the values of a row
+
+        Parameters
+        ----------
+        columns: List[str]
+            column names of the queried rows
+
+        Returns
+        -------
+        createEntity: Callable[[Sequence], Entity]
+            function which accepts the row values in the order of `columns`
+        """
+        entityClass = EntityFactory.entityClass(cls.table)
+        names = [i.name for i in fields(entityClass)] if is_dataclass(entityClass) else []
+
+        # `SELECT *` returns columns in the same order as entity fields
+        if columns == names[:len(columns)]:
+            return lambda values: entityClass(*values)
+
+        if set(columns) <= set(names):
+            return lambda values: entityClass(**dict(zip(columns, values)))
+
+        def createEntity(values):
+            entity = entityClass()
+            for column, value in zip(columns, values):
+                entity[column] = value
+
+            return entity
+
+        return createEntity
+
     @finishQuery
     def update(self, id, field: str, value) -> bool:
         """ update the value of a field in a record
@@ -0,0 +1,20 @@
+# coding:utf-8
+from .dao_base import DaoBase
+
+
+class PictureInfoDao(DaoBase):
+    """ Picture information DAO """
+
+    table = 'tbl_picture_info'
+    fields = ['id', 'path', 'size', 'hash']
+
+    def createTable(self):
+        success = self.query.exec(f"""
+            CREATE TABLE IF NOT EXISTS {self.table}(
+                id TEXT PRIMARY KEY,
+                path TEXT,
+                size INTEGER,
+                hash TEXT
+            )
+        """)
+        return success
@@ -8,6 +8,7 @@ class PlaylistDao(DaoBase):
 
     table = 'tbl_playlist'
     fields = ['name', 'singer', 'album', 'count', 'modifiedTime']
+    searchKind = 'playlist'
 
     def createTable(self):
         success = self.query.exec(f"""
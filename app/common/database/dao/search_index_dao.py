@@ -0,0 +1,149 @@
+# coding:utf-8
+from pathlib import Path
+from typing import List
+
+from ..utils import SearchUtils
+from .dao_base import DaoBase, finishQuery
+
+
+class SearchIndexDao(DaoBase):
+    """ Full-text search index DAO
+
+    The FTS5 index covers song, album, singer and playlist tables. Triggers on
+    these tables record the changed keys in `tbl_search_index_change`, so the
+    index never misses a write path, and the changed rows are tokenized and
+    written to the index by `refresh()` before searching.
+    """
+
+    table = 'tbl_search_index'
+    fields = ['name', 'singer', 'album', 'file']
+
+    # search kind -> (table, primary key, columns mapped to the indexed fields)
+    sources = {
+        'song': ('tbl_song_info', 'file', ['title', 'singer', 'album', 'file']),
+        'album': ('tbl_album_info', 'id', ['album', 'singer', None, None]),
+        'singer': ('tbl_singer_info', 'id', ['singer', None, None, None]),
+        'playlist': ('tbl_playlist', 'name', ['name', 'singer', 'album', None]),
+    }
+
+    def __init__(self, db=None):
+        super().__init__(db)
+        self._isAvailable = None
+
+    @classmethod
+    def createStatements(cls) -> List[str]:
+        """ sql statements to create the index and the triggers """
+        statements = [
+            "CREATE TABLE IF NOT EXISTS tbl_search_document(id INTEGER PRIMARY KEY, kind TEXT, key TEXT, UNIQUE(kind, key))",
+            "CREATE TABLE IF NOT EXISTS tbl_search_index_change(kind TEXT, key TEXT, PRIMARY KEY(kind, key)) WITHOUT ROWID",
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {cls.table} USING fts5({', '.join(cls.fields)}, tokenize='unicode61', prefix='1 2')",
+        ]
+
+        for kind, (table, key, columns) in cls.sources.items():
+            mark = "INSERT OR IGNORE INTO tbl_search_index_change VALUES ('{}', {}.{});"
+            insert, delete = mark.format(kind, 'NEW', key), mark.format(kind, 'OLD', key)
+            columns = ', '.join([key] + [c for c in columns if c and c != key])
+            statements.extend([
+                f"CREATE TRIGGER IF NOT EXISTS trg_{table}_search_insert AFTER INSERT ON {table} BEGIN {insert} END",
+                f"CREATE TRIGGER IF NOT EXISTS trg_{table}_search_delete AFTER DELETE ON {table} BEGIN {delete} END",
+                f"CREATE TRIGGER IF NOT EXISTS trg_{table}_search_update AFTER UPDATE OF {columns} ON {table} BEGIN {delete} {insert} END",
+                f"INSERT OR IGNORE INTO tbl_search_index_change SELECT '{kind}', {key} FROM {table}",
+            ])
+
+        return statements
+
+    def isAvailable(self) -> bool:
+        """ whether the search index is created, it may be missing if SQLite isn't built with FTS5 """
+        if self._isAvailable is None:
+            sql = f"SELECT 1 FROM sqlite_master WHERE name = '{self.table}'"
+            self._isAvailable = self.query.exec(sql) and self.query.next()
+            self.query.finish()
+
+        return self._isAvailable
+
+    @finishQuery
+    def refresh(self) -> bool:
+        """ write the changed rows to index
+
+        Returns
+        -------
+        success: bool
+            whether the index is up to date
+        """
+        if not self.isAvailable():
+            return False
+
+        if not self.query.exec("SELECT 1 FROM tbl_search_index_change LIMIT 1"):
+            return False
+
+        if not self.query.next():
+            return True
+
+        # the changes are locked until they are written to index
+        self.query.finish()
+        if not self.query.exec("BEGIN IMMEDIATE"):
+            return False
+
+        if self.__refresh():
+            return self.query.exec("COMMIT")
+
+        self.query.exec("ROLLBACK")
+        return False
+
+    def __refresh(self) -> bool:
+        """ write the changed rows to index in transaction """
+        changed = "SELECT d.id FROM tbl_search_index_change c JOIN tbl_search_document d ON d.kind = c.kind AND d.key = c.key"
+        statements = [
+            "INSERT OR IGNORE INTO tbl_search_document(kind, key) SELECT kind, key FROM tbl_search_index_change",
+            f"DELETE FROM {self.table} WHERE rowid IN ({changed})",
+        ]
+        if not all(self.query.exec(sql) for sql in statements):
+            return False
+
+        for kind, (table, key, columns) in self.sources.items():
+            if not self.__refreshKind(kind, table, key, columns):
+                return False
+
+            # remove the documents of deleted rows
+            sql = f"""
+                DELETE FROM tbl_search_document WHERE kind = '{kind}'
+                AND key IN (SELECT key FROM tbl_search_index_change WHERE kind = '{kind}')
+                AND NOT EXISTS (SELECT 1 FROM {table} s WHERE s.{key} = tbl_search_document.key)
+            """
+            if not self.query.exec(sql):
+                return False
+
+        return self.query.exec("DELETE FROM tbl_search_index_change")
+
+    def __refreshKind(self, kind: str, table: str, key: str, columns: List[str]) -> bool:
+        """ index the changed rows of a table """
+        values = ', '.join(f"s.{c}" if c else "''" for c in columns)
+        sql = f"""
+            SELECT d.id, {values} FROM tbl_search_index_change c
+            JOIN tbl_search_document d ON d.kind = c.kind AND d.key = c.key
+            JOIN {table} s ON s.{key} = c.key
+            WHERE c.kind = '{kind}'
+        """
+        if not self.query.exec(sql):
+            return False
+
+        # only the file name is indexed, the directory shouldn't be matched
+        rows = [[] for _ in range(len(self.fields) + 1)]
+        value, segment = self.query.value, SearchUtils.segment
+        while self.query.next():
+            rows[0].append(value(0))
+            rows[1].append(segment(value(1)))
+            rows[2].append(segment(value(2)))
+            rows[3].append(segment(value(3)))
+            rows[4].append(segment(Path(value(4)).stem if value(4) else ''))
+
+        if not rows[0]:
+            return True
+
+        placeHolders = ','.join(['?'] * len(rows))
+        self.query.prepare(
+            f"INSERT INTO {self.table}(rowid, {', '.join(self.fields)}) VALUES ({placeHolders})")
+        for row in rows:
+            self.query.addBindValue(row)
+
+        return self.query.check(self.query.execBatch())
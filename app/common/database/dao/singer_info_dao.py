@@ -7,6 +7,7 @@ class SingerInfoDao(DaoBase):
 
     table = 'tbl_singer_info'
     fields = ['id', 'singer', 'genre']
+    searchKind = 'singer'
 
     def createTable(self):
         success = self.query.exec(f"""
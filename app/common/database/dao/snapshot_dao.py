@@ -0,0 +1,38 @@
+# coding:utf-8
+from .dao_base import DaoBase
+
+
+class DirectorySnapshotDao(DaoBase):
+    """ Directory snapshot DAO """
+
+    table = 'tbl_directory_snapshot'
+    fields = ['path', 'parent', 'mtime']
+
+    def createTable(self):
+        success = self.query.exec(f"""
+            CREATE TABLE IF NOT EXISTS {self.table}(
+                path TEXT PRIMARY KEY,
+                parent TEXT,
+                mtime REAL
+            )
+        """)
+        return success
+
+
+class FileSnapshotDao(DaoBase):
+    """ Audio file snapshot DAO """
+
+    table = 'tbl_file_snapshot'
+    fields = ['file', 'directory', 'size', 'mtime', 'inode']
+
+    def createTable(self):
+        success = self.query.exec(f"""
+            CREATE TABLE IF NOT EXISTS {self.table}(
+                file TEXT PRIMARY KEY,
+                directory TEXT,
+                size INTEGER,
+                mtime REAL,
+                inode INTEGER
+            )
+        """)
+        return success
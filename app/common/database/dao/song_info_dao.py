@@ -11,6 +11,7 @@ class SongInfoDao(DaoBase):
     table = 'tbl_song_info'
     fields = ['file', 'title', 'singer', 'album', 'year', 'genre', 'duration', 'track',
               'trackTotal', 'disc', 'discTotal', 'createTime', 'modifiedTime']
+    searchKind = 'song'
 
     def createTable(self):
         success = self.query.exec(f"""
@@ -97,3 +98,4 @@ class PlaylistSongInfoDao(SongInfoDao):
     """ Playlist song information DAO """
 
     table = "tbl_playlist_song_info"
+    searchKind = ''
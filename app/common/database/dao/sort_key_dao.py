@@ -0,0 +1,19 @@
+# coding:utf-8
+from .dao_base import DaoBase
+
+
+class SortKeyDao(DaoBase):
+    """ Sort key DAO """
+
+    table = 'tbl_sort_key'
+    fields = ['id', 'key', 'initials']
+
+    def createTable(self):
+        success = self.query.exec(f"""
+            CREATE TABLE IF NOT EXISTS {self.table}(
+                id TEXT PRIMARY KEY,
+                key TEXT,
+                initials TEXT
+            )
+        """)
+        return success
@@ -4,8 +4,10 @@ from common.cache import dbPath
 from PyQt5.QtSql import QSqlDatabase
 from PyQt5.QtWidgets import qApp
 
-from .service import (AlbumInfoService, PlaylistService, RecentPlayService,
-                      SingerInfoService, SongInfoService)
+from .db_migrator import DBMigrator
+from .service import (AlbumInfoService, PictureInfoService, PlaylistService,
+                      RecentPlayService, SingerInfoService, SnapshotService,
+                      SongInfoService, SortKeyService)
 
 
 class DBInitializer:
@@ -28,4 +30,9 @@ class DBInitializer:
         AlbumInfoService(db).createTable()
         SingerInfoService(db).createTable()
         PlaylistService(db).createTable()
-        RecentPlayService(db).createTable()
\ No newline at end of file
+        RecentPlayService(db).createTable()
+        SnapshotService(db).createTable()
+        PictureInfoService(db).createTable()
+        SortKeyService(db).createTable()
+
+        DBMigrator(db).migrate()
@@ -0,0 +1,77 @@
+# coding:utf-8
+from typing import List
+
+from common.logger import Logger
+from PyQt5.QtSql import QSqlDatabase
+
+from .dao.search_index_dao import SearchIndexDao
+from .dao.sql_query import SqlQuery
+
+
+class DBMigrator:
+    """ Database schema migrator
+
+    The schema version is stored in `PRAGMA user_version`, each migration
+    upgrades the schema by one version and is applied in a transaction.
+    """
+
+    logger = Logger("cache")
+
+    # the n-th migration upgrades the schema from version n to version n+1
+    migrations = [
+        [
+            "CREATE INDEX IF NOT EXISTS idx_song_info_singer_album ON tbl_song_info(singer, album)",
+            "CREATE INDEX IF NOT EXISTS idx_album_info_singer_album ON tbl_album_info(singer, album)",
+            "CREATE INDEX IF NOT EXISTS idx_singer_info_singer ON tbl_singer_info(singer)",
+            "CREATE INDEX IF NOT EXISTS idx_song_playlist_name_file ON tbl_song_playlist(name, file)",
+            "CREATE INDEX IF NOT EXISTS idx_song_playlist_file ON tbl_song_playlist(file)",
+            "CREATE INDEX IF NOT EXISTS idx_recent_play_last_played_time ON tbl_recent_play(lastPlayedTime)",
+            "CREATE INDEX IF NOT EXISTS idx_file_snapshot_directory ON tbl_file_snapshot(directory)",
+        ],
+        SearchIndexDao.createStatements(),
+    ]
+
+    def __init__(self, db: QSqlDatabase = None):
+        self.db = db or QSqlDatabase.database()
+        self.query = SqlQuery(self.db)
+
+    @classmethod
+    def latestVersion(cls) -> int:
+        """ the schema version after applying all migrations """
+        return len(cls.migrations)
+
+    def version(self) -> int:
+        """ get the schema version of database """
+        if not (self.query.exec("PRAGMA user_version") and self.query.next()):
+            return 0
+
+        version = self.query.value(0)
+        self.query.finish()
+        return version
+
+    def migrate(self) -> bool:
+        """ apply all pending migrations
+
+        Returns
+        -------
+        success: bool
+            whether all migrations are applied successfully
+        """
+        version = self.version()
+        for i, statements in enumerate(self.migrations[version:], version):
+            if not self.__apply(statements, i + 1):
+                self.logger.error(f"Failed to migrate database schema to version {i + 1}")
+                return False
+
+        return True
+
+    def __apply(self, statements: List[str], version: int) -> bool:
+        """ apply a migration in transaction """
+        self.db.transaction()
+
+        for sql in statements + [f"PRAGMA user_version = {version}"]:
+            if not self.query.exec(sql):
+                self.db.rollback()
+                return False
+
+        return self.db.commit()
@@ -1,16 +1,33 @@
-from .entity import Entity
+from .entity import Entity, SlotEntity
 from .song_info import SongInfo
 from .album_info import AlbumInfo
 from .singer_info import SingerInfo
 from .recent_play import RecentPlay
 from .playlist import Playlist, SongPlaylist
+from .snapshot import DirectorySnapshot, FileSnapshot
+from .picture_info import PictureInfo
+from .sort_key import SortKey
 
 
 class EntityFactory:
     """ Entity factory """
 
-    @staticmethod
-    def create(table: str):
+    tables = {
+        "tbl_song_info": SongInfo,
+        "tbl_album_info": AlbumInfo,
+        "tbl_singer_info": SingerInfo,
+        "tbl_playlist": Playlist,
+        "tbl_playlist_song_info": SongInfo,
+        "tbl_song_playlist": SongPlaylist,
+        "tbl_recent_play": RecentPlay,
+        "tbl_directory_snapshot": DirectorySnapshot,
+        "tbl_file_snapshot": FileSnapshot,
+        "tbl_picture_info": PictureInfo,
+        "tbl_sort_key": SortKey,
+    }
+
+    @classmethod
+    def create(cls, table: str):
         """ create an entity instance
 
         Parameters
@@ -23,16 +40,23 @@ class EntityFactory:
         entity:
             entity instance
         """
-        tables = {
-            "tbl_song_info": SongInfo,
-            "tbl_album_info": AlbumInfo,
-            "tbl_singer_info": SingerInfo,
-            "tbl_playlist": Playlist,
-            "tbl_playlist_song_info": SongInfo,
-            "tbl_song_playlist": SongPlaylist,
-            "tbl_recent_play": RecentPlay,
-        }
-        if table not in tables:
+        return cls.entityClass(table)()
+
+    @classmethod
+    def entityClass(cls, table: str):
+        """ get the entity class corresponding to table
+
+        Parameters
+        ----------
+        table: str
+            database table name corresponding to entity
+
+        Returns
+        -------
+        entityClass:
+            entity class
+        """
+        if table not in cls.tables:
             raise ValueError(f"Table name `{table}` is illegal")
 
-        return tables[table]()
+        return cls.tables[table]
@@ -1,12 +1,13 @@
 # coding:utf-8
 from typing import List
-from .entity import Entity
+from .entity import SlotEntity, slotted
 from .song_info import SongInfo
 from dataclasses import dataclass, field
 
 
+@slotted
 @dataclass
-class AlbumInfo(Entity):
+class AlbumInfo(SlotEntity):
     """ ALbum information """
 
     id: str = None
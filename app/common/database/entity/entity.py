@@ -1,18 +1,94 @@
 # coding:utf-8
-from copy import deepcopy
+from copy import copy, deepcopy
+from dataclasses import fields
 
 
 class Entity:
     """ Entity abstract class """
 
+    __slots__ = ()
+
     def __setitem__(self, key, value):
-        self.__dict__[key] = value
+        setattr(self, key, value)
 
     def __getitem__(self, key):
-        return self.__dict__[key]
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
 
     def get(self, key, default=None):
-        return self.__dict__.get(key, default)
+        return getattr(self, key, default)
 
     def copy(self):
         return deepcopy(self)
+
+
+class SlotEntity(Entity):
+    """ Entity whose fields are stored in `__slots__`
+
+    Keys which are not fields, such as `coverPath` and `albummid` of online
+    songs, are stored in an optional side dict created on first use.
+    """
+
+    __slots__ = ("_extras",)
+
+    def __setitem__(self, key, value):
+        try:
+            setattr(self, key, value)
+        except AttributeError:
+            if not hasattr(self, "_extras"):
+                self._extras = {}
+
+            self._extras[key] = value
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            pass
+
+        try:
+            return self._extras[key]
+        except (AttributeError, KeyError):
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def copy(self):
+        """ shallow copy, list fields and extra keys are copied one level """
+        entity = copy(self)
+        for name in self.__slots__:
+            value = getattr(self, name, None)
+            if isinstance(value, (list, dict)):
+                setattr(entity, name, copy(value))
+
+        if hasattr(self, "_extras"):
+            entity._extras = self._extras.copy()
+
+        return entity
+
+
+def slotted(cls):
+    """ recreate a dataclass with `__slots__`, like `dataclass(slots=True)` of Python 3.10
+
+    Parameters
+    ----------
+    cls:
+        dataclass inherited from `SlotEntity`
+    """
+    names = tuple(i.name for i in fields(cls))
+    namespace = dict(cls.__dict__)
+    namespace["__slots__"] = names
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+
+    # the default values are kept in `__init__()` generated by dataclass
+    for name in names:
+        namespace.pop(name, None)
+
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
@@ -0,0 +1,13 @@
+# coding:utf-8
+from .entity import Entity
+from dataclasses import dataclass
+
+
+@dataclass
+class PictureInfo(Entity):
+    """ Information of stored album cover or singer avatar """
+
+    id: str = None      # picture key, e.g. `AlbumCover/singer_album`
+    path: str = None
+    size: int = None
+    hash: str = None
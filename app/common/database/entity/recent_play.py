@@ -1,10 +1,11 @@
 # coding:utf-8
-from .entity import Entity
+from .entity import SlotEntity, slotted
 from dataclasses import dataclass
 
 
+@slotted
 @dataclass
-class RecentPlay(Entity):
+class RecentPlay(SlotEntity):
     """ Recent play """
 
     file: str = None
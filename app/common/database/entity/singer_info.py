@@ -1,12 +1,13 @@
 # coding:utf-8
 from typing import List
-from .entity import Entity
+from .entity import SlotEntity, slotted
 from .album_info import AlbumInfo
 from dataclasses import dataclass, field
 
 
+@slotted
 @dataclass
-class SingerInfo(Entity):
+class SingerInfo(SlotEntity):
     """ Singer information """
 
     id: str = None
@@ -0,0 +1,23 @@
+# coding:utf-8
+from .entity import Entity
+from dataclasses import dataclass
+
+
+@dataclass
+class DirectorySnapshot(Entity):
+    """ Snapshot of audio directory """
+
+    path: str = None
+    parent: str = None
+    mtime: float = None
+
+
+@dataclass
+class FileSnapshot(Entity):
+    """ Snapshot of audio file """
+
+    file: str = None
+    directory: str = None
+    size: int = None
+    mtime: float = None
+    inode: int = None
@@ -1,10 +1,11 @@
 # coding:utf-8
-from .entity import Entity
+from .entity import SlotEntity, slotted
 from dataclasses import dataclass
 
 
+@slotted
 @dataclass
-class SongInfo(Entity):
+class SongInfo(SlotEntity):
     """ Song information """
 
     file: str = None
@@ -0,0 +1,12 @@
+# coding:utf-8
+from .entity import Entity
+from dataclasses import dataclass
+
+
+@dataclass
+class SortKey(Entity):
+    """ Collation key of song title, album, singer or playlist name """
+
+    id: str = None          # the text to be sorted
+    key: str = None         # full pinyin of CJK characters and case-folded Latin, e.g. `zhoujielun`
+    initials: str = None    # initials of the key, e.g. `zjl`
@@ -1,5 +1,8 @@
 from .album_info_service import AlbumInfoService
+from .picture_info_service import PictureInfoService
 from .playlist_service import PlaylistService
 from .recent_play_service import RecentPlayService
 from .singer_info_service import SingerInfoService
+from .snapshot_service import SnapshotService
 from .song_info_service import PlaylistSongInfoService, SongInfoService
+from .sort_key_service import SortKeyService
@@ -3,7 +3,7 @@ from typing import List
 
 from PyQt5.QtSql import QSqlDatabase
 
-from ..dao import AlbumInfoDao
+from ..dao import AlbumInfoDao, SearchIndexDao
 from ..entity import AlbumInfo
 
 from.service_base import ServiceBase
@@ -15,6 +15,7 @@ class AlbumInfoService(ServiceBase):
     def __init__(self, db: QSqlDatabase = None):
         super().__init__()
         self.albumInfoDao = AlbumInfoDao(db)
+        self.searchIndexDao = SearchIndexDao(db)
 
     def createTable(self) -> bool:
         return self.albumInfoDao.createTable()
@@ -31,6 +32,13 @@ class AlbumInfoService(ServiceBase):
     def listLike(self, **condition) -> List[AlbumInfo]:
         return self.albumInfoDao.listLike(**condition)
 
+    def search(self, keyWord: str, limit: int = None) -> List[AlbumInfo]:
+        # fall back to fuzzy query if the search index isn't available
+        if not self.searchIndexDao.refresh():
+            return self.albumInfoDao.listLike(singer=keyWord, album=keyWord)[:limit]
+
+        return self.albumInfoDao.search(keyWord, limit)
+
     def listByIds(self, ids: List[str]) -> List[AlbumInfo]:
         return self.albumInfoDao.listByIds(ids)
 
@@ -68,3 +76,4 @@ class AlbumInfoService(ServiceBase):
 
     def setDatabase(self, db: QSqlDatabase):
         self.albumInfoDao.setDatabase(db)
+        self.searchIndexDao.setDatabase(db)
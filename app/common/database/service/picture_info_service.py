@@ -0,0 +1,39 @@
+# coding:utf-8
+from typing import List
+
+from PyQt5.QtSql import QSqlDatabase
+
+from ..dao import PictureInfoDao
+from ..entity import PictureInfo
+
+from .service_base import ServiceBase
+
+
+class PictureInfoService(ServiceBase):
+    """ Picture information service """
+
+    def __init__(self, db: QSqlDatabase = None):
+        super().__init__()
+        self.pictureInfoDao = PictureInfoDao(db)
+
+    def createTable(self) -> bool:
+        return self.pictureInfoDao.createTable()
+
+    def listAll(self) -> List[PictureInfo]:
+        return self.pictureInfoDao.listAll()
+
+    def addBatch(self, pictureInfos: List[PictureInfo]) -> bool:
+        """ add picture information, the old records with the same id are replaced """
+        ids = [i.id for i in pictureInfos]
+        s1 = self.pictureInfoDao.deleteByIds(ids)
+        s2 = self.pictureInfoDao.insertBatch(pictureInfos)
+        return s1 and s2
+
+    def removeByIds(self, ids: List[str]) -> bool:
+        return self.pictureInfoDao.deleteByIds(ids)
+
+    def clearTable(self) -> bool:
+        return self.pictureInfoDao.clearTable()
+
+    def setDatabase(self, db: QSqlDatabase):
+        self.pictureInfoDao.setDatabase(db)
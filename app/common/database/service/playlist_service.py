@@ -4,7 +4,7 @@ from typing import List
 from PyQt5.QtCore import QDateTime
 from PyQt5.QtSql import QSqlDatabase
 
-from ..dao import PlaylistDao, SongPlaylistDao, PlaylistSongInfoDao
+from ..dao import PlaylistDao, SongPlaylistDao, PlaylistSongInfoDao, SearchIndexDao
 from ..entity import Playlist, SongPlaylist, SongInfo
 from ..utils import UUIDUtils
 
@@ -17,6 +17,7 @@ class PlaylistService(ServiceBase):
     def __init__(self, db: QSqlDatabase = None):
         super().__init__()
         self.playlistDao = PlaylistDao(db)
+        self.searchIndexDao = SearchIndexDao(db)
         self.songPlaylistDao = SongPlaylistDao(db)
         self.songInfoDao = PlaylistSongInfoDao(db)
 
@@ -57,6 +58,13 @@ class PlaylistService(ServiceBase):
     def listLike(self, **condition) -> List[Playlist]:
         return self.playlistDao.listLike(**condition)
 
+    def search(self, keyWord: str, limit: int = None) -> List[Playlist]:
+        # fall back to fuzzy query if the search index isn't available
+        if not self.searchIndexDao.refresh():
+            return self.playlistDao.listLike(name=keyWord, singer=keyWord, album=keyWord)[:limit]
+
+        return self.playlistDao.search(keyWord, limit)
+
     def modifyName(self, old: str, new: str) -> bool:
         """ modify the name of playlist """
         if not self.playlistDao.update(old, 'name', new):
@@ -176,3 +184,4 @@ class PlaylistService(ServiceBase):
         self.playlistDao.setDatabase(db)
         self.songPlaylistDao.setDatabase(db)
         self.songInfoDao.setDatabase(db)
+        self.searchIndexDao.setDatabase(db)
@@ -66,6 +66,24 @@ class ServiceBase:
         """
         raise NotImplementedError
 
+    def search(self, keyWord: str, limit: int = None) -> List[Entity]:
+        """ full-text search records
+
+        Parameters
+        ----------
+        keyWord: str
+            key word to search
+
+        limit: int
+            the maximum number of records, `None` means no limit
+
+        Returns
+        -------
+        entities: List[Entity]
+            entity instances sorted by relevance, empty if no records are found
+        """
+        raise NotImplementedError
+
     def listAll(self) -> List[Entity]:
         """ query all records """
         raise NotImplementedError
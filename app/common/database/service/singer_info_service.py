@@ -3,7 +3,7 @@ from typing import List
 
 from PyQt5.QtSql import QSqlDatabase
 
-from ..dao import SingerInfoDao
+from ..dao import SearchIndexDao, SingerInfoDao
 from ..entity import SingerInfo
 
 from.service_base import ServiceBase
@@ -15,6 +15,7 @@ class SingerInfoService(ServiceBase):
     def __init__(self, db: QSqlDatabase = None):
         super().__init__()
         self.singerInfoDao = SingerInfoDao(db)
+        self.searchIndexDao = SearchIndexDao(db)
 
     def createTable(self) -> bool:
         return self.singerInfoDao.createTable()
@@ -28,6 +29,13 @@ class SingerInfoService(ServiceBase):
     def listAll(self) -> List[SingerInfo]:
         return self.singerInfoDao.listAll()
 
+    def search(self, keyWord: str, limit: int = None) -> List[SingerInfo]:
+        # fall back to fuzzy query if the search index isn't available
+        if not self.searchIndexDao.refresh():
+            return self.singerInfoDao.listLike(singer=keyWord)[:limit]
+
+        return self.singerInfoDao.search(keyWord, limit)
+
     def listByIds(self, ids: List[str]) -> List[SingerInfo]:
         return self.singerInfoDao.listByIds(ids)
 
@@ -57,6 +65,7 @@ class SingerInfoService(ServiceBase):
 
     def setDatabase(self, db: QSqlDatabase):
         self.singerInfoDao.setDatabase(db)
+        self.searchIndexDao.setDatabase(db)
 
     def listLike(self, **condition) -> List[SingerInfo]:
         return self.singerInfoDao.listLike(**condition)
@@ -0,0 +1,58 @@
+# coding:utf-8
+from typing import List
+
+from PyQt5.QtSql import QSqlDatabase
+
+from ..dao import DirectorySnapshotDao, FileSnapshotDao
+from ..entity import DirectorySnapshot, FileSnapshot
+
+from .service_base import ServiceBase
+
+
+class SnapshotService(ServiceBase):
+    """ Directory and audio file snapshot service """
+
+    def __init__(self, db: QSqlDatabase = None):
+        super().__init__()
+        self.directoryDao = DirectorySnapshotDao(db)
+        self.fileDao = FileSnapshotDao(db)
+
+    def createTable(self) -> bool:
+        s1 = self.directoryDao.createTable()
+        s2 = self.fileDao.createTable()
+        return s1 and s2
+
+    def listAllDirectories(self) -> List[DirectorySnapshot]:
+        """ list all directory snapshots """
+        return self.directoryDao.listAll()
+
+    def listAllFiles(self) -> List[FileSnapshot]:
+        """ list all audio file snapshots """
+        return self.fileDao.listAll()
+
+    def replaceDirectories(self, directories: List[DirectorySnapshot], files: List[FileSnapshot]) -> bool:
+        """ replace the snapshots of directories and the audio files in them """
+        paths = [i.path for i in directories]
+        s1 = self.removeDirectories(paths)
+        s2 = self.directoryDao.insertBatch(directories)
+        s3 = self.fileDao.insertBatch(files)
+        return s1 and s2 and s3
+
+    def updateFiles(self, files: List[FileSnapshot]) -> bool:
+        """ update the snapshots of modified audio files """
+        return self.fileDao.updateByIds(files)
+
+    def removeDirectories(self, paths: List[str]) -> bool:
+        """ remove the snapshots of directories and the audio files in them """
+        s1 = self.directoryDao.deleteByIds(paths)
+        s2 = self.fileDao.deleteByFields('directory', paths)
+        return s1 and s2
+
+    def clearTable(self) -> bool:
+        s1 = self.directoryDao.clearTable()
+        s2 = self.fileDao.clearTable()
+        return s1 and s2
+
+    def setDatabase(self, db: QSqlDatabase):
+        self.directoryDao.setDatabase(db)
+        self.fileDao.setDatabase(db)
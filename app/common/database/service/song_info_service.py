@@ -3,7 +3,7 @@ from typing import List
 
 from PyQt5.QtSql import QSqlDatabase
 
-from ..dao import PlaylistSongInfoDao, SongInfoDao
+from ..dao import PlaylistSongInfoDao, SearchIndexDao, SongInfoDao
 from ..entity import SongInfo
 
 from.service_base import ServiceBase
@@ -15,6 +15,7 @@ class SongInfoService(ServiceBase):
     def __init__(self, db: QSqlDatabase = None):
         super().__init__()
         self.songInfoDao = SongInfoDao(db)
+        self.searchIndexDao = SearchIndexDao(db)
 
     def createTable(self) -> bool:
         return self.songInfoDao.createTable()
@@ -32,6 +33,13 @@ class SongInfoService(ServiceBase):
     def listLike(self, **condition) -> List[SongInfo]:
         return self.songInfoDao.listLike(**condition)
 
+    def search(self, keyWord: str, limit: int = None) -> List[SongInfo]:
+        # fall back to fuzzy query if the search index isn't available
+        if not self.searchIndexDao.refresh():
+            return self.songInfoDao.listLike(file=keyWord, title=keyWord, singer=keyWord, album=keyWord)[:limit]
+
+        return self.songInfoDao.search(keyWord, limit)
+
     def listAll(self) -> List[SongInfo]:
         return self.songInfoDao.listAll()
 
@@ -100,6 +108,7 @@ class SongInfoService(ServiceBase):
     def setDatabase(self, db: QSqlDatabase):
         """ use the specified database """
         self.songInfoDao.setDatabase(db)
+        self.searchIndexDao.setDatabase(db)
 
 
 class PlaylistSongInfoService(SongInfoService):
@@ -0,0 +1,33 @@
+# coding:utf-8
+from typing import List
+
+from PyQt5.QtSql import QSqlDatabase
+
+from ..dao import SortKeyDao
+from ..entity import SortKey
+
+from .service_base import ServiceBase
+
+
+class SortKeyService(ServiceBase):
+    """ Sort key service """
+
+    def __init__(self, db: QSqlDatabase = None):
+        super().__init__()
+        self.sortKeyDao = SortKeyDao(db)
+
+    def createTable(self) -> bool:
+        return self.sortKeyDao.createTable()
+
+    def listAll(self) -> List[SortKey]:
+        return self.sortKeyDao.listAll()
+
+    def addBatch(self, sortKeys: List[SortKey]) -> bool:
+        """ add sort keys, the key of a text never changes, so the existing records are ignored """
+        return self.sortKeyDao.insertBatch(sortKeys, ignore=True)
+
+    def clearTable(self) -> bool:
+        return self.sortKeyDao.clearTable()
+
+    def setDatabase(self, db: QSqlDatabase):
+        self.sortKeyDao.setDatabase(db)
@@ -1 +1,2 @@
-from .uuid_utils import UUIDUtils
\ No newline at end of file
+from .search_utils import SearchUtils
+from .uuid_utils import UUIDUtils
@@ -0,0 +1,33 @@
+# coding:utf-8
+import re
+
+
+class SearchUtils:
+    """ Full-text search tool class """
+
+    # CJK text has no spaces between words, so each character is a token
+    CJK_PATTERN = re.compile(
+        r'([\u2e80-\u2fdf\u3040-\u30ff\u3100-\u31bf\u3400-\u4dbf'
+        r'\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff\uff66-\uff9f])'
+    )
+
+    @classmethod
+    def segment(cls, text: str) -> str:
+        """ split CJK text into characters, so that the `unicode61` tokenizer
+        can find the words inside CJK text """
+        return cls.CJK_PATTERN.sub(r' \1 ', text or '')
+
+    @classmethod
+    def toMatchQuery(cls, keyWord: str) -> str:
+        """ convert key word to FTS5 match query
+
+        The key word is searched as a phrase and the last token is used as
+        prefix, e.g. `"jay chou"` matches `Jay Chou's Bedtime Stories` and
+        `周杰` matches `周杰伦`. An empty string is returned if the key word
+        contains no token.
+        """
+        text = cls.segment(keyWord)
+        if not re.search(r'[^\W_]', text):
+            return ''
+
+        return '"' + text.replace('"', '""') + '"*'
@@ -1,14 +1,18 @@
 # coding:utf-8
 import imghdr
-from math import floor
+import os
+from functools import lru_cache
+from hashlib import md5
+from pathlib import Path
+from threading import Lock
 
 import cv2 as cv
 import numpy as np
-from colorthief import ColorThief
 from PIL import Image
-from PyQt5.QtGui import QImage, QPixmap
-from scipy.ndimage.filters import gaussian_filter
+from PyQt5.QtCore import QPointF, QRectF
+from PyQt5.QtGui import QPainter, QPixmap, QPolygonF, QTransform
 
+from .cache import albumCoverStoreFolder, coverEffectFolder
 from .exception_handler import exceptionHandler
 from .logger import Logger
 
@@ -36,6 +40,42 @@ def readImage(imagePath: str):
     return Image.fromqpixmap(QPixmap(imagePath))
 
 
+def getImageKey(imagePath: str) -> str:
+    """ get the key of image used by effect cache
+
+    The pictures in the content-addressed cover store are keyed by their content
+    hash, so the albums sharing the same cover also share the effects. The other
+    images are keyed by path, modified time and file size.
+
+    Returns
+    -------
+    key: str
+        image key, `None` if the image is a resource or doesn't exist
+    """
+    if not imagePath or imagePath.startswith(':'):
+        return None
+
+    path = Path(imagePath)
+    if path.parent == albumCoverStoreFolder:
+        return path.stem
+
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    key = f"{imagePath}:{stat.st_mtime_ns}:{stat.st_size}"
+    return md5(key.encode('utf-8')).hexdigest()
+
+
+def _writeEffect(path: Path, write):
+    """ write effect file atomically, so the other threads never read a partial file """
+    path.parent.mkdir(exist_ok=True, parents=True)
+    temp = path.with_name(f"{path.stem}.{os.getpid()}.{id(write)}.tmp{path.suffix}")
+    write(str(temp))
+    os.replace(temp, path)
+
+
 def gaussianBlur(imagePath: str, blurRadius=18, brightFactor=1, blurPicSize: tuple = None) -> np.ndarray:
     """ apply Gaussian blur to image
 
@@ -62,28 +102,87 @@ def gaussianBlur(imagePath: str, blurRadius=18, brightFactor=1, blurPicSize: tup
     image = readImage(imagePath)
 
     if blurPicSize:
+        # let the decoder skip the unused pixels of jpeg image
+        image.draft('RGB', blurPicSize)
+
         # scale image to speed up the computation speed
         w, h = image.size
         ratio = min(blurPicSize[0] / w, blurPicSize[1] / h)
         w_, h_ = w * ratio, h * ratio
 
         if w_ < w:
-            image = image.resize((int(w_), int(h_)), Image.ANTIALIAS)
+            image = image.resize((int(w_), int(h_)), Image.LANCZOS)
+
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGB')
 
     image = np.array(image)
+    h, w = image.shape[:2]
+
+    # the blurred image is smooth, so it's blurred in low resolution and
+    # upsampled back, which reduces the kernel size of the separable filter
+    factor = max(1, int(blurRadius / 4))
+    w_, h_ = max(1, w // factor), max(1, h // factor)
+    rgb = np.ascontiguousarray(image[..., :3])
+    if factor > 1:
+        rgb = cv.resize(rgb, (w_, h_), interpolation=cv.INTER_AREA)
 
-    # handle gray image
-    if len(image.shape) == 2:
-        image = np.stack([image, image, image], axis=-1)
+    rgb = cv.GaussianBlur(rgb, (0, 0), blurRadius / factor,
+                          borderType=cv.BORDER_REFLECT)
 
-    # blur each color channel
-    for i in range(3):
-        image[:, :, i] = gaussian_filter(
-            image[:, :, i], blurRadius) * brightFactor
+    if factor > 1:
+        rgb = cv.resize(rgb, (w, h), interpolation=cv.INTER_LINEAR)
 
+    if brightFactor != 1:
+        rgb = cv.convertScaleAbs(rgb, alpha=brightFactor)
+
+    image[..., :3] = rgb
     return image
 
 
+@exceptionHandler("image")
+def getBlurImagePath(imagePath: str, blurRadius=30, brightFactor=1, blurPicSize: tuple = None) -> str:
+    """ get the path of blurred image, the result is memoized on disk
+
+    Parameters
+    ----------
+    imagePath: str
+        the image to be blurred
+
+    blurRadius: int
+        blur radius
+
+    brightFactor: float
+        brightness scale factor
+
+    blurPicSize: tuple
+        the maximum size of image
+
+    Returns
+    -------
+    path: str
+        path of the blurred image, `None` if the image can't be cached
+    """
+    key = getImageKey(imagePath)
+    if not key:
+        return None
+
+    size = "x".join(str(i) for i in blurPicSize) if blurPicSize else "full"
+    name = f"{key}_blur_{blurRadius}_{brightFactor:g}_{size}"
+    for suffix in ('.jpg', '.png'):
+        path = coverEffectFolder / (name + suffix)
+        if path.exists():
+            return str(path)
+
+    image = Image.fromarray(gaussianBlur(
+        imagePath, blurRadius, brightFactor, blurPicSize))
+
+    # the blurred image has no sharp edges, so jpeg is good enough
+    path = coverEffectFolder / (name + ('.jpg' if image.mode == 'RGB' else '.png'))
+    _writeEffect(path, lambda p: image.save(p, quality=90))
+    return str(path)
+
+
 def getBlurPixmap(imagePath: str, blurRadius=30, brightFactor=1, blurPicSize: tuple = None) -> QPixmap:
     """ apply Gaussian blur to image
 
@@ -107,6 +206,12 @@ def getBlurPixmap(imagePath: str, blurRadius=30, brightFactor=1, blurPicSize: tu
     blurPixmap: QPixmap
         the image after blurring
     """
+    path = getBlurImagePath(imagePath, blurRadius, brightFactor, blurPicSize)
+    if path:
+        pixmap = QPixmap(path)
+        if not pixmap.isNull():
+            return pixmap
+
     image = gaussianBlur(imagePath, blurRadius, brightFactor, blurPicSize)
     return Image.fromarray(image).toqpixmap()
 
@@ -114,10 +219,14 @@ def getBlurPixmap(imagePath: str, blurRadius=30, brightFactor=1, blurPicSize: tu
 class DominantColor:
     """ Dominant color class """
 
+    # memory tier of dominant colors, the disk tier is in the cover effect folder
+    colors = {}
+    lock = Lock()
+
     @classmethod
     @exceptionHandler("image", (24, 24, 24))
     def getDominantColor(cls, imagePath: str):
-        """ extract dominant color from image
+        """ extract dominant color from image, the result is memoized
 
         Parameters
         ----------
@@ -129,109 +238,126 @@ class DominantColor:
         r, g, b: int
             gray value of each color channel
         """
-        if imagePath.startswith(':'):
+        key = getImageKey(imagePath)
+        if not key:
             return (24, 24, 24)
 
-        colorThief = ColorThief(imagePath)
+        with cls.lock:
+            if key in cls.colors:
+                return cls.colors[key]
 
-        # scale image to speed up the computation speed
-        if max(colorThief.image.size) > 400:
-            colorThief.image = colorThief.image.resize((400, 400))
+        path = coverEffectFolder / f"{key}_color.txt"
+        try:
+            color = tuple(int(i) for i in path.read_text().split(','))
+        except (OSError, ValueError):
+            color = cls.extract(imagePath)
+            _writeEffect(path, lambda p: Path(p).write_text(
+                ",".join(str(i) for i in color)))
+
+        with cls.lock:
+            cls.colors[key] = color
+
+        return color
+
+    @classmethod
+    def extract(cls, imagePath: str):
+        """ extract dominant color from image without cache
+
+        Parameters
+        ----------
+        imagePath: str
+            image path
 
-        palette = colorThief.get_palette(quality=9)
+        Returns
+        -------
+        r, g, b: int
+            gray value of each color channel
+        """
+        palette = cls.getPalette(imagePath)
 
         # adjust the brightness of palette
         palette = cls.__adjustPaletteValue(palette)
-        for rgb in palette[:]:
-            h, s, v = cls.rgb2hsv(rgb)
-            if h < 0.02:
-                palette.remove(rgb)
-                if len(palette) <= 2:
-                    break
 
-        palette = palette[:5]
-        palette.sort(key=lambda rgb: cls.colorfulness(*rgb), reverse=True)
+        # remove the red and gray colors, at least two colors are kept
+        h = cls.rgb2hsv(palette)[:, 0]
+        indexes = np.flatnonzero(h < 0.02)[:max(1, len(palette) - 2)]
+        palette = np.delete(palette, indexes, axis=0)[:5]
+        if not len(palette):
+            return (24, 24, 24)
+
+        # np.argmax returns the first one, which is the same as stable sorting
+        r, g, b = palette[np.argmax(cls.colorfulness(palette))]
+        return (int(r), int(g), int(b))
 
-        return palette[0]
+    @staticmethod
+    def getPalette(imagePath: str, colorCount=10) -> np.ndarray:
+        """ get the palette of image by color histogram
+
+        Parameters
+        ----------
+        imagePath: str
+            image path
+
+        colorCount: int
+            the maximum number of colors in palette
+
+        Returns
+        -------
+        palette: `~np.ndarray` of shape `(n, 3)`
+            palette sorted by pixel number in descending order
+        """
+        image = Image.open(imagePath)
+        image.draft('RGB', (100, 100))
+        image = image.convert('RGB')
+        image.thumbnail((100, 100))
+
+        pixels = np.asarray(image).reshape(-1, 3).astype(np.int64)
+
+        # ignore the white pixels like color thief
+        mask = np.any(pixels <= 250, axis=1)
+        if mask.any():
+            pixels = pixels[mask]
+
+        # quantize each channel to 3 bits and use the mean color of bin
+        bins = (pixels[:, 0] >> 5) << 6 | (pixels[:, 1] >> 5) << 3 | (pixels[:, 2] >> 5)
+        counts = np.bincount(bins, minlength=512)
+        sums = np.stack([np.bincount(bins, pixels[:, i], 512) for i in range(3)], 1)
+
+        indexes = np.argsort(-counts, kind='stable')[:colorCount]
+        indexes = indexes[counts[indexes] > 0]
+        return np.rint(sums[indexes] / counts[indexes, None]).astype(np.int64)
 
     @classmethod
-    def __adjustPaletteValue(cls, palette: list):
+    def __adjustPaletteValue(cls, palette: np.ndarray):
         """ adjust the brightness of palette """
-        newPalette = []
-        for rgb in palette:
-            h, s, v = cls.rgb2hsv(rgb)
-            if v > 0.9:
-                factor = 0.8
-            elif 0.8 < v <= 0.9:
-                factor = 0.9
-            elif 0.7 < v <= 0.8:
-                factor = 0.95
-            else:
-                factor = 1
-            v *= factor
-            newPalette.append(cls.hsv2rgb(h, s, v))
-
-        return newPalette
+        hsv = cls.rgb2hsv(palette)
+        v = hsv[:, 2]
+        factors = np.select([v > 0.9, v > 0.8, v > 0.7], [0.8, 0.9, 0.95], 1)
+        hsv[:, 2] = v * factors
+        return cls.hsv2rgb(hsv)
 
     @staticmethod
-    def rgb2hsv(rgb: tuple) -> tuple:
-        """ convert rgb to hsv """
-        r, g, b = [i / 255 for i in rgb]
-        mx = max(r, g, b)
-        mn = min(r, g, b)
-        df = mx - mn
-        if mx == mn:
-            h = 0
-        elif mx == r:
-            h = (60 * ((g - b) / df) + 360) % 360
-        elif mx == g:
-            h = (60 * ((b - r) / df) + 120) % 360
-        elif mx == b:
-            h = (60 * ((r - g) / df) + 240) % 360
-        s = 0 if mx == 0 else df / mx
-        v = mx
-        return (h, s, v)
+    def rgb2hsv(rgb: np.ndarray) -> np.ndarray:
+        """ convert rgb colors of shape `(n, 3)` to hsv, the hue is in `[0, 360)` """
+        rgb = np.asarray(rgb, np.float32).reshape(1, -1, 3) / 255
+        return cv.cvtColor(rgb, cv.COLOR_RGB2HSV).reshape(-1, 3)
 
     @staticmethod
-    def hsv2rgb(h, s, v) -> tuple:
-        """ convert hsv to rgb """
-        h60 = h / 60.0
-        h60f = floor(h60)
-        hi = int(h60f) % 6
-        f = h60 - h60f
-        p = v * (1 - s)
-        q = v * (1 - f * s)
-        t = v * (1 - (1 - f) * s)
-        r, g, b = 0, 0, 0
-        if hi == 0:
-            r, g, b = v, t, p
-        elif hi == 1:
-            r, g, b = q, v, p
-        elif hi == 2:
-            r, g, b = p, v, t
-        elif hi == 3:
-            r, g, b = p, q, v
-        elif hi == 4:
-            r, g, b = t, p, v
-        elif hi == 5:
-            r, g, b = v, p, q
-        r, g, b = int(r * 255), int(g * 255), int(b * 255)
-        return (r, g, b)
+    def hsv2rgb(hsv: np.ndarray) -> np.ndarray:
+        """ convert hsv colors of shape `(n, 3)` to rgb """
+        hsv = np.asarray(hsv, np.float32).reshape(1, -1, 3)
+        rgb = cv.cvtColor(hsv, cv.COLOR_HSV2RGB).reshape(-1, 3)
+        return np.floor(rgb * 255).astype(np.int64)
 
     @staticmethod
-    def colorfulness(r: int, g: int, b: int):
+    def colorfulness(rgb: np.ndarray) -> np.ndarray:
+        """ compute the colorfulness of colors of shape `(n, 3)` """
+        r, g, b = np.asarray(rgb, np.float64).T
         rg = np.absolute(r - g)
         yb = np.absolute(0.5 * (r + g) - b)
 
-        # Compute the mean and standard deviation of both `rg` and `yb`.
-        rg_mean, rg_std = (np.mean(rg), np.std(rg))
-        yb_mean, yb_std = (np.mean(yb), np.std(yb))
-
-        # Combine the mean and standard deviations.
-        std_root = np.sqrt((rg_std ** 2) + (yb_std ** 2))
-        mean_root = np.sqrt((rg_mean ** 2) + (yb_mean ** 2))
-
-        return std_root + (0.3 * mean_root)
+        # the standard deviation of a single color is zero
+        return 0.3 * np.sqrt(rg ** 2 + yb ** 2)
 
 
 def getPicSuffix(pic_data: bytes) -> str:
@@ -256,84 +382,87 @@ def getPicMimeType(pic_data: bytes) -> str:
     return mimeType
 
 
+@lru_cache(maxsize=128)
+def getQuadTransform(width: int, height: int, dstPoints: tuple) -> QTransform:
+    """ get the perspective transform which maps the image rectangle to destination quadrilateral
+
+    Parameters
+    ----------
+    width: int
+        image width
+
+    height: int
+        image height
+
+    dstPoints: tuple
+        corner coordinates after transformation, in the order of
+        left top, right top, left bottom and right bottom
+
+    Returns
+    -------
+    transform: QTransform
+        perspective transform, the results are cached for each image size
+        because cards of the same kind share the same size
+    """
+    srcPoints = [(0, 0), (width - 1, 0), (width - 1, height - 1), (0, height - 1)]
+    lt, rt, lb, rb = dstPoints
+    transform = QTransform()
+    QTransform.quadToQuad(
+        QPolygonF([QPointF(*p) for p in srcPoints]),
+        QPolygonF([QPointF(*p) for p in (lt, rt, rb, lb)]),
+        transform
+    )
+    return transform
+
+
 class PixmapPerspectiveTransform:
-    """ Pixmap perspective transform class """
+    """ Pixmap perspective transform class
 
-    def __init__(self, pixmap=None):
-        self.pixmap = pixmap
+    The transform is applied by `QPainter` with a cached `QTransform`, so no
+    pixel buffer is copied or allocated when the widget is pressed.
+    """
+
+    def __init__(self, pixmap: QPixmap = None):
+        self.pixmap = None
+        self.width = 0
+        self.height = 0
+        self.dstPoints = None
+        if pixmap:
+            self.setPixmap(pixmap)
 
     def setPixmap(self, pixmap: QPixmap):
         """ set the image to be transformed """
-        self.pixmap = QPixmap
-        self.src = self.transQPixmapToNdarray(pixmap)
-        self.height, self.width = self.src.shape[:2]
-
-        # corner coordinates before transformation
-        self.srcPoints = np.float32(
-            [[0, 0], [self.width - 1, 0], [0, self.height - 1],
-             [self.width - 1, self.height - 1]])
+        self.pixmap = pixmap
+        self.width, self.height = pixmap.width(), pixmap.height()
+        self.dstPoints = ((0, 0), (self.width - 1, 0),
+                          (0, self.height - 1), (self.width - 1, self.height - 1))
 
     def setDstPoints(self, leftTop: list, rightTop, leftBottom, rightBottom):
-        """ set the corner coordinates after transformation """
-        self.dstPoints = np.float32(
-            [leftTop, rightTop, leftBottom, rightBottom])
+        """ set the corner coordinates after transformation, in device pixels """
+        self.dstPoints = tuple(
+            tuple(p) for p in (leftTop, rightTop, leftBottom, rightBottom))
+
+    def transform(self) -> QTransform:
+        """ get the transform which maps the device pixels of image to the
+        logical coordinates of widget """
+        r = self.pixmap.devicePixelRatio()
+        transform = getQuadTransform(self.width, self.height, self.dstPoints)
+        return transform * QTransform.fromScale(1/r, 1/r)
 
-    def getPerspectiveTransform(self, imWidth: int, imHeight: int, borderMode=cv.BORDER_CONSTANT, borderValue=[255, 255, 255, 0]) -> QPixmap:
-        """ get transformed image
+    def draw(self, painter: QPainter):
+        """ draw the transformed image
 
         Parameters
         ----------
-        imWidth: int
-            image width before transformation
-
-        imHeight: int
-            image height before transformation
-
-        borderMode: int
-            border interpolation mode
-
-        borderValue: list
-            filled border color
-
-        Returns
-        -------
-        pixmap: QPixmap
-            image after transformation
+        painter: QPainter
+            painter of widget, it should enable `QPainter.SmoothPixmapTransform`
+            render hint to get smooth edges
         """
-        # handle jpeg image
-        if self.src.shape[-1] == 3:
-            self.src = cv.cvtColor(self.src, cv.COLOR_BGR2BGRA)
-
-        # calculate transform matrix
-        perspectiveMatrix = cv.getPerspectiveTransform(
-            self.srcPoints, self.dstPoints)
-
-        # apply perspective transform
-        self.dst = cv.warpPerspective(self.src, perspectiveMatrix, (
-            imWidth, imHeight), borderMode=borderMode, borderValue=borderValue)
-
-        return self.transNdarrayToQPixmap(self.dst)
-
-    def transQPixmapToNdarray(self, pixmap: QPixmap):
-        """ 将QPixmap转换为numpy数组 """
-        width, height = pixmap.width(), pixmap.height()
-        channels_count = 4
-        image = pixmap.toImage()  # type:QImage
-        s = image.bits().asstring(height * width * channels_count)
-
-        # BGRA image array
-        array = np.fromstring(s, np.uint8).reshape(
-            (height, width, channels_count))
-
-        return array
-
-    def transNdarrayToQPixmap(self, array: np.ndarray):
-        """ convert numpy array to QPixmap """
-        height, width, bytesPerComponent = array.shape
-        bytesPerLine = 4 * width
-
-        # array shape: m*n*4
-        dst = cv.cvtColor(array, cv.COLOR_BGRA2RGBA)
-        pix = QPixmap.fromImage(
-            QImage(dst.data, width, height, bytesPerLine, QImage.Format_RGBA8888))
-        return pix
+        if not self.pixmap:
+            return
+
+        painter.save()
+        painter.setTransform(self.transform(), True)
+        rect = QRectF(0, 0, self.width, self.height)
+        painter.drawPixmap(rect, self.pixmap, rect)
+        painter.restore()
@@ -1,3 +1,6 @@
 from .directory import Directory
+from .file_availability import FileAvailability, fileAvailability
 from .file_system_watcher import FileSystemWatcher
+from .inotify_file_system_watcher import InotifyFileSystemWatcher
 from .library import Library
+from .library_index import LibraryIndex
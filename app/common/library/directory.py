@@ -1,5 +1,6 @@
 # coding: utf-8
-from typing import Union
+import os
+from typing import List, Union
 from pathlib import Path
 from common.meta_data.reader import SongInfoReader
 
@@ -14,43 +15,76 @@ class Directory(QObject):
     fileAdded = pyqtSignal(list)
     fileRemoved = pyqtSignal(list)
 
-    def __init__(self, path: str):
+    def __init__(self, path: str, audioFiles: List[Path] = None):
         """
         Parameters
         ----------
         path: str
             path of audio directory
+
+        audioFiles: List[Path]
+            audio files in directory, `glob()` will be called if it's `None`
         """
         super().__init__()
         self.path = Path(path)
-        self.audioFiles = self.glob()
+        self.audioFiles = self.glob() if audioFiles is None else audioFiles
 
     def glob(self, recursive=False):
         """ get all audio file paths """
-        if not self.path.exists():
+        if not self.path.is_dir():
             return []
 
-        paths = self.path.rglob('*') if recursive else self.path.iterdir()
-        return [i.absolute() for i in paths if self.isAudio(i)]
+        if not recursive:
+            return self.scan(self.path)
+
+        files = []
+        for folder, _, names in os.walk(self.path):
+            folder = Path(folder).absolute()
+            files.extend(folder/i for i in names if self.isAudioName(i))
 
-    def update(self):
+        return files
+
+    @classmethod
+    def scan(cls, path: Path):
+        """ get audio file paths in a folder, the file type cached by `os.scandir()` is
+        used so no extra `stat()` is called for each entry """
+        try:
+            with os.scandir(path) as entries:
+                return [Path(i.path).absolute() for i in entries
+                        if cls.isAudioName(i.name) and i.is_file()]
+        except OSError:
+            return []
+
+    def update(self, added: List[Path] = None, removed: List[Path] = None):
         """ update audio directory
 
-        Returns
-        -------
-        changedFiles: Dict[str, List[Path]]
-            a dict containing a list of files added and deleted
+        Parameters
+        ----------
+        added: List[Path]
+            audio files known to be added, the folder is globbed again if both
+            `added` and `removed` are `None`
+
+        removed: List[Path]
+            audio files known to be removed
         """
-        files = self.glob()
-        filesSet = set(files)
         oldFilesSet = set(self.audioFiles)
+
+        if added is None and removed is None:
+            files = self.glob()
+            filesSet = set(files)
+            added = list(filesSet - oldFilesSet)
+            removed = list(oldFilesSet - filesSet)
+        else:
+            removedSet = set(removed or []) & oldFilesSet
+            added = [i for i in dict.fromkeys(added or []) if i not in oldFilesSet]
+            removed = [i for i in self.audioFiles if i in removedSet]
+            files = [i for i in self.audioFiles if i not in removedSet] + added
+
         self.audioFiles = files
 
-        added = list(filesSet - oldFilesSet)
         if added:
             self.fileAdded.emit(added)
 
-        removed = list(oldFilesSet - filesSet)
         if removed:
             self.fileRemoved.emit(removed)
 
@@ -61,3 +95,8 @@ class Directory(QObject):
             path = Path(path)
 
         return path.is_file() and path.suffix.lower() in cls.formats
+
+    @classmethod
+    def isAudioName(cls, name: str):
+        """ determine whether a file name has audio suffix """
+        return os.path.splitext(name)[1].lower() in cls.formats
@@ -0,0 +1,122 @@
+# coding:utf-8
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Union
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+from ..singleton import Singleton
+
+
+class FileAvailabilityCheckWorker(QRunnable):
+    """ File availability check worker """
+
+    def __init__(self, files: List[str], service):
+        """
+        Parameters
+        ----------
+        files: List[str]
+            files to be checked
+
+        service: FileAvailability
+            service which receives the check result
+        """
+        super().__init__()
+        self.files = files
+        self.service = service
+
+    def run(self):
+        availabilities = {i: os.path.exists(i) for i in self.files}
+        self.service.checkFinished.emit(availabilities)
+
+
+class FileAvailability(Singleton, QObject):
+    """ File availability service
+
+    The availability of audio files is fed by library when scanning directories
+    and watching file system, the unknown files are checked in a background thread,
+    so the song cards never call `stat()` in the GUI thread.
+    """
+
+    availabilityChanged = pyqtSignal(dict)  # file -> whether the file is available
+    checkFinished = pyqtSignal(dict)
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self.availabilities = {}    # type:Dict[str, bool]
+        self.pendingFiles = {}      # type:Dict[str, None]
+        self.checkingFiles = set()
+        self.threadPool = QThreadPool(self)
+        self.threadPool.setMaxThreadCount(1)
+        self.checkFinished.connect(self.__onCheckFinished)
+
+    def isAvailable(self, file: Union[str, Path]) -> bool:
+        """ get whether the file is available, the unknown file is considered
+        available and will be checked in background, this method should be
+        called in the GUI thread
+
+        Parameters
+        ----------
+        file: str | Path
+            audio file path or online url
+        """
+        file = self.__key(file)
+        if file.startswith('http'):
+            return True
+
+        if file in self.availabilities:
+            return self.availabilities[file]
+
+        if file not in self.checkingFiles:
+            if not self.pendingFiles:
+                QTimer.singleShot(0, self.__checkPendingFiles)
+
+            self.pendingFiles[file] = None
+
+        return True
+
+    def setAvailable(self, files: Iterable[Union[str, Path]], isAvailable: bool):
+        """ set the availability of files, `availabilityChanged` is emitted if the
+        availability of any file changes
+
+        Parameters
+        ----------
+        files: Iterable[str | Path]
+            audio files
+
+        isAvailable: bool
+            whether the files are available
+        """
+        self.update({self.__key(i): isAvailable for i in files})
+
+    def update(self, availabilities: Dict[str, bool]):
+        """ update the availability map """
+        changes = {k: v for k, v in availabilities.items()
+                   if self.availabilities.get(k, True) != v}
+        self.availabilities.update(availabilities)
+
+        if changes:
+            self.availabilityChanged.emit(changes)
+
+    def __checkPendingFiles(self):
+        """ check the availability of pending files in background """
+        files = list(self.pendingFiles.keys())
+        self.pendingFiles.clear()
+        if not files:
+            return
+
+        self.checkingFiles.update(files)
+        self.threadPool.start(FileAvailabilityCheckWorker(files, self))
+
+    def __onCheckFinished(self, availabilities: Dict[str, bool]):
+        """ background check finished slot """
+        self.checkingFiles.difference_update(availabilities.keys())
+        self.update(availabilities)
+
+    @staticmethod
+    def __key(file: Union[str, Path]) -> str:
+        """ get the key of file, which is the same as `SongInfo.file` """
+        return str(file).replace('\\', '/')
+
+
+fileAvailability = FileAvailability()
@@ -1,20 +1,21 @@
 # coding:utf-8
+import os
 from pathlib import Path
 from typing import Dict, List, Union
 
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
 
 from .directory import Directory
 from .file_system_watcher import FileSystemWatcher
+from .inotify_file_system_watcher import InotifyFileSystemWatcher
 
 
 class FileSystem(QObject):
     """ File system class """
 
-    added = pyqtSignal(list)
-    removed = pyqtSignal(list)
+    changed = pyqtSignal(list, list)    # added and removed files of a batch
 
-    def __init__(self, directories: List[str] = None, watch=True, parent=None):
+    def __init__(self, directories: List[str] = None, watch=True, batchDelay=1000, parent=None):
         """
         Parameters
         ----------
@@ -24,6 +25,10 @@ class FileSystem(QObject):
         watch: bool
             whether to monitor audio directories
 
+        batchDelay: int
+            time in milliseconds to collect the changes of all directories
+            before emitting them as one batch
+
         parent:
             parent instance
         """
@@ -31,14 +36,28 @@ class FileSystem(QObject):
         self.isWatch = watch
         self.directories = {}  # type:Dict[Path, Directory]
 
-        # add file system watcher
-        self.watcher = FileSystemWatcher(self)
+        # changes waiting to be emitted, dict is used as an ordered set
+        self.addedFiles = {}    # type:Dict[Path, None]
+        self.removedFiles = {}  # type:Dict[Path, None]
+        self.batchTimer = QTimer(self)
+        self.batchTimer.setSingleShot(True)
+        self.batchTimer.setInterval(batchDelay)
+        self.batchTimer.timeout.connect(self.flush)
+
+        # add file system watcher, use inotify on Linux to get the exact changed files
+        if watch and InotifyFileSystemWatcher.isAvailable():
+            self.watcher = InotifyFileSystemWatcher(parent=self)
+        else:
+            self.watcher = FileSystemWatcher(parent=self)
+
         if watch:
             self.watcher.directoryChanged.connect(self.__onDirectoryChanged)
+            self.watcher.filesChanged.connect(self.__onFilesChanged)
+            self.watcher.directoryRemoved.connect(self.__onDirectoryRemoved)
 
-        self.addDirs(directories)
+        self.addDirs(directories or [])
 
-    def setDirs(self, paths: List[Union[str, Path]]):
+    def setDirs(self, paths: List[Union[str, Path]], tree: Dict[Path, List[Path]] = None):
         """ Set the directories in the file system
 
         Parameters
@@ -46,62 +65,85 @@ class FileSystem(QObject):
         paths: List[str | Path]
             directory list
 
+        tree: Dict[Path, List[Path]]
+            audio files of each folder in the directories, e.g. the result of
+            directory snapshots. The directories are walked if it's `None`
+
         Returns
         -------
         isChanged: bool
             whether the directories in file system has changed
         """
-        directories = set(paths)
-        oldDirectories = set(self.directories.keys())
+        directories = {Path(i) for i in paths}
+        oldDirectories = set(self.roots())
 
         if directories == oldDirectories:
             return False
 
         self.removeDirs(oldDirectories - directories)
-        self.addDirs(directories - oldDirectories)
+        self.addDirs(directories - oldDirectories, tree)
         return True
 
-    def addDir(self, path: Union[str, Path]):
-        """ add a directory to file system """
+    def roots(self) -> List[Path]:
+        """ get the root directories in file system """
+        return [i for i in self.directories if not any(p in self.directories for p in i.parents)]
+
+    def addDir(self, path: Union[str, Path], tree: Dict[Path, List[Path]] = None):
+        """ add a directory to file system, see `setDirs()` for the meaning of `tree` """
         if not isinstance(path, Path):
             path = Path(path)
 
         if path in self.directories or not path.is_dir():
             return
 
-        directory = Directory(path)
-        self.directories[path] = directory
+        # only the root directory is needed if the file system is not monitored
+        if not self.isWatch:
+            self.directories[path] = Directory(path, [])
+            return
 
-        if self.isWatch:
-            self.watcher.addPath(str(path))
-            directory.fileRemoved.connect(self.removed)
-            directory.fileAdded.connect(self.added)
+        if tree is not None:
+            folders = [(k, v) for k, v in tree.items() if k == path or path in k.parents]
+        else:
+            # walk the directory tree only once
+            folders = [
+                (Path(folder), [(Path(folder)/i).absolute() for i in names if Directory.isAudioName(i)])
+                for folder, _, names in os.walk(path)
+            ]
+
+        for folder, files in folders:
+            if folder not in self.directories:
+                self.__addDirectory(folder, files)
+
+    def __addDirectory(self, path: Path, files: List[Path]):
+        """ add a monitored directory without walking its sub folders """
+        directory = Directory(path, files)
+        self.directories[path] = directory
 
-        # add folder recursively
-        for folder in path.rglob('*'):
-            self.addDir(folder)
+        self.watcher.addPath(str(path))
+        directory.fileRemoved.connect(self.__onFileRemoved)
+        directory.fileAdded.connect(self.__onFileAdded)
+        return directory
 
     def removeDir(self, path: Union[str, Path]):
         """ remove a directory from file system """
         if not isinstance(path, Path):
             path = Path(path)
 
-        if path not in self.directories or not path.is_dir():
+        if path not in self.directories:
             return
 
-        self.directories.pop(path)
+        # remove folder recursively
+        folders = [i for i in self.directories if i == path or path in i.parents]
+        for folder in folders:
+            self.directories.pop(folder)
 
         if self.isWatch:
-            self.watcher.removePath(str(path))
-
-        # remove folder recursively
-        for folder in path.rglob('*'):
-            self.removeDir(folder)
+            self.watcher.removePaths([str(i) for i in folders])
 
-    def addDirs(self, paths: List[Union[str, Path]]):
+    def addDirs(self, paths: List[Union[str, Path]], tree: Dict[Path, List[Path]] = None):
         """ add multi directories to file system """
         for path in paths:
-            self.addDir(path)
+            self.addDir(path, tree)
 
     def removeDirs(self, paths: List[Union[str, Path]]):
         """ remove multi directories from file system """
@@ -112,11 +154,71 @@ class FileSystem(QObject):
         """ get all audio file paths """
         files = []  # type:List[Path]
         for directory in self.directories.values():
-            files.extend(directory.glob())
+            files.extend(directory.glob(not self.isWatch))
 
         return files
 
+    def flush(self):
+        """ emit the pending changes of all directories as one batch """
+        self.batchTimer.stop()
+        if not (self.addedFiles or self.removedFiles):
+            return
+
+        added = list(self.addedFiles)
+        removed = list(self.removedFiles)
+        self.addedFiles.clear()
+        self.removedFiles.clear()
+        self.changed.emit(added, removed)
+
+    def __onFileAdded(self, files: List[Path]):
+        """ directory file added slot """
+        self.addedFiles.update(dict.fromkeys(files))
+        self.__startBatch()
+
+    def __onFileRemoved(self, files: List[Path]):
+        """ directory file removed slot """
+        for file in files:
+            # the file is added in the current batch, the library doesn't know it yet
+            if file in self.addedFiles:
+                self.addedFiles.pop(file)
+            else:
+                self.removedFiles[file] = None
+
+        self.__startBatch()
+
+    def __startBatch(self):
+        """ start collecting a batch of changes """
+        if not self.batchTimer.isActive():
+            self.batchTimer.start()
+
     def __onDirectoryChanged(self, path: str):
         """ directory changed slot """
-        directory = self.directories[Path(path)]
-        directory.update()
+        directory = self.directories.get(Path(path))
+        if directory:
+            directory.update()
+
+    def __onFilesChanged(self, path: str, added: List[str], removed: List[str]):
+        """ files in directory changed slot """
+        path = Path(path)
+
+        # the sub folder is created after the directory is added
+        directory = self.directories.get(path)
+        if not directory:
+            directory = self.__addDirectory(path, [])
+
+        directory.update(
+            [Path(i).absolute() for i in added],
+            [Path(i).absolute() for i in removed]
+        )
+
+    def __onDirectoryRemoved(self, path: str):
+        """ directory removed slot """
+        path = Path(path)
+        files = []
+        for folder, directory in self.directories.items():
+            if folder == path or path in folder.parents:
+                files.extend(directory.audioFiles)
+
+        self.removeDir(path)
+        if files:
+            self.__onFileRemoved(files)
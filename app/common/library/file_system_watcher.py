@@ -1,21 +1,32 @@
 # coding:utf-8
-from typing import List
+import os
+from typing import Dict, List
 
-from PyQt5.QtCore import (QDir, QDirIterator, QFileSystemWatcher, QObject,
-                          QTimer, pyqtSignal)
+from PyQt5.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal
 
 
 class FileSystemWatcher(QObject):
     """ File system watcher class """
 
     directoryChanged = pyqtSignal(str)
-
-    def __init__(self, parent=None):
+    filesChanged = pyqtSignal(str, list, list)  # directory, added and removed files
+    directoryRemoved = pyqtSignal(str)
+
+    def __init__(self, delay=500, parent=None):
+        """
+        Parameters
+        ----------
+        delay: int
+            debounce time of each directory in milliseconds
+
+        parent:
+            parent instance
+        """
         super().__init__(parent=parent)
+        self.delay = delay
         self.watcher = QFileSystemWatcher(self)
         self.timer = QTimer(self)
-        self.lastDirSize = 0
-        self.changedDir = ''
+        self.dirSignatures = {}  # type:Dict[str, tuple]
 
         self.timer.setSingleShot(True)
         self.timer.timeout.connect(self.__onTimerTimeOut)
@@ -35,6 +46,7 @@ class FileSystemWatcher(QObject):
     def removePath(self, path: str):
         """ remove a monitored path """
         self.watcher.removePath(path)
+        self.dirSignatures.pop(path, None)
 
     def removePaths(self, paths: List[str]):
         """ remove multi monitored paths """
@@ -42,33 +54,40 @@ class FileSystemWatcher(QObject):
             return
 
         self.watcher.removePaths(paths)
+        for path in paths:
+            self.dirSignatures.pop(path, None)
 
     def __onDirectoryChanged(self, path: str):
         """ directory changed slot """
-        self.changedDir = path
+        self.dirSignatures[path] = self.getDirSignature(path)
         self.timer.stop()
-        self.timer.start(500)
+        self.timer.start(self.delay)
 
     def __onTimerTimeOut(self):
         """ timer time out slot """
-        # wait until the folder no longer changes
-        size = self.getDirSize(self.changedDir)
-        if self.lastDirSize != size:
-            self.lastDirSize = size
-            self.timer.start(500)
-            return
-
-        self.directoryChanged.emit(self.changedDir)
-        self.lastDirSize = 0
-        self.changedDir = ''
+        # wait until the folders no longer change
+        isStable = True
+        for path, signature in list(self.dirSignatures.items()):
+            newSignature = self.getDirSignature(path)
+            if newSignature != signature:
+                self.dirSignatures[path] = newSignature
+                isStable = False
+            elif signature is None:
+                self.dirSignatures.pop(path)
+                self.directoryRemoved.emit(path)
+            else:
+                self.dirSignatures.pop(path)
+                self.directoryChanged.emit(path)
+
+        if not isStable:
+            self.timer.start(self.delay)
 
     @staticmethod
-    def getDirSize(path: str):
-        """ get directory size """
-        size = 0
-        iterator = QDirIterator(path, QDir.Files, QDirIterator.Subdirectories)
-        while iterator.hasNext():
-            iterator.next()
-            size += iterator.fileInfo().size()
-
-        return size
+    def getDirSignature(path: str):
+        """ get the names and sizes of the files directly in the directory """
+        try:
+            with os.scandir(path) as entries:
+                return tuple(sorted(
+                    (i.name, i.stat().st_size) for i in entries if i.is_file()))
+        except OSError:
+            return None
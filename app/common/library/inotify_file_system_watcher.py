@@ -0,0 +1,263 @@
+# coding:utf-8
+import ctypes
+import ctypes.util
+import os
+import struct
+import sys
+from time import monotonic
+from typing import Dict, List
+
+from common.logger import Logger
+from PyQt5.QtCore import QObject, QSocketNotifier, QTimer, pyqtSignal
+
+from .directory import Directory
+
+logger = Logger("file_system_watcher")
+
+
+# inotify constants, see <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_EXCL_UNLINK = 0x04000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | \
+    IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR | IN_EXCL_UNLINK
+
+EVENT_HEADER = struct.Struct("iIII")
+
+
+def _loadLibc():
+    """ load libc with inotify support, return `None` if it is unavailable """
+    if not sys.platform.startswith("linux"):
+        return None
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c")
+                           or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [
+            ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    except (OSError, AttributeError):
+        return None
+
+    return libc
+
+
+class InotifyFileSystemWatcher(QObject):
+    """ File system watcher using a single inotify instance
+
+    Instead of rescanning the changed directory, the events of audio files
+    are recorded and coalesced per directory. Once a directory has been quiet
+    for `delay` milliseconds, `filesChanged` is emitted with the exact files
+    added and removed.
+    """
+
+    directoryChanged = pyqtSignal(str)
+    filesChanged = pyqtSignal(str, list, list)  # directory, added and removed files
+    directoryRemoved = pyqtSignal(str)
+
+    libc = _loadLibc()
+
+    def __init__(self, delay=500, parent=None):
+        """
+        Parameters
+        ----------
+        delay: int
+            debounce time of each directory in milliseconds
+
+        parent:
+            parent instance
+        """
+        super().__init__(parent=parent)
+        self.delay = delay
+        self.wdToPath = {}          # type:Dict[int, str]
+        self.pathToWd = {}          # type:Dict[str, int]
+
+        # pending changes of each directory, `True` means the file exists
+        self.pendingChanges = {}    # type:Dict[str, Dict[str, bool]]
+        self.lastEventTimes = {}    # type:Dict[str, float]
+
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "Failed to initialize inotify")
+
+        self.notifier = QSocketNotifier(self.fd, QSocketNotifier.Read, self)
+        self.notifier.activated.connect(self.__readEvents)
+        fd = self.fd
+        self.destroyed.connect(lambda: os.close(fd))
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.__onTimerTimeOut)
+
+    @classmethod
+    def isAvailable(cls) -> bool:
+        """ whether inotify can be used on this platform """
+        return cls.libc is not None
+
+    def addPath(self, path: str):
+        """ add a monitored path """
+        path = os.path.normpath(path)
+        if path in self.pathToWd:
+            return True
+
+        wd = self.libc.inotify_add_watch(
+            self.fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            logger.warning(
+                f"Can't monitor `{path}`: {os.strerror(errno)}")
+            return False
+
+        # a directory may be renamed, remove the stale path of watch descriptor
+        self.pathToWd.pop(self.wdToPath.get(wd), None)
+        self.wdToPath[wd] = path
+        self.pathToWd[path] = wd
+        return True
+
+    def addPaths(self, paths: List[str]):
+        """ add multi monitored paths """
+        for path in paths:
+            self.addPath(path)
+
+    def removePath(self, path: str):
+        """ remove a monitored path """
+        path = os.path.normpath(path)
+        wd = self.pathToWd.pop(path, None)
+        self.pendingChanges.pop(path, None)
+        self.lastEventTimes.pop(path, None)
+        if wd is None:
+            return
+
+        self.wdToPath.pop(wd, None)
+        self.libc.inotify_rm_watch(self.fd, wd)
+
+    def removePaths(self, paths: List[str]):
+        """ remove multi monitored paths """
+        for path in paths:
+            self.removePath(path)
+
+    def directories(self):
+        """ get all monitored directories """
+        return list(self.pathToWd.keys())
+
+    def __readEvents(self):
+        """ read and dispatch all events in the inotify buffer """
+        while True:
+            try:
+                buffer = os.read(self.fd, 65536)
+            except BlockingIOError:
+                break
+            except OSError as e:
+                logger.error(f"Failed to read inotify events. {e}")
+                break
+
+            if not buffer:
+                break
+
+            offset = 0
+            while offset + EVENT_HEADER.size <= len(buffer):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(buffer, offset)
+                offset += EVENT_HEADER.size
+                name = os.fsdecode(buffer[offset:offset+length].rstrip(b"\0"))
+                offset += length
+                self.__handleEvent(wd, mask, name)
+
+    def __handleEvent(self, wd: int, mask: int, name: str):
+        """ handle an inotify event """
+        if mask & IN_Q_OVERFLOW:
+            logger.warning("Inotify event queue overflowed, rescan all directories")
+            for path in self.directories():
+                self.directoryChanged.emit(path)
+            return
+
+        path = self.wdToPath.get(wd)
+        if path is None:
+            return
+
+        if mask & (IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED):
+            self.__removeTree(path)
+            return
+
+        child = os.path.join(path, name)
+
+        if mask & IN_ISDIR:
+            if mask & (IN_CREATE | IN_MOVED_TO):
+                self.__addTree(child)
+            elif mask & (IN_DELETE | IN_MOVED_FROM):
+                self.__removeTree(child)
+            return
+
+        if not Directory.isAudioName(name):
+            return
+
+        if mask & (IN_CREATE | IN_MOVED_TO):
+            exists = True
+        elif mask & (IN_DELETE | IN_MOVED_FROM):
+            exists = False
+        elif name in self.pendingChanges.get(path, {}):
+            # the new file is still being written
+            self.__touch(path)
+            return
+        else:
+            return
+
+        self.pendingChanges.setdefault(path, {})[name] = exists
+        self.__touch(path)
+
+    def __addTree(self, path: str):
+        """ monitor a new directory tree and record its audio files as added """
+        for folder, _, names in os.walk(path):
+            if not self.addPath(folder):
+                continue
+
+            folder = os.path.normpath(folder)
+            changes = self.pendingChanges.setdefault(folder, {})
+            changes.update({i: True for i in names if Directory.isAudioName(i)})
+            self.__touch(folder)
+
+    def __removeTree(self, path: str):
+        """ stop monitoring a removed directory tree """
+        prefix = os.path.join(path, "")
+        paths = [i for i in self.pathToWd if i == path or i.startswith(prefix)]
+        if not paths:
+            return
+
+        self.removePaths(paths)
+        self.directoryRemoved.emit(path)
+
+    def __touch(self, path: str):
+        """ restart the debounce time of a directory """
+        self.lastEventTimes[path] = monotonic()
+        if not self.timer.isActive():
+            self.timer.start(self.delay)
+
+    def __onTimerTimeOut(self):
+        """ emit the changes of directories which are quiet enough """
+        now = monotonic()
+        delay = self.delay / 1000
+        paths = [p for p, t in self.lastEventTimes.items() if now - t >= delay]
+
+        for path in paths:
+            self.lastEventTimes.pop(path)
+            changes = self.pendingChanges.pop(path, {})
+            added = [os.path.join(path, k) for k, v in changes.items() if v]
+            removed = [os.path.join(path, k) for k, v in changes.items() if not v]
+            self.filesChanged.emit(path, added, removed)
+
+        if self.lastEventTimes:
+            remain = delay - (now - min(self.lastEventTimes.values()))
+            self.timer.start(max(int(remain * 1000), 1))
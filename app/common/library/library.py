@@ -1,21 +1,27 @@
 # coding:utf-8
 from pathlib import Path
-from typing import List, Union
+from typing import Dict, List, Union
 
 from PyQt5.QtCore import QObject, pyqtSignal
 from PyQt5.QtSql import QSqlDatabase
 
-from ..database.controller import (AlbumCoverController, AlbumInfoController,
-                                   PlaylistController, RecentPlayController,
-                                   SingerInfoController, SongInfoController)
-from ..database.entity import SongInfo
+from ..database.controller import (AggregationController,
+                                   AlbumCoverController, AlbumInfoController,
+                                   PictureController, PlaylistController,
+                                   RecentPlayController, SingerInfoController,
+                                   SnapshotController, SongInfoController,
+                                   SortKeyController)
+from ..database.entity import AlbumInfo, SingerInfo, SongInfo
+from .file_availability import fileAvailability
 from .file_system import FileSystem
+from .library_index import LibraryIndex
 
 
 class Library(QObject):
     """ Song library """
 
-    loadFinished = pyqtSignal()
+    loadFinished = pyqtSignal(list, list, list, dict)  # directories, song information, removed files and folder tree
+    loadProgressed = pyqtSignal(list, list, list)   # song, album and singer information chunk
     reloadFinished = pyqtSignal()
     fileAdded = pyqtSignal(list)
     fileRemoved = pyqtSignal(list)
@@ -32,48 +38,115 @@ class Library(QObject):
             database to be used
 
         watch: bool
-            whether to monitor audio directories
+            whether to monitor audio directories, the directories are monitored
+            once their folders are known by `load()` or `applyLoadResult()`
 
         parent:
             parent instance
         """
         super().__init__(parent=parent)
-        self.songInfos = []
-        self.albumInfos = []
-        self.singerInfos = []
-        self.playlists = []
+        self.songIndex = LibraryIndex()
         self.directories = directories
-        self.fileSystem = FileSystem(directories, watch, self)
+        self.fileSystem = FileSystem(None, watch, parent=self)
+        self.fileAvailability = fileAvailability
 
         self.songInfoController = SongInfoController(db)
         self.albumInfoController = AlbumInfoController(db)
         self.albumCoverController = AlbumCoverController()
+        self.pictureController = PictureController(db)
         self.singerInfoController = SingerInfoController(db)
         self.playlistController = PlaylistController(db)
         self.recentPlayController = RecentPlayController(db)
+        self.snapshotController = SnapshotController(db)
+        self.aggregationController = AggregationController(db)
+        self.sortKeyController = SortKeyController(db)
 
         self.songInfos = []
         self.albumInfos = []
         self.singerInfos = []
         self.playlists = []
         self.recentPlaySongInfos = []
+        self.mergedSongInfos = []
+
+        self.fileSystem.changed.connect(self.__onFileChanged)
+
+    @property
+    def songInfos(self) -> List[SongInfo]:
+        """ song information list sorted by create time in descending order """
+        return self.songIndex.orderBy("createTime")
 
-        self.fileSystem.added.connect(self.__onFileAdded)
-        self.fileSystem.removed.connect(self.__onFileRemoved)
+    @songInfos.setter
+    def songInfos(self, songInfos: List[SongInfo]):
+        self.songIndex = LibraryIndex(songInfos)
+
+    def load(self, stream=False):
+        """ load data to library
+
+        Parameters
+        ----------
+        stream: bool
+            whether to emit `loadProgressed` signal once a chunk of new song information is read
+        """
+        self.pictureController.loadIndex()
+        self.sortKeyController.loadIndex()
+
+        # use the modified time in directory snapshot to avoid calling `stat()` again
+        snapshots = self.snapshotController.scan(self.directories)
+        mtimes = {Path(i.file): int(i.mtime) for i in snapshots}
+        files = list(mtimes.keys())
+
+        # monitor the folders found by scanning instead of walking the directories again
+        tree = self.snapshotController.getDirectoryTree(snapshots)
+        self.fileSystem.setDirs(self.directories, tree)
+
+        removedFiles = []
+        if stream:
+            self.songInfos = self.__loadSongInfosByChunk(files, mtimes, removedFiles)
+        else:
+            self.songInfos = self.songInfoController.getSongInfosFromCache(
+                files, mtimes, removedFiles)
+            self.albumCoverController.getAlbumCovers(self.songInfos)
 
-    def load(self):
-        """ load data to library """
-        files = self.fileSystem.glob()
-        self.songInfos = self.songInfoController.getSongInfosFromCache(files)
         self.albumInfos = self.albumInfoController.getAlbumInfosFromCache(
             self.songInfos)
-        self.albumCoverController.getAlbumCovers(self.songInfos)
         self.singerInfos = self.singerInfoController.getSingerInfosFromCache(
             self.albumInfos)
         self.playlists = self.playlistController.getAllPlaylists()
         self.recentPlaySongInfos = self.recentPlayController.getRecentPlays()
+        self.aggregationController.invalidate()
+        self.pictureController.saveIndex()
+        self.__updateSortKeys()
+
+        self.loadFinished.emit(self.directories, self.songInfos, removedFiles, tree)
+
+    def loadFromCache(self):
+        """ load data cached in database to library without scanning audio directories """
+        # scanning the picture folders is left to `load()` in the library thread
+        self.pictureController.loadIndex(False)
+        self.sortKeyController.loadIndex()
+        self.songInfos = self.songInfoController.getCachedSongInfos()
+        self.albumInfos = self.albumInfoController.getCachedAlbumInfos()
+        self.singerInfos = self.singerInfoController.getCachedSingerInfos()
+        self.playlists = self.playlistController.getAllPlaylists()
+        self.recentPlaySongInfos = self.recentPlayController.getRecentPlays()
+        self.aggregationController.invalidate()
+        self.__updateSortKeys()
+
+    def merge(self, songInfos: List[SongInfo], albumInfos: List[AlbumInfo], singerInfos: List[SingerInfo]):
+        """ merge a chunk of information emitted by `loadProgressed` signal into library """
+        songInfos = self.__newerSongInfos(songInfos)
+        self.songIndex.add(songInfos)
+        self.mergedSongInfos.extend(songInfos)
+
+        albumKeys = {(i.singer, i.album) for i in self.albumInfos}
+        albumInfos = [i for i in albumInfos if (i.singer, i.album) not in albumKeys]
+        self.albumInfos = sorted(
+            self.albumInfos + albumInfos, key=lambda i: i.modifiedTime, reverse=True)
 
-        self.loadFinished.emit()
+        singers = {i.singer for i in self.singerInfos}
+        self.singerInfos = self.singerInfos + \
+            [i for i in singerInfos if i.singer not in singers]
+        self.aggregationController.invalidate()
 
     def loadFromFiles(self, files: List[Union[Path, str]], emit=True):
         """ load song information from files """
@@ -84,6 +157,29 @@ class Library(QObject):
 
         return songInfos
 
+    def getAlbumInfo(self, singer: str, album: str) -> AlbumInfo:
+        """ get an album information, the songs of album are looked up in the index """
+        return self.albumInfoController.getAlbumInfo(
+            singer, album, self.songIndex.listByAlbum(singer, album))
+
+    def getSongInfosBySingers(self, singers: List[str]) -> List[SongInfo]:
+        """ get song information of singers, which are sorted by singer, album and track """
+        songInfos = []
+        for singer in dict.fromkeys(singers):
+            songInfos.extend(sorted(
+                self.songIndex.listBySinger(singer), key=lambda i: (i.album, i.track or 0)))
+
+        return songInfos
+
+    def getSongInfosBySingerAlbum(self, singers: List[str], albums: List[str]) -> List[SongInfo]:
+        """ get song information of albums, which are sorted by album and track """
+        songInfos = []
+        for singer, album in dict.fromkeys(zip(singers, albums)):
+            songInfos.extend(sorted(
+                self.songIndex.listByAlbum(singer, album), key=lambda i: i.track or 0))
+
+        return songInfos
+
     def setDirectories(self, directories: List[str]):
         """ set the audio directories """
         isChanged = self.fileSystem.setDirs(directories)
@@ -105,73 +201,137 @@ class Library(QObject):
         self.albumInfoController.albumInfoService.setDatabase(db)
         self.singerInfoController.singerInfoService.setDatabase(db)
         self.playlistController.playlistService.setDatabase(db)
-
-    def copyTo(self, library):
-        """ copy data to another library """
-        library.songInfos = self.songInfos
-        library.albumInfos = self.albumInfos
-        library.singerInfos = self.singerInfos
-        library.playlists = self.playlists
-        library.recentPlaySongInfos = self.recentPlaySongInfos
-        library.directories = self.directories.copy()
-        library.fileSystem.setDirs(self.directories)
+        self.snapshotController.snapshotService.setDatabase(db)
+        self.aggregationController.albumInfoService.setDatabase(db)
+        self.aggregationController.singerInfoService.setDatabase(db)
+        self.pictureController.pictureInfoService.setDatabase(db)
+        self.sortKeyController.sortKeyService.setDatabase(db)
+
+    def applyLoadResult(self, directories: List[str], songInfos: List[SongInfo], removedFiles: List[str],
+                        tree: Dict[Path, List[Path]]):
+        """ apply the result of `load()` emitted by `loadFinished` signal of another library,
+        only the scan delta is applied, so the changes made during loading are kept """
+        self.directories = directories.copy()
+        self.fileSystem.setDirs(directories, tree)
+
+        # the availability service lives in the GUI thread, so it's fed here instead of in `load()`
+        self.fileAvailability.setAvailable(removedFiles, False)
+        self.fileAvailability.setAvailable((i for files in tree.values() for i in files), True)
+
+        added = self.__newerSongInfos(songInfos)
+        removed = self.songIndex.remove(removedFiles)
+        olds = self.songIndex.add(added)
+
+        # the temporary album and singer information of merged chunks are replaced too
+        self.__aggregate(self.mergedSongInfos + added, removed + olds)
+        self.mergedSongInfos = []
+        self.__updateSortKeys(added)
 
     def updateSongInfo(self, oldSongInfo: SongInfo, newSongInfo: SongInfo):
         """ update one song information """
         self.songInfoController.updateSongInfo(newSongInfo)
 
-        for i, songInfo_ in enumerate(self.songInfos):
-            if newSongInfo.file == songInfo_.file:
-                self.songInfos[i] = newSongInfo
-                break
-
-        self.albumInfos = self.albumInfoController.updateBySongInfo(
-            oldSongInfo, newSongInfo)
-        self.singerInfos = self.singerInfoController.getSingerInfosFromCache(
-            self.albumInfos)
+        self.songIndex.update([newSongInfo])
+        self.__aggregate([newSongInfo], [oldSongInfo], True)
         self.albumCoverController.getAlbumCover(newSongInfo)
+        self.__updateSortKeys([newSongInfo])
 
     def updateMultiSongInfos(self, olds: List[SongInfo], news: List[SongInfo]):
         """ update multi song information """
         self.songInfoController.updateMultiSongInfos(news)
 
-        songInfoMap = {i.file: i for i in news}
-        for i, songInfo_ in enumerate(self.songInfos):
-            if songInfo_.file in songInfoMap:
-                self.songInfos[i] = songInfoMap[songInfo_.file]
-
-        self.albumInfos = self.albumInfoController.updateBySongInfos(
-            olds, news)
-        self.singerInfos = self.singerInfoController.getSingerInfosFromCache(
-            self.albumInfos)
+        self.songIndex.update(news)
+        self.__aggregate(news, olds, True)
         self.albumCoverController.getAlbumCovers(news)
+        self.__updateSortKeys(news)
 
-    def __onFileAdded(self, files: List[Path]):
-        """ file added to file system slot """
-        songInfos = self.songInfoController.addSongInfos(files)
-
-        # don't change to extend() or += which will affect the selected song card
-        self.songInfos = self.songInfos + songInfos
-        self.songInfos.sort(key=lambda i: i.createTime, reverse=True)
-        self.albumInfos = self.albumInfoController.getAlbumInfosFromCache(
-            self.songInfos)
-        self.singerInfos = self.singerInfoController.getSingerInfosFromCache(
-            self.albumInfos)
-        self.albumCoverController.getAlbumCovers(songInfos)
-
-        self.fileAdded.emit(songInfos)
-
-    def __onFileRemoved(self, files: List[Path]):
-        """ file removed from file system slot """
-        files = self.songInfoController.removeSongInfos(files)
+    def __onFileChanged(self, added: List[Path], removed: List[Path]):
+        """ file system changed slot, all changes of a batch are applied at once """
+        self.fileAvailability.setAvailable(removed, False)
+        self.fileAvailability.setAvailable(added, True)
 
-        for songInfo in self.songInfos.copy():
-            if songInfo.file in files:
-                self.songInfos.remove(songInfo)
+        removed = self.songInfoController.removeSongInfos(removed) if removed else []
+        songInfos = self.songInfoController.addSongInfos(added) if added else []
 
-        self.albumInfos = self.albumInfoController.getAlbumInfosFromCache(
-            self.songInfos)
-        self.singerInfos = self.singerInfoController.getSingerInfosFromCache(
-            self.albumInfos)
-
-        self.fileRemoved.emit(files)
+        # the index creates a new sorted list, so the song cards using the old one are not affected
+        removedSongInfos = self.songIndex.remove(removed)
+        self.songIndex.add(songInfos)
+        self.__aggregate(songInfos, removedSongInfos)
+        self.albumCoverController.getAlbumCovers(songInfos)
+        self.pictureController.saveIndex()
+        self.__updateSortKeys(songInfos)
+
+        if removed:
+            self.fileRemoved.emit(removed)
+
+        if songInfos:
+            self.fileAdded.emit(songInfos)
+
+    def __newerSongInfos(self, songInfos: List[SongInfo]) -> List[SongInfo]:
+        """ filter out the song information older than the one in library, e.g.
+        the song edited during loading is newer than the one read by scanning """
+        newers = []
+        for songInfo in songInfos:
+            old = self.songIndex.get(songInfo.file)
+            if not old or songInfo.modifiedTime > old.modifiedTime:
+                newers.append(songInfo)
+
+        return newers
+
+    def __aggregate(self, added: List[SongInfo], removed: List[SongInfo], override=False):
+        """ update album and singer information by the changed song information,
+        only the affected albums and singers are aggregated again """
+        if not self.aggregationController.isBuilt:
+            self.aggregationController.build(
+                self.songInfos, self.albumInfos, self.singerInfos)
+
+        self.albumInfos, self.singerInfos = self.aggregationController.update(
+            added, removed, override)
+
+    def __updateSortKeys(self, songInfos: List[SongInfo] = None):
+        """ compute the sort keys of new songs, albums, singers and playlists and persist them """
+        songInfos = self.songInfos if songInfos is None else songInfos
+        self.sortKeyController.update(
+            songInfos, self.albumInfos, self.singerInfos, self.playlists)
+        self.sortKeyController.saveIndex()
+
+    def __loadSongInfosByChunk(self, files: List[Path], mtimes: Dict[Path, int], removed: List[str]) -> List[SongInfo]:
+        """ load song information and emit the new ones chunk by chunk """
+        chunks = self.songInfoController.iterSongInfosFromCache(files, mtimes, removed)
+
+        # the cached song information has been loaded by `loadFromCache()`
+        songInfos = next(chunks)
+        self.albumCoverController.getAlbumCovers(songInfos)
+        albumKeys = {(i.singer, i.album) for i in songInfos}
+        singers = {i.singer for i in songInfos}
+
+        for chunk in chunks:
+            songInfos.extend(chunk)
+            self.albumCoverController.getAlbumCovers(chunk)
+
+            # create temporary album and singer information which will be
+            # replaced by the ones in database after loading
+            albumInfos = []
+            singerInfos = []
+            for songInfo in chunk:
+                key = (songInfo.singer, songInfo.album)
+                if key not in albumKeys:
+                    albumKeys.add(key)
+                    albumInfos.append(AlbumInfo(
+                        singer=songInfo.singer,
+                        album=songInfo.album,
+                        year=songInfo.year,
+                        genre=songInfo.genre,
+                        modifiedTime=songInfo.createTime
+                    ))
+
+                if songInfo.singer not in singers:
+                    singers.add(songInfo.singer)
+                    singerInfos.append(SingerInfo(
+                        singer=songInfo.singer, genre=songInfo.genre))
+
+            self.sortKeyController.update(chunk, albumInfos, singerInfos)
+            self.loadProgressed.emit(chunk, albumInfos, singerInfos)
+
+        songInfos.sort(key=lambda i: i.createTime, reverse=True)
+        return songInfos
@@ -0,0 +1,135 @@
+# coding:utf-8
+from typing import Dict, Iterable, List, Tuple
+
+from ..database.entity import SongInfo
+
+
+class LibraryIndex:
+    """ In-memory index of song information
+
+    Song information is stored in a dict keyed by file path, with secondary
+    indexes by `(singer, album)` and singer. Sorted views are built
+    lazily and cached until the index is changed, so a batch of changes costs
+    O(changed songs) plus one sort of an almost sorted list.
+    """
+
+    # ordered view name: (sort key, reverse)
+    orders = {
+        "createTime": (lambda i: i.createTime, True),
+    }
+
+    def __init__(self, songInfos: Iterable[SongInfo] = None):
+        self.songInfos = {}         # type:Dict[str, SongInfo]
+        self.albumSongInfos = {}    # type:Dict[Tuple[str, str], Dict[str, SongInfo]]
+        self.singerSongInfos = {}   # type:Dict[str, Dict[str, SongInfo]]
+        self.views = {}             # type:Dict[str, List[SongInfo]]
+        self.add(songInfos or [])
+
+    def __len__(self):
+        return len(self.songInfos)
+
+    def __contains__(self, file: str):
+        return file in self.songInfos
+
+    def __iter__(self):
+        return iter(self.songInfos.values())
+
+    def get(self, file: str, default=None) -> SongInfo:
+        """ get song information by file path """
+        return self.songInfos.get(file, default)
+
+    def add(self, songInfos: Iterable[SongInfo]):
+        """ add song information, the one with the same file will be replaced
+
+        Returns
+        -------
+        olds: List[SongInfo]
+            the replaced song information
+        """
+        olds = []
+        for songInfo in songInfos:
+            old = self.songInfos.get(songInfo.file)
+            if old:
+                self.__unindex(old)
+                olds.append(old)
+
+            self.songInfos[songInfo.file] = songInfo
+            self.__index(songInfo)
+
+        self.views.clear()
+        return olds
+
+    def update(self, songInfos: Iterable[SongInfo]):
+        """ replace the song information with the same file, unknown songs are ignored
+
+        Returns
+        -------
+        olds: List[SongInfo]
+            the replaced song information
+        """
+        return self.add([i for i in songInfos if i.file in self.songInfos])
+
+    def remove(self, files: Iterable[str]) -> List[SongInfo]:
+        """ remove song information by file path
+
+        Returns
+        -------
+        removed: List[SongInfo]
+            the removed song information
+        """
+        removed = []
+        for file in files:
+            songInfo = self.songInfos.pop(file, None)
+            if songInfo:
+                self.__unindex(songInfo)
+                removed.append(songInfo)
+
+        self.views.clear()
+        return removed
+
+    def listByAlbum(self, singer: str, album: str) -> List[SongInfo]:
+        """ list song information of an album """
+        return list(self.albumSongInfos.get((singer, album), {}).values())
+
+    def listBySinger(self, singer: str) -> List[SongInfo]:
+        """ list song information of a singer """
+        return list(self.singerSongInfos.get(singer, {}).values())
+
+    def orderBy(self, order="createTime") -> List[SongInfo]:
+        """ get the song information list in specified order
+
+        Parameters
+        ----------
+        order: str
+            order name, only `createTime` (descending) is supported now
+
+        Returns
+        -------
+        songInfos: List[SongInfo]
+            sorted song information list, a new list is created once the index
+            changes, so don't modify it
+        """
+        if order not in self.views:
+            key, reverse = self.orders[order]
+            self.views[order] = sorted(
+                self.songInfos.values(), key=key, reverse=reverse)
+
+        return self.views[order]
+
+    def __index(self, songInfo: SongInfo):
+        file = songInfo.file
+        self.albumSongInfos.setdefault(
+            (songInfo.singer, songInfo.album), {})[file] = songInfo
+        self.singerSongInfos.setdefault(songInfo.singer, {})[file] = songInfo
+
+    def __unindex(self, songInfo: SongInfo):
+        file = songInfo.file
+        for index, key in [(self.albumSongInfos, (songInfo.singer, songInfo.album)),
+                           (self.singerSongInfos, songInfo.singer)]:
+            songInfos = index.get(key)
+            if songInfos is None:
+                continue
+
+            songInfos.pop(file, None)
+            if not songInfos:
+                index.pop(key)
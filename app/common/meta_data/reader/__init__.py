@@ -1,3 +1,6 @@
 from .song_info_reader import SongInfoReader
+from .parallel_song_info_reader import ParallelSongInfoReader
 from .album_cover_reader import AlbumCoverReader
-from .lyric_reader import LyricReader
\ No newline at end of file
+from .lyric_reader import LyricReader
+from .tag_cache import TagCache, tagCache
+from .tag_reader import AudioTag, TagReader
@@ -1,14 +1,14 @@
 # coding:utf-8
 import base64
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from shutil import rmtree
-from typing import List, Union
+from typing import Dict, List, Tuple, Union
 
 from common.exception_handler import exceptionHandler
 from common.cache import albumCoverFolder
 from common.database.entity import SongInfo
 from common.picture import Cover
-from mutagen import File, FileType
+from mutagen import FileType
 from mutagen.aac import AAC
 from mutagen.aiff import AIFF
 from mutagen.apev2 import APEv2
@@ -25,11 +25,18 @@ from mutagen.oggvorbis import OggVorbis
 from mutagen.trueaudio import TrueAudio
 from mutagen.wave import WAVE
 
+from .tag_cache import tagCache
+
 
 class AlbumCoverReader:
-    """ Read and save album cover class """
+    """ Read and save album cover class
+
+    The covers are saved to the content-addressed store of `Cover`, so the albums
+    sharing the same artwork only reference one copy of picture.
+    """
 
     coverFolder = albumCoverFolder
+    maxWorkers = 8
     _readers = []
 
     @classmethod
@@ -48,39 +55,107 @@ class AlbumCoverReader:
 
     @classmethod
     def getAlbumCovers(cls, songInfos: List[SongInfo]):
-        """ Read and save album covers from audio files """
-        cls.coverFolder.mkdir(exist_ok=True, parents=True)
+        """ Read and save album covers from audio files, only one representative
+        track of each album without cover is read """
+        covers = {}     # type:Dict[Tuple[str, str], Cover]
+        files = []
         for songInfo in songInfos:
-            cls.getAlbumCover(songInfo)
+            key = (songInfo.singer, songInfo.album)
+            if key in covers:
+                continue
+
+            cover = Cover(songInfo.singer, songInfo.album)
+            covers[key] = cover
+            if cover.isExists():
+                continue
+
+            # remove the dirty folder
+            cover.delete()
+
+            if not songInfo.file.startswith('http'):
+                files.append((cover, songInfo.file))
+
+        if not files:
+            return
+
+        # the covers are saved in the current thread, only reading is parallel
+        workers = min(cls.maxWorkers, len(files))
+        with ThreadPoolExecutor(workers) as executor:
+            datas = executor.map(cls.readCoverData, [i[1] for i in files])
+            for (cover, _), picData in zip(files, datas):
+                if picData:
+                    cls._saveCover(cover, picData)
 
     @classmethod
     @exceptionHandler("meta_data_reader", False)
-    def getAlbumCover(cls, songInfo: SongInfo) -> bool:
-        """ Read and save an album cover from audio file """
-        cls.coverFolder.mkdir(exist_ok=True, parents=True)
+    def getAlbumCover(cls, songInfo: SongInfo, audio: FileType = None) -> bool:
+        """ Read and save an album cover from audio file
+
+        Parameters
+        ----------
+        songInfo: SongInfo
+            song information
 
+        audio: FileType
+            the parsed audio tag of song, the tag cache is used if it's `None`
+
+        Returns
+        -------
+        success: bool
+            whether the album cover exists
+        """
         cover = Cover(songInfo.singer, songInfo.album)
         if cover.isExists():
             return True
 
         # remove the dirty folder
-        if cover.folder.exists():
-            rmtree(cover.folder)
+        cover.delete()
 
         file = songInfo.file
         if file.startswith('http'):
             return False
 
+        picData = cls.readCoverData(file, audio)
+        if picData:
+            cover.save(picData)
+            return True
+
+        return False
+
+    @classmethod
+    @exceptionHandler("meta_data_reader")
+    def _saveCover(cls, cover: Cover, picData: bytes):
+        """ save album cover """
+        cover.save(picData)
+
+    @classmethod
+    @exceptionHandler("meta_data_reader")
+    def readCoverData(cls, file: Union[Path, str], audio: FileType = None) -> bytes:
+        """ extract binary data of album cover from audio file
+
+        Parameters
+        ----------
+        file: str | Path
+            audio file path
+
+        audio: FileType
+            the parsed audio tag, the tag cache is used if it's `None`
+
+        Returns
+        -------
+        picData: bytes
+            binary data of album cover, `None` if no cover is found
+        """
         for Reader in cls._readers:
             if not Reader.canRead(file):
                 continue
 
-            picData = Reader.read(file)
-            if picData:
-                cover.save(picData)
-                return True
+            if audio is None:
+                audio = tagCache.parse(file)
 
-        return False
+            return Reader.readFromAudio(audio)
+
+        return None
 
 
 class CoverDataReaderBase:
@@ -95,9 +170,25 @@ class CoverDataReaderBase:
         return str(file).lower().endswith(tuple(cls.formats))
 
     @classmethod
-    def read(cls, audio: FileType) -> bytes:
+    def read(cls, file: Union[Path, str]) -> bytes:
         """ extract binary data of album cover from audio file
 
+        Parameters
+        ----------
+        file: str | Path
+            audio file path
+
+        Returns
+        -------
+        picData: bytes
+            binary data of album cover, `None` if no cover is found
+        """
+        return cls.readFromAudio(tagCache.parse(file))
+
+    @classmethod
+    def readFromAudio(cls, audio: FileType) -> bytes:
+        """ extract binary data of album cover from the parsed audio tag
+
         Parameters
         ----------
         audio: FileType
@@ -119,11 +210,9 @@ class ID3CoverDataReader(CoverDataReaderBase):
     options = [MP3, AAC, TrueAudio]
 
     @classmethod
-    def read(cls, file: Union[Path, str]) -> bytes:
-        try:
-            return cls._readFromTag(ID3(file))
-        except:
-            return None
+    def readFromAudio(cls, audio: FileType) -> bytes:
+        tag = audio if isinstance(audio, ID3) else audio.tags
+        return cls._readFromTag(tag or {})
 
     @classmethod
     def _readFromTag(cls, tag):
@@ -141,8 +230,7 @@ class FLACCoverDataReader(CoverDataReaderBase):
     options = [FLAC]
 
     @classmethod
-    def read(cls, file: Union[Path, str]) -> bytes:
-        audio = FLAC(file)
+    def readFromAudio(cls, audio: FLAC) -> bytes:
         if not audio.pictures:
             return None
 
@@ -157,8 +245,7 @@ class MP4CoverDataReader(CoverDataReaderBase):
     options = [MP4]
 
     @classmethod
-    def read(cls, file: Union[Path, str]) -> bytes:
-        audio = MP4(file)
+    def readFromAudio(cls, audio: MP4) -> bytes:
         if not audio.get("covr"):
             return None
 
@@ -173,8 +260,7 @@ class OGGCoverDataReader(CoverDataReaderBase):
     options = [OggVorbis, OggFLAC, OggSpeex, OggOpus]
 
     @classmethod
-    def read(cls, file: Union[Path, str]) -> bytes:
-        audio = File(file, options=cls.options)
+    def readFromAudio(cls, audio: FileType) -> bytes:
         for base64Data in audio.get("metadata_block_picture", []):
             try:
                 return Picture(base64.b64decode(base64Data)).data
@@ -189,10 +275,6 @@ class SuperID3CoverDataReader(ID3CoverDataReader):
     formats = [".aiff", ".wav"]
     options = [AIFF, WAVE]
 
-    @classmethod
-    def read(cls, file: Union[Path, str]) -> bytes:
-        return cls._readFromTag(File(file, options=cls.options))
-
 
 @AlbumCoverReader.register
 class APECoverDataReader(CoverDataReaderBase):
@@ -202,11 +284,9 @@ class APECoverDataReader(CoverDataReaderBase):
     options = [APEv2]
 
     @classmethod
-    def read(cls, file: Union[Path, str]) -> bytes:
-        try:
-            return cls._readFromTag(APEv2(file))
-        except:
-            return None
+    def readFromAudio(cls, audio: FileType) -> bytes:
+        tag = audio if isinstance(audio, APEv2) else audio.tags
+        return cls._readFromTag(tag or {})
 
     @classmethod
     def _readFromTag(cls, tag):
@@ -226,8 +306,7 @@ class ASFCoverDataReader(CoverDataReaderBase):
     options = [ASF]
 
     @classmethod
-    def read(cls, file: Union[Path, str]) -> bytes:
-        audio = ASF(file)
+    def readFromAudio(cls, audio: ASF) -> bytes:
         picture = audio.get('WM/Picture')  # type:List[ASFByteArrayAttribute]
         if not picture:
             return None
@@ -4,18 +4,12 @@ from typing import List, Union
 
 from common.lyric import Lyric
 from common.exception_handler import exceptionHandler
-from mutagen import File
-from mutagen.aiff import AIFF
+from mutagen import FileType
 from mutagen.apev2 import APEv2
-from mutagen.asf import ASF, ASFUnicodeAttribute
-from mutagen.flac import FLAC
-from mutagen.id3 import ID3, USLT
-from mutagen.mp4 import MP4
-from mutagen.oggflac import OggFLAC
-from mutagen.oggopus import OggOpus
-from mutagen.oggspeex import OggSpeex
-from mutagen.oggvorbis import OggVorbis
-from mutagen.wave import WAVE
+from mutagen.asf import ASFUnicodeAttribute
+from mutagen.id3 import ID3
+
+from .tag_cache import tagCache
 
 
 class LyricReader:
@@ -39,7 +33,7 @@ class LyricReader:
 
     @classmethod
     @exceptionHandler("meta_data_reader", Lyric.new())
-    def read(cls, file: Union[Path, str]) -> Lyric:
+    def read(cls, file: Union[Path, str], audio: FileType = None) -> Lyric:
         """ read lyrics from audio file
 
         Parameters
@@ -47,6 +41,9 @@ class LyricReader:
         file: str or Path
             audio file path
 
+        audio: FileType
+            the parsed audio tag, the tag cache is used if it's `None`
+
         Returns
         -------
         lyric: Lyric
@@ -56,8 +53,13 @@ class LyricReader:
             return Lyric.new()
 
         for reader in cls._readers:
-            if reader.canRead(file):
-                return reader.read(file)
+            if not reader.canRead(file):
+                continue
+
+            if audio is None:
+                audio = tagCache.parse(file)
+
+            return reader.readFromAudio(audio)
 
         return Lyric.new()
 
@@ -81,6 +83,22 @@ class LyricReaderBase:
         file: str or Path
             audio file path
 
+        Returns
+        -------
+        lyric: Lyric
+            song lyrics
+        """
+        return cls.readFromAudio(tagCache.parse(file))
+
+    @classmethod
+    def readFromAudio(cls, audio: FileType) -> Lyric:
+        """ read lyrics from the parsed audio tag
+
+        Parameters
+        ----------
+        audio: FileType
+            audio tag instance
+
         Returns
         -------
         lyric: Lyric
@@ -96,11 +114,9 @@ class ID3LyricReader(LyricReaderBase):
     formats = [".mp3", ".aac", ".tta"]
 
     @classmethod
-    def read(cls, file: Union[Path, str]) -> Lyric:
-        try:
-            return cls._readFromTag(ID3(file))
-        except:
-            return Lyric.new()
+    def readFromAudio(cls, audio: FileType) -> Lyric:
+        tag = audio if isinstance(audio, ID3) else audio.tags
+        return cls._readFromTag(tag or {})
 
     @classmethod
     def _readFromTag(cls, tag: ID3):
@@ -117,11 +133,6 @@ class SuperID3LyricReader(ID3LyricReader):
     """ Super ID3 album cover data reader """
 
     formats = [".aiff", ".wav"]
-    options = [AIFF, WAVE]
-
-    @classmethod
-    def read(cls, file: Union[Path, str]):
-        return cls._readFromTag(File(file, options=cls.options))
 
 
 @LyricReader.register
@@ -131,9 +142,7 @@ class FLACLyricReader(LyricReaderBase):
     formats = [".flac", ".ogg", ".opus"]
 
     @classmethod
-    def read(cls, file: Union[Path, str]):
-        audio = File(file, options=[FLAC, OggVorbis,
-                     OggFLAC, OggSpeex, OggOpus])
+    def readFromAudio(cls, audio: FileType) -> Lyric:
         if not audio.get("lyrics"):
             return Lyric.new()
 
@@ -147,8 +156,7 @@ class MP4LyricReader(LyricReaderBase):
     formats = [".m4a", ".mp4"]
 
     @classmethod
-    def read(cls, file: Union[Path, str]):
-        audio = MP4(file)
+    def readFromAudio(cls, audio: FileType) -> Lyric:
         lyric = audio.get("©lyr") or audio.get("----:com.apple.iTunes:Lyrics")
         if not lyric:
             return Lyric.new()
@@ -165,9 +173,9 @@ class APECoverDataReader(LyricReaderBase):
     formats = [".ac3", ".ape", ".wv", ".mpc"]
 
     @classmethod
-    def read(cls, file: Union[Path, str]) -> bytes:
-        tag = APEv2(file)
-        if not tag.get("Lyrics"):
+    def readFromAudio(cls, audio: FileType) -> Lyric:
+        tag = audio if isinstance(audio, APEv2) else audio.tags
+        if not tag or not tag.get("Lyrics"):
             return Lyric.new()
 
         return Lyric.parse(str(tag["Lyrics"]))
@@ -180,8 +188,7 @@ class ASFLyricReader(LyricReaderBase):
     formats = [".asf", ".wma"]
 
     @classmethod
-    def read(cls, file: Union[Path, str]) -> Lyric:
-        audio = ASF(file)
+    def readFromAudio(cls, audio: FileType) -> Lyric:
         lyric = audio.get("WM/Lyrics", [None])[0]  # type:ASFUnicodeAttribute
         if not lyric:
             return Lyric.new()
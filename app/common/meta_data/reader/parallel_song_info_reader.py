@@ -0,0 +1,197 @@
+# coding:utf-8
+import multiprocessing as mp
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Iterator, List, Set, Tuple, Union
+
+from common.database.entity import PictureInfo, SongInfo
+from common.logger import Logger
+from common.picture import Cover
+
+from .song_info_reader import SongInfoReaderBase
+from .tag_reader import TagReader
+
+logger = Logger("meta_data_reader")
+
+# keys of the albums whose cover has been stored, used by worker process
+_coverKeys = set()
+
+
+def _initWorker(defaults: dict, coverKeys: Set[str]):
+    """ initialize worker process
+
+    Parameters
+    ----------
+    defaults: dict
+        default values of song information translated in main process
+
+    coverKeys: Set[str]
+        keys of the albums whose cover has been stored
+    """
+    global _coverKeys
+    SongInfoReaderBase.defaults = defaults
+    _coverKeys = coverKeys
+
+
+def _readBatch(files: List[Union[str, Path]], coverKeys: Set[str] = None) -> Tuple[List[SongInfo], List[PictureInfo]]:
+    """ read song information of a batch of audio files, the album covers are
+    extracted from the same parsed tags and written to the cover store
+
+    Parameters
+    ----------
+    files: List[str | Path]
+        audio file paths
+
+    coverKeys: Set[str]
+        keys of the albums whose cover has been stored, the album covers which
+        are extracted will be added to it. `None` means using the one of worker process
+
+    Returns
+    -------
+    songInfos: List[SongInfo]
+        song information list
+
+    pictureInfos: List[PictureInfo]
+        information of the stored album covers
+    """
+    coverKeys = _coverKeys if coverKeys is None else coverKeys
+    songInfos = []
+    pictureInfos = []
+
+    for file in files:
+        tag = TagReader.read(file, False)
+        songInfos.append(tag.songInfo)
+
+        # only the first track of album is used to extract cover
+        cover = Cover(tag.songInfo.singer, tag.songInfo.album)
+        if cover.key in coverKeys:
+            continue
+
+        coverKeys.add(cover.key)
+        picData = tag.readCover()
+        if picData:
+            pictureInfos.append(cover.store(picData))
+
+    return songInfos, pictureInfos
+
+
+class ParallelSongInfoReader:
+    """ Song information reader which parses audio files in a process pool
+
+    Each audio file is parsed only once, the cover of album which hasn't been
+    stored is extracted from the same tag and written to the cover store.
+    """
+
+    def __init__(self, workers=0, batchSize=64, threshold=256):
+        """
+        Parameters
+        ----------
+        workers: int
+            number of worker processes, `0` means using all cpu cores
+
+        batchSize: int
+            number of audio files in a batch sent to worker process
+
+        threshold: int
+            minimum number of files to start the process pool, fewer files
+            will be read in the current process
+        """
+        self.workers = workers
+        self.batchSize = max(1, batchSize)
+        self.threshold = threshold
+
+    @property
+    def workerCount(self) -> int:
+        """ actual number of worker processes """
+        return self.workers or os.cpu_count() or 1
+
+    def read(self, files: List[Union[str, Path]]) -> List[SongInfo]:
+        """ read song information from audio files
+
+        Parameters
+        ----------
+        files: List[str | Path]
+            audio file paths
+
+        Returns
+        -------
+        songInfos: List[SongInfo]
+            song information list, in the same order as `files`
+        """
+        songInfos = []
+        for batch in self.iterBatches(files):
+            songInfos.extend(batch)
+
+        return songInfos
+
+    def iterBatches(self, files: List[Union[str, Path]]) -> Iterator[List[SongInfo]]:
+        """ read song information from audio files and yield them in batches
+
+        Parameters
+        ----------
+        files: List[str | Path]
+            audio file paths
+
+        Yields
+        ------
+        songInfos: List[SongInfo]
+            song information of a batch, batches are yielded in the same order as `files`
+        """
+        files = list(files)
+        batches = [files[i:i+self.batchSize]
+                   for i in range(0, len(files), self.batchSize)]
+        if not batches:
+            return
+
+        coverKeys = set(Cover.index.keys(Cover.parentFolder.name + "/"))
+        readBatch = partial(_readBatch, coverKeys=coverKeys)
+
+        if len(files) < self.threshold or self.workerCount <= 1:
+            for batch in map(readBatch, batches):
+                yield self._addCovers(*batch)
+
+            return
+
+        # use spawn on all platforms, forking a process with Qt threads is unsafe
+        executor = ProcessPoolExecutor(
+            min(self.workerCount, len(batches)),
+            mp.get_context('spawn'),
+            _initWorker,
+            (self._defaults(), coverKeys)
+        )
+
+        with executor:
+            results = executor.map(_readBatch, batches)
+            for i in range(len(batches)):
+                try:
+                    batch = next(results)
+                except Exception as e:
+                    logger.error(
+                        f"Process pool failed, fall back to serial reading. {e.__class__.__name__}: {e}")
+                    for batch in map(readBatch, batches[i:]):
+                        yield self._addCovers(*batch)
+
+                    break
+                else:
+                    yield self._addCovers(*batch)
+
+    @staticmethod
+    def _addCovers(songInfos: List[SongInfo], pictureInfos: List[PictureInfo]) -> List[SongInfo]:
+        """ add the album covers stored by worker to picture index """
+        for pictureInfo in pictureInfos:
+            if not Cover.index.get(pictureInfo.id):
+                Cover.index.add(pictureInfo)
+
+        return songInfos
+
+    @staticmethod
+    def _defaults() -> dict:
+        """ get the translated default values of song information """
+        reader = SongInfoReaderBase()
+        return {
+            "singer": reader.singer,
+            "album": reader.album,
+            "genre": reader.genre
+        }
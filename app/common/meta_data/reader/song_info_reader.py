@@ -1,17 +1,18 @@
 # coding:utf-8
+import re
 from pathlib import Path
-from typing import Union, Type
+from typing import Tuple, Type, Union
 
 from common.database.entity import SongInfo
 from common.logger import Logger
-from mutagen import File
+from mutagen import File, FileType
 from mutagen.aac import AAC
 from mutagen.ac3 import AC3
 from mutagen.aiff import AIFF
 from mutagen.apev2 import APEv2
 from mutagen.asf import ASF, ASFUnicodeAttribute
 from mutagen.flac import FLAC
-from mutagen.id3 import ID3
+from mutagen.id3 import ID3, TCON
 from mutagen.monkeysaudio import MonkeysAudio
 from mutagen.mp3 import MP3
 from mutagen.mp4 import MP4
@@ -24,10 +25,9 @@ from mutagen.trueaudio import TrueAudio
 from mutagen.wave import WAVE
 from mutagen.wavpack import WavPack
 from PyQt5.QtCore import QObject
-from tinytag import TinyTag
 
 from ..frame_map import (APEV2_FRAME_MAP, ASF_FRAME_MAP, ID3_FRAME_MAP,
-                         VORBIS_FRAME_MAP)
+                         MP4_FRAME_MAP, VORBIS_FRAME_MAP)
 
 logger = Logger("meta_data_reader")
 
@@ -57,12 +57,16 @@ class SongInfoReaderBase(QObject):
     formats = []
     options = []
 
+    # default values passed in from the main process, used by worker processes
+    # which have no translator installed
+    defaults = {}
+
     def __init__(self):
         super().__init__()
         # default values of song information
-        self.singer = self.tr('Unknown artist')
-        self.album = self.tr("Unknown album")
-        self.genre = self.tr("Unknown genre")
+        self.singer = self.defaults.get('singer') or self.tr('Unknown artist')
+        self.album = self.defaults.get('album') or self.tr("Unknown album")
+        self.genre = self.defaults.get('genre') or self.tr("Unknown genre")
         self.year = None
         self.track = 0
         self.trackTotal = 1
@@ -77,7 +81,7 @@ class SongInfoReaderBase(QObject):
 
         return file.suffix.lower() in cls.formats
 
-    def read(self, file: Union[str, Path]) -> SongInfo:
+    def read(self, file: Union[str, Path], audio: FileType = None) -> SongInfo:
         """ read song information from audio file
 
         Parameters
@@ -85,6 +89,9 @@ class SongInfoReaderBase(QObject):
         file: str or Path
             audio file path
 
+        audio: FileType
+            the parsed audio tag, the audio file will be parsed if it's `None`
+
         Returns
         -------
         songInfo: SongInfo
@@ -108,20 +115,41 @@ class SongInfoReaderBase(QObject):
             modifiedTime=int(file.stat().st_mtime)
         )
 
-    def _parseTrack(self, track):
-        """ parse track number """
-        track = str(track)
-        if not track:
-            return self.track
+    @classmethod
+    def parse(cls, file: Union[str, Path]) -> FileType:
+        """ parse the tag of audio file
 
-        # handle a/b
-        track = track.split('/')[0]
+        Parameters
+        ----------
+        file: str or Path
+            audio file path
 
-        # handle An
-        if track[0].upper() == 'A':
-            track = track[1:]
+        Returns
+        -------
+        audio: FileType
+            audio tag instance
+        """
+        audio = File(file, options=cls.options or None)
+        if audio is None:
+            raise ValueError(f"Unsupported audio file `{file}`")
 
-        return int(track)
+        return audio
+
+    @staticmethod
+    def _parseNumber(value, default=None):
+        """ parse number, the prefix like `A` in `A1` is ignored """
+        match = re.search(r'\d+', str(value or ''))
+        return int(match.group()) if match else default
+
+    def _parsePair(self, value, default, defaultTotal) -> Tuple[int, int]:
+        """ parse number in `n/total` format, e.g. `1/12` """
+        n, _, total = str(value or '').partition('/')
+        return self._parseNumber(n, default), self._parseNumber(total, defaultTotal)
+
+    def _parseYear(self, value):
+        """ parse release year, e.g. `2011` or `2011-07-19` """
+        match = re.search(r'\d{4}', str(value or ''))
+        return int(match.group()) if match else self.year
 
     @staticmethod
     def getModifiedTime(file: str):
@@ -151,82 +179,24 @@ class SongInfoReader(SongInfoReaderBase):
 
         return reader
 
-    def read(self, file: Union[str, Path]) -> SongInfo:
+    def read(self, file: Union[str, Path], audio: FileType = None) -> SongInfo:
         if not isinstance(file, Path):
             file = Path(file)
 
         for reader in self.readers:
             if reader.canRead(file):
-                return reader().read(file)
+                return reader().read(file, audio)
 
         logger.warning(f"No song information reader available for `{file}`")
         return super().read(file)
 
+    @classmethod
+    def parse(cls, file: Union[str, Path]) -> FileType:
+        for reader in cls.readers:
+            if reader.canRead(file):
+                return reader.parse(file)
 
-@SongInfoReader.register
-class GeneralSongInfoReader(SongInfoReaderBase):
-    """ General song information reader """
-
-    formats = [".mp3", ".flac", ".m4a", ".mp4", ".aiff"]
-    options = [MP3, FLAC, MP4, AIFF]
-
-    @exceptionHandler
-    def read(self, file: Union[str, Path]):
-        if not isinstance(file, Path):
-            file = Path(file)
-
-        tag = TinyTag.get(file)
-
-        file_ = str(file).replace('\\', '/')
-        title = tag.title or file.stem
-        singer = tag.artist or self.singer
-        album = tag.album or self.album
-        year = self.__getYear(tag, file)
-        genre = tag.genre or self.genre
-        duration = int(tag.duration)
-        track = self._parseTrack(tag.track or self.track)
-        trackTotal = int(tag.track_total or self.trackTotal)
-        disc = int(tag.disc or self.disc)
-        discTotal = int(tag.disc_total or self.discTotal)
-        createTime = int(file.stat().st_ctime)
-        modifiedTime = int(file.stat().st_mtime)
-
-        return SongInfo(
-            file=file_,
-            title=title,
-            singer=singer,
-            album=album,
-            year=year,
-            genre=genre,
-            duration=duration,
-            track=track,
-            trackTotal=trackTotal,
-            disc=disc,
-            discTotal=discTotal,
-            createTime=createTime,
-            modifiedTime=modifiedTime
-        )
-
-    def __getYear(self, tag: TinyTag, file: Path):
-        """ get release year of song """
-        if tag.year and str(tag.year).isdigit():
-            return int(tag.year[:4])
-
-        audio = File(file, self.options)
-
-        if isinstance(audio, (MP3, AIFF)):
-            year = [str(audio.get("TDRC", 0))]
-        elif isinstance(audio, MP4):
-            year = audio.get('©day', ['0'])
-        elif isinstance(audio, FLAC):
-            year = audio.get('year', ['0'])
-        else:
-            year = ['0']
-
-        if year and year[0] != '0' and year[0].isdigit():
-            return int(year[0][:4])
-
-        return self.year
+        return super().parse(file)
 
 
 class MutagenSongInfoReader(SongInfoReaderBase):
@@ -245,45 +215,51 @@ class MutagenSongInfoReader(SongInfoReaderBase):
         "discTotal": "discTotal"
     }
 
+    @classmethod
+    def parse(cls, file: Union[str, Path]) -> FileType:
+        audio = super().parse(file)
+
+        # some formats don't support tagging, so the tag is loaded separately
+        if cls._Tag is not None:
+            try:
+                audio.tags = cls._Tag(file)
+            except:
+                audio.tags = cls._Tag()
+
+        return audio
+
     @exceptionHandler
-    def read(self, file: Union[str, Path]) -> SongInfo:
+    def read(self, file: Union[str, Path], audio: FileType = None) -> SongInfo:
         if not isinstance(file, Path):
             file = Path(file)
 
-        audio = File(file, self.options)
-        if self._Tag is not None:
-            try:
-                tag = self._Tag(file)
-            except:
-                tag = self._Tag()
-        else:
-            tag = audio
+        if audio is None:
+            audio = self.parse(file)
+
+        tag = audio
+        frameMap = self.frameMap
 
         file_ = str(file).replace('\\', '/')
-        title = self._v(tag, self.frameMap['title'], file.stem)
-        singer = self._v(tag, self.frameMap['singer'], self.singer)
-        album = self._v(tag, self.frameMap['album'], self.album)
-        genre = self._v(tag, self.frameMap['genre'], self.genre)
-        track = self._v(tag, self.frameMap['track'], self.track)
-        track = self._parseTrack(track)
-        trackTotal = self._v(tag, self.frameMap['trackTotal'], self.trackTotal)
-        trackTotal = self._parseTrack(trackTotal)
-        disc = int(self._v(tag, self.frameMap['disc'], self.trackTotal))
-        discTotal = int(
-            self._v(tag, self.frameMap['discTotal'], self.trackTotal))
+        title = self._get(tag, frameMap['title'], file.stem)
+        singer = self._get(tag, frameMap['singer'], self.singer)
+        album = self._get(tag, frameMap['album'], self.album)
+        genre = self._get(tag, frameMap['genre'], self.genre)
+        year = self._parseYear(self._get(tag, frameMap['year']))
         duration = int(audio.info.length)
-        createTime = int(file.stat().st_ctime)
-        modifiedTime = int(file.stat().st_mtime)
 
-        year = None
-        if isinstance(self.frameMap['year'], list):
-            for k in self.frameMap['year']:
-                year = year or self._v(tag, k)
-        else:
-            year = self._v(tag, self.frameMap['year'])
+        track, trackTotal = self._parsePair(
+            self._get(tag, frameMap['track']), self.track, self.trackTotal)
+        if frameMap['trackTotal'] != frameMap['track']:
+            trackTotal = self._parseNumber(
+                self._get(tag, frameMap['trackTotal']), trackTotal)
 
-        year = int(year) if year and str(year).isdigit() else self.year
+        disc, discTotal = self._parsePair(
+            self._get(tag, frameMap['disc']), self.disc, self.discTotal)
+        if frameMap['discTotal'] != frameMap['disc']:
+            discTotal = self._parseNumber(
+                self._get(tag, frameMap['discTotal']), discTotal)
 
+        stat = file.stat()
         return SongInfo(
             file=file_,
             title=title,
@@ -296,22 +272,34 @@ class MutagenSongInfoReader(SongInfoReaderBase):
             trackTotal=trackTotal,
             disc=disc,
             discTotal=discTotal,
-            createTime=createTime,
-            modifiedTime=modifiedTime
+            createTime=int(stat.st_ctime),
+            modifiedTime=int(stat.st_mtime)
         )
 
+    def _get(self, tag, keys, default=None):
+        """ get the value of the first non-empty frame """
+        if not isinstance(keys, list):
+            keys = [keys]
+
+        for key in keys:
+            v = self._v(tag, key)
+            if v:
+                return v
+
+        return default
+
     def _v(self, tag, key: str, default=None):
         """ get the value of frame """
         v = tag.get(key)
-        return str(v) if v else str(default)
+        return str(v) if v else default
 
 
 @SongInfoReader.register
-class OGGSongInfoReader(MutagenSongInfoReader):
-    """ Ogg song information reader """
+class FLACSongInfoReader(MutagenSongInfoReader):
+    """ FLAC song information reader """
 
-    formats = [".ogg"]
-    options = [OggVorbis, OggFLAC, OggSpeex]
+    formats = [".flac"]
+    options = [FLAC]
     frameMap = VORBIS_FRAME_MAP
 
     def _v(self, tag, key, default=None):
@@ -319,6 +307,34 @@ class OGGSongInfoReader(MutagenSongInfoReader):
         return v or default
 
 
+@SongInfoReader.register
+class MP4SongInfoReader(MutagenSongInfoReader):
+    """ MP4/M4A song information reader """
+
+    formats = [".m4a", ".mp4"]
+    options = [MP4]
+    frameMap = MP4_FRAME_MAP
+
+    def _v(self, tag, key, default=None):
+        v = tag.get(key, [None])[0]
+        if not v:
+            return default
+
+        # the track and disc number are stored as (n, total)
+        if isinstance(v, tuple):
+            return f"{v[0]}/{v[1]}" if v[1] else str(v[0])
+
+        return str(v)
+
+
+@SongInfoReader.register
+class OGGSongInfoReader(FLACSongInfoReader):
+    """ Ogg song information reader """
+
+    formats = [".ogg"]
+    options = [OggVorbis, OggFLAC, OggSpeex]
+
+
 @SongInfoReader.register
 class OPUSSongInfoReader(OGGSongInfoReader):
     """ Opus song information reader """
@@ -336,6 +352,32 @@ class ID3SongInfoReader(MutagenSongInfoReader):
     _Tag = ID3
     frameMap = ID3_FRAME_MAP
 
+    def _v(self, tag, key, default=None):
+        v = tag.get(key)
+        if isinstance(v, TCON):
+            # convert the genre like `(13)` to `Pop`
+            return v.genres[0] if v.genres else default
+
+        return str(v) if v else default
+
+
+@SongInfoReader.register
+class MP3SongInfoReader(ID3SongInfoReader):
+    """ MP3 song information reader """
+
+    formats = [".mp3"]
+    options = [MP3]
+    _Tag = None
+
+
+@SongInfoReader.register
+class AIFFSongInfoReader(ID3SongInfoReader):
+    """ AIFF song information reader """
+
+    formats = [".aiff"]
+    options = [AIFF]
+    _Tag = None
+
 
 @SongInfoReader.register
 class TrueAudioSongInfoReader(ID3SongInfoReader):
@@ -404,6 +446,6 @@ class ASFSongInfoReader(MutagenSongInfoReader):
         v = tag.get(key, [None])[0]  # type:ASFUnicodeAttribute
 
         if v and not v.value or v is None:
-            return str(default)
+            return default
 
         return str(v)
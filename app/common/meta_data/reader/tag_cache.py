@@ -0,0 +1,81 @@
+# coding:utf-8
+import os
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from time import monotonic
+from typing import Dict, Tuple, Union
+
+from mutagen import FileType
+
+from .song_info_reader import SongInfoReader
+
+
+class TagCache:
+    """ Short-lived cache of parsed audio tags
+
+    The tags are keyed by `(path, mtime, size)`, so a modified file is parsed
+    again. The player and editors usually read the same file several times in
+    a short period, this cache avoids opening the file for each reader.
+    """
+
+    def __init__(self, capacity=16, ttl=30):
+        """
+        Parameters
+        ----------
+        capacity: int
+            the maximum number of cached tags
+
+        ttl: float
+            time to live of cached tag in seconds
+        """
+        self.capacity = capacity
+        self.ttl = ttl
+        self.tags = OrderedDict()   # type:Dict[Tuple[str, int, int], Tuple[float, FileType]]
+        self.lock = Lock()
+
+    def parse(self, file: Union[str, Path]) -> FileType:
+        """ parse the tag of audio file, the cached tag is reused if the file isn't modified
+
+        Parameters
+        ----------
+        file: str | Path
+            audio file path
+
+        Returns
+        -------
+        audio: FileType
+            audio tag instance, which should be treated as read-only
+        """
+        file = str(file)
+        stat = os.stat(file)
+        key = (file, stat.st_mtime_ns, stat.st_size)
+
+        with self.lock:
+            self.__removeExpiredTags()
+            if key in self.tags:
+                self.tags.move_to_end(key)
+                return self.tags[key][1]
+
+        audio = SongInfoReader.parse(file)
+
+        with self.lock:
+            self.tags[key] = (monotonic(), audio)
+            while len(self.tags) > self.capacity:
+                self.tags.popitem(last=False)
+
+        return audio
+
+    def clear(self):
+        """ clear all cached tags """
+        with self.lock:
+            self.tags.clear()
+
+    def __removeExpiredTags(self):
+        """ remove the expired tags """
+        t = monotonic() - self.ttl
+        for key in [k for k, v in self.tags.items() if v[0] < t]:
+            self.tags.pop(key)
+
+
+tagCache = TagCache()
@@ -0,0 +1,81 @@
+# coding:utf-8
+from pathlib import Path
+from typing import Union
+
+from common.database.entity import SongInfo
+from common.logger import Logger
+from common.lyric import Lyric
+from mutagen import FileType
+
+from .album_cover_reader import AlbumCoverReader
+from .lyric_reader import LyricReader
+from .song_info_reader import SongInfoReader, SongInfoReaderBase
+from .tag_cache import tagCache
+
+logger = Logger("meta_data_reader")
+
+
+class AudioTag:
+    """ Audio tag parsed in one pass, the song information, album cover and
+    embedded lyrics are all extracted from it without opening the file again """
+
+    def __init__(self, file: Union[str, Path], songInfo: SongInfo, audio: FileType = None):
+        """
+        Parameters
+        ----------
+        file: str | Path
+            audio file path
+
+        songInfo: SongInfo
+            song information
+
+        audio: FileType
+            the parsed audio tag, `None` if the file can't be parsed
+        """
+        self.file = file
+        self.songInfo = songInfo
+        self.audio = audio
+
+    def readCover(self) -> bytes:
+        """ extract binary data of album cover, `None` if no cover is found """
+        if self.audio is None:
+            return None
+
+        return AlbumCoverReader.readCoverData(self.file, self.audio)
+
+    def readLyric(self) -> Lyric:
+        """ extract embedded lyrics """
+        if self.audio is None:
+            return Lyric.new()
+
+        return LyricReader.read(self.file, self.audio)
+
+
+class TagReader:
+    """ Tag reader, which opens each audio file only once """
+
+    @staticmethod
+    def read(file: Union[str, Path], useCache=True) -> AudioTag:
+        """ parse audio file
+
+        Parameters
+        ----------
+        file: str | Path
+            audio file path
+
+        useCache: bool
+            whether to use the short-lived tag cache, it should be disabled when
+            scanning lots of files
+
+        Returns
+        -------
+        tag: AudioTag
+            audio tag
+        """
+        try:
+            audio = tagCache.parse(file) if useCache else SongInfoReader.parse(file)
+        except Exception as e:
+            logger.error(f"{e.__class__.__name__}: {e}")
+            return AudioTag(file, SongInfoReaderBase().read(file))
+
+        return AudioTag(file, SongInfoReader().read(file, audio), audio)
@@ -1,7 +1,14 @@
 # coding:utf-8
+import os
 from enum import Enum
+from hashlib import md5
 from pathlib import Path
-from .cache import albumCoverFolder, singerAvatarFolder
+from shutil import rmtree
+from threading import RLock
+from typing import Dict, List, Tuple
+
+from .cache import albumCoverFolder, albumCoverStoreFolder, singerAvatarFolder
+from .database.entity import PictureInfo
 from .os_utils import adjustName
 from .image_utils import getPicSuffix
 
@@ -22,12 +29,97 @@ class AvatarType(Enum):
     SMALL = ":/images/default_covers/singer_200_200.png"
 
 
+class PictureIndex:
+    """ Picture index, which maps the key of picture to the stored picture information
+
+    The index is shared by all threads and persisted in database by `PictureController`.
+    """
+
+    def __init__(self):
+        self.isLoaded = False
+        self.infos = {}     # type:Dict[str, PictureInfo]
+        self.changes = {}   # type:Dict[str, PictureInfo], `None` means the picture is removed
+        self.lock = RLock()
+
+    def load(self, pictureInfos: List[PictureInfo]):
+        """ load picture information to index, the changes before loading are kept """
+        with self.lock:
+            infos = {i.id: i for i in pictureInfos}
+            for key, info in self.changes.items():
+                if info:
+                    infos[key] = info
+                else:
+                    infos.pop(key, None)
+
+            self.infos = infos
+            self.isLoaded = True
+
+    def get(self, key: str) -> PictureInfo:
+        """ get the picture information, `None` if the picture is not in index """
+        with self.lock:
+            return self.infos.get(key)
+
+    def add(self, pictureInfo: PictureInfo):
+        """ add picture information to index """
+        with self.lock:
+            self.infos[pictureInfo.id] = pictureInfo
+            self.changes[pictureInfo.id] = pictureInfo
+
+    def remove(self, key: str):
+        """ remove picture information from index """
+        with self.lock:
+            if self.infos.pop(key, None):
+                self.changes[key] = None
+
+    def isReferenced(self, path: str) -> bool:
+        """ whether the picture file is referenced by any key """
+        with self.lock:
+            return any(i.path == path for i in self.infos.values())
+
+    def keys(self, prefix: str) -> List[str]:
+        """ list the keys starting with prefix """
+        with self.lock:
+            return [i for i in self.infos if i.startswith(prefix)]
+
+    def takeChanges(self) -> Tuple[List[PictureInfo], List[str]]:
+        """ take the changes which haven't been persisted
+
+        Returns
+        -------
+        added: List[PictureInfo]
+            added or updated picture information
+
+        removed: List[str]
+            keys of removed pictures
+        """
+        with self.lock:
+            changes = self.changes
+            self.changes = {}
+
+        added = [v for v in changes.values() if v]
+        removed = [k for k, v in changes.items() if not v]
+        return added, removed
+
+
 class Picture:
     """ Picture class """
 
     parentFolder = Path()
     pictureName = "picture"
 
+    # folder of content-addressed store, the pictures with the same content are
+    # stored only once and referenced by index. `None` means each picture is
+    # stored in its own folder
+    storeFolder = None  # type:Path
+
+    # file in picture folder which records the name of stored picture, so the
+    # index can be rebuilt without the database
+    refSuffix = ".ref"
+    suffixes = (".png", ".jpg", ".jpeg", ".jiff", ".gif")
+
+    # shared by all kinds of pictures
+    index = PictureIndex()
+
     def __init__(self, name: str):
         """
         Parameters
@@ -37,12 +129,80 @@ class Picture:
         """
         self.name = adjustName(name)
         self.folder = self.parentFolder/self.name
+        self.key = self.parentFolder.name + "/" + self.name
 
     @classmethod
     def listNames(cls):
         """ list all picture names """
+        if cls.index.isLoaded:
+            prefix = cls.parentFolder.name + "/"
+            return [i[len(prefix):] for i in cls.index.keys(prefix)]
+
         return [i.name for i in cls.parentFolder.glob("*") if i.is_dir()]
 
+    @classmethod
+    def scan(cls) -> List[PictureInfo]:
+        """ scan the picture folders to get the information of stored pictures """
+        if not cls.parentFolder.exists():
+            return []
+
+        pictureInfos = []
+        for folder in cls.parentFolder.iterdir():
+            if not folder.is_dir():
+                continue
+
+            key = cls.parentFolder.name + "/" + folder.name
+            file = cls.__findPicture(folder)
+            if not file:
+                continue
+
+            # the name of stored picture is its md5, so it needn't be read again
+            if file.parent == cls.storeFolder:
+                pictureInfos.append(PictureInfo(
+                    id=key,
+                    path=str(file),
+                    size=file.stat().st_size,
+                    hash=file.stem
+                ))
+            else:
+                data = file.read_bytes()
+                pictureInfos.append(PictureInfo(
+                    id=key,
+                    path=str(file),
+                    size=len(data),
+                    hash=md5(data).hexdigest()
+                ))
+
+        return pictureInfos
+
+    @classmethod
+    def removeUnreferenced(cls, pictureInfos: List[PictureInfo]):
+        """ remove the pictures in store which aren't referenced by any picture information """
+        if cls.storeFolder is None or not cls.storeFolder.exists():
+            return
+
+        paths = {i.path for i in pictureInfos}
+        for file in cls.storeFolder.iterdir():
+            if file.is_file() and str(file) not in paths:
+                file.unlink(missing_ok=True)
+
+    @classmethod
+    def __findPicture(cls, folder: Path):
+        """ find the stored picture referenced by folder or the first image file in folder """
+        files = [i for i in folder.glob('*') if i.is_file()]
+        if not files:
+            return None
+
+        ref = next((i for i in files if i.suffix == cls.refSuffix), None)
+        if ref and cls.storeFolder is not None:
+            file = cls.storeFolder / ref.read_text(encoding="utf-8").strip()
+            return file if file.is_file() else None
+
+        if files[0].suffix.lower() in cls.suffixes:
+            return files[0]
+
+        return None
+
     def path(self, pictureType: Enum) -> str:
         """ get picture path
 
@@ -56,17 +216,19 @@ class Picture:
         picPath: str
             picture path
         """
-        picPath = pictureType.value
-        files = [i for i in self.folder.glob('*') if i.is_file()]
+        if self.index.isLoaded:
+            info = self.index.get(self.key)
+            return info.path if info else pictureType.value
 
         # use the first image file in directory
-        if files and files[0].suffix.lower() in (".png", ".jpg", ".jpeg", ".jiff", ".gif"):
-            picPath = str(files[0])
-
-        return picPath
+        file = self.__findPicture(self.folder)
+        return str(file) if file else pictureType.value
 
     def isExists(self):
         """ Whether this cover exists """
+        if self.index.isLoaded:
+            return self.index.get(self.key) is not None
+
         return Path(self.path()).exists()
 
     def save(self, data: bytes):
@@ -82,18 +244,100 @@ class Picture:
         path: str
             save path of picture
         """
-        self.folder.mkdir(exist_ok=True, parents=True)
-        path = self.folder / (self.pictureName + getPicSuffix(data))
-        with open(path, "wb") as f:
+        pictureInfo = self.store(data)
+
+        old = self.index.get(self.key)
+        self.index.add(pictureInfo)
+
+        # remove the old picture with different content or suffix
+        if old and old.path != pictureInfo.path:
+            self.__release(old.path)
+
+        return pictureInfo.path
+
+    def store(self, data: bytes) -> PictureInfo:
+        """ write picture to disk without updating the index, this method
+        can be called in other processes
+
+        Parameters
+        ----------
+        data: bytes
+            picture data
+
+        Returns
+        -------
+        pictureInfo: PictureInfo
+            information of the stored picture
+        """
+        digest = md5(data).hexdigest()
+        suffix = getPicSuffix(data)
+        if self.storeFolder is None:
+            self.folder.mkdir(exist_ok=True, parents=True)
+            path = self.folder / (self.pictureName + suffix)
+            with open(path, "wb") as f:
+                f.write(data)
+        else:
+            path = self.storeFolder / (digest + suffix)
+            if not path.exists():
+                self.__write(path, data)
+
+            self.__link(path)
+
+        return PictureInfo(
+            id=self.key,
+            path=str(path),
+            size=len(data),
+            hash=digest
+        )
+
+    @staticmethod
+    def __write(path: Path, data: bytes):
+        """ write picture to a temporary file first, so other threads and
+        processes never read a partial picture """
+        path.parent.mkdir(exist_ok=True, parents=True)
+        temp = path.with_name(f"{path.name}.{os.getpid()}.{id(data)}.tmp")
+        with open(temp, "wb") as f:
             f.write(data)
 
-        return str(path)
+        os.replace(temp, path)
+
+    def __link(self, path: Path):
+        """ replace the picture stored in its own folder with the reference to stored picture """
+        self.folder.mkdir(exist_ok=True, parents=True)
+        ref = self.folder / (self.pictureName + self.refSuffix)
+        for file in self.folder.iterdir():
+            if file.is_dir():
+                rmtree(file)
+            elif file != ref:
+                file.unlink(missing_ok=True)
+
+        self.__write(ref, path.name.encode("utf-8"))
+
+    def __release(self, path: str):
+        """ remove the picture file which is no longer referenced """
+        path = Path(path)
+        if self.storeFolder is not None and path.parent == self.storeFolder \
+                and self.index.isReferenced(str(path)):
+            return
+
+        path.unlink(missing_ok=True)
+
+    def delete(self):
+        """ delete picture """
+        if self.folder.exists():
+            rmtree(self.folder)
+
+        old = self.index.get(self.key)
+        self.index.remove(self.key)
+        if old:
+            self.__release(old.path)
 
 
 class Cover(Picture):
     """ Album cover """
 
     parentFolder = albumCoverFolder
+    storeFolder = albumCoverStoreFolder
     pictureName = "cover"
 
     def __init__(self, singer: str, album: str):
@@ -0,0 +1,77 @@
+# coding:utf-8
+from threading import RLock
+from typing import Dict, Iterable, List
+
+import pinyin
+
+from .database.entity import SortKey
+
+
+class SortKeyIndex:
+    """ Sort key index, which maps the text to its collation key
+
+    The key of a text is computed once and shared by all threads, the new keys
+    are persisted in database by `SortKeyController`.
+    """
+
+    def __init__(self):
+        self.isLoaded = False
+        self.sortKeys = {}  # type:Dict[str, SortKey]
+        self.changes = {}   # type:Dict[str, SortKey]
+        self.lock = RLock()
+
+    @staticmethod
+    def create(text: str) -> SortKey:
+        """ compute the sort key of text """
+        key = pinyin.get(text, format="strip").casefold()
+        initials = pinyin.get_initial(text, delimiter="").casefold()
+        return SortKey(text, key, initials)
+
+    def load(self, sortKeys: List[SortKey]):
+        """ load sort keys to index """
+        with self.lock:
+            for sortKey in sortKeys:
+                self.sortKeys.setdefault(sortKey.id, sortKey)
+
+            self.isLoaded = True
+
+    def get(self, text: str) -> SortKey:
+        """ get the sort key of text, it's computed if not in index """
+        text = text or ""
+        sortKey = self.sortKeys.get(text)
+        if sortKey is not None:
+            return sortKey
+
+        with self.lock:
+            sortKey = self.sortKeys.get(text)
+            if sortKey is None:
+                sortKey = self.sortKeys[text] = self.create(text)
+                self.changes[text] = sortKey
+
+            return sortKey
+
+    def add(self, texts: Iterable[str]):
+        """ compute the sort keys of texts which aren't in index """
+        with self.lock:
+            for text in texts:
+                self.get(text)
+
+    def key(self, text: str) -> str:
+        """ get the collation key of text """
+        return self.get(text).key
+
+    def letter(self, text: str) -> str:
+        """ get the navigation letter of text, `...` if the initial isn't in A-Z """
+        initial = self.get(text).initials[:1].upper()
+        return initial if "A" <= initial <= "Z" else "..."
+
+    def takeChanges(self) -> List[SortKey]:
+        """ take the new sort keys which haven't been persisted """
+        with self.lock:
+            changes = self.changes
+            self.changes = {}
+
+        return list(changes.values())
+
+
+sortKeyIndex = SortKeyIndex()
@@ -1,6 +1,8 @@
 # coding:utf-8
 from queue import Queue
-from urllib.request import urlretrieve
+
+from common.crawler import httpClient
+from common.exception_handler import exceptionHandler
 from PyQt5.QtCore import pyqtSignal, QThread
 
 
@@ -17,9 +19,15 @@ class DownloadMvThread(QThread):
         """ start to download MV """
         while not self.download_queque.empty():
             url, save_path = self.download_queque.get()
-            urlretrieve(url, save_path)
+            self.download(url, save_path)
             self.downloadOneMvFinished.emit()
 
+    @exceptionHandler("crawler", False)
+    def download(self, url: str, save_path: str) -> bool:
+        """ download MV, the failed download doesn't block the remaining tasks """
+        httpClient.download(url, save_path)
+        return True
+
     def appendDownloadTask(self, url: str, save_path: str):
         """ add download task to queque """
         self.download_queque.put((url, save_path))
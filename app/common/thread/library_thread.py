@@ -1,4 +1,5 @@
 # coding:utf-8
+from collections import deque
 from typing import List
 from PyQt5.QtCore import Qt, pyqtSignal, QThread
 from PyQt5.QtSql import QSqlDatabase
@@ -10,32 +11,41 @@ from common.database import DBInitializer
 class LibraryThread(QThread):
     """ Song library thread """
 
+    loadFinished = pyqtSignal(list, list, list, dict)
     reloadFinished = pyqtSignal()
+    loadProgressed = pyqtSignal(list, list, list)
     loadFromFilesFinished = pyqtSignal(list)
+    taskFinished = pyqtSignal(object, object)   # task, result
 
     def __init__(self, directories: List[Directory] = None, parent=None):
         super().__init__(parent=parent)
         db = QSqlDatabase.database('main')
         self.library = Library(directories, db, False, self)
-        self.task = self.library.load
-        self.params = {}
+        self.tasks = deque()
         self.taskResult = None
 
+        self.library.loadFinished.connect(self.loadFinished)
         self.library.reloadFinished.connect(self.reloadFinished)
+        self.library.loadProgressed.connect(self.loadProgressed)
         self.library.loadFromFilesFinished.connect(self.loadFromFilesFinished)
+        self.finished.connect(self.__onFinished)
 
     def run(self):
-        """ executive song library task """
+        """ executive the queued song library tasks """
         if not QSqlDatabase.contains('thread'):
             db = QSqlDatabase.addDatabase('QSQLITE', 'thread')
             db.setDatabaseName(DBInitializer.CACHE_FILE)
             db.open()
             self.library.setDatabase(db)
 
-        self.taskResult = self.task(**self.params)
+        while self.tasks:
+            task, params = self.tasks.popleft()
+            self.taskResult = task(**params)
+            self.taskFinished.emit(task, self.taskResult)
 
-    def setTask(self, task, **params):
-        """ Set the song library task implemented in the thread
+    def addTask(self, task, **params):
+        """ Add a song library task, which is executed in the thread after the
+        queued tasks, the caller never waits for the running task
 
         Parameters
         ----------
@@ -45,5 +55,12 @@ class LibraryThread(QThread):
         **params:
             parameters to be used in the task
         """
-        self.task = task
-        self.params = params
+        self.tasks.append((task, params))
+        if not self.isRunning():
+            self.start()
+
+    def __onFinished(self):
+        """ thread finished slot """
+        # the task is added after `run()` drains the queue but before the thread finishes
+        if self.tasks:
+            self.start()
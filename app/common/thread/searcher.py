@@ -0,0 +1,174 @@
+# coding:utf-8
+from common.crawler import KuWoMusicCrawler
+from common.database import DBInitializer
+from common.database.controller import (AlbumInfoController, PlaylistController,
+                                        SingerInfoController, SongInfoController)
+from common.singleton import Singleton
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtSql import QSqlDatabase
+
+
+class LocalSearchWorker(QRunnable):
+    """ Local search worker, which queries the library with its own database connection """
+
+    connectionName = 'search'
+
+    def __init__(self, searchId: int, keyWord: str, service):
+        """
+        Parameters
+        ----------
+        searchId: int
+            search id, the worker stops if it is superseded by a newer search
+
+        keyWord: str
+            key word to search
+
+        service: Searcher
+            service which receives the search result
+        """
+        super().__init__()
+        self.searchId = searchId
+        self.keyWord = keyWord
+        self.service = service
+
+    def run(self):
+        if self.isCancelled():
+            return
+
+        db = self.__database()
+        keyWord = self.keyWord
+
+        singerInfos = SingerInfoController(db).searchSingerInfos(keyWord)
+        if self.isCancelled():
+            return
+
+        albumInfos = AlbumInfoController(db).searchAlbumInfos(keyWord)
+        if self.isCancelled():
+            return
+
+        songInfos = SongInfoController(db).searchSongInfos(keyWord)
+        if self.isCancelled():
+            return
+
+        playlists = PlaylistController(db).searchPlaylists(keyWord)
+
+        self.service.localSearchFinished.emit(
+            self.searchId, singerInfos, albumInfos, songInfos, playlists)
+
+    def isCancelled(self) -> bool:
+        return self.searchId != self.service.searchId
+
+    def __database(self) -> QSqlDatabase:
+        """ get the database connection of search thread """
+        if QSqlDatabase.contains(self.connectionName):
+            return QSqlDatabase.database(self.connectionName)
+
+        db = QSqlDatabase.addDatabase('QSQLITE', self.connectionName)
+        db.setDatabaseName(DBInitializer.CACHE_FILE)
+        db.open()
+        return db
+
+
+class OnlineSearchWorker(QRunnable):
+    """ Online search worker """
+
+    def __init__(self, searchId: int, keyWord: str, pageSize: int, service):
+        """
+        Parameters
+        ----------
+        searchId: int
+            search id, the result is discarded if it is superseded by a newer search
+
+        keyWord: str
+            key word to search
+
+        pageSize: int
+            number of online songs in the first page
+
+        service: Searcher
+            service which receives the search result
+        """
+        super().__init__()
+        self.searchId = searchId
+        self.keyWord = keyWord
+        self.pageSize = pageSize
+        self.service = service
+
+    def run(self):
+        if self.searchId != self.service.searchId:
+            return
+
+        songInfos, total = self.service.crawler.getSongInfos(
+            self.keyWord, 1, self.pageSize)
+        self.service.onlineSearchFinished.emit(self.searchId, songInfos, total)
+
+
+class Searcher(Singleton, QObject):
+    """ Searcher, which searches local library and online songs concurrently
+    in background threads
+
+    Each search has an increasing id, a new search cancels the queued workers of
+    superseded searches and the results of superseded searches are discarded.
+    """
+
+    localResultReady = pyqtSignal(str, list, list, list, list)  # key word, singers, albums, songs and playlists
+    onlineResultReady = pyqtSignal(str, list, int)              # key word, online songs and total number
+    localSearchFinished = pyqtSignal(int, list, list, list, list)
+    onlineSearchFinished = pyqtSignal(int, list, int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self.searchId = 0
+        self.keyWord = ''
+        self.crawler = KuWoMusicCrawler()
+
+        # the database connection belongs to the thread, so the local pool
+        # only has one thread which never expires
+        self.localThreadPool = QThreadPool(self)
+        self.localThreadPool.setMaxThreadCount(1)
+        self.localThreadPool.setExpiryTimeout(-1)
+        self.onlineThreadPool = QThreadPool(self)
+        self.onlineThreadPool.setMaxThreadCount(2)
+
+        self.localSearchFinished.connect(self.__onLocalSearchFinished)
+        self.onlineSearchFinished.connect(self.__onOnlineSearchFinished)
+
+    def search(self, keyWord: str, pageSize: int = 0):
+        """ search local library and online songs, this method should be called in the GUI thread
+
+        Parameters
+        ----------
+        keyWord: str
+            key word to search
+
+        pageSize: int
+            number of online songs in the first page, online songs are not
+            searched if it isn't greater than 0
+        """
+        self.cancel()
+        self.keyWord = keyWord
+        self.localThreadPool.start(
+            LocalSearchWorker(self.searchId, keyWord, self))
+
+        if pageSize > 0:
+            self.onlineThreadPool.start(
+                OnlineSearchWorker(self.searchId, keyWord, pageSize, self))
+
+    def cancel(self):
+        """ cancel the running search """
+        self.searchId += 1
+        self.localThreadPool.clear()
+        self.onlineThreadPool.clear()
+
+    def __onLocalSearchFinished(self, searchId: int, singerInfos: list, albumInfos: list,
+                                songInfos: list, playlists: list):
+        if searchId == self.searchId:
+            self.localResultReady.emit(
+                self.keyWord, singerInfos, albumInfos, songInfos, playlists)
+
+    def __onOnlineSearchFinished(self, searchId: int, songInfos: list, total: int):
+        if searchId == self.searchId:
+            self.onlineResultReady.emit(self.keyWord, songInfos, total)
+
+
+searcher = Searcher()
@@ -0,0 +1,371 @@
+# coding:utf-8
+import os
+from collections import OrderedDict
+from hashlib import md5
+from threading import Lock
+from typing import Callable, Dict, Tuple, Union
+
+from PIL import Image
+from PyQt5.QtCore import QObject, QRunnable, Qt, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QImage, QImageReader, QPixmap
+
+from .cache import thumbnailFolder
+from .exception_handler import exceptionHandler
+from .singleton import Singleton
+
+
+class ThumbnailWorker(QRunnable):
+    """ Thumbnail worker, which reads the thumbnail or its effect from disk or generates it """
+
+    def __init__(self, path: str, size: int, service, effect: str = None):
+        """
+        Parameters
+        ----------
+        path: str
+            image path
+
+        size: int
+            thumbnail size
+
+        service: ThumbnailCache
+            service which receives the thumbnail
+
+        effect: str
+            name of the effect applied to thumbnail, `None` means no effect
+        """
+        super().__init__()
+        self.path = path
+        self.size = size
+        self.service = service
+        self.effect = effect
+
+    def run(self):
+        image = self.__read()
+        if image is None:
+            image = QImage()
+
+        if self.effect:
+            self.service.effectLoadFinished.emit(self.path, self.effect, image)
+        else:
+            self.service.loadFinished.emit(self.path, self.size, image)
+
+    @exceptionHandler("thumbnail")
+    def __read(self) -> QImage:
+        # the images in resource are small enough, so they are not cached on disk
+        if self.path.startswith(':'):
+            return self.__applyEffect(self.__scale(self.path))
+
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return QImage()
+
+        key = f"{self.path}:{stat.st_mtime_ns}:{stat.st_size}"
+        key = md5(key.encode('utf-8')).hexdigest()
+
+        # the effects are stored alongside the thumbnails
+        if self.effect:
+            image = self.__readCache(self.service.folder / self.effect, key)
+            if image.isNull():
+                image = self.__applyEffect(self.__readThumbnail(key))
+                self.__writeCache(self.service.folder / self.effect, key, image)
+
+            return image
+
+        return self.__readThumbnail(key)
+
+    def __readThumbnail(self, key: str) -> QImage:
+        """ read thumbnail from disk or generate it """
+        folder = self.service.folder / str(self.size)
+        image = self.__readCache(folder, key)
+        if image.isNull():
+            image = self.__scale(self.path)
+            self.__writeCache(folder, key, image)
+
+        return image
+
+    @staticmethod
+    def __readCache(folder, key: str) -> QImage:
+        """ read image from the disk tier """
+        for suffix in ('.jpg', '.png'):
+            file = folder / (key + suffix)
+            if file.exists():
+                image = QImage(str(file))
+                if not image.isNull():
+                    # the modified time records the last access used by eviction
+                    try:
+                        os.utime(file)
+                    except OSError:
+                        pass
+
+                    return image
+
+        return QImage()
+
+    def __writeCache(self, folder, key: str, image: QImage):
+        """ write image to the disk tier """
+        if image.isNull():
+            return
+
+        folder.mkdir(exist_ok=True, parents=True)
+        suffix = '.png' if image.hasAlphaChannel() else '.jpg'
+        file = folder / (key + suffix)
+        if image.save(str(file), quality=90):
+            self.service.addDiskCost(file.stat().st_size)
+
+    def __applyEffect(self, image: QImage) -> QImage:
+        """ apply effect to thumbnail """
+        if not self.effect or image.isNull():
+            return image
+
+        image = self.service.effects[self.effect](Image.fromqimage(image))
+        return image.toqimage().copy()
+
+    def __scale(self, path: str) -> QImage:
+        """ decode image at the scaled size """
+        reader = QImageReader(path)
+        reader.setAutoTransform(True)
+
+        size = reader.size()
+        if size.isValid():
+            reader.setScaledSize(size.scaled(
+                self.size, self.size, Qt.KeepAspectRatioByExpanding))
+            return reader.read()
+
+        image = reader.read()
+        if image.isNull():
+            return image
+
+        return image.scaled(self.size, self.size, Qt.KeepAspectRatioByExpanding,
+                            Qt.SmoothTransformation)
+
+
+class ThumbnailCache(Singleton, QObject):
+    """ Thumbnail cache
+
+    The thumbnails are pre-scaled to a few sizes and stored in two tiers, the
+    memory tier is a LRU cache of pixmaps and the disk tier stores the scaled
+    images in the cache folder. The missing thumbnails are generated in worker
+    threads, so widgets never decode the full-size image in the GUI thread.
+
+    The effects like hover blur are applied to thumbnails in worker threads too,
+    and stored in the same way as thumbnails.
+
+    The disk tier is size-bounded, the least recently read images are removed
+    when it's exceeded, including the ones keyed by a stale modified time.
+    """
+
+    sizes = (113, 200, 275, 450)
+
+    thumbnailReady = pyqtSignal(str, int)   # image path and thumbnail size
+    effectReady = pyqtSignal(str, str)      # image path and effect name
+    loadFinished = pyqtSignal(str, int, QImage)
+    effectLoadFinished = pyqtSignal(str, str, QImage)
+
+    def __init__(self, cacheLimit=64*1024, diskLimit=256 << 20, folder=thumbnailFolder, parent=None):
+        """
+        Parameters
+        ----------
+        cacheLimit: int
+            the maximum size of memory tier in kilobytes
+
+        diskLimit: int
+            the maximum size of disk tier in bytes
+
+        folder: Path
+            folder of disk tier
+
+        parent:
+            parent instance
+        """
+        super().__init__(parent=parent)
+        self.cacheLimit = cacheLimit
+        self.cost = 0
+        self.pixmaps = OrderedDict()    # type:Dict[Tuple[str, Union[int, str]], QPixmap]
+        self.pendingKeys = set()
+        self.effects = {}   # type:Dict[str, Callable[[Image.Image], Image.Image]]
+        self.effectSizes = {}   # type:Dict[str, int]
+        self.diskLimit = diskLimit
+        self.diskCost = None
+        self.diskLock = Lock()
+        self.folder = folder
+        self.threadPool = QThreadPool(self)
+        self.loadFinished.connect(self.__onLoadFinished)
+        self.effectLoadFinished.connect(self.__onLoadFinished)
+
+    def thumbnail(self, path: str, size: int) -> QPixmap:
+        """ get the thumbnail of image, this method should be called in the GUI thread
+
+        Parameters
+        ----------
+        path: str
+            image path
+
+        size: int
+            the minimum size of thumbnail, it will be rounded up to one of
+            the pre-scaled sizes
+
+        Returns
+        -------
+        pixmap: QPixmap
+            thumbnail. If it's not in the memory tier, a thumbnail of the other size
+            or a null pixmap is returned as placeholder and `thumbnailReady` will be
+            emitted once the thumbnail is loaded
+        """
+        path = str(path)
+        key = (path, self.thumbnailSize(size))
+        if key in self.pixmaps:
+            self.pixmaps.move_to_end(key)
+            return self.pixmaps[key]
+
+        if key not in self.pendingKeys:
+            self.pendingKeys.add(key)
+            self.threadPool.start(ThumbnailWorker(*key, self))
+
+        for (p, s), pixmap in reversed(self.pixmaps.items()):
+            if p == path and isinstance(s, int):
+                return pixmap
+
+        return QPixmap()
+
+    def registerEffect(self, name: str, size: int, effect: Callable[[Image.Image], Image.Image]):
+        """ register an effect applied to thumbnail
+
+        Parameters
+        ----------
+        name: str
+            effect name, which should contain all the parameters of effect,
+            because it's used as the key of cache
+
+        size: int
+            the minimum size of thumbnail used by effect
+
+        effect: Callable[[Image], Image]
+            effect function, which will be called in worker threads
+        """
+        if name not in self.effects:
+            self.effects[name] = effect
+            self.effectSizes[name] = self.thumbnailSize(size)
+
+    def effect(self, path: str, name: str) -> QPixmap:
+        """ get the thumbnail with effect applied, this method should be called in the GUI thread
+
+        Parameters
+        ----------
+        path: str
+            image path
+
+        name: str
+            name of the registered effect
+
+        Returns
+        -------
+        pixmap: QPixmap
+            thumbnail with effect. If it's not in the memory tier, a null pixmap is
+            returned and `effectReady` will be emitted once the thumbnail is loaded
+        """
+        path = str(path)
+        key = (path, name)
+        if key in self.pixmaps:
+            self.pixmaps.move_to_end(key)
+            return self.pixmaps[key]
+
+        if key not in self.pendingKeys:
+            self.pendingKeys.add(key)
+            self.threadPool.start(ThumbnailWorker(
+                path, self.effectSizes[name], self, name))
+
+        return QPixmap()
+
+    def thumbnailSize(self, size: int) -> int:
+        """ get the pre-scaled size used for the requested size """
+        for s in self.sizes:
+            if s >= size:
+                return s
+
+        return size
+
+    def invalidate(self, path: str):
+        """ remove the thumbnails of image from memory tier, it should be called
+        when the image file is overwritten """
+        path = str(path)
+        for key in [k for k in self.pixmaps if k[0] == path]:
+            self.cost -= self.__cost(self.pixmaps.pop(key))
+
+    def addDiskCost(self, size: int):
+        """ record the size of image written to disk tier, this method can be
+        called in any thread """
+        with self.diskLock:
+            if self.diskCost is None:
+                self.diskCost = sum(i.stat().st_size for i in self.__diskFiles())
+            else:
+                self.diskCost += size
+
+            if self.diskCost > self.diskLimit:
+                self.__trimDisk()
+
+    def __diskFiles(self):
+        """ iterate over the images in disk tier """
+        return (i for i in self.folder.rglob('*') if i.is_file())
+
+    def __trimDisk(self):
+        """ remove the least recently read images until the size of disk tier
+        drops to 3/4 of the maximum size """
+        files = []
+        for file in self.__diskFiles():
+            try:
+                stat = file.stat()
+            except OSError:
+                continue
+
+            files.append((stat.st_mtime, stat.st_size, file))
+
+        size = 0
+        limit = self.diskLimit * 3 // 4
+        files.sort(key=lambda i: i[0], reverse=True)
+        for i, (_, n, file) in enumerate(files):
+            if size + n > limit:
+                break
+
+            size += n
+        else:
+            i = len(files)
+
+        for _, n, file in files[i:]:
+            try:
+                file.unlink()
+            except OSError:
+                size += n
+
+        self.diskCost = size
+
+    def __onLoadFinished(self, path: str, size: Union[int, str], image: QImage):
+        """ load thumbnail or effect finished slot """
+        key = (path, size)
+        self.pendingKeys.discard(key)
+        if image.isNull():
+            return
+
+        pixmap = QPixmap.fromImage(image)
+        if key in self.pixmaps:
+            self.cost -= self.__cost(self.pixmaps.pop(key))
+
+        self.pixmaps[key] = pixmap
+        self.cost += self.__cost(pixmap)
+
+        # evict the least recently used thumbnails
+        while self.cost > self.cacheLimit and len(self.pixmaps) > 1:
+            _, p = self.pixmaps.popitem(last=False)
+            self.cost -= self.__cost(p)
+
+        if isinstance(size, str):
+            self.effectReady.emit(path, size)
+        else:
+            self.thumbnailReady.emit(path, size)
+
+    @staticmethod
+    def __cost(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8 // 1024
+
+
+thumbnailCache = ThumbnailCache()
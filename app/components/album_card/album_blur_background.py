@@ -1,11 +1,36 @@
 # coding:utf-8
 from common.config import config, Theme
-from common.image_utils import readImage
+from common.thumbnail import thumbnailCache
 from components.widgets.label import FadeInLabel
 from PIL import Image
 from PIL.ImageFilter import GaussianBlur
 
 
+def blurAlbumCover(image: Image.Image, imageSize: tuple, blurRadius: int, theme: Theme) -> Image.Image:
+    """ create the blur background of album cover """
+    albumCover = image.convert('RGB').resize(imageSize, Image.LANCZOS)
+
+    # create a new image
+    r = 0 if theme == Theme.DARK else 255
+    blurAlbumCover = Image.new(
+        'RGBA', (imageSize[0]+2*blurRadius, imageSize[1]+2*blurRadius), (r, r, r, 0))
+    blurAlbumCover.paste(albumCover, (blurRadius, blurRadius))
+
+    # apply Gaussian blur to album cover
+    return blurAlbumCover.filter(GaussianBlur(blurRadius/2))
+
+
+def albumBlurEffect(imageSize: tuple = (210, 210), blurRadius=30) -> str:
+    """ register the blur effect of album cover and return the effect name """
+    theme = config.theme
+    name = f"AlbumBlur_{imageSize[0]}x{imageSize[1]}_{blurRadius}_{theme.value}"
+    thumbnailCache.registerEffect(
+        name, max(imageSize),
+        lambda image: blurAlbumCover(image, imageSize, blurRadius, theme)
+    )
+    return name
+
+
 class AlbumBlurBackground(FadeInLabel):
     """ Blur background under album card """
 
@@ -26,25 +51,32 @@ class AlbumBlurBackground(FadeInLabel):
             blur radius
         """
         super().__init__(parent)
+        self.imagePath = ''
+        self.effectName = ''
+        thumbnailCache.effectReady.connect(self.__onEffectReady)
         self.setBlurAlbum(imagePath, imageSize, blurRadius)
 
     def setBlurAlbum(self, imagePath: str, imageSize: tuple = (210, 210), blurRadius=30):
-        """ set the album cover to be blurred """
+        """ set the album cover to be blurred, the blur background is computed in
+        background thread if it isn't precomputed """
         if not imagePath:
             return
 
-        albumCover = readImage(imagePath).resize(imageSize)
+        self.imagePath = str(imagePath)
+        self.effectName = albumBlurEffect(imageSize, blurRadius)
+        self.__updatePixmap()
 
-        # create a new image
-        r = 0 if config.theme == Theme.DARK else 255
-        blurAlbumCover = Image.new(
-            'RGBA', (imageSize[0]+2*blurRadius, imageSize[1]+2*blurRadius), (r, r, r, 0))
-        blurAlbumCover.paste(albumCover, (blurRadius, blurRadius))
+    def __updatePixmap(self):
+        pixmap = thumbnailCache.effect(self.imagePath, self.effectName)
+        if pixmap.isNull():
+            self.clear()
+        else:
+            self.resize(pixmap.size())
+            self.setPixmap(pixmap)
 
-        # apply Gaussian blur to album cover
-        blurAlbumCover = blurAlbumCover.filter(GaussianBlur(blurRadius/2))
-        self.resize(*blurAlbumCover.size)
-        self.setPixmap(blurAlbumCover.toqpixmap())
+    def __onEffectReady(self, path: str, name: str):
+        if path == self.imagePath and name == self.effectName:
+            self.__updatePixmap()
 
     def showEvent(self, e):
         super().showEvent(e)
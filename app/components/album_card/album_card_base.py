@@ -5,6 +5,7 @@ from common.auto_wrap import TextWrap
 from common.database.entity import AlbumInfo
 from common.picture import Cover
 from common.signal_bus import signalBus
+from common.thumbnail import thumbnailCache
 from components.buttons.blur_button import BlurButton
 from components.widgets.check_box import CheckBox
 from components.widgets.label import AlbumCover, ClickableLabel
@@ -15,6 +16,8 @@ from PyQt5.QtGui import QContextMenuEvent, QFont, QFontMetrics, QMouseEvent
 from PyQt5.QtWidgets import (QApplication, QGraphicsOpacityEffect, QVBoxLayout,
                              QWidget)
 
+from .album_blur_background import albumBlurEffect
+
 
 class AlbumCardBase(PerspectiveWidget):
     """ Album card base class """
@@ -126,6 +129,11 @@ class AlbumCardBase(PerspectiveWidget):
         self.singer = albumInfo.singer
         self.year = str(albumInfo.year)
         self.coverPath = Cover(self.singer, self.album).path()
+        self.__prefetchBlurBackground()
+
+    def __prefetchBlurBackground(self):
+        """ compute the blur background in background thread before the card is hovered """
+        thumbnailCache.effect(self.coverPath, albumBlurEffect())
 
     def enterEvent(self, e):
         albumCardPos = self.mapToGlobal(QPoint(0, 0))  # type:QPoint
@@ -171,6 +179,7 @@ class AlbumCardBase(PerspectiveWidget):
         """ update album cover """
         self.coverPath = coverPath
         self.albumPic.setCover(coverPath)
+        self.__prefetchBlurBackground()
         self.playButton.setBlurPic(coverPath, 40)
         self.addToButton.setBlurPic(coverPath, 40)
 
@@ -222,6 +231,38 @@ class AlbumCardBase(PerspectiveWidget):
 
         self.isInSelectionMode = isOpen
 
+    def restoreState(self, isChecked: bool, isInSelectionMode: bool):
+        """ restore the state of album card without emitting signals, used when
+        the album card is reused to display another album
+
+        Parameters
+        ----------
+        isChecked: bool
+            whether the album card is checked
+
+        isInSelectionMode: bool
+            whether the view is in selection mode
+        """
+        self.hideCheckBoxAni.stop()
+        self.checkBoxOpacityEffect.setOpacity(1)
+        self.checkBox.setVisible(isInSelectionMode)
+        self.isInSelectionMode = isInSelectionMode
+        self.playButton.hide()
+        self.addToButton.hide()
+
+        if self.isChecked == isChecked:
+            return
+
+        self.isChecked = isChecked
+        self.checkBox.blockSignals(True)
+        self.checkBox.setChecked(isChecked)
+        self.checkBox.blockSignals(False)
+
+        self.setProperty("isChecked", str(isChecked))
+        self.albumLabel.setProperty("isChecked", str(isChecked))
+        self.contentLabel.setProperty("isChecked", str(isChecked))
+        self.setStyle(QApplication.style())
+
     def _onSelectActionTriggered(self):
         """ select action triggered slot """
         self.setSelectionModeOpen(True)
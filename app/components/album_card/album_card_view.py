@@ -88,9 +88,13 @@ class AlbumCardViewBase(QWidget):
         card.hideBlurAlbumBackgroundSig.connect(
             self.hideBlurAlbumBackgroundSig)
 
+    @property
+    def checkedAlbumInfos(self) -> List[AlbumInfo]:
+        return [i.albumInfo for i in self.checkedAlbumCards]
+
     def getAlbumSongInfos(self, singer: str, album: str):
         """ get song information of an album """
-        albumInfo = self.library.albumInfoController.getAlbumInfo(
+        albumInfo = self.library.getAlbumInfo(
             singer, album)
         if not albumInfo:
             return []
@@ -112,7 +116,7 @@ class AlbumCardViewBase(QWidget):
 
     def showAlbumInfoEditDialog(self, singer: str, album: str):
         """ show album information edit dialog box """
-        albumInfo = self.library.albumInfoController.getAlbumInfo(
+        albumInfo = self.library.getAlbumInfo(
             singer, album)
         if not albumInfo:
             return
@@ -2,11 +2,12 @@
 from typing import List, Union
 
 from common.image_utils import DominantColor
+from common.thumbnail import thumbnailCache
 from components.widgets.label import AvatarLabel
 from components.widgets.menu import AddToMenu, AddFromMenu, RoundMenu
 from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import (QColor, QFont, QFontMetrics, QPainter, QPalette,
-                         QPixmap, QResizeEvent)
+                         QResizeEvent)
 from PyQt5.QtWidgets import QAction, QLabel, QWidget
 
 from .app_bar_button import AppBarButton
@@ -94,9 +95,9 @@ class CollapsingAppBarBase(QWidget):
         self.setMaximumHeight(385)
         self.setBackgroundColor()
         self.setAutoFillBackground(True)
-        self.coverLabel.setPixmap(QPixmap(self.coverPath).scaled(
-            275, 275, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation))
+        self.__setCover()
         self.coverLabel.setScaledContents(True)
+        thumbnailCache.thumbnailReady.connect(self.__onThumbnailReady)
 
         self.resize(1300, 385)
 
@@ -118,6 +119,18 @@ class CollapsingAppBarBase(QWidget):
                 button.clicked.connect(self.__signalMap[name])
                 action.triggered.connect(self.__signalMap[name])
 
+    def __setCover(self):
+        """ set the cover of app bar, the thumbnail is used to avoid decoding the full-size image """
+        if isinstance(self.coverLabel, AvatarLabel):
+            self.coverLabel.setImagePath(self.coverPath)
+            return
+
+        self.coverLabel.setPixmap(thumbnailCache.thumbnail(self.coverPath, 275))
+
+    def __onThumbnailReady(self, path: str, size: int):
+        if path == self.coverPath and not isinstance(self.coverLabel, AvatarLabel):
+            self.__setCover()
+
     def setBackgroundColor(self):
         """ set the background color of app bar """
         r, g, b = DominantColor.getDominantColor(self.coverPath)
@@ -301,7 +314,7 @@ class CollapsingAppBarBase(QWidget):
         self.title = title
         self.content = content
         self.coverPath = coverPath
-        self.coverLabel.setPixmap(QPixmap(self.coverPath))
+        self.__setCover()
         self.setBackgroundColor()
         self.__adjustText()
         self.update()
@@ -1,11 +1,26 @@
 # coding:utf-8
 from common.icon import drawSvgIcon
+from common.thumbnail import thumbnailCache
+from PIL import Image
 from PIL.ImageFilter import GaussianBlur
-from PyQt5.QtCore import QPropertyAnimation, Qt, pyqtProperty, QRectF, QSize
+from PyQt5.QtCore import QPropertyAnimation, Qt, pyqtProperty, QRect, QRectF, QSize
 from PyQt5.QtGui import QBrush, QEnterEvent, QPainter, QPixmap
 
 from .tool_tip_button import ToolTipButton
-from common.image_utils import readImage
+
+
+def blurImage(image: Image.Image, blurRadius: int) -> Image.Image:
+    """ blur the whole image for blur buttons """
+    image = image.convert('RGB').resize((200, 200), Image.LANCZOS)
+    return image.filter(GaussianBlur(blurRadius)).point(lambda x: int(x * 0.7))
+
+
+def blurButtonEffect(blurRadius=40) -> str:
+    """ register the blur effect of blur button and return the effect name """
+    name = f"ButtonBlur_{blurRadius}"
+    thumbnailCache.registerEffect(
+        name, 200, lambda image: blurImage(image, blurRadius))
+    return name
 
 
 class BlurButton(ToolTipButton):
@@ -57,30 +72,41 @@ class BlurButton(ToolTipButton):
         self.opacityAni = QPropertyAnimation(self, b'opacity', self)
         self.setToolTip(text)
         self.setToolTipDelay(250)
+        thumbnailCache.effectReady.connect(self.__onEffectReady)
+        self.__prefetch()
 
     def setBlurPic(self, blurPicPath, blurRadius=35):
         """ set the image to be blurred """
-        if self.blurPicPath == blurPicPath:
+        if self.blurPicPath == blurPicPath and self.blurRadius == blurRadius:
             return
 
         self.blurPicPath = blurPicPath
         self.blurRadius = blurRadius
         self.blurPix = None
+        self.__prefetch()
+
+    def __prefetch(self):
+        """ compute the blurred image in background before the button is shown """
+        if self.blurPicPath:
+            thumbnailCache.effect(self.blurPicPath, blurButtonEffect(self.blurRadius))
 
     def __blur(self):
-        """ do blur action """
-        img = readImage(self.blurPicPath).convert('RGB').resize((200, 200))
-        img = img.crop((
-            self.cropX,
-            self.cropY,
-            self.width() + self.cropX,
-            self.height() + self.cropY
-        ))
-        img = img.filter(GaussianBlur(self.blurRadius)).point(lambda x: int(x * 0.7))
-        self.blurPix = img.toqpixmap()
+        """ crop the precomputed blurred image, so no blur is done in the GUI thread """
+        if not self.blurPicPath:
+            return
+
+        pixmap = thumbnailCache.effect(self.blurPicPath, blurButtonEffect(self.blurRadius))
+        if pixmap.isNull():
+            return
 
+        self.blurPix = pixmap.copy(
+            QRect(self.cropX, self.cropY, self.width(), self.height()))
         self.update()
 
+    def __onEffectReady(self, path: str, name: str):
+        if path == str(self.blurPicPath) and not self.blurPix and self.isVisible():
+            self.__blur()
+
     def fadeIn(self):
         """ fade in """
         self.__opacity = 0
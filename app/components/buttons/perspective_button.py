@@ -13,7 +13,6 @@ class PerspectivePushButton(QPushButton):
     def __init__(self, text: str = "", parent=None, icon: QIcon = None):
         super().__init__(text, parent)
         self.transform = PixmapPerspectiveTransform()
-        self.__pressedPix = None
         self.__pressedPos = None
         if icon:
             self.setIcon(icon)
@@ -22,7 +21,7 @@ class PerspectivePushButton(QPushButton):
         """ apply perspective transform """
         super().mousePressEvent(e)
 
-        # grab screen
+        # grab screen, the perspective transform is applied when painting
         self.grabMouse()
         self.transform.setPixmap(self.grab())
 
@@ -47,8 +46,6 @@ class PerspectivePushButton(QPushButton):
         if self.__pressedPos in dstPointMap:
             self.transform.setDstPoints(*dstPointMap[self.pressedPos])
 
-        self.__pressedPix = self.transform.getPerspectiveTransform(w, h).scaled(
-            self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
         self.update()
 
     def mouseReleaseEvent(self, e):
@@ -73,7 +70,7 @@ class PerspectivePushButton(QPushButton):
         painter.setPen(Qt.NoPen)
 
         # paint background
-        painter.drawPixmap(self.rect(), self.__pressedPix)
+        self.transform.draw(painter)
 
     @property
     def pressedPos(self):
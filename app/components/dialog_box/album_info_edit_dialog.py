@@ -4,8 +4,8 @@ from pathlib import Path
 
 from common.style_sheet import setStyleSheet
 from common.database.entity import AlbumInfo, SongInfo
-from common.image_utils import getPicSuffix
-from common.picture import Cover, CoverType
+from common.picture import Cover
+from common.thumbnail import thumbnailCache
 from components.buttons.perspective_button import PerspectivePushButton
 from components.widgets.label import ErrorIcon, PixmapLabel
 from components.widgets.line_edit import LineEdit
@@ -241,22 +241,10 @@ class AlbumInfoEditDialog(MaskDialogBase):
         with open(self.newAlbumCoverPath, "rb") as f:
             picData = f.read()
 
-        # get suffix of new album cover
-        suffix = getPicSuffix(picData)
+        coverPath = Cover(self.singer, self.album).save(picData)
 
-        # modify the cover path if it's default
-        if self.coverPath == CoverType.ALBUM_BIG.value:
-            cover = Cover(self.singer, self.album)
-            coverPath = cover.folder/("cover" + suffix)
-        else:
-            coverPath = Path(self.coverPath)
-
-        coverPath.parent.mkdir(exist_ok=True, parents=True)
-        with open(coverPath, "wb") as f:
-            f.write(picData)
-
-        if suffix != coverPath.suffix:
-            coverPath.rename(coverPath.with_suffix(suffix))
+        # the cover is overwritten, so the cached thumbnails are out of date
+        thumbnailCache.invalidate(coverPath)
 
     def __setWidgetEnable(self, isEnable: bool):
         """ set whether widgets is enabled """
@@ -1,7 +1,7 @@
 # coding:utf-8
 from typing import List
 
-import pinyin
+from common.sort_key import sortKeyIndex
 from common.style_sheet import setStyleSheet
 from PyQt5.QtCore import QFile, Qt, pyqtSignal
 from PyQt5.QtWidgets import QGridLayout, QStackedWidget, QWidget
@@ -89,9 +89,7 @@ class LabelNavigationInterface(QWidget):
                 label.setCursor(Qt.PointingHandCursor)
                 self.vBox.addWidget(label)
         else:
-            letters = set(pinyin.get_initial(i)[0].upper() for i in labels)
-            letters = set(i if 65 <= ord(i) <=
-                            90 else "..." for i in letters)
+            letters = {sortKeyIndex.letter(i) for i in labels}
 
             for label in self.__clickableLetterLabels:
                 enabled = label.text() in letters
@@ -5,8 +5,9 @@ from typing import List
 
 from common.cache import lastPlaylistFolder
 from common.database.entity import SongInfo
-from common.library import Library
+from common.library import Library, fileAvailability
 from common.url import url
+from PyQt5.QtCore import QTimer
 from PyQt5.QtMultimedia import QMediaContent, QMediaPlaylist
 
 
@@ -35,7 +36,10 @@ class MediaPlaylist(QMediaPlaylist):
         self.setPlaybackMode(QMediaPlaylist.Sequential)
         self.prePlayMode = self.playbackMode()
         self.randPlayBtnPressed = False
+        self.isSelecting = False
+        self.step = 1
         self.__readLastPlaylist()
+        self.currentIndexChanged.connect(self.__onCurrentIndexChanged)
 
     def addSong(self, songInfo: SongInfo):
         """ append song to playlist """
@@ -79,26 +83,66 @@ class MediaPlaylist(QMediaPlaylist):
         """ play next song """
         if self.currentIndex() == self.mediaCount() - 1:
             if self.playbackMode() == QMediaPlaylist.Loop:
-                self.setCurrentIndex(0)
+                super().setCurrentIndex(0)
             elif self.playbackMode() == QMediaPlaylist.Random:
                 super().next()
         else:
             if self.playbackMode() == QMediaPlaylist.CurrentItemInLoop:
-                self.setCurrentIndex(self.currentIndex()+1)
+                super().setCurrentIndex(self.currentIndex()+1)
             else:
                 super().next()
 
     def previous(self):
         """ play previous song """
+        self.step = -1
         if self.currentIndex() == 0:
             if self.playbackMode() == QMediaPlaylist.Loop:
-                self.setCurrentIndex(self.mediaCount() - 1)
+                super().setCurrentIndex(self.mediaCount() - 1)
         else:
             if self.playbackMode() == QMediaPlaylist.CurrentItemInLoop:
-                self.setCurrentIndex(self.currentIndex()-1)
+                super().setCurrentIndex(self.currentIndex()-1)
             else:
                 super().previous()
 
+        self.step = 1
+
+    def setCurrentIndex(self, index: int):
+        """ set the index of song to be played, the song selected explicitly
+        is played even if its file is missing """
+        self.isSelecting = True
+        super().setCurrentIndex(index)
+        self.isSelecting = False
+
+    def __onCurrentIndexChanged(self, index: int):
+        """ current index changed slot """
+        if self.isSelecting or not 0 <= index < len(self.playlist):
+            return
+
+        if fileAvailability.isAvailable(self.playlist[index].file):
+            return
+
+        # skip the missing song after the other slots have handled current index
+        step = self.step
+        QTimer.singleShot(0, lambda: self.__skip(index, step))
+
+    def __skip(self, index: int, step: int):
+        """ move to the nearest available song in the direction of step """
+        count = self.mediaCount()
+        if self.currentIndex() != index or count != len(self.playlist):
+            return
+
+        isLoop = self.playbackMode() in [QMediaPlaylist.Loop, QMediaPlaylist.Random]
+        for i in range(1, count):
+            j = index + i*step
+            if isLoop:
+                j %= count
+            elif not 0 <= j < count:
+                return
+
+            if fileAvailability.isAvailable(self.playlist[j].file):
+                super().setCurrentIndex(j)
+                return
+
     def getCurrentSong(self) -> SongInfo:
         """ get current song information """
         if self.currentIndex() >= 0:
@@ -194,11 +238,11 @@ class MediaPlaylist(QMediaPlaylist):
 
     def updateSongInfo(self, newSongInfo: SongInfo):
         """ update song information """
-        for i, songInfo in enumerate(self.playlist):
-            if songInfo.file == newSongInfo.file:
-                self.playlist[i] = newSongInfo
+        self.updateMultiSongInfos([newSongInfo])
 
-    def updateMultiSongInfos(self, songInfos: SongInfo):
+    def updateMultiSongInfos(self, songInfos: List[SongInfo]):
         """ update multi song information """
-        for songInfo in songInfos:
-            self.updateSongInfo(songInfo)
+        songInfoMap = {i.file: i for i in songInfos}
+        for i, songInfo in enumerate(self.playlist):
+            if songInfo.file in songInfoMap:
+                self.playlist[i] = songInfoMap[songInfo.file]
@@ -1,10 +1,10 @@
 # coding:utf-8
 from typing import Dict, List
 
-import pinyin
 from common.database.entity import Playlist, SongInfo
 from common.library import Library
 from common.signal_bus import signalBus
+from common.sort_key import sortKeyIndex
 from components.dialog_box.message_dialog import MessageDialog
 from components.dialog_box.playlist_dialog import RenamePlaylistDialog
 from components.layout import HBoxLayout, FlowLayout
@@ -226,8 +226,7 @@ class PlaylistCardViewBase(QWidget):
         if mode == 'modifiedTime':
             self.playlistCards.sort(key=lambda i: i.playlist[mode])
         else:
-            self.playlistCards.sort(
-                key=lambda i: pinyin.get_initial(i.playlist.name)[0].lower())
+            self.playlistCards.sort(key=lambda i: sortKeyIndex.key(i.playlist.name))
 
         self._removeCardsFromLayout()
         self._addCardsToLayout()
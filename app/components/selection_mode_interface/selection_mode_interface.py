@@ -244,14 +244,14 @@ class SongSelectionModeInterface(SelectionModeInterface):
         self.adjustScrollHeight()
 
     def _getCheckedSongInfos(self) -> List[SongInfo]:
-        return [i.songInfo for i in self.songListWidget.checkedSongCards]
+        return self.songListWidget.checkedSongInfos
 
     def _getCheckedAlbum(self) -> Tuple[str, str]:
-        songCard = self.songListWidget.checkedSongCards[0]
-        return songCard.singer, songCard.album
+        songInfo = self.songListWidget.checkedSongInfos[0]
+        return songInfo.singer, songInfo.album
 
     def _getCheckedSinger(self) -> str:
-        return self.songListWidget.checkedSongCards[0].singer
+        return self.songListWidget.checkedSongInfos[0].singer
 
     def _onProperty(self):
         songInfo = self._getCheckedSongInfos()[0]
@@ -264,12 +264,13 @@ class SongSelectionModeInterface(SelectionModeInterface):
         self.songListWidget.showSongInfoEditDialog(songInfo)
 
     def _onDelete(self):
-        if len(self.songListWidget.checkedSongCards) > 1:
+        songInfos = self.songListWidget.checkedSongInfos
+        if len(songInfos) > 1:
             title = self.tr("Are you sure you want to delete these?")
             content = self.tr(
                 "If you delete these songs, they won't be on be this device anymore.")
         else:
-            name = self.songListWidget.checkedSongCards[0].songName
+            name = songInfos[0].title
             title = self.tr("Are you sure you want to delete this?")
             content = self.tr("If you delete") + f' "{name}" ' + \
                 self.tr("it won't be on be this device anymore.")
@@ -278,12 +279,8 @@ class SongSelectionModeInterface(SelectionModeInterface):
         if not w.exec():
             return
 
-        songPaths = [i.songPath for i in self.songListWidget.checkedSongCards]
-
-        for songCard in self.songListWidget.checkedSongCards.copy():
-            songCard.setChecked(False)
-            self.songListWidget.removeSongCard(songCard.itemIndex)
-
+        songInfos = self.songListWidget.removeCheckedSongCards()
+        songPaths = [i.file for i in songInfos]
         signalBus.removeSongSig.emit(songPaths)
 
 
@@ -325,8 +322,8 @@ class SingerSelectionModeInterface(SelectionModeInterface):
         self.adjustScrollHeight()
 
     def _getCheckedSongInfos(self) -> List[SongInfo]:
-        singers = [i.singer for i in self.singerCardView.checkedSingerCards]
-        songInfos = self.library.songInfoController.getSongInfosBySingers(
+        singers = [i.singer for i in self.singerCardView.checkedSingerInfos]
+        songInfos = self.library.getSongInfosBySingers(
             singers)
         return songInfos
 
@@ -371,21 +368,21 @@ class AlbumSelectionModeInterface(SelectionModeInterface):
     def _getCheckedSongInfos(self) -> List[SongInfo]:
         singers = []
         albums = []
-        for albumCard in self.albumCardView.checkedAlbumCards:
-            singers.append(albumCard.singer)
-            albums.append(albumCard.album)
+        for albumInfo in self.albumCardView.checkedAlbumInfos:
+            singers.append(albumInfo.singer)
+            albums.append(albumInfo.album)
 
-        songInfos = self.library.songInfoController.getSongInfosBySingerAlbum(
+        songInfos = self.library.getSongInfosBySingerAlbum(
             singers, albums)
 
         return songInfos
 
     def _getCheckedAlbum(self) -> Tuple[str, str]:
-        card = self.albumCardView.checkedAlbumCards[0]
-        return card.singer, card.album
+        albumInfo = self.albumCardView.checkedAlbumInfos[0]
+        return albumInfo.singer, albumInfo.album
 
     def _getCheckedSinger(self) -> str:
-        return self.albumCardView.checkedAlbumCards[0].singer
+        return self.albumCardView.checkedAlbumInfos[0].singer
 
     def _onEditInfo(self):
         singer, album = self._getCheckedAlbum()
@@ -393,12 +390,12 @@ class AlbumSelectionModeInterface(SelectionModeInterface):
         self.albumCardView.showAlbumInfoEditDialog(singer, album)
 
     def _onDelete(self):
-        if len(self.albumCardView.checkedAlbumCards) > 1:
+        if len(self.albumCardView.checkedAlbumInfos) > 1:
             title = self.tr("Are you sure you want to delete these?")
             content = self.tr(
                 "If you delete these albums, they won't be on be this device anymore.")
         else:
-            name = self.albumCardView.checkedAlbumCards[0].album
+            name = self.albumCardView.checkedAlbumInfos[0].album
             title = self.tr("Are you sure you want to delete this?")
             content = self.tr("If you delete") + f' "{name}" ' + \
                 self.tr("it won't be on be this device anymore.")
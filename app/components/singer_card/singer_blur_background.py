@@ -1,11 +1,39 @@
 # coding:utf-8
 from common.config import config, Theme
-from common.image_utils import readImage
+from common.thumbnail import thumbnailCache
 from components.widgets.label import FadeInLabel
 from PIL import Image, ImageDraw
 from PIL.ImageFilter import GaussianBlur
 
 
+def blurAvatar(image: Image.Image, imageSize: tuple, blurRadius: int, theme: Theme) -> Image.Image:
+    """ create the blur background of singer avatar """
+    avatar = image.convert('RGB').resize(imageSize, Image.LANCZOS)
+
+    # create a new image
+    r = 0 if theme == Theme.DARK else 255
+    blurAvatar = Image.new(
+        'RGBA', (imageSize[0]+2*blurRadius, imageSize[1]+2*blurRadius), (r, r, r, 0))
+    mask = Image.new('L', imageSize, 0)
+    draw = ImageDraw.Draw(mask)
+    draw.pieslice([(0, 0), imageSize], 0, 360, fill=255)
+    blurAvatar.paste(avatar, (blurRadius, blurRadius), mask)
+
+    # apply Gaussian blur to avatar
+    return blurAvatar.filter(GaussianBlur(blurRadius/2))
+
+
+def singerBlurEffect(imageSize: tuple = (200, 200), blurRadius=30) -> str:
+    """ register the blur effect of singer avatar and return the effect name """
+    theme = config.theme
+    name = f"SingerBlur_{imageSize[0]}x{imageSize[1]}_{blurRadius}_{theme.value}"
+    thumbnailCache.registerEffect(
+        name, max(imageSize),
+        lambda image: blurAvatar(image, imageSize, blurRadius, theme)
+    )
+    return name
+
+
 class SingerBlurBackground(FadeInLabel):
     """ Blur background under singer card """
 
@@ -26,28 +54,32 @@ class SingerBlurBackground(FadeInLabel):
             blur radius
         """
         super().__init__(parent)
+        self.imagePath = ''
+        self.effectName = ''
+        thumbnailCache.effectReady.connect(self.__onEffectReady)
         self.setBlurAvatar(imagePath, imageSize, blurRadius)
 
     def setBlurAvatar(self, imagePath: str, imageSize: tuple = (200, 200), blurRadius=30):
-        """ set the avatar to be blurred """
+        """ set the avatar to be blurred, the blur background is computed in
+        background thread if it isn't precomputed """
         if not imagePath:
             return
 
-        avatar = readImage(imagePath).resize(imageSize)
-
-        # create a new image
-        r = 0 if config.theme == Theme.DARK else 255
-        blurAvatar = Image.new(
-            'RGBA', (imageSize[0]+2*blurRadius, imageSize[1]+2*blurRadius), (r, r, r, 0))
-        mask = Image.new('L', imageSize, 0)
-        draw = ImageDraw.Draw(mask)
-        draw.pieslice([(0, 0), imageSize], 0, 360, fill=255)
-        blurAvatar.paste(avatar, (blurRadius, blurRadius), mask)
-
-        # apply Gaussian blur to album cover
-        blurAvatar = blurAvatar.filter(GaussianBlur(blurRadius/2))
-        self.resize(*blurAvatar.size)
-        self.setPixmap(blurAvatar.toqpixmap())
+        self.imagePath = str(imagePath)
+        self.effectName = singerBlurEffect(imageSize, blurRadius)
+        self.__updatePixmap()
+
+    def __updatePixmap(self):
+        pixmap = thumbnailCache.effect(self.imagePath, self.effectName)
+        if pixmap.isNull():
+            self.clear()
+        else:
+            self.resize(pixmap.size())
+            self.setPixmap(pixmap)
+
+    def __onEffectReady(self, path: str, name: str):
+        if path == self.imagePath and name == self.effectName:
+            self.__updatePixmap()
 
     def showEvent(self, e):
         super().showEvent(e)
@@ -4,16 +4,19 @@ import sys
 from common.database.entity import SingerInfo
 from common.picture import Avatar
 from common.signal_bus import signalBus
+from common.thumbnail import thumbnailCache
 from components.buttons.blur_button import BlurButton
 from components.widgets.check_box import CheckBox
 from components.widgets.label import ClickableLabel
 from components.widgets.menu import AddToMenu
 from components.widgets.perspective_widget import PerspectiveWidget
 from PyQt5.QtCore import QEvent, QPoint, QPropertyAnimation, Qt, pyqtSignal
-from PyQt5.QtGui import (QBrush, QColor, QContextMenuEvent, QImage,
-                         QImageReader, QMouseEvent, QPainter, QPen)
+from PyQt5.QtGui import (QBrush, QColor, QContextMenuEvent, QMouseEvent,
+                         QPainter, QPen)
 from PyQt5.QtWidgets import QApplication, QGraphicsOpacityEffect, QWidget
 
+from .singer_blur_background import singerBlurEffect
+
 
 class SingerAvatar(QWidget):
     """ Singer avatar """
@@ -35,6 +38,7 @@ class SingerAvatar(QWidget):
         self.setFixedSize(size, size)
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setSinger(singer)
+        thumbnailCache.thumbnailReady.connect(self.__onThumbnailReady)
 
     def setSinger(self, singer: str):
         """ set singer
@@ -50,23 +54,29 @@ class SingerAvatar(QWidget):
     def updateAvatar(self, imagePath: str):
         """ update avatar """
         self.imagePath = imagePath
-        self.__image = QImage()
         self.update()
 
+    def __onThumbnailReady(self, path: str, size: int):
+        if path == self.imagePath:
+            self.update()
+
     def paintEvent(self, e):
         """ paint avatar """
-        if self.__image.isNull():
-            reader = QImageReader(self.imagePath)
-            reader.setScaledSize(self.size())
-            reader.setAutoTransform(True)
-            self.__image = reader.read()
+        w = self.width()
+        pixmap = thumbnailCache.thumbnail(self.imagePath, w)
+        if pixmap.isNull():
+            return
+
+        # the placeholder may be a thumbnail of the other size
+        if min(pixmap.width(), pixmap.height()) != w:
+            pixmap = pixmap.scaled(
+                w, w, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
 
         painter = QPainter(self)
         painter.setRenderHints(
             QPainter.Antialiasing | QPainter.SmoothPixmapTransform)
-        w = self.width()
         painter.setPen(QPen(QColor(0, 0, 0, 25), 2))
-        painter.setBrush(QBrush(self.__image))
+        painter.setBrush(QBrush(pixmap))
         painter.drawRoundedRect(self.rect(), w//2, w//2)
 
 
@@ -110,6 +120,7 @@ class SingerCardBase(PerspectiveWidget):
             self.checkBoxOpacityEffect, b'opacity', self)
 
         self.__initWidget()
+        self.__prefetchBlurBackground()
 
     def __initWidget(self):
         """ initialize widgets """
@@ -216,11 +227,16 @@ class SingerCardBase(PerspectiveWidget):
         QApplication.sendEvent(self, event)
         return super().contextMenuEvent(e)
 
+    def __prefetchBlurBackground(self):
+        """ compute the blur background in background thread before the card is hovered """
+        thumbnailCache.effect(self.avatar.imagePath, singerBlurEffect())
+
     def updateAvatar(self, imagePath: str):
         """ update avatar """
         self.avatar.updateAvatar(imagePath)
         self.playButton.setBlurPic(imagePath, 40)
         self.addToButton.setBlurPic(imagePath, 40)
+        self.__prefetchBlurBackground()
 
     def updateWindow(self, singerInfo: SingerInfo):
         """ update singer card """
@@ -232,6 +248,7 @@ class SingerCardBase(PerspectiveWidget):
         self.singerLabel.setText(self.singer)
         self.playButton.setBlurPic(self.avatar.imagePath, 40)
         self.addToButton.setBlurPic(self.avatar.imagePath, 40)
+        self.__prefetchBlurBackground()
 
     def setChecked(self, isChecked: bool):
         """ set the checked state """
@@ -248,6 +265,37 @@ class SingerCardBase(PerspectiveWidget):
 
         self.isInSelectionMode = isOpen
 
+    def restoreState(self, isChecked: bool, isInSelectionMode: bool):
+        """ restore the state of singer card without emitting signals, used when
+        the singer card is reused to display another singer
+
+        Parameters
+        ----------
+        isChecked: bool
+            whether the singer card is checked
+
+        isInSelectionMode: bool
+            whether the view is in selection mode
+        """
+        self.hideCheckBoxAni.stop()
+        self.checkBoxOpacityEffect.setOpacity(1)
+        self.checkBox.setVisible(isInSelectionMode)
+        self.isInSelectionMode = isInSelectionMode
+        self.playButton.hide()
+        self.addToButton.hide()
+
+        if self.isChecked == isChecked:
+            return
+
+        self.isChecked = isChecked
+        self.checkBox.blockSignals(True)
+        self.checkBox.setChecked(isChecked)
+        self.checkBox.blockSignals(False)
+
+        self.setProperty("isChecked", str(isChecked))
+        self.singerLabel.setProperty("isChecked", str(isChecked))
+        self.setStyle(QApplication.style())
+
     def _onSelectActionTriggered(self):
         """ select action triggered slot """
         self.setSelectionModeOpen(True)
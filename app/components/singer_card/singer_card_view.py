@@ -83,9 +83,13 @@ class SingerCardViewBase(QWidget):
         card.hideBlurSingerBackgroundSig.connect(
             self.hideBlurSingerBackgroundSig)
 
+    @property
+    def checkedSingerInfos(self) -> List[SingerInfo]:
+        return [i.singerInfo for i in self.checkedSingerCards]
+
     def getSongInfos(self, singers: List[str]):
         """ get song information of singers """
-        return self.library.songInfoController.getSongInfosBySingers(singers)
+        return self.library.getSongInfosBySingers(singers)
 
     def __hideAllCheckBox(self):
         """ hide check box of singer cards """
@@ -1,8 +1,9 @@
 # coding:utf-8
-import os
 import sys
+from typing import Dict
 
 from common.database.entity import SongInfo
+from common.library import fileAvailability
 from common.signal_bus import signalBus
 from components.widgets.menu import AddToMenu, DownloadMenu
 from PyQt5.QtCore import (QAbstractAnimation, QEasingCurve, QEvent,
@@ -79,6 +80,8 @@ class BasicSongCard(QWidget):
         self.playButton.clicked.connect(
             lambda: self.playButtonClicked.emit(self.itemIndex))
         self.playButton.clicked.connect(self.songNameCard.cancelButtonHoverState)
+        fileAvailability.availabilityChanged.connect(
+            self.__onFileAvailabilityChanged)
 
     def setSongInfo(self, songInfo: SongInfo):
         """ set song information without updating song card """
@@ -242,8 +245,16 @@ class BasicSongCard(QWidget):
         self._getAniTargetX()
 
     def _validateSongPath(self):
-        """ validate song path """
-        self.isSongExist = os.path.exists(self.songPath)
+        """ validate song path, the unknown file is checked in background """
+        self.isSongExist = fileAvailability.isAvailable(self.songPath)
+
+    def __onFileAvailabilityChanged(self, availabilities: Dict[str, bool]):
+        """ file availability changed slot """
+        if not self.isPlaying or self.songPath not in availabilities:
+            return
+
+        self._validateSongPath()
+        self.songNameCard.setPlay(True, self.isSongExist)
 
     def _getAniTargetX(self):
         """ get initial value of animation """
@@ -382,6 +393,54 @@ class BasicSongCard(QWidget):
 
         self.checkBox.setChecked(isChecked)
 
+    def restoreState(self, isPlaying: bool, isSelected: bool, isChecked: bool,
+                     isInSelectionMode: bool, isSongExist=True):
+        """ restore the state of song card without emitting signals, used when
+        the song card is reused to display another row of song list
+
+        Parameters
+        ----------
+        isPlaying: bool
+            whether the song is playing
+
+        isSelected: bool
+            whether the song card is selected
+
+        isChecked: bool
+            whether the song card is checked
+
+        isInSelectionMode: bool
+            whether the song list is in selection mode
+
+        isSongExist: bool
+            whether the song file exists
+        """
+        self.isPlaying = isPlaying
+        self.isSelected = isSelected
+        self.isChecked = isChecked
+        self.isInSelectionMode = isInSelectionMode
+        self.isSongExist = isSongExist
+        self.isPressed = False
+        self.isDoubleClicked = False
+
+        self.checkBox.blockSignals(True)
+        self.checkBox.setChecked(isChecked)
+        self.checkBox.blockSignals(False)
+
+        self.songNameCard.setPlay(isPlaying, isSongExist)
+        self.buttonGroup.setHidden(not isSelected or isInSelectionMode)
+        self.checkBox.setHidden(not (isSelected or isInSelectionMode))
+
+        if isSelected:
+            self.setState(WidgetState.SELECTED, CardState.SELECTED_LEAVE)
+        else:
+            state = WidgetState.PLAY if isPlaying else WidgetState.NORMAL
+            self.setState(state, CardState.LEAVE)
+
+        cursor = Qt.ArrowCursor if isInSelectionMode else Qt.PointingHandCursor
+        self.setClickableLabelCursor(cursor)
+        self.setStyle(QApplication.style())
+
     def updateSongCard(self, songInfo: SongInfo):
         """ update song card """
         raise NotImplementedError
@@ -1,21 +1,29 @@
 # coding:utf-8
-from typing import List
+from typing import Dict, List
 
 from common.database.entity import SongInfo
+from common.library import fileAvailability
 from common.signal_bus import signalBus
 from components.dialog_box.song_info_edit_dialog import SongInfoEditDialog
 from components.dialog_box.song_property_dialog import SongPropertyDialog
-from components.widgets.list_widget import ListWidget
-from PyQt5.QtCore import QMargins, QSize, Qt, pyqtSignal
-from PyQt5.QtGui import QResizeEvent
-from PyQt5.QtWidgets import QApplication, QListWidgetItem, QWidget
+from components.widgets.list_widget import ListView
+from PyQt5.QtCore import QEvent, QMargins, pyqtSignal
+from PyQt5.QtGui import QCursor
+from PyQt5.QtWidgets import QApplication
 
-from .song_card import BasicSongCard, SongCardFactory
+from .song_card import SongCardFactory
+from .song_card_delegate import SongCardDelegate
 from .song_card_type import SongCardType
+from .song_list_model import SongListModel
 
 
-class BasicSongListWidget(ListWidget):
-    """ song list widget base class """
+class BasicSongListWidget(ListView):
+    """ song list widget base class
+
+    Song cards are rows of `SongListModel` painted by `SongCardDelegate`, only
+    the row under mouse is covered by a real song card to handle interaction,
+    so the cost of song list doesn't grow with the number of songs.
+    """
 
     emptyChangedSig = pyqtSignal(bool)           # 歌曲卡是否为空
     removeSongSignal = pyqtSignal(SongInfo)      # 刪除歌曲列表中的一首歌
@@ -23,6 +31,8 @@ class BasicSongListWidget(ListWidget):
     checkedNumChanged = pyqtSignal(int, bool)    # 选中的歌曲卡数量发生改变
     currentIndexChanged = pyqtSignal(int)        # 选中的歌曲卡改变
 
+    paddingBottomHeight = 0
+
     def __init__(self, songInfos: List[SongInfo], songCardType: SongCardType, parent=None,
                  viewportMargins=QMargins(30, 0, 30, 0), paddingBottomHeight: int = 116):
         """
@@ -47,29 +57,35 @@ class BasicSongListWidget(ListWidget):
         self.__songCardType = songCardType
         self.paddingBottomHeight = paddingBottomHeight
         self.songInfos = songInfos if songInfos else []
-        self.currentIndex = None  # the index of selected song card
-        self.playingIndex = None  # the index of playing song card
+        self.currentIndex = None   # the index of current song card
+        self.playingIndex = None   # the index of playing song card
+        self.selectedIndex = None  # the index of selected song card
 
         self.isInSelectionMode = False
 
-        self.item_list = []
-        self.songCards = []  # type:List[BasicSongCard]
-        self.checkedSongCards = []  # type:List[BasicSongCard]
+        # the song card which covers the row under mouse
+        self.hoverCard = None
+
+        self.songListModel = SongListModel(self)
+        self.delegate = SongCardDelegate(songCardType, self)
+        self.setModel(self.songListModel)
+        self.setItemDelegate(self.delegate)
+        self.setUniformItemSizes(True)
+        self.setResizeMode(self.Adjust)
+        self.setMouseTracking(True)
 
         self.setAlternatingRowColors(True)
         self.setViewportMargins(viewportMargins)
 
         signalBus.playBySongInfoSig.connect(self.setPlayBySongInfo)
         signalBus.clearPlayingPlaylistSig.connect(self.cancelState)
+        fileAvailability.availabilityChanged.connect(
+            self.__onFileAvailabilityChanged)
 
     def createSongCards(self):
         """ 清空列表并创建新歌曲卡 """
         self.clearSongCards()
-        for songInfo in self.songInfos:
-            self.appendOneSongCard(songInfo)
-            QApplication.processEvents()
-
-        self.__createPaddingBottomItem()
+        self.songListModel.setSongInfos(self.songInfos)
 
     def appendOneSongCard(self, songInfo: SongInfo):
         """ append a song card to list widget, this does not change `songInfos` property
@@ -79,24 +95,7 @@ class BasicSongListWidget(ListWidget):
         songInfo: SongInfo
             song information
         """
-        item = QListWidgetItem(self)
-        songCard = SongCardFactory.create(self.songCardType, songInfo, self)
-        songCard.itemIndex = len(self.songCards)
-
-        # adjust song card width
-        margin = self.viewportMargins()
-        size = QSize(self.width()-margin.left()-margin.right(), 60)
-        QApplication.sendEvent(songCard, QResizeEvent(size, songCard.size()))
-        QApplication.processEvents()
-        songCard.resize(size)
-        item.setSizeHint(size)
-
-        self.addItem(item)
-        self.setItemWidget(item, songCard)
-        self.songCards.append(songCard)
-        self.item_list.append(item)
-
-        self._connectSongCardSignalToSlot(songCard)
+        self.appendSongCards([songInfo])
 
     def prependOneSongCard(self, songInfo: SongInfo):
         """ prepend a song card to list widget, this does not change `songInfos` property
@@ -106,26 +105,11 @@ class BasicSongListWidget(ListWidget):
         songInfo: SongInfo
             song information
         """
-        item = QListWidgetItem()
-        songCard = SongCardFactory.create(self.songCardType, songInfo, self)
-        songCard.itemIndex = 0
-
-        # adjust song card width
-        margin = self.viewportMargins()
-        size = QSize(self.width()-margin.left()-margin.right(), 60)
-        QApplication.sendEvent(songCard, QResizeEvent(size, songCard.size()))
-        QApplication.processEvents()
-        songCard.resize(size)
-        item.setSizeHint(size)
-
-        self.insertItem(0, item)
-        self.setItemWidget(item, songCard)
-        self.songCards.insert(0, songCard)
-        self.item_list.insert(0, item)
-        for card in self.songCards[1:]:
-            card.itemIndex += 1
-
-        self._connectSongCardSignalToSlot(songCard)
+        self.songListModel.insertSongInfos(0, [songInfo])
+        self.currentIndex = self.__shiftIndex(self.currentIndex)
+        self.playingIndex = self.__shiftIndex(self.playingIndex)
+        self.selectedIndex = self.__shiftIndex(self.selectedIndex)
+        self.__hideHoverCard()
 
     def appendSongCards(self, songInfos: List[SongInfo]):
         """ append song cards to list widget, this does not change `songInfos` property
@@ -135,66 +119,105 @@ class BasicSongListWidget(ListWidget):
         songInfos: List[SongInfo]
             song information list
         """
-        self.__removePaddingBottomItem()
-
-        for songInfo in songInfos:
-            self.appendOneSongCard(songInfo)
-
-        self.__createPaddingBottomItem()
+        self.songListModel.insertSongInfos(self.songCardNum, songInfos)
 
     def setCurrentIndex(self, index: int):
         """ set currently selected song card """
-        if not self.songCards:
+        if not self.songCardNum:
             return
 
         if self.isInSelectionMode:
-            songCard = self.songCards[index]
-            songCard.setChecked(not songCard.isChecked)
+            self.setSongCardChecked(
+                index, not self.songListModel.isChecked(index))
         elif index != self.currentIndex:
             self.cancelSelectedState()
-            self.songCards[index].setSelected(True)
+            self.__setSelected(index, True)
             self.currentIndexChanged.emit(index)
 
         self.currentIndex = index
 
     def removeSongCard(self, index: int, emit=True):
         """ remove a song card """
-        if not self.songCards:
+        if not self.songCardNum:
             return
 
-        songCard = self.songCards.pop(index)
+        self.__takeSongCards([index])
+
+        if emit:
+            self.songCardNumChanged.emit(self.songCardNum)
+
+    def removeSongCards(self, songPaths: List[str]):
+        """ remove multi song cards """
+        songPaths = set(songPaths)
+        indexes = [i for i, songInfo in enumerate(self.songListModel.songInfos)
+                   if songInfo.file in songPaths]
+        if not indexes:
+            return
 
-        if songCard in self.checkedSongCards:
-            self.checkedSongCards.remove(songCard)
+        self.__takeSongCards(indexes)
+        self.songCardNumChanged.emit(self.songCardNum)
 
-        songCard.deleteLater()
-        self.item_list.pop(index)
-        self.songInfos.pop(index)
-        self.takeItem(index)
+    def removeCheckedSongCards(self) -> List[SongInfo]:
+        """ uncheck and remove all checked song cards
 
-        # update item index
-        for i in range(index, len(self.songCards)):
-            self.songCards[i].itemIndex = i
+        Returns
+        -------
+        songInfos: List[SongInfo]
+            song information of removed song cards
+        """
+        indexes = self.songListModel.checkedRows()
+        if not indexes:
+            return []
+
+        songInfos = [self.songListModel.songInfo(i) for i in indexes]
+        self.uncheckAll()
+        self.__takeSongCards(indexes)
+        self.songCardNumChanged.emit(self.songCardNum)
+        return songInfos
+
+    def __takeSongCards(self, indexes: List[int]):
+        """ remove song cards and the corresponding song information """
+        indexes = sorted(set(indexes))
+        N0 = self.songListModel.checkedNum
+        self.__hideHoverCard()
+        self.songListModel.removeSongInfos(indexes)
+
+        # `songInfos` is parallel to song cards
+        for index in reversed(indexes):
+            if index < len(self.songInfos):
+                self.songInfos.pop(index)
+
+        self.currentIndex = self.__adjustIndex(self.currentIndex, indexes)
+        self.playingIndex = self.__adjustIndex(self.playingIndex, indexes)
+        self.selectedIndex = self.__adjustIndex(self.selectedIndex, indexes, True)
+
+        if N0 != self.songListModel.checkedNum:
+            self.__onCheckedNumChanged(N0, self.currentIndex or 0)
+
+    @staticmethod
+    def __adjustIndex(index: int, removed: List[int], dropRemoved=False):
+        """ adjust the index after removing song cards, the index before the
+        removed one is used if the song card of index is removed """
+        if index is None:
+            return None
 
-        if self.currentIndex is not None and self.currentIndex >= index:
-            self.currentIndex = self.currentIndex-1 if self.currentIndex > 0 else None
-        if self.playingIndex is not None and self.playingIndex >= index:
-            self.playingIndex = self.playingIndex-1 if self.playingIndex > 0 else None
+        if dropRemoved and index in removed:
+            return None
 
-        if emit:
-            self.songCardNumChanged.emit(len(self.songCards))
+        n = sum(1 for i in removed if i <= index)
+        if not n:
+            return index
 
-        self.update()
+        index -= n
+        return index if index >= 0 else None
 
-    def removeSongCards(self, songPaths: List[str]):
-        """ remove multi song cards """
-        for songCard in self.songCards.copy():
-            if songCard.songPath in songPaths:
-                self.removeSongCard(songCard.itemIndex)
+    @staticmethod
+    def __shiftIndex(index: int, n=1):
+        return index + n if index is not None else None
 
     def setPlay(self, index: int):
         """ set the playing song card """
-        if not self.songCards:
+        if not self.songCardNum:
             return
 
         self.cancelState()
@@ -202,7 +225,7 @@ class BasicSongListWidget(ListWidget):
         self.playingIndex = index
 
         if index >= 0:
-            self.songCards[index].setPlay(True)
+            self.__setSelected(index, True)
 
     def setPlayBySongInfo(self, songInfo: SongInfo):
         """ set the song card playback status. If the song is not in current song list,
@@ -216,17 +239,20 @@ class BasicSongListWidget(ListWidget):
 
     def cancelSelectedState(self):
         """ cancel the selected status """
-        if self.currentIndex is not None and 0 <= self.currentIndex < len(self.songCards):
-            self.songCards[self.currentIndex].setSelected(False)
+        if self.selectedIndex is not None and 0 <= self.selectedIndex < self.songCardNum:
+            self.__setSelected(self.selectedIndex, False)
 
         self.currentIndex = None
 
     def cancelPlayState(self):
         """ cancel the playback status """
-        if self.playingIndex is not None and 0 <= self.playingIndex < len(self.songCards):
-            self.songCards[self.playingIndex].setPlay(False)
-
+        index = self.playingIndex
         self.playingIndex = None
+        if index is not None and 0 <= index < self.songCardNum:
+            if self.selectedIndex == index:
+                self.selectedIndex = None
+
+            self.__refreshSongCard(index)
 
     def cancelState(self):
         """ cancel selected and playback status """
@@ -258,76 +284,115 @@ class BasicSongListWidget(ListWidget):
         for i, songInfo in enumerate(self.songInfos):
             if songInfo.file == old.file:
                 self.songInfos[i] = new
-                self.songCards[i].updateSongCard(new)
+                self.songListModel.setSongInfo(i, new)
+
+        self.__syncHoverCard()
 
     def updateOneSongCard(self, newSongInfo: SongInfo):
         """ update a song card """
-        for i, songInfo in enumerate(self.songInfos):
-            if songInfo.file == newSongInfo.file:
-                self.songInfos[i] = newSongInfo
-                self.songCards[i].updateSongCard(newSongInfo)
+        self.updateMultiSongCards([newSongInfo])
 
-    def updateMultiSongCards(self, songInfos: list):
+    def updateMultiSongCards(self, songInfos: List[SongInfo]):
         """ update multi song cards """
-        for songInfo in songInfos:
-            self.updateOneSongCard(songInfo)
+        songInfoMap = {i.file: i for i in songInfos}
+        for i, songInfo in enumerate(self.songInfos):
+            if songInfo.file in songInfoMap:
+                self.songInfos[i] = songInfoMap[songInfo.file]
+                self.songListModel.setSongInfo(i, self.songInfos[i])
+
+        self.__syncHoverCard()
 
     def resizeEvent(self, e):
         super().resizeEvent(e)
+        self.__hideHoverCard()
 
-        margins = self.viewportMargins()  # type:QMargins
-        size = QSize(self.width() - margins.left() - margins.right(), 60)
-        for item in self.item_list:
-            item.setSizeHint(size)
+    def updateGeometries(self):
+        super().updateGeometries()
 
+        # leave a blank at the bottom by extending the scroll range
         if self.paddingBottomHeight:
-            self.paddingBottomItem.setSizeHint(
-                QSize(size.width(), self.paddingBottomHeight))
+            scrollBar = self.verticalScrollBar()
+            scrollBar.setMaximum(scrollBar.maximum() + self.paddingBottomHeight)
+
+    def mouseMoveEvent(self, e):
+        super().mouseMoveEvent(e)
+        index = self.indexAt(e.pos())
+        if index.isValid():
+            self.__bindHoverCard(index.row())
+
+    def songCardState(self, index: int) -> tuple:
+        """ get the state of song card
+
+        Returns
+        -------
+        state: tuple
+            `(isPlaying, isSelected, isChecked, isInSelectionMode, isSongExist)`
+        """
+        isPlaying = index == self.playingIndex
+        isChecked = self.songListModel.isChecked(index)
+        isSelected = isChecked or index == self.selectedIndex
+        isSongExist = True
+        if isPlaying:
+            isSongExist = fileAvailability.isAvailable(
+                self.songListModel.songInfo(index).file)
+
+        return (isPlaying, isSelected, isChecked, self.isInSelectionMode, isSongExist)
+
+    def setSongCardChecked(self, index: int, isChecked: bool):
+        """ set the checked state of a song card """
+        if self.songListModel.isChecked(index) == isChecked:
+            return
+
+        self.onSongCardCheckedStateChanged(index, isChecked)
 
     def onSongCardCheckedStateChanged(self, itemIndex: int, isChecked: bool):
         """ song card checked state changed slot """
-        songCard = self.songCards[itemIndex]
-
-        N0 = len(self.checkedSongCards)
-
-        if songCard not in self.checkedSongCards and isChecked:
-            self.checkedSongCards.append(songCard)
-        elif songCard in self.checkedSongCards and not isChecked:
-            self.checkedSongCards.remove(songCard)
-        else:
+        if self.songListModel.isChecked(itemIndex) == isChecked:
             return
 
-        N1 = len(self.checkedSongCards)
+        N0 = self.songListModel.checkedNum
+        self.songListModel.setChecked(itemIndex, isChecked)
+        self.__setSelected(itemIndex, isChecked)
+        self.__onCheckedNumChanged(N0, itemIndex)
+
+    def __onCheckedNumChanged(self, N0: int, itemIndex: int):
+        """ open or close selection mode after the checked song cards changed """
+        N1 = self.songListModel.checkedNum
 
         if N0 == 0 and N1 > 0:
             self.setCurrentIndex(itemIndex)
-            self.__setAllSongCardSelectionModeOpen(True)
-            self.isInSelectionMode = True
+            self.__setSelectionModeOpen(True)
         elif N1 == 0:
-            self.__setAllSongCardSelectionModeOpen(False)
-            self.isInSelectionMode = False
+            self.__setSelectionModeOpen(False)
 
-        isAllChecked = N1 == len(self.songCards)
+        self.__syncHoverCard()
+        isAllChecked = N1 == self.songCardNum
         self.checkedNumChanged.emit(N1, isAllChecked)
 
-    def __setAllSongCardSelectionModeOpen(self, isOpen: bool):
+    def __setSelectionModeOpen(self, isOpen: bool):
         """ set whether all song cards enter selection mode """
-        cursor = Qt.ArrowCursor if isOpen else Qt.PointingHandCursor
+        if self.isInSelectionMode == isOpen:
+            return
 
-        for songCard in self.songCards:
-            songCard.setSelectionModeOpen(isOpen)
-            songCard.setClickableLabelCursor(cursor)
+        self.isInSelectionMode = isOpen
+        self.songListModel.refresh()
 
     def setAllChecked(self, isChecked: bool):
         """ set the checked state of all song cards """
-        for songCard in self.songCards:
-            songCard.setChecked(isChecked)
+        N0 = self.songListModel.checkedNum
+        if N0 == (self.songCardNum if isChecked else 0):
+            return
+
+        rows = self.songListModel.checkedRows()
+        self.songListModel.setAllChecked(isChecked)
+        if not isChecked and self.selectedIndex in rows:
+            self.selectedIndex = None
+
+        self.__onCheckedNumChanged(N0, 0)
 
     def uncheckAll(self):
         """ uncheck all song cards """
-        for songCard in self.checkedSongCards.copy():
-            songCard.setChecked(False)
-
+        self.setAllChecked(False)
         self.checkedNumChanged.emit(0, False)
 
     def updateAllSongCards(self, songInfos: List[SongInfo]):
@@ -338,54 +403,31 @@ class BasicSongListWidget(ListWidget):
         songInfos: List[SongInfo]
             song information list
         """
-        self.__removePaddingBottomItem()
-
         playingSongInfo = self.playingSongInfo
+        oldSongNum = self.songCardNum
 
-        newSongNum = len(songInfos)
-        oldSongNum = len(self.songCards)
-        if newSongNum > oldSongNum:
-            # create new song cards
-            for songInfo in songInfos[oldSongNum:]:
-                self.appendOneSongCard(songInfo)
-                QApplication.processEvents()
-
-        elif newSongNum < oldSongNum:
-            # delete song cards
-            for i in range(oldSongNum - 1, newSongNum - 1, -1):
-                self.item_list.pop()
-                songCard = self.songCards.pop()
-                songCard.deleteLater()
-                self.takeItem(i)
-                QApplication.processEvents()
+        if self.songListModel.checkedNum:
+            self.uncheckAll()
 
         if not (bool(self.songInfos) and bool(songInfos)):
             self.emptyChangedSig.emit(not bool(songInfos))
 
-        # update part of song cards
+        self.clearSongCards()
         self.songInfos = songInfos
-        n = min(oldSongNum, newSongNum)
-        for songInfo, songCard in zip(songInfos[:n], self.songCards[:n]):
-            songCard.updateSongCard(songInfo)
-            QApplication.processEvents()
-
+        self.songListModel.setSongInfos(songInfos)
         self.setPlayBySongInfo(playingSongInfo)
-        self.__createPaddingBottomItem()
 
-        if oldSongNum != newSongNum:
+        if oldSongNum != len(songInfos):
             self.songCardNumChanged.emit(len(self.songInfos))
 
     def clearSongCards(self):
         """ clear song cards """
-        self.item_list.clear()
-        self.clear()
-
-        for songCard in self.songCards:
-            songCard.deleteLater()
-
-        self.songCards.clear()
+        self.__hideHoverCard()
+        self.songListModel.setSongInfos([])
+        self.delegate.clearCache()
         self.currentIndex = None
         self.playingIndex = None
+        self.selectedIndex = None
 
     def sortSongInfo(self, key: str, reverse=True):
         """ sort song information list
@@ -412,33 +454,74 @@ class BasicSongListWidget(ListWidget):
 
         return songInfo
 
-    def __createPaddingBottomItem(self):
-        """ create padding item in bottom """
-        if not self.paddingBottomHeight:
+    def __setSelected(self, index: int, isSelected: bool):
+        """ set the selected state of song card """
+        if isSelected:
+            old = self.selectedIndex
+            self.selectedIndex = index
+            if old is not None and old != index and old < self.songCardNum:
+                self.__refreshSongCard(old)
+        elif self.selectedIndex == index:
+            self.selectedIndex = None
+
+        self.__refreshSongCard(index)
+
+    def __refreshSongCard(self, index: int):
+        """ repaint a song card and the hover card on it """
+        self.songListModel.refresh(index)
+        if self.hoverCard and self.hoverCard.itemIndex == index:
+            self.__syncHoverCard()
+
+    def __bindHoverCard(self, index: int):
+        """ move the hover card to the row and restore the state of row """
+        if self.hoverCard and self.hoverCard.itemIndex == index and self.hoverCard.isVisible():
             return
 
-        self.paddingBottomItem = QListWidgetItem(self)
+        songInfo = self.songListModel.songInfo(index)
+        if self.hoverCard is None:
+            self.hoverCard = SongCardFactory.create(
+                self.songCardType, songInfo, self.viewport())
+            self._connectSongCardSignalToSlot(self.hoverCard)
+
+        card = self.hoverCard
+        card.itemIndex = index
+        card.updateSongCard(songInfo)
+        card.setGeometry(self.visualRect(self.songListModel.index(index)))
+        card.restoreState(*self.songCardState(index))
+        card.show()
+        card.raise_()
+
+        # the card may appear under mouse without receiving an enter event
+        if card.rect().contains(card.mapFromGlobal(QCursor.pos())):
+            QApplication.sendEvent(card, QEvent(QEvent.Enter))
+
+    def __syncHoverCard(self):
+        """ synchronize the hover card with the row under it """
+        card = self.hoverCard
+        if not card or not card.isVisible():
+            return
+
+        if card.itemIndex is None or card.itemIndex >= self.songCardNum:
+            self.__hideHoverCard()
+            return
 
-        # create padding widget
-        self.paddingBottomWidget = QWidget(self)
-        self.paddingBottomWidget.setStyleSheet("background:white")
-        self.paddingBottomWidget.setFixedHeight(self.paddingBottomHeight)
+        card.hide()
+        self.__bindHoverCard(card.itemIndex)
 
-        margins = self.viewportMargins()  # type:QMargins
-        width = self.width() - margins.left() - margins.right()
-        self.paddingBottomWidget.resize(width, self.paddingBottomHeight)
-        self.paddingBottomItem.setSizeHint(
-            QSize(width, self.paddingBottomHeight))
-        self.setItemWidget(self.paddingBottomItem, self.paddingBottomWidget)
-        self.addItem(self.paddingBottomItem)
+    def __hideHoverCard(self):
+        """ hide the hover card, it will be shown again when mouse moves """
+        if self.hoverCard:
+            self.hoverCard.hide()
+            self.hoverCard.itemIndex = None
 
-    def __removePaddingBottomItem(self):
-        """ remove the padding item in bottom """
-        if not self.paddingBottomHeight:
+    def __onFileAvailabilityChanged(self, availabilities: Dict[str, bool]):
+        """ file availability changed slot, the missing state of playing song card is updated """
+        index = self.playingIndex
+        if index is None or not 0 <= index < self.songCardNum:
             return
 
-        self.removeItemWidget(self.paddingBottomItem)
-        self.takeItem(len(self.songCards))
+        if self.songListModel.songInfo(index).file in availabilities:
+            self.__refreshSongCard(index)
 
     @property
     def songCardType(self) -> SongCardType:
@@ -450,7 +533,11 @@ class BasicSongListWidget(ListWidget):
 
     @property
     def songCardNum(self) -> int:
-        return len(self.songCards)
+        return self.songListModel.rowCount()
+
+    def currentRow(self) -> int:
+        """ get the row of current item """
+        return super().currentIndex().row()
 
     def index(self, songInfo: SongInfo):
         """ get the index of song information, return `None` if it's not in the list """
@@ -460,12 +547,14 @@ class BasicSongListWidget(ListWidget):
         return None
 
     @property
-    def currentSongCard(self) -> BasicSongCard:
-        return self.songCards[self.currentRow()]
+    def currentSongInfo(self) -> SongInfo:
+        return self.songListModel.songInfo(self.currentRow())
 
     @property
-    def currentSongInfo(self) -> SongInfo:
-        return self.currentSongCard.songInfo
+    def checkedSongInfos(self) -> List[SongInfo]:
+        """ song information of checked song cards """
+        model = self.songListModel
+        return [model.songInfo(i) for i in model.checkedRows()]
 
     @property
     def playingSongInfo(self):
@@ -476,4 +565,4 @@ class BasicSongListWidget(ListWidget):
 
     def _playSongs(self, index: int):
         """ Use the song list as current playlist of media player """
-        signalBus.playPlaylistSig.emit(self.songInfos, index)
\ No newline at end of file
+        signalBus.playPlaylistSig.emit(self.songInfos, index)
@@ -1,7 +1,4 @@
 # coding:utf-8
-from typing import List
-
-from common.database.entity import SongInfo
 from PyQt5.QtCore import QMargins, Qt
 
 from .basic_song_list_widget import BasicSongListWidget
@@ -37,34 +34,15 @@ class NoScrollSongListWidget(BasicSongListWidget):
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
 
+        model = self.songListModel
+        model.rowsInserted.connect(self.__adjustHeight)
+        model.rowsRemoved.connect(self.__adjustHeight)
+        model.modelReset.connect(self.__adjustHeight)
+
     def wheelEvent(self, e):
         return
 
-    def appendOneSongCard(self, songInfo: SongInfo):
-        super().appendOneSongCard(songInfo)
-        self.__adjustHeight()
-
-    def prependOneSongCard(self, songInfo: SongInfo):
-        super().prependOneSongCard(songInfo)
-        self.__adjustHeight()
-
-    def appendSongCards(self, songInfos: List[SongInfo]):
-        super().appendSongCards(songInfos)
-        self.__adjustHeight()
-
-    def updateAllSongCards(self, songInfos: List[SongInfo]):
-        super().updateAllSongCards(songInfos)
-        self.__adjustHeight()
-
-    def removeSongCard(self, index, emit=True):
-        super().removeSongCard(index, emit)
-        self.__adjustHeight()
-
-    def clearSongCards(self):
-        super().clearSongCards()
-        self.__adjustHeight()
-
     def __adjustHeight(self):
         """ adjust height """
-        self.resize(self.width(), 60*len(self.songCards) +
+        self.resize(self.width(), 60*self.songCardNum +
                     self.__paddingBottomHeight)
@@ -1,5 +1,4 @@
 # coding:utf-8
-import os
 from common.database.entity import SongInfo
 from common.signal_bus import signalBus
 from components.widgets.label import ClickableLabel
@@ -194,12 +193,6 @@ class PlaylistInterfaceSongCard(DurationSongCard):
         self.genreLabel.setText(self.genre)
         self._adjustWidgetWidth()
 
-    def _validateSongPath(self):
-        if self.songPath.startswith("http"):
-            self.isSongExist = True
-        else:
-            self.isSongExist = os.path.exists(self.songPath)
-
 
 class NoCheckBoxSongCard(DurationSongCard):
     """ Song card without check box """
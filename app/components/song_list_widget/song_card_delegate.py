@@ -0,0 +1,104 @@
+# coding:utf-8
+from collections import OrderedDict
+
+from common.database.entity import SongInfo
+from PyQt5.QtCore import QModelIndex, QPoint, QSize, Qt
+from PyQt5.QtGui import QPainter, QPixmap, QRegion
+from PyQt5.QtWidgets import (QStyle, QStyledItemDelegate, QStyleOptionViewItem,
+                             QWidget)
+
+from .song_card import BasicSongCard, SongCardFactory
+from .song_card_type import SongCardType
+
+
+class SongCardDelegate(QStyledItemDelegate):
+    """ Song card delegate
+
+    The rows are painted with a template song card which is never displayed,
+    so the song list only creates widgets for the card under mouse instead of
+    one song card per song. The rendered rows are cached until the song
+    information, state or width of row changes.
+    """
+
+    def __init__(self, songCardType: SongCardType, parent, cacheSize=128):
+        """
+        Parameters
+        ----------
+        songCardType: SongCardType
+            song card type
+
+        parent: BasicSongListWidget
+            song list widget, it provides the state of each row
+
+        cacheSize: int
+            the maximum number of cached rows
+        """
+        super().__init__(parent)
+        self.view = parent
+        self.songCardType = songCardType
+        self.cacheSize = cacheSize
+        self.templateCard = None    # type:BasicSongCard
+        self.pixmaps = OrderedDict()
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex):
+        return QSize(self.view.viewport().width(), 60)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        # draw the alternating background without the selection of view
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.state &= ~(QStyle.State_Selected |
+                       QStyle.State_MouseOver | QStyle.State_HasFocus)
+        style = self.view.style()
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, self.view)
+
+        songInfo = index.data(Qt.UserRole)
+        state = self.view.songCardState(index.row())
+        pixmap = self.__getPixmap(songInfo, state, option.rect.size())
+        painter.drawPixmap(option.rect.topLeft(), pixmap)
+
+    def clearCache(self):
+        """ clear the cached rows """
+        self.pixmaps.clear()
+
+    def __getPixmap(self, songInfo: SongInfo, state: tuple, size: QSize) -> QPixmap:
+        """ get the rendered row from cache or render it """
+        ratio = self.view.devicePixelRatioF()
+        key = (songInfo.file, songInfo.title, songInfo.singer, songInfo.album,
+               songInfo.year, songInfo.genre, songInfo.duration, songInfo.track,
+               state, size.width(), ratio)
+
+        pixmap = self.pixmaps.get(key)
+        if pixmap is not None:
+            self.pixmaps.move_to_end(key)
+            return pixmap
+
+        card = self.__getTemplateCard(songInfo)
+        card.updateSongCard(songInfo)
+        if card.width() != size.width():
+            card.resize(size.width(), 60)
+
+        card.restoreState(*state)
+
+        pixmap = QPixmap(size * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        card.render(pixmap, QPoint(), QRegion(), QWidget.DrawChildren)
+
+        self.pixmaps[key] = pixmap
+        if len(self.pixmaps) > self.cacheSize:
+            self.pixmaps.popitem(False)
+
+        return pixmap
+
+    def __getTemplateCard(self, songInfo: SongInfo) -> BasicSongCard:
+        """ create the template card lazily, it is visible but out of view so that
+        the show and hide events of its children work as usual """
+        if self.templateCard is None:
+            self.templateCard = SongCardFactory.create(
+                self.songCardType, songInfo, self.view)
+            self.templateCard.setAttribute(Qt.WA_TransparentForMouseEvents)
+            self.templateCard.move(0, -1000)
+            self.templateCard.show()
+
+        return self.templateCard
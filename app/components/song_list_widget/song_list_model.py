@@ -0,0 +1,112 @@
+# coding:utf-8
+from typing import List
+
+from common.database.entity import SongInfo
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+class SongListModel(QAbstractListModel):
+    """ Song list model, each row corresponds to a song card """
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self.songInfos = []         # type:List[SongInfo]
+        self.checkedStates = []     # type:List[bool]
+        self.checkedNum = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.songInfos)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.UserRole:
+            return None
+
+        return self.songInfos[index.row()]
+
+    def songInfo(self, row: int) -> SongInfo:
+        """ get the song information of row """
+        return self.songInfos[row]
+
+    def setSongInfos(self, songInfos: List[SongInfo]):
+        """ replace all rows, the checked states are reset """
+        self.beginResetModel()
+        self.songInfos = list(songInfos)
+        self.checkedStates = [False] * len(self.songInfos)
+        self.checkedNum = 0
+        self.endResetModel()
+
+    def insertSongInfos(self, row: int, songInfos: List[SongInfo]):
+        """ insert rows before `row` """
+        if not songInfos:
+            return
+
+        self.beginInsertRows(QModelIndex(), row, row + len(songInfos) - 1)
+        self.songInfos[row:row] = songInfos
+        self.checkedStates[row:row] = [False] * len(songInfos)
+        self.endInsertRows()
+
+    def removeSongInfos(self, rows: List[int]) -> List[SongInfo]:
+        """ remove rows, consecutive rows are removed at once
+
+        Returns
+        -------
+        songInfos: List[SongInfo]
+            removed song information in ascending order of row
+        """
+        rows = sorted(set(rows))
+        removed = [self.songInfos[i] for i in rows]
+
+        # remove from the end so that the remaining rows are still valid
+        end = len(rows)
+        while end > 0:
+            start = end - 1
+            while start > 0 and rows[start - 1] == rows[start] - 1:
+                start -= 1
+
+            first, last = rows[start], rows[end - 1]
+            self.beginRemoveRows(QModelIndex(), first, last)
+            self.checkedNum -= sum(self.checkedStates[first:last + 1])
+            del self.songInfos[first:last + 1]
+            del self.checkedStates[first:last + 1]
+            self.endRemoveRows()
+            end = start
+
+        return removed
+
+    def setSongInfo(self, row: int, songInfo: SongInfo):
+        """ replace the song information of row """
+        self.songInfos[row] = songInfo
+        self.refresh(row)
+
+    def isChecked(self, row: int) -> bool:
+        return self.checkedStates[row]
+
+    def setChecked(self, row: int, isChecked: bool):
+        """ set the checked state of row """
+        if self.checkedStates[row] == isChecked:
+            return
+
+        self.checkedStates[row] = isChecked
+        self.checkedNum += 1 if isChecked else -1
+        self.refresh(row)
+
+    def setAllChecked(self, isChecked: bool):
+        """ set the checked state of all rows """
+        self.checkedStates = [isChecked] * len(self.songInfos)
+        self.checkedNum = len(self.songInfos) if isChecked else 0
+        self.refresh()
+
+    def checkedRows(self) -> List[int]:
+        """ get the checked rows in ascending order """
+        return [i for i, isChecked in enumerate(self.checkedStates) if isChecked]
+
+    def refresh(self, row: int = None):
+        """ notify the view to repaint a row, or all rows if `row` is `None` """
+        if not self.songInfos:
+            return
+
+        if row is None:
+            self.dataChanged.emit(
+                self.index(0), self.index(len(self.songInfos) - 1))
+        else:
+            self.dataChanged.emit(self.index(row), self.index(row))
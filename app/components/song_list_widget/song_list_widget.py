@@ -83,7 +83,7 @@ class SongListWidget(NoScrollSongListWidget):
 
     def __onPlayButtonClicked(self, index: int):
         """ play button clicked slot """
-        self.playSignal.emit(self.songCards[index].songInfo)
+        self.playSignal.emit(self.songListModel.songInfo(index))
 
     def contextMenuEvent(self, e: QContextMenuEvent):
         """ show context menu """
@@ -98,7 +98,7 @@ class SongListWidget(NoScrollSongListWidget):
         if self.isInSelectionMode:
             return
 
-        self.playSignal.emit(self.songCards[index].songInfo)
+        self.playSignal.emit(self.songListModel.songInfo(index))
 
     def __setQss(self):
         """ set style sheet """
@@ -157,14 +157,14 @@ class SongListWidget(NoScrollSongListWidget):
             lambda: signalBus.getSongDetailsUrlSig.emit(self.currentSongInfo, QueryServerType.WANYI))
         menu.showAlbumAct.triggered.connect(
             lambda: signalBus.switchToAlbumInterfaceSig.emit(
-                self.currentSongCard.singer,
-                self.currentSongCard.album,
+                self.currentSongInfo.singer,
+                self.currentSongInfo.album,
             )
         )
         menu.addToMenu.playingAct.triggered.connect(
             lambda: signalBus.addSongsToPlayingPlaylistSig.emit([self.currentSongInfo]))
         menu.selectAct.triggered.connect(
-            lambda: self.currentSongCard.setChecked(True))
+            lambda: self.setSongCardChecked(self.currentRow(), True))
         menu.addToMenu.addSongsToPlaylistSig.connect(
             lambda name: signalBus.addSongsToCustomPlaylistSig.emit(name, [self.currentSongInfo]))
         menu.addToMenu.newPlaylistAct.triggered.connect(
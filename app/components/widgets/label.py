@@ -3,8 +3,9 @@ from typing import Union
 
 from common.picture import Cover
 from common.thread.blur_cover_thread import BlurCoverThread
+from common.thumbnail import thumbnailCache
 from PyQt5.QtCore import QPropertyAnimation, Qt, pyqtProperty, pyqtSignal
-from PyQt5.QtGui import QBrush, QColor, QImage, QImageReader, QMouseEvent, QPainter, QPixmap
+from PyQt5.QtGui import QBrush, QColor, QImage, QMouseEvent, QPainter, QPixmap
 from PyQt5.QtWidgets import QLabel, QWidget
 from PyQt5.QtSvg import QSvgWidget
 
@@ -34,23 +35,51 @@ class AvatarLabel(QLabel):
 
     def __init__(self, imagePath: str, parent=None):
         super().__init__(parent)
-        self.__pixmap = QPixmap(imagePath)
+        self.imagePath = imagePath
+        self.__pixmap = QPixmap()
+        self.__scaledPixmap = QPixmap()
+        self.__scaledWidth = 0
         self.setScaledContents(True)
         self.setAttribute(Qt.WA_TranslucentBackground)
+        thumbnailCache.thumbnailReady.connect(self.__onThumbnailReady)
 
     def setPixmap(self, pixmap: QPixmap) -> None:
         self.__pixmap = pixmap
+        self.__scaledPixmap = QPixmap()
         self.update()
 
+    def setImagePath(self, imagePath: str):
+        """ set the avatar path, the thumbnail of avatar is used if no pixmap is set """
+        self.imagePath = imagePath
+        self.setPixmap(QPixmap())
+
+    def __onThumbnailReady(self, path: str, size: int):
+        if path == self.imagePath and self.__pixmap.isNull():
+            self.__scaledPixmap = QPixmap()
+            self.update()
+
     def paintEvent(self, e):
         """ paint avatar """
+        w = self.width()
+
+        # only scale the pixmap again when the size changes
+        if self.__scaledPixmap.isNull() or self.__scaledWidth != w:
+            pixmap = self.__pixmap
+            if pixmap.isNull():
+                pixmap = thumbnailCache.thumbnail(self.imagePath, w)
+
+            if pixmap.isNull():
+                return
+
+            self.__scaledWidth = w
+            self.__scaledPixmap = pixmap.scaled(
+                w, w, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+
         painter = QPainter(self)
         painter.setRenderHints(QPainter.Antialiasing |
                                QPainter.SmoothPixmapTransform)
-        w = self.width()
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(self.__pixmap.scaled(
-            w, w, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)))
+        painter.setBrush(QBrush(self.__scaledPixmap))
         painter.drawRoundedRect(self.rect(), w//2, w//2)
 
 
@@ -354,24 +383,26 @@ class AlbumCover(QWidget):
         super().__init__(parent=parent)
         self.setFixedSize(*size)
         self.setCover(imagePath)
+        thumbnailCache.thumbnailReady.connect(self.__onThumbnailReady)
 
     def setCover(self, imagePath: str):
         """ update album cover """
         self.imagePath = imagePath
-        # lazy load
-        self.__image = QImage()
         self.update()
 
+    def __onThumbnailReady(self, path: str, size: int):
+        if path == self.imagePath:
+            self.update()
+
     def paintEvent(self, e):
-        if self.__image.isNull():
-            reader = QImageReader(self.imagePath)
-            reader.setScaledSize(self.size())
-            reader.setAutoTransform(True)
-            self.__image = reader.read()
+        # the thumbnail is loaded in background if it's not cached
+        pixmap = thumbnailCache.thumbnail(self.imagePath, self.width())
+        if pixmap.isNull():
+            return
 
         painter = QPainter(self)
         painter.setRenderHints(QPainter.Antialiasing |
                                QPainter.SmoothPixmapTransform)
         painter.setPen(Qt.NoPen)
-        painter.drawImage(self.rect(), self.__image)
+        painter.drawPixmap(self.rect(), pixmap)
 
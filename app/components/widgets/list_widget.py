@@ -2,11 +2,11 @@
 from common.smooth_scroll import SmoothScroll, SmoothMode
 from PyQt5.QtCore import Qt, QPoint
 from PyQt5.QtGui import QWheelEvent, QCursor
-from PyQt5.QtWidgets import QApplication, QListWidget
+from PyQt5.QtWidgets import QApplication, QListView, QListWidget
 
 
-class ListWidget(QListWidget):
-    """ A list widget which can scroll smoothly """
+class SmoothScrollMixin:
+    """ Mixin of list view which can scroll smoothly, it should precede the Qt base class """
 
     def __init__(self, parent=None, trigger=False):
         super().__init__(parent)
@@ -29,3 +29,11 @@ class ListWidget(QListWidget):
 
     def wheelEvent(self, e: QWheelEvent):
         self.smoothScroll.wheelEvent(e)
+
+
+class ListWidget(SmoothScrollMixin, QListWidget):
+    """ A list widget which can scroll smoothly """
+
+
+class ListView(SmoothScrollMixin, QListView):
+    """ A list view which can scroll smoothly """
@@ -2,7 +2,7 @@
 from common.get_pressed_pos import getPressedPos, Position
 from common.image_utils import PixmapPerspectiveTransform
 from PyQt5.QtCore import QPoint, Qt
-from PyQt5.QtGui import QPainter, QPixmap, QScreen, QCursor
+from PyQt5.QtGui import QPainter, QScreen, QCursor
 from PyQt5.QtWidgets import QApplication, QWidget
 
 
@@ -14,8 +14,7 @@ class PerspectiveWidget(QWidget):
         self.__visibleChildren = []
         self.__isTransScreenshot = isTransScreenshot
         self.__perspectiveTrans = PixmapPerspectiveTransform()
-        self.__screenshotPix = None
-        self.__pressedPix = None
+        self.__screenshotTrans = PixmapPerspectiveTransform()
         self.__pressedPos = None
         self.__isPressed = False
 
@@ -30,19 +29,16 @@ class PerspectiveWidget(QWidget):
 
         self.__isPressed = True
 
-        # grab screen
+        # grab screen, the perspective transform is applied when painting
         self.grabMouse()
-        pixmap = self.grab()
-        self.__perspectiveTrans.setPixmap(pixmap)
+        self.__perspectiveTrans.setPixmap(self.grab())
+
+        if self.__isTransScreenshot:
+            self.__grabScreenShot()
 
         # get destination corner coordinates after transform
         self.__setDstPointsByPressedPos(getPressedPos(self, e))
 
-        self.__pressedPix = self.__getTransformPixmap()
-
-        if self.__isTransScreenshot:
-            self.__adjustTransformPix()
-
         # 隐藏本来看得见的小部件
         self.__visibleChildren = [
             i for i in self.children() if hasattr(i, "isVisible") and i.isVisible()]
@@ -79,15 +75,27 @@ class PerspectiveWidget(QWidget):
         )
         painter.setPen(Qt.NoPen)
 
-        # paint perspective transformed image
+        # paint perspective transformed image, the transformed screenshot
+        # fills the transparent edges to eliminate black edges
         if self.__pressedPos:
-            painter.drawPixmap(self.rect(), self.__pressedPix)
+            if self.__isTransScreenshot:
+                self.__screenshotTrans.draw(painter)
+
+            self.__perspectiveTrans.draw(painter)
 
     def __setDstPointsByPressedPos(self, pressedPos: str):
         """ get destination corner coordinates after transform """
         self.__pressedPos = pressedPos
-        w = self.__perspectiveTrans.width
-        h = self.__perspectiveTrans.height
+        self.__perspectiveTrans.setDstPoints(*self.__getDstPoints(
+            pressedPos, self.__perspectiveTrans.width, self.__perspectiveTrans.height))
+
+        if self.__isTransScreenshot and self.__screenshotTrans.pixmap:
+            self.__screenshotTrans.setDstPoints(*self.__getDstPoints(
+                pressedPos, self.__screenshotTrans.width, self.__screenshotTrans.height))
+
+    @staticmethod
+    def __getDstPoints(pressedPos: str, w: int, h: int):
+        """ get destination corner coordinates of image """
         dstPointMap = {
             Position.LEFT: [[5, 4], [w - 2, 1], [3, h - 3], [w - 2, h - 1]],
             Position.TOP_LEFT: [[7, 6], [w - 1, 1], [1, h - 2], [w - 2, h - 1]],
@@ -99,35 +107,16 @@ class PerspectiveWidget(QWidget):
             Position.TOP_RIGHT: [[0, 1], [w - 7, 5], [2, h - 1], [w - 2, h - 2]],
             Position.RIGHT: [[1, 1], [w - 6, 4], [2, h - 1], [w - 4, h - 3]]
         }
-        self.__perspectiveTrans.setDstPoints(*dstPointMap[pressedPos])
-
-    def __getTransformPixmap(self) -> QPixmap:
-        """ get the image of window after transformed """
-        pix = self.__perspectiveTrans.getPerspectiveTransform(
-            self.__perspectiveTrans.width, self.__perspectiveTrans.height
-        ).scaled(self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        return pix
+        return dstPointMap[pressedPos]
 
-    def __getScreenShot(self) -> QPixmap:
-        """ get screen shot """
+    def __grabScreenShot(self):
+        """ grab screen shot """
         screen = QApplication.screenAt(QCursor.pos())  # type:QScreen
+        if not screen:
+            self.__screenshotTrans.pixmap = None
+            return
+
         pos = self.mapToGlobal(QPoint(0, 0))  # type:QPoint
         pix = screen.grabWindow(0, pos.x(), pos.y(),
                                 self.width(), self.height())
-        return pix
-
-    def __adjustTransformPix(self):
-        """ adjust transform pixmap to elimate black edge """
-        self.__screenshotPix = self.__getScreenShot()
-        self.__perspectiveTrans.setPixmap(self.__screenshotPix)
-        self.__screenshotPressedPix = self.__getTransformPixmap()
-
-        img_1 = self.__perspectiveTrans.transQPixmapToNdarray(
-            self.__pressedPix)
-        img_2 = self.__perspectiveTrans.transQPixmapToNdarray(
-            self.__screenshotPressedPix)
-
-        mask = img_1[:, :, -1] == 0
-        img_2[mask] = img_1[mask]
-        self.__pressedPix = self.__perspectiveTrans.transNdarrayToQPixmap(
-            img_2)
+        self.__screenshotTrans.setPixmap(pix)
@@ -0,0 +1,307 @@
+# coding:utf-8
+from bisect import bisect_right
+from typing import Dict, List, Tuple
+
+from PyQt5.QtCore import QEvent, QMargins, QPoint, QRect, QSize, pyqtSignal
+from PyQt5.QtWidgets import QWidget
+
+from .label import ClickableLabel
+
+
+class VirtualGridView(QWidget):
+    """ Grid view which only creates card widgets for the visible cells
+
+    The items are split into groups with an optional title. When the view is
+    scrolled, the cards and title labels out of the visible area are recycled
+    and bound to the items scrolled in, so the number of widgets depends on
+    the size of viewport instead of the number of items.
+    """
+
+    titleClicked = pyqtSignal(str)
+
+    def __init__(self, cardSize: QSize, spacings=(10, 20), margins=QMargins(0, 0, 0, 0),
+                 groupSpacing=30, titleHeight=45, parent=None):
+        """
+        Parameters
+        ----------
+        cardSize: QSize
+            size of card
+
+        spacings: tuple
+            horizontal and vertical spacing between cards
+
+        margins: QMargins
+            margins of grid
+
+        groupSpacing: int
+            vertical spacing between groups
+
+        titleHeight: int
+            height of group title
+
+        parent:
+            parent window
+        """
+        super().__init__(parent=parent)
+        self.cardSize = cardSize
+        self.horizontalSpacing, self.verticalSpacing = spacings
+        self.margins = margins
+        self.groupSpacing = groupSpacing
+        self.titleHeight = titleHeight
+
+        self.items = []
+        self.groups = []        # type:List[Tuple[str, int, int]]
+        self.groupStarts = []   # type:List[int]
+        self.groupYs = []       # type:List[int]
+        self.columnNum = 1
+
+        self.visibleCards = {}  # type:Dict[int, QWidget]
+        self.freeCards = []     # type:List[QWidget]
+        self.visibleTitles = {}  # type:Dict[int, ClickableLabel]
+        self.freeTitles = []    # type:List[ClickableLabel]
+        self.watchedAncestors = []  # type:List[QWidget]
+
+        self.__watchAncestors()
+
+    def setGroups(self, groups: List[Tuple[str, list]]):
+        """ set the items of view
+
+        Parameters
+        ----------
+        groups: List[Tuple[str, list]]
+            title and items of each group, the title of group is hidden if it's empty
+        """
+        self.items = []
+        self.groups = []
+        for title, items in groups:
+            self.groups.append((title, len(self.items), len(items)))
+            self.items.extend(items)
+
+        self.groupStarts = [i[1] for i in self.groups]
+        self.__recycle(self.visibleCards.keys(), self.visibleTitles.keys())
+        self.__doLayout()
+        self.updateVisibleCards()
+
+    def cards(self) -> List[QWidget]:
+        """ get all the cards created by view """
+        return list(self.visibleCards.values()) + self.freeCards
+
+    def cardAt(self, index: int) -> QWidget:
+        """ get the card bound to the item at index, `None` if it's invisible """
+        return self.visibleCards.get(index)
+
+    def refresh(self):
+        """ bind the visible cards to items again """
+        for index, card in self.visibleCards.items():
+            self._bindCard(card, index)
+
+    def groupY(self, title: str) -> int:
+        """ get the vertical position of group specified by title """
+        for (t, _, _), y in zip(self.groups, self.groupYs):
+            if t == title:
+                return y
+
+        return -1
+
+    def heightForWidth(self, width: int) -> int:
+        m = self.margins
+        if not self.groups:
+            return m.top() + m.bottom()
+
+        columnNum = self.__columnNum(width)
+        h = sum(self.__groupHeight(i, columnNum) for i in range(len(self.groups)))
+        h += self.groupSpacing * (len(self.groups) - 1)
+        return h + m.top() + m.bottom()
+
+    def sizeHint(self):
+        return QSize(self.width(), self.heightForWidth(self.width()))
+
+    def adjustHeight(self):
+        """ adjust view height """
+        self.resize(self.width(), self.heightForWidth(self.width()))
+        self.updateGeometry()
+
+    def _createCard(self, index: int) -> QWidget:
+        """ create a card for the item at index """
+        raise NotImplementedError
+
+    def _bindCard(self, card: QWidget, index: int):
+        """ bind card to the item at index """
+        raise NotImplementedError
+
+    def _createTitleLabel(self) -> ClickableLabel:
+        """ create a group title label """
+        label = ClickableLabel(parent=self)
+        label.clicked.connect(lambda: self.titleClicked.emit(label.text()))
+        label.setStyleSheet(
+            "font: 22px 'Segoe UI Semilight', 'Microsoft YaHei Light'; font-weight: bold; color: rgb(0, 153, 188)")
+        return label
+
+    def updateVisibleCards(self):
+        """ recycle the cards out of visible area and bind cards to the visible items """
+        if not self.groups:
+            return
+
+        # expand the visible area by one row to reduce the rebinding when scrolling
+        rect = self.__visibleRect()
+        dy = self.cardSize.height() + self.verticalSpacing
+        top, bottom = rect.top() - dy, rect.bottom() + dy
+
+        indexes, titles = [], []
+        if rect.isValid():
+            indexes, titles = self.__visibleIndexes(top, bottom)
+
+        indexSet, titleSet = set(indexes), set(titles)
+        self.__recycle(
+            [i for i in self.visibleCards if i not in indexSet],
+            [i for i in self.visibleTitles if i not in titleSet]
+        )
+
+        for i in titles:
+            if i in self.visibleTitles:
+                continue
+
+            label = self.freeTitles.pop() if self.freeTitles else self._createTitleLabel()
+            label.setText(self.groups[i][0])
+            label.adjustSize()
+            label.move(self.margins.left() + 8, self.groupYs[i] + 6)
+            label.show()
+            self.visibleTitles[i] = label
+
+        for i in indexes:
+            if i in self.visibleCards:
+                continue
+
+            if self.freeCards:
+                card = self.freeCards.pop()
+                self._bindCard(card, i)
+            else:
+                card = self._createCard(i)
+
+            card.move(self.__cardPos(i))
+            card.show()
+            self.visibleCards[i] = card
+
+    def resizeEvent(self, e):
+        if self.__columnNum(self.width()) != self.columnNum:
+            self.__recycle(self.visibleCards.keys(), self.visibleTitles.keys())
+            self.__doLayout()
+
+        self.updateVisibleCards()
+
+    def showEvent(self, e):
+        super().showEvent(e)
+        self.updateVisibleCards()
+
+    def event(self, e: QEvent):
+        if e.type() == QEvent.ParentChange:
+            self.__watchAncestors()
+
+        return super().event(e)
+
+    def eventFilter(self, obj, e: QEvent):
+        if e.type() in (QEvent.Move, QEvent.Resize, QEvent.Show):
+            self.updateVisibleCards()
+
+        return super().eventFilter(obj, e)
+
+    def __watchAncestors(self):
+        """ watch the ancestors which clip the view, such as the scroll widget of scroll area """
+        # the ancestors before reparenting no longer clip the view
+        for ancestor in self.watchedAncestors:
+            ancestor.destroyed.disconnect(self.__onAncestorDestroyed)
+            ancestor.removeEventFilter(self)
+
+        self.watchedAncestors.clear()
+        parent = self.parentWidget()
+        while parent:
+            parent.installEventFilter(self)
+            parent.destroyed.connect(self.__onAncestorDestroyed)
+            self.watchedAncestors.append(parent)
+            parent = parent.parentWidget()
+
+    def __onAncestorDestroyed(self, obj):
+        """ watched ancestor destroyed slot """
+        self.watchedAncestors = [i for i in self.watchedAncestors if i is not obj]
+
+    def __visibleRect(self) -> QRect:
+        """ get the area of view which is not clipped by ancestors """
+        rect = self.rect()
+        offset = QPoint()
+        widget = self
+        while not widget.isWindow() and widget.parentWidget():
+            offset += widget.pos()
+            widget = widget.parentWidget()
+            rect &= widget.rect().translated(-offset)
+
+        return rect
+
+    def __recycle(self, indexes, titles):
+        """ recycle cards and title labels """
+        for i in list(indexes):
+            card = self.visibleCards.pop(i)
+            card.hide()
+            self.freeCards.append(card)
+
+        for i in list(titles):
+            label = self.visibleTitles.pop(i)
+            label.hide()
+            self.freeTitles.append(label)
+
+    def __columnNum(self, width: int) -> int:
+        """ get the number of columns, the same as `FlowLayout` """
+        w = width - 1 - self.margins.left() - self.cardSize.width()
+        return max(1, w // (self.cardSize.width() + self.horizontalSpacing) + 1)
+
+    def __groupHeight(self, group: int, columnNum: int) -> int:
+        title, _, n = self.groups[group]
+        h = self.titleHeight if title else 0
+        if n == 0:
+            return h
+
+        rows = (n - 1) // columnNum + 1
+        return h + rows * self.cardSize.height() + (rows - 1) * self.verticalSpacing
+
+    def __doLayout(self):
+        """ calculate the vertical position of each group """
+        self.columnNum = self.__columnNum(self.width())
+        self.groupYs = []
+
+        y = self.margins.top()
+        for i in range(len(self.groups)):
+            self.groupYs.append(y)
+            y += self.__groupHeight(i, self.columnNum) + self.groupSpacing
+
+    def __cardPos(self, index: int) -> QPoint:
+        """ get the position of card bound to the item at index """
+        group = bisect_right(self.groupStarts, index) - 1
+        title, start, _ = self.groups[group]
+        row, column = divmod(index - start, self.columnNum)
+        x = self.margins.left() + column * (self.cardSize.width() + self.horizontalSpacing)
+        y = self.groupYs[group] + (self.titleHeight if title else 0) + \
+            row * (self.cardSize.height() + self.verticalSpacing)
+        return QPoint(x, y)
+
+    def __visibleIndexes(self, top: int, bottom: int):
+        """ get the indexes of items and titles intersected with the vertical range """
+        indexes, titles = [], []
+        dy = self.cardSize.height() + self.verticalSpacing
+
+        group = max(0, bisect_right(self.groupYs, top) - 1)
+        while group < len(self.groups) and self.groupYs[group] <= bottom:
+            title, start, n = self.groups[group]
+            y0 = self.groupYs[group]
+            if title and y0 + self.titleHeight >= top:
+                titles.append(group)
+
+            y0 += self.titleHeight if title else 0
+            rows = (n - 1) // self.columnNum + 1 if n else 0
+            firstRow = max(0, (top - y0) // dy)
+            lastRow = min(rows - 1, (bottom - y0) // dy)
+            for row in range(firstRow, lastRow + 1):
+                i0 = start + row * self.columnNum
+                indexes.extend(range(i0, min(i0 + self.columnNum, start + n)))
+
+            group += 1
+
+        return indexes, titles
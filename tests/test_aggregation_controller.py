@@ -0,0 +1,58 @@
+# coding:utf-8
+import sys
+
+sys.path.append('app')
+
+from unittest import TestCase
+
+from app.common.database.controller import (AggregationController,
+                                            AlbumInfoController,
+                                            SingerInfoController,
+                                            SongInfoController)
+from app.common.library import Directory
+from PyQt5.QtSql import QSqlDatabase
+
+
+class TestAggregationController(TestCase):
+    """ 测试增量聚合控制类 """
+
+    def __init__(self, methodName: str = ...) -> None:
+        super().__init__(methodName)
+        self.db = QSqlDatabase.addDatabase('QSQLITE')
+        self.db.setDatabaseName('./app/cache/cache.db')
+        if not self.db.open():
+            raise Exception("数据库连接失败")
+
+        self.songInfoController = SongInfoController()
+        self.albumInfoController = AlbumInfoController()
+        self.singerInfoController = SingerInfoController()
+        self.aggregationController = AggregationController()
+        self.directory = Directory('D:/hzz/Music')
+
+    def test_update(self):
+        """ 测试增量更新专辑和歌手信息 """
+        songInfos = self.songInfoController.getSongInfosFromCache(
+            self.directory.glob())
+        albumInfos = self.albumInfoController.getAlbumInfosFromCache(songInfos)
+        singerInfos = self.singerInfoController.getSingerInfosFromCache(
+            albumInfos)
+        self.aggregationController.build(songInfos, albumInfos, singerInfos)
+
+        # 移除第一首歌后，专辑和歌手信息应该和全量聚合的结果一致
+        removed = songInfos[:1]
+        albumInfos, singerInfos = self.aggregationController.update(
+            removed=removed)
+        expected = self.albumInfoController.getAlbumInfosFromCache(
+            songInfos[1:])
+        self.assertEqual(
+            {(i.singer, i.album) for i in albumInfos},
+            {(i.singer, i.album) for i in expected}
+        )
+
+        # 加回去
+        albumInfos, singerInfos = self.aggregationController.update(
+            added=removed)
+        self.assertEqual(
+            len(albumInfos), len({(i.singer, i.album) for i in songInfos}))
+        self.assertEqual(
+            len(singerInfos), len({i.singer for i in songInfos}))
@@ -0,0 +1,53 @@
+# coding:utf-8
+import sys
+
+sys.path.append('app')
+
+from time import time
+from unittest import TestCase
+
+from app.common.database.dao import SongInfoDao
+from PyQt5.QtSql import QSqlDatabase
+
+
+class TestDaoBenchmark(TestCase):
+    """ 测试批量解码数据库记录的速度 """
+
+    def __init__(self, methodName: str = ...) -> None:
+        super().__init__(methodName)
+        self.dbPath = './app/cache/cache.db'
+        self.db = QSqlDatabase.addDatabase('QSQLITE')
+        self.db.setDatabaseName(self.dbPath)
+        if not self.db.open():
+            raise Exception("数据库连接失败")
+
+        self.dao = SongInfoDao(self.db)
+
+    def listAllByRecord(self):
+        """ 逐行调用 `record()` 的旧实现 """
+        entities = []
+        self.dao.query.exec(f"SELECT * FROM {self.dao.table}")
+        while self.dao.query.next():
+            entities.append(self.dao.loadFromRecord(self.dao.query.record()))
+
+        self.dao.query.finish()
+        return entities
+
+    def test_list_all(self):
+        """ 测试载入所有歌曲信息 """
+        methods = {
+            'record': self.listAllByRecord,
+            'value': self.dao.listAll,
+            'sqlite3': lambda: SongInfoDao.listAllFromFile(self.dbPath),
+        }
+
+        results = {}
+        for name, method in methods.items():
+            t0 = time()
+            results[name] = method()
+            t1 = time()
+            n = len(results[name])
+            print(f'{name}: {n} 行，{n / max(t1 - t0, 1e-6):.0f} 行/秒')
+
+        self.assertEqual(results['record'], results['value'])
+        self.assertEqual(results['record'], results['sqlite3'])
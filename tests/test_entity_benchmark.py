@@ -0,0 +1,77 @@
+# coding:utf-8
+import sys
+
+sys.path.append('app')
+
+import tracemalloc
+from dataclasses import dataclass
+from time import time
+from unittest import TestCase
+
+from app.common.database.entity import SongInfo
+from app.common.database.service import SongInfoService
+from PyQt5.QtSql import QSqlDatabase
+
+
+@dataclass
+class DictSongInfo:
+    """ 使用 `__dict__` 存储字段的歌曲信息，用于对比 """
+
+    file: str = None
+    title: str = None
+    singer: str = None
+    album: str = None
+    year: int = None
+    genre: str = None
+    duration: int = None
+    track: int = None
+    trackTotal: int = None
+    disc: int = None
+    discTotal: int = None
+    createTime: int = None
+    modifiedTime: int = None
+
+
+class TestEntityBenchmark(TestCase):
+    """ 测试实体类的内存占用和载入速度 """
+
+    def __init__(self, methodName: str = ...) -> None:
+        super().__init__(methodName)
+        self.db = QSqlDatabase.addDatabase('QSQLITE')
+        self.db.setDatabaseName('./app/cache/cache.db')
+        if not self.db.open():
+            raise Exception("数据库连接失败")
+
+        self.service = SongInfoService(self.db)
+
+    @staticmethod
+    def measure(cls, n=100000):
+        """ 返回每行的内存占用（字节）和创建速度（行/秒） """
+        tracemalloc.start()
+        t0 = time()
+        entities = [
+            cls(file=f'D:/hzz/Music/{i}.mp3', title=f'song {i}', singer='aiko', album='aiko',
+                year=2005, genre='Pop', duration=307, track=1, trackTotal=4, disc=1,
+                discTotal=1, createTime=i, modifiedTime=i)
+            for i in range(n)
+        ]
+        t1 = time()
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del entities
+        return size / n, n / (t1 - t0)
+
+    def test_memory(self):
+        """ 测试每行内存占用 """
+        dictSize, dictSpeed = self.measure(DictSongInfo)
+        slotSize, slotSpeed = self.measure(SongInfo)
+        print(f'__dict__: {dictSize:.0f} B/行, {dictSpeed:.0f} 行/秒')
+        print(f'__slots__: {slotSize:.0f} B/行, {slotSpeed:.0f} 行/秒')
+        self.assertLess(slotSize, dictSize)
+
+    def test_load(self):
+        """ 测试从数据库载入歌曲信息的速度 """
+        t0 = time()
+        songInfos = self.service.listAll()
+        t1 = time()
+        print(f'载入 {len(songInfos)} 行，{len(songInfos) / max(t1 - t0, 1e-6):.0f} 行/秒')
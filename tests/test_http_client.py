@@ -0,0 +1,115 @@
+# coding:utf-8
+import sys
+
+# VS Code 中的格式化会把 `sys.path.append('app')` 放到最后，那种事情不要啊
+sys.path.append('app')
+
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from unittest import TestCase
+
+from requests import RequestException
+
+from app.common.crawler.http_client import HttpClient
+
+
+class Handler(BaseHTTPRequestHandler):
+    """ 测试服务器的请求处理器 """
+
+    protocol_version = 'HTTP/1.1'
+    counts = {}
+    ports = set()
+    active = peak = 0
+    lock = Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def reply(self, code=200):
+        self.send_response(code)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'ok')
+
+    def do_GET(self):
+        cls = Handler
+        cls.ports.add(self.client_address[1])
+        cls.counts[self.path] = cls.counts.get(self.path, 0) + 1
+
+        if self.path == '/flaky':
+            return self.reply(503 if cls.counts[self.path] < 3 else 200)
+
+        if self.path == '/hang':
+            time.sleep(2)
+        elif self.path == '/slow':
+            with cls.lock:
+                cls.active += 1
+                cls.peak = max(cls.peak, cls.active)
+
+            time.sleep(0.1)
+            with cls.lock:
+                cls.active -= 1
+
+        self.reply()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        Handler.counts[self.path] = Handler.counts.get(self.path, 0) + 1
+        self.reply(503)
+
+
+class TestHttpClient(TestCase):
+    """ 测试 HTTP 客户端 """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        cls.url = f'http://127.0.0.1:{cls.server.server_port}'
+        Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.client = HttpClient(backoff=0, concurrency=2)
+        Handler.counts.clear()
+        Handler.ports.clear()
+
+    def test_keep_alive(self):
+        """ 测试复用连接 """
+        for _ in range(5):
+            self.assertEqual(self.client.request('get', self.url).text, 'ok')
+
+        self.assertEqual(len(Handler.ports), 1)
+
+    def test_retry(self):
+        """ 测试只重试幂等请求 """
+        self.assertEqual(self.client.request('get', self.url + '/flaky').text, 'ok')
+        self.assertEqual(Handler.counts['/flaky'], 3)
+
+        self.assertRaises(RequestException, self.client.request,
+                          'post', self.url + '/post', data=b'data')
+        self.assertEqual(Handler.counts['/post'], 1)
+
+    def test_timeout(self):
+        """ 测试读取超时 """
+        client = HttpClient(retries=0)
+        t = time.time()
+        self.assertRaises(RequestException, client.request,
+                          'get', self.url + '/hang', timeout=(1, 0.5))
+        self.assertLess(time.time() - t, 1.5)
+
+    def test_concurrency(self):
+        """ 测试限制并发请求数 """
+        threads = [Thread(target=self.client.request, args=('get', self.url + '/slow', 'test'))
+                   for _ in range(6)]
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(Handler.peak, 2)
@@ -0,0 +1,73 @@
+# coding:utf-8
+import sys
+
+# VS Code 中的格式化会把 `sys.path.append('app')` 放到最后，那种事情不要啊
+sys.path.append('app')
+
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import numpy as np
+from PIL import Image
+from PyQt5.QtCore import QPointF
+
+from app.common import image_utils
+from app.common.image_utils import (DominantColor, gaussianBlur, getBlurImagePath,
+                                    getQuadTransform)
+
+
+class TestImageUtils(TestCase):
+    """ 测试图像工具 """
+
+    def setUp(self):
+        self.folder = TemporaryDirectory()
+        self.effectFolder = image_utils.coverEffectFolder
+        image_utils.coverEffectFolder = Path(self.folder.name) / 'CoverEffect'
+
+        image = np.zeros((300, 200, 3), np.uint8)
+        image[:] = (30, 120, 200)
+        image[100:200] = (240, 240, 240)
+        self.path = os.path.join(self.folder.name, 'cover.png')
+        Image.fromarray(image).save(self.path)
+
+    def tearDown(self):
+        image_utils.coverEffectFolder = self.effectFolder
+        DominantColor.colors.clear()
+        self.folder.cleanup()
+
+    def test_blur(self):
+        """ 测试模糊图像 """
+        image = gaussianBlur(self.path, 12, 0.5, (100, 100))
+        self.assertEqual(image.shape, (100, 66, 3))
+        self.assertLessEqual(image.max(), 121)
+
+        # 模糊结果缓存在磁盘中
+        path = getBlurImagePath(self.path, 12, 0.5, (100, 100))
+        self.assertTrue(Path(path).exists())
+        self.assertEqual(getBlurImagePath(self.path, 12, 0.5, (100, 100)), path)
+
+    def test_dominant_color(self):
+        """ 测试提取主题色 """
+        # 白色被忽略，亮度在 0.7 到 0.8 之间的颜色会变暗一点
+        color = DominantColor.getDominantColor(self.path)
+        self.assertEqual(color, (28, 113, 190))
+
+        # 从磁盘缓存中读取主题色
+        DominantColor.colors.clear()
+        self.assertEqual(DominantColor.getDominantColor(self.path), color)
+        self.assertEqual(len(list(image_utils.coverEffectFolder.glob('*_color.txt'))), 1)
+
+    def test_quad_transform(self):
+        """ 测试透视变换矩阵 """
+        dstPoints = ((7, 6), (209, 1), (1, 288), (208, 289))
+        transform = getQuadTransform(210, 290, dstPoints)
+        corners = [QPointF(0, 0), QPointF(209, 0), QPointF(0, 289), QPointF(209, 289)]
+        for p, (x, y) in zip(corners, dstPoints):
+            p = transform.map(p)
+            self.assertAlmostEqual(p.x(), x, 3)
+            self.assertAlmostEqual(p.y(), y, 3)
+
+        # 相同尺寸的卡片共用变换矩阵
+        self.assertIs(getQuadTransform(210, 290, dstPoints), transform)
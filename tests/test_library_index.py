@@ -0,0 +1,43 @@
+# coding:utf-8
+import sys
+sys.path.append('app')
+
+from app.common.library import LibraryIndex
+from app.common.database.entity import SongInfo
+from unittest import TestCase
+
+
+class TestLibraryIndex(TestCase):
+    """ 测试歌曲库索引 """
+
+    def __init__(self, methodName: str = ...) -> None:
+        super().__init__(methodName)
+        self.songInfos = [
+            SongInfo(file=f'D:/hzz/Music/{i}.mp3', title=f'song {i}', singer=f'singer {i % 3}',
+                     album=f'album {i % 5}', genre='Pop', createTime=i)
+            for i in range(100)
+        ]
+
+    def test_order_by(self):
+        """ 测试排序视图 """
+        index = LibraryIndex(self.songInfos)
+        songInfos = index.orderBy('createTime')
+        self.assertEqual([i.createTime for i in songInfos], list(range(99, -1, -1)))
+        self.assertIs(songInfos, index.orderBy('createTime'))
+
+        index.remove([self.songInfos[0].file])
+        self.assertIsNot(songInfos, index.orderBy('createTime'))
+        self.assertEqual(len(index.orderBy('createTime')), 99)
+
+    def test_update(self):
+        """ 测试更新歌曲信息 """
+        index = LibraryIndex(self.songInfos)
+        songInfo = self.songInfos[1].copy()
+        songInfo.album = 'new album'
+
+        olds = index.update([songInfo, SongInfo(file='not exist')])
+        self.assertEqual(olds, [self.songInfos[1]])
+        self.assertNotIn('not exist', index)
+        self.assertEqual(index.listByAlbum(songInfo.singer, 'new album'), [songInfo])
+        self.assertEqual(len(index.listByAlbum('singer 1', 'album 1')), 6)
+        self.assertEqual(len(index.listBySinger('singer 1')), 33)
@@ -0,0 +1,57 @@
+# coding:utf-8
+import sys
+sys.path.append('app')
+
+import os
+import wave
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from time import time
+
+from app.common.library import Directory
+from app.common.meta_data.reader import ParallelSongInfoReader, SongInfoReader
+
+
+class TestParallelSongInfoReader(TestCase):
+    """ 测试多进程歌曲信息读取器 """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.folder = TemporaryDirectory()
+        for i in range(30):
+            folder = os.path.join(cls.folder.name, f'album {i % 3}')
+            os.makedirs(folder, exist_ok=True)
+            with wave.open(os.path.join(folder, f'song {i}.wav'), 'wb') as f:
+                f.setnchannels(1)
+                f.setsampwidth(2)
+                f.setframerate(8000)
+                f.writeframes(b'\0\0' * 8000)
+
+        cls.files = Directory(cls.folder.name).glob(True)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.folder.cleanup()
+
+    def test_read(self):
+        """ 测试读取结果与串行读取一致 """
+        t0 = time()
+        songInfos = ParallelSongInfoReader(4, threshold=0).read(self.files)
+        t1 = time()
+        reader = SongInfoReader()
+        expected = [reader.read(i) for i in self.files]
+        t2 = time()
+        print('并行耗时：', t1-t0, '串行耗时：', t2-t1)
+        self.assertEqual(songInfos, expected)
+
+    def test_iter_batches(self):
+        """ 测试分批返回结果 """
+        reader = ParallelSongInfoReader(4, batchSize=10, threshold=0)
+        batches = list(reader.iterBatches(self.files))
+        self.assertTrue(all(len(i) <= 10 for i in batches))
+        self.assertEqual(sum(len(i) for i in batches), len(self.files))
+
+    def test_empty(self):
+        """ 测试没有文件时不启动进程池 """
+        reader = ParallelSongInfoReader(4, threshold=0)
+        self.assertEqual(reader.read([]), [])
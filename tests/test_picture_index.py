@@ -0,0 +1,145 @@
+# coding:utf-8
+import sys
+
+# VS Code 中的格式化会把 `sys.path.append('app')` 放到最后，那种事情不要啊
+sys.path.append('app')
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from app.common.database.controller import picture_controller
+from app.common.database.entity import PictureInfo
+from app.common.picture import CoverType, Picture, PictureIndex
+from PyQt5.QtSql import QSqlDatabase
+
+
+class TestPictureIndex(TestCase):
+    """ 测试图片索引 """
+
+    def test_changes(self):
+        """ 测试索引的修改记录 """
+        index = PictureIndex()
+        index.add(PictureInfo('AlbumCover/a_b', 'a_b/cover.jpg', 1, 'x'))
+        index.add(PictureInfo('AlbumCover/c_d', 'c_d/cover.jpg', 1, 'y'))
+
+        # 加载前的修改不会被覆盖
+        index.load([PictureInfo('SingerAvatar/a', 'a/avatar.jpg', 1, 'z')])
+        self.assertTrue(index.isLoaded)
+        self.assertEqual(len(index.infos), 3)
+
+        index.remove('AlbumCover/c_d')
+        index.remove('AlbumCover/e_f')
+        self.assertEqual(index.keys('AlbumCover/'), ['AlbumCover/a_b'])
+
+        added, removed = index.takeChanges()
+        self.assertEqual([i.id for i in added], ['AlbumCover/a_b'])
+        self.assertEqual(removed, ['AlbumCover/c_d'])
+        self.assertEqual(index.takeChanges(), ([], []))
+
+    def test_save_delete(self):
+        """ 测试保存和删除图片 """
+        with TemporaryDirectory() as folder:
+            class TestPicture(Picture):
+                parentFolder = Path(folder) / 'TestPicture'
+                index = PictureIndex()
+
+            TestPicture.index.load(TestPicture.scan())
+            picture = TestPicture('a')
+            self.assertFalse(picture.isExists())
+            self.assertEqual(TestPicture.listNames(), [])
+
+            path = picture.save(b'\x89PNG\r\n\x1a\n')
+            self.assertTrue(picture.isExists())
+            self.assertEqual(picture.path(CoverType.ALBUM_BIG), path)
+            self.assertEqual(TestPicture.listNames(), ['a'])
+
+            # 扫描结果和索引一致
+            self.assertEqual(TestPicture.scan(), [TestPicture.index.get(picture.key)])
+
+            picture.delete()
+            self.assertFalse(picture.isExists())
+            self.assertFalse(picture.folder.exists())
+
+    def test_content_addressed_store(self):
+        """ 测试内容寻址存储 """
+        with TemporaryDirectory() as folder:
+            class TestCover(Picture):
+                parentFolder = Path(folder) / 'TestCover'
+                storeFolder = Path(folder) / 'TestCoverStore'
+                index = PictureIndex()
+
+            TestCover.index.load([])
+            data = b'\x89PNG\r\n\x1a\n'
+            c1, c2 = TestCover('a'), TestCover('b')
+
+            # 相同的图片只保存一份
+            path = c1.save(data)
+            self.assertEqual(c2.save(data), path)
+            self.assertEqual(len(list(TestCover.storeFolder.iterdir())), 1)
+            self.assertEqual([i.name for i in c1.folder.iterdir()], ['picture.ref'])
+            self.assertEqual(sorted(TestCover.listNames()), ['a', 'b'])
+
+            # 图片在没有引用之后才会被删除
+            c1.delete()
+            self.assertTrue(Path(path).exists())
+            self.assertTrue(c2.isExists())
+
+            newPath = c2.save(b'\xff\xd8\xff' + data)
+            self.assertNotEqual(newPath, path)
+            self.assertFalse(Path(path).exists())
+
+            c2.delete()
+            self.assertFalse(Path(newPath).exists())
+
+    def test_rebuild(self):
+        """ 测试清空数据库后重建索引 """
+        with TemporaryDirectory() as folder:
+            folder = Path(folder)
+            Cover, Avatar = picture_controller.Cover, picture_controller.Avatar
+            with patch.object(Cover, 'parentFolder', folder / 'AlbumCover'), \
+                    patch.object(Cover, 'storeFolder', folder / 'AlbumCoverStore'), \
+                    patch.object(Avatar, 'parentFolder', folder / 'SingerAvatar'), \
+                    patch.object(picture_controller.Picture, 'index', PictureIndex()):
+                db = QSqlDatabase.addDatabase('QSQLITE', 'test_picture')
+                db.setDatabaseName(str(folder / 'cache.db'))
+                db.open()
+                controller = picture_controller.PictureController(db)
+                controller.pictureInfoService.createTable()
+                controller.loadIndex()
+
+                data = b'\x89PNG\r\n\x1a\n'
+                c1, c2, c3 = Cover('a', 'b'), Cover('c', 'd'), Cover('e', 'f')
+                path = c1.save(data)
+                c2.save(data)
+                c3.save(b'\xff\xd8\xff' + data)
+                c3.delete()
+                avatarPath = Avatar('a').save(data)
+                controller.saveIndex()
+
+                # 没有被引用的图片在重建时被删除
+                orphan = Cover.storeFolder / 'orphan.jpg'
+                orphan.write_bytes(data)
+
+                controller.pictureInfoService.clearTable()
+                picture_controller.Picture.index = PictureIndex()
+
+                # 不重建索引时从文件夹中查找图片
+                controller.loadIndex(False)
+                self.assertFalse(picture_controller.Picture.index.isLoaded)
+                self.assertEqual(c1.path(), path)
+                self.assertFalse(c3.isExists())
+
+                controller.loadIndex()
+
+                self.assertEqual(c1.path(), path)
+                self.assertEqual(c2.path(), path)
+                self.assertFalse(c3.isExists())
+                self.assertEqual(Avatar('a').path(), avatarPath)
+                self.assertFalse(orphan.exists())
+                self.assertEqual(len(controller.pictureInfoService.listAll()), 3)
+
+                db.close()
+
+        QSqlDatabase.removeDatabase('test_picture')
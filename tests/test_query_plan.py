@@ -0,0 +1,79 @@
+# coding:utf-8
+import re
+import sys
+
+# VS Code 中的格式化会把 `sys.path.append('app')` 放到最后，那种事情不要啊
+sys.path.append('app')
+
+from unittest import TestCase
+from app.common.database import DBMigrator
+from app.common.database.service import (AlbumInfoService, PlaylistService, RecentPlayService,
+                                         SingerInfoService, SnapshotService, SongInfoService)
+from PyQt5.QtSql import QSqlDatabase, QSqlQuery
+
+
+class TestQueryPlan(TestCase):
+    """ 测试热点查询的执行计划 """
+
+    # 热点查询，LIKE 模糊查询无法使用索引，不在此列
+    queries = [
+        "SELECT * FROM tbl_song_info WHERE file = 'a.mp3'",
+        "SELECT * FROM tbl_song_info WHERE singer in ('a', 'b') ORDER BY CASE singer WHEN 'a' THEN 1 WHEN 'b' THEN 2 END, album",
+        "SELECT * FROM tbl_song_info WHERE singer = 'a' AND album = 'b'",
+        "SELECT * FROM tbl_song_info WHERE (singer, album) in (VALUES ('a', 'b'), ('c', 'd'))",
+        "SELECT * FROM tbl_album_info WHERE singer = 'a' AND album = 'b'",
+        "SELECT * FROM tbl_album_info WHERE (singer, album) in (VALUES ('a', 'b'), ('c', 'd'))",
+        "DELETE FROM tbl_album_info WHERE (singer, album) in (VALUES ('a', 'b'), ('c', 'd'))",
+        "SELECT * FROM tbl_singer_info WHERE singer = 'a'",
+        "SELECT * FROM tbl_song_playlist WHERE name = 'a'",
+        "SELECT * FROM tbl_song_playlist WHERE file = 'a.mp3'",
+        "DELETE FROM tbl_song_playlist WHERE (name = 'a' AND file = 'a.mp3') OR (name = 'a' AND file = 'b.mp3')",
+        "SELECT * FROM tbl_recent_play ORDER BY lastPlayedTime DESC LIMIT 10",
+        "DELETE FROM tbl_file_snapshot WHERE directory in ('a', 'b')",
+    ]
+
+    def __init__(self, methodName: str = ...) -> None:
+        super().__init__(methodName)
+        # 每个测试用例都会实例化一次，复用已有的连接
+        if QSqlDatabase.contains():
+            self.db = QSqlDatabase.database()
+        else:
+            self.db = QSqlDatabase.addDatabase('QSQLITE')
+            self.db.setDatabaseName('./app/cache/cache.db')
+
+        if not self.db.open():
+            raise Exception("数据库连接失败")
+
+        SongInfoService(self.db).createTable()
+        AlbumInfoService(self.db).createTable()
+        SingerInfoService(self.db).createTable()
+        PlaylistService(self.db).createTable()
+        RecentPlayService(self.db).createTable()
+        SnapshotService(self.db).createTable()
+        self.migrator = DBMigrator(self.db)
+
+    def test_migrate(self):
+        """ 测试迁移数据库 """
+        self.assertTrue(self.migrator.migrate())
+        self.assertEqual(self.migrator.version(), DBMigrator.latestVersion())
+
+        # 重复迁移不会出错
+        self.assertTrue(self.migrator.migrate())
+        self.assertEqual(self.migrator.version(), DBMigrator.latestVersion())
+
+    def test_query_plan(self):
+        """ 测试热点查询不会全表扫描 """
+        self.migrator.migrate()
+        query = QSqlQuery(self.db)
+
+        for sql in self.queries:
+            self.assertTrue(query.exec(f"EXPLAIN QUERY PLAN {sql}"), sql)
+
+            details = []
+            while query.next():
+                details.append(query.value(3))
+
+            for detail in details:
+                isFullScan = re.match(r"SCAN (TABLE )?tbl_\w+", detail) and \
+                    "INDEX" not in detail
+                self.assertFalse(isFullScan, f"{sql}\n{details}")
@@ -0,0 +1,115 @@
+# coding:utf-8
+import sys
+
+# VS Code 中的格式化会把 `sys.path.append('app')` 放到最后，那种事情不要啊
+sys.path.append('app')
+
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from app.common.crawler.exception_handler import exceptionHandler
+from app.common.crawler.response_cache import ResponseCache
+from app.common.database.entity import SongInfo
+
+
+class TestResponseCache(TestCase):
+    """ 测试爬虫响应缓存 """
+
+    def setUp(self):
+        self.folder = TemporaryDirectory()
+        self.cache = ResponseCache(os.path.join(self.folder.name, 'cache.db'), maxSize=4096)
+        self.requests = []
+        cache, requests = self.cache, self.requests
+
+        class Crawler:
+
+            name = 'test'
+
+            @exceptionHandler([], 0)
+            @cache.cached('search')
+            def getSongInfos(self, key_word: str, page_num=1, page_size=10):
+                requests.append(key_word)
+                if key_word == 'error':
+                    raise ConnectionError('network error')
+
+                if key_word == 'none':
+                    return [], 0
+
+                return [SongInfo(file=key_word, title=key_word)], 1
+
+            @exceptionHandler()
+            @cache.cached('lyric')
+            def getLyric(self, key_word: str):
+                requests.append(key_word)
+                songInfos, _ = self.getSongInfos(key_word)
+                return songInfos[0].title if songInfos else None
+
+        self.crawler = Crawler()
+
+    def tearDown(self):
+        self.cache.connection.close()
+        self.folder.cleanup()
+
+    def test_cache(self):
+        """ 测试缓存搜索结果 """
+        songInfos, total = self.crawler.getSongInfos('aiko')
+        self.assertEqual(self.crawler.getSongInfos('aiko'), (songInfos, total))
+        self.assertEqual(self.requests, ['aiko'])
+
+        # 参数不同的请求分开缓存
+        self.crawler.getSongInfos('aiko', 2)
+        self.assertEqual(self.requests, ['aiko', 'aiko'])
+
+        # 重新打开数据库后缓存依然有效
+        cache = ResponseCache(self.cache.path)
+        self.assertTrue(cache.get(next(iter(self.keys())))[0])
+        cache.connection.close()
+
+    def test_negative_cache(self):
+        """ 测试缓存空结果，不缓存网络错误 """
+        self.assertEqual(self.crawler.getSongInfos('none'), ([], 0))
+        self.assertEqual(self.crawler.getSongInfos('none'), ([], 0))
+        self.assertEqual(self.requests, ['none'])
+
+        self.assertEqual(self.crawler.getSongInfos('error'), ([], 0))
+        self.assertEqual(self.crawler.getSongInfos('error'), ([], 0))
+        self.assertEqual(self.requests, ['none', 'error', 'error'])
+
+        # 内部请求出错时外层的结果也不缓存
+        self.assertIsNone(self.crawler.getLyric('error'))
+        self.assertIsNone(self.crawler.getLyric('error'))
+        self.assertEqual(self.requests.count('error'), 6)
+
+    def test_expire(self):
+        """ 测试缓存过期 """
+        self.cache.put('a', 1, -1)
+        self.assertEqual(self.cache.get('a'), (False, None))
+        self.cache.put('a', 1, 60)
+        self.assertEqual(self.cache.get('a'), (True, 1))
+
+    def test_size_limit(self):
+        """ 测试限制缓存大小 """
+        for i in range(100):
+            self.cache.put(str(i), b'0' * 100, 60 + i)
+
+        self.assertLessEqual(self.cache.size, self.cache.maxSize)
+        self.assertEqual(self.cache.size, sum(i[0] for i in self.cache.connection.execute(
+            "SELECT size FROM tbl_response")))
+
+        # 最晚过期的结果被保留
+        self.assertTrue(self.cache.get('99')[0])
+        self.assertFalse(self.cache.get('0')[0])
+
+    def test_replace(self):
+        """ 测试覆盖已有的结果不会重复计算大小 """
+        for _ in range(100):
+            self.cache.put('a', b'0' * 100, 60)
+
+        size = self.cache.connection.execute(
+            "SELECT size FROM tbl_response WHERE key = 'a'").fetchone()[0]
+        self.assertEqual(self.cache.size, size)
+        self.assertTrue(self.cache.get('a')[0])
+
+    def keys(self):
+        return [i[0] for i in self.cache.connection.execute("SELECT key FROM tbl_response")]
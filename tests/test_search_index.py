@@ -0,0 +1,98 @@
+# coding:utf-8
+import sys
+
+# VS Code 中的格式化会把 `sys.path.append('app')` 放到最后，那种事情不要啊
+sys.path.append('app')
+
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from app.common.database import DBMigrator
+from app.common.database.entity import SongInfo
+from app.common.database.service import (AlbumInfoService, PlaylistService, RecentPlayService,
+                                         SingerInfoService, SnapshotService, SongInfoService)
+from app.common.database.utils import SearchUtils
+from PyQt5.QtSql import QSqlDatabase, QSqlQuery
+
+
+class TestSearchIndex(TestCase):
+    """ 测试全文搜索索引 """
+
+    songInfos = [
+        SongInfo(file='D:/音乐/周杰伦 - 晴天.mp3', title='晴天', singer='周杰伦', album='叶惠美'),
+        SongInfo(file='D:/音乐/aiko - KissHug.mp3', title='KissHug', singer='aiko', album='aikoの詩。'),
+        SongInfo(file='D:/音乐/aiko - Loveletter.mp3', title='Loveletter', singer='aiko', album='aikoの詩。'),
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        cls.folder = TemporaryDirectory()
+        cls.db = QSqlDatabase.addDatabase('QSQLITE', 'test_search_index')
+        cls.db.setDatabaseName(os.path.join(cls.folder.name, 'cache.db'))
+        if not cls.db.open():
+            raise Exception("数据库连接失败")
+
+        cls.service = SongInfoService(cls.db)
+        cls.service.createTable()
+        AlbumInfoService(cls.db).createTable()
+        SingerInfoService(cls.db).createTable()
+        PlaylistService(cls.db).createTable()
+        RecentPlayService(cls.db).createTable()
+        SnapshotService(cls.db).createTable()
+
+        # 迁移之前的数据也会被索引
+        cls.service.addBatch(cls.songInfos)
+        if not DBMigrator(cls.db).migrate():
+            raise Exception("数据库迁移失败")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.db.close()
+        del cls.db, cls.service
+        QSqlDatabase.removeDatabase('test_search_index')
+        cls.folder.cleanup()
+
+    def setUp(self):
+        self.service.clearTable()
+        self.service.addBatch(self.songInfos)
+
+    def search(self, keyWord: str, limit=None):
+        return [i.title for i in self.service.search(keyWord, limit)]
+
+    def test_segment(self):
+        """ 测试中文分词和查询语句 """
+        self.assertEqual(SearchUtils.segment('周杰伦 Jay').split(), ['周', '杰', '伦', 'Jay'])
+        self.assertEqual(SearchUtils.toMatchQuery('杰伦'), '" 杰  伦 "*')
+        self.assertEqual(SearchUtils.toMatchQuery('a"b'), '"a""b"*')
+        self.assertEqual(SearchUtils.toMatchQuery(' -*" '), '')
+
+    def test_search(self):
+        """ 测试前缀搜索和相关度排序 """
+        self.assertEqual(self.search('杰伦'), ['晴天'])
+        self.assertEqual(self.search('love'), ['Loveletter'])
+        self.assertEqual(set(self.search('aik')), {'KissHug', 'Loveletter'})
+        self.assertEqual(len(self.search('aik', 1)), 1)
+        self.assertEqual(self.search('ove'), [])
+        self.assertEqual(self.search('音乐'), [])
+        self.assertEqual(self.search('"'), [])
+
+        # 歌名的权重比歌手高
+        self.service.modify('D:/音乐/aiko - KissHug.mp3', 'singer', 'Loveletter')
+        self.assertEqual(self.search('loveletter'), ['Loveletter', 'KissHug'])
+
+    def test_sync(self):
+        """ 测试索引和表的同步 """
+        self.service.modify('D:/音乐/周杰伦 - 晴天.mp3', 'album', 'Ye Hui Mei')
+        self.assertEqual(self.search('叶惠美'), [])
+        self.assertEqual(self.search('ye hui'), ['晴天'])
+
+        self.service.removeById('D:/音乐/aiko - Loveletter.mp3')
+        self.assertEqual(self.search('love'), [])
+
+        # 直接执行 SQL 语句也会同步
+        query = QSqlQuery(self.db)
+        self.assertTrue(query.exec("UPDATE tbl_song_info SET title = 'Sunny' WHERE title = '晴天'"))
+        query.finish()
+        self.assertEqual(self.search('sun'), ['Sunny'])
+        self.assertEqual(self.search('ye hui'), ['Sunny'])
@@ -0,0 +1,79 @@
+# coding:utf-8
+import sys
+
+# VS Code 中的格式化会把 `sys.path.append('app')` 放到最后，那种事情不要啊
+sys.path.append('app')
+
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from app.common.database.controller import SnapshotController
+from app.common.database.service import SnapshotService
+from PyQt5.QtSql import QSqlDatabase
+
+
+class TestSnapshotController(TestCase):
+    """ 测试目录快照控制器 """
+
+    def __init__(self, methodName: str = ...) -> None:
+        super().__init__(methodName)
+        self.db = QSqlDatabase.addDatabase('QSQLITE')
+        self.db.setDatabaseName('./app/cache/cache.db')
+        if not self.db.open():
+            raise Exception("数据库连接失败")
+
+        SnapshotService(self.db).createTable()
+        self.controller = SnapshotController(self.db)
+        self.directories = ['D:/hzz/Music']
+
+    def test_scan(self):
+        """ 测试扫描目录 """
+        snapshots = self.controller.scan(self.directories)
+        files = {i.file for i in snapshots}
+
+        # 第二次扫描使用数据库中的快照
+        snapshots = self.controller.scan(self.directories)
+        self.assertEqual(files, {i.file for i in snapshots})
+        self.assertEqual(
+            len(snapshots), len(self.controller.snapshotService.listAllFiles()))
+
+    def test_remove_directory(self):
+        """ 测试移除目录 """
+        self.controller.scan(self.directories)
+        self.assertEqual(self.controller.scan([]), [])
+        self.assertFalse(self.controller.snapshotService.listAllDirectories())
+
+    def test_modify_file(self):
+        """ 测试目录未修改时也能发现就地修改的文件 """
+        with TemporaryDirectory() as folder:
+            db = QSqlDatabase.addDatabase('QSQLITE', 'test_snapshot')
+            db.setDatabaseName(os.path.join(folder, 'cache.db'))
+            db.open()
+            controller = SnapshotController(db)
+            controller.snapshotService.createTable()
+
+            os.mkdir(os.path.join(folder, 'album'))
+            file = os.path.join(folder, 'album', 'a.mp3')
+            with open(file, 'wb') as f:
+                f.write(b'0')
+
+            snapshots = controller.scan([folder])
+            self.assertEqual(len(snapshots), 1)
+
+            # 就地修改文件不会改变目录的修改时间
+            mtime = os.stat(os.path.dirname(file)).st_mtime
+            with open(file, 'r+b') as f:
+                f.write(b'1')
+
+            os.utime(file, (snapshots[0].mtime + 10, snapshots[0].mtime + 10))
+            os.utime(os.path.dirname(file), (mtime, mtime))
+
+            snapshots = controller.scan([folder])
+            self.assertEqual(snapshots[0].mtime, os.stat(file).st_mtime)
+
+            # 数据库中的快照也被更新
+            snapshots = controller.snapshotService.listAllFiles()
+            self.assertEqual([i.mtime for i in snapshots], [os.stat(file).st_mtime])
+            db.close()
+
+        QSqlDatabase.removeDatabase('test_snapshot')
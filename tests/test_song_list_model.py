@@ -0,0 +1,53 @@
+# coding:utf-8
+import sys
+
+# VS Code 中的格式化会把 `sys.path.append('app')` 放到最后，那种事情不要啊
+sys.path.append('app')
+
+from unittest import TestCase
+from app.common.database.entity import SongInfo
+from app.components.song_list_widget.song_list_model import SongListModel
+
+
+class TestSongListModel(TestCase):
+    """ 测试歌曲列表模型 """
+
+    def __init__(self, methodName: str = ...) -> None:
+        super().__init__(methodName)
+        self.songInfos = [
+            SongInfo(file=f'D:/hzz/Music/{i}.mp3', title=str(i), duration=200)
+            for i in range(10)
+        ]
+
+    def test_insert_remove(self):
+        """ 测试插入和删除行 """
+        model = SongListModel()
+        model.setSongInfos(self.songInfos[:5])
+        model.insertSongInfos(0, self.songInfos[5:])
+        self.assertEqual(model.rowCount(), 10)
+        self.assertEqual(model.songInfo(0), self.songInfos[5])
+
+        removed = model.removeSongInfos([0, 1, 2, 7, 9])
+        self.assertEqual(
+            [i.title for i in removed], ['5', '6', '7', '2', '4'])
+        self.assertEqual(
+            [i.title for i in model.songInfos], ['8', '9', '0', '1', '3'])
+
+    def test_checked_state(self):
+        """ 测试选中状态 """
+        model = SongListModel()
+        model.setSongInfos(self.songInfos)
+        model.setChecked(1, True)
+        model.setChecked(3, True)
+        model.setChecked(3, True)
+        self.assertEqual(model.checkedNum, 2)
+        self.assertEqual(model.checkedRows(), [1, 3])
+
+        model.removeSongInfos([0, 1])
+        self.assertEqual(model.checkedNum, 1)
+        self.assertEqual(model.checkedRows(), [1])
+
+        model.setAllChecked(True)
+        self.assertEqual(model.checkedNum, 8)
+        model.setAllChecked(False)
+        self.assertEqual(model.checkedRows(), [])
@@ -0,0 +1,48 @@
+# coding:utf-8
+import sys
+
+# VS Code 中的格式化会把 `sys.path.append('app')` 放到最后，那种事情不要啊
+sys.path.append('app')
+
+from unittest import TestCase
+
+from app.common.database.entity import SortKey
+from app.common.sort_key import SortKeyIndex
+
+
+class TestSortKeyIndex(TestCase):
+    """ 测试排序键索引 """
+
+    def test_create(self):
+        """ 测试计算排序键 """
+        sortKey = SortKeyIndex.create('周杰伦 Jay')
+        self.assertEqual(sortKey.key, 'zhoujielun jay')
+        self.assertEqual(sortKey.initials, 'zjl jay')
+        self.assertEqual(SortKeyIndex.create('aiko').key, 'aiko')
+
+    def test_letter(self):
+        """ 测试导航字母 """
+        index = SortKeyIndex()
+        self.assertEqual(index.letter('周杰伦'), 'Z')
+        self.assertEqual(index.letter('aiko'), 'A')
+        self.assertEqual(index.letter('2019'), '...')
+        self.assertEqual(index.letter('キラキラ'), '...')
+        self.assertEqual(index.letter(''), '...')
+        self.assertEqual(index.letter(None), '...')
+
+    def test_sort(self):
+        """ 测试中英文混合排序 """
+        index = SortKeyIndex()
+        texts = ['周杰伦', 'Beyond', '阿信', 'aiko', '陈奕迅']
+        self.assertEqual(sorted(texts, key=index.key),
+                         ['aiko', '阿信', 'Beyond', '陈奕迅', '周杰伦'])
+
+    def test_changes(self):
+        """ 测试只记录新计算的排序键 """
+        index = SortKeyIndex()
+        index.load([SortKey('aiko', 'aiko', 'aiko')])
+        self.assertTrue(index.isLoaded)
+
+        index.add(['aiko', '周杰伦', '周杰伦'])
+        self.assertEqual([i.id for i in index.takeChanges()], ['周杰伦'])
+        self.assertEqual(index.takeChanges(), [])
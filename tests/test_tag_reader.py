@@ -0,0 +1,76 @@
+# coding:utf-8
+import sys
+
+# VS Code 中的格式化会把 `sys.path.append('app')` 放到最后，那种事情不要啊
+sys.path.append('app')
+
+import os
+import wave
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from mutagen.id3 import APIC, TALB, TCON, TDRC, TIT2, TPE1, TPOS, TRCK, USLT
+from mutagen.wave import WAVE
+
+from app.common.meta_data.reader import TagCache, TagReader
+
+
+class TestTagReader(TestCase):
+    """ 测试标签读取器 """
+
+    def setUp(self):
+        self.folder = TemporaryDirectory()
+        self.file = os.path.join(self.folder.name, 'test.wav')
+        self.picData = b'\x89PNG\r\n\x1a\n' + b'0' * 32
+
+        # 生成带有 ID3 标签的音频文件
+        with wave.open(self.file, 'wb') as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(8000)
+            f.writeframes(b'\0\0' * 8000)
+
+        audio = WAVE(self.file)
+        audio.add_tags()
+        for frame in [
+            TIT2(encoding=3, text='title'),
+            TPE1(encoding=3, text='singer'),
+            TALB(encoding=3, text='album'),
+            TRCK(encoding=3, text='3/12'),
+            TPOS(encoding=3, text='1/2'),
+            TDRC(encoding=3, text='2011-07-19'),
+            TCON(encoding=3, text='(13)'),
+            APIC(encoding=3, mime='image/png', type=3, desc='', data=self.picData),
+            USLT(encoding=3, lang='eng', desc='', text='[00:01.00]hello\n[00:02.00]world')
+        ]:
+            audio.tags.add(frame)
+
+        audio.save()
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_read(self):
+        """ 测试一次解析读取所有信息 """
+        tag = TagReader.read(self.file, False)
+        songInfo = tag.songInfo
+        self.assertEqual((songInfo.title, songInfo.singer, songInfo.album),
+                         ('title', 'singer', 'album'))
+        self.assertEqual((songInfo.track, songInfo.trackTotal), (3, 12))
+        self.assertEqual((songInfo.disc, songInfo.discTotal), (1, 2))
+        self.assertEqual(songInfo.year, 2011)
+        self.assertEqual(songInfo.genre, 'Pop')
+        self.assertEqual(tag.readCover(), self.picData)
+        self.assertTrue(tag.readLyric().isValid())
+
+    def test_cache(self):
+        """ 测试标签缓存 """
+        cache = TagCache(capacity=1)
+        audio = cache.parse(self.file)
+        self.assertIs(cache.parse(self.file), audio)
+
+        # 文件修改之后重新解析
+        audio.tags.add(TIT2(encoding=3, text='new title'))
+        audio.save()
+        self.assertIsNot(cache.parse(self.file), audio)
+        self.assertEqual(len(cache.tags), 1)